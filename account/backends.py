@@ -0,0 +1,31 @@
+"""
+Bu dosya: account/backends.py
+--------------------------------
+E-posta + şifre ile giriş.
+
+Mantık:
+- Kullanıcı e-postayla, tekil indeks üzerinden TEK sorguyla bulunur.
+- Şifre bir kez kontrol edilir.
+- E-posta yoksa da bir şifre hash'i hesaplanır; böylece "böyle bir e-posta
+  var mı?" sorusu yanıt süresinden anlaşılamaz.
+
+Admin girişi (kullanıcı adıyla) için ModelBackend ayarlarda ikinci sırada durur.
+"""
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+
+class EmailBackend(ModelBackend):
+    def authenticate(self, request, email=None, password=None, **kwargs):
+        if email is None or password is None:
+            return None
+        User = get_user_model()
+        try:
+            user = User._default_manager.get(email=email)
+        except User.DoesNotExist:
+            User().set_password(password)  # zamanlama farkı olmasın
+            return None
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
@@ -0,0 +1,60 @@
+"""
+Bu dosya: account/kapsam.py
+--------------------------------
+Kullanıcının hangi ilin verisini görebileceği (il kapsamı).
+
+Basit anlatım:
+- İli ARAS olan kullanıcı, süper kullanıcı ve yönetici gruplarındakiler
+  bütün bölgeyi görür (HEPSI).
+- Diğerleri yalnızca kendi ilini görür. İli boş olan kullanıcı hiçbir ilin
+  verisini görmez ("").
+- Kapsam oturumda saklanır: grup sorgusu oturum başına bir kez çalışır.
+  Kullanıcının ili değişirse (request.user zaten her istekte okunuyor) kapsam
+  yeniden çözülür; grup değişikliği bir sonraki girişte geçerli olur.
+
+Kullanım (duzeltme görünümleri):
+    kapsam = istek_kapsami(request)
+    qs = kapsamla(Kesinti.objects.filter(...), kapsam)
+"""
+
+from .constants import IL_LIST
+
+HEPSI = "*"
+TUM_BOLGE_ILI = "ARAS"
+# Bu gruplardaki kullanıcılar ilinden bağımsız olarak bütün bölgeyi görür
+TUM_BOLGE_GRUPLARI = ("BT Admin", "Admin", "OMS Admin")
+
+_OTURUM_ANAHTARI = "il_kapsami"
+
+
+def kapsam_coz(user) -> str:
+    """Kullanıcının kapsamı: HEPSI, bir il adı ya da "" (hiçbiri)."""
+    if not user.is_authenticated:
+        return ""
+    if user.is_superuser or user.il == TUM_BOLGE_ILI:
+        return HEPSI
+    if user.groups.filter(name__in=TUM_BOLGE_GRUPLARI).exists():
+        return HEPSI
+    return user.il if user.il in IL_LIST else ""
+
+
+def istek_kapsami(request) -> str:
+    """İsteğin kapsamı; istek içinde ve oturumda önbelleklenir."""
+    if hasattr(request, "_il_kapsami"):
+        return request._il_kapsami
+    user = request.user
+    kayit = request.session.get(_OTURUM_ANAHTARI)
+    if not kayit or kayit.get("kullanici") != user.pk or kayit.get("il") != user.il:
+        kayit = {"kullanici": user.pk, "il": user.il, "kapsam": kapsam_coz(user)}
+        request.session[_OTURUM_ANAHTARI] = kayit
+    request._il_kapsami = kayit["kapsam"]
+    return request._il_kapsami
+
+
+def kapsamla(qs, kapsam: str, alan: str = "il"):
+    """Queryset'i kapsama göre süzer; alan: tablonun il kolonu."""
+    if kapsam == HEPSI:
+        return qs
+    if not kapsam:
+        return qs.none()
+    return qs.filter(**{alan: kapsam})
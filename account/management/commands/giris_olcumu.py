@@ -0,0 +1,95 @@
+"""
+Bu dosya: account/management/commands/giris_olcumu.py
+--------------------------------
+Giriş (login) akışını eşzamanlı yük altında ölçer: saniyede kaç giriş?
+
+Geçici kullanıcılar açar, her iş parçacığı kendi test istemcisiyle login
+sayfasına POST atar, sonunda kullanıcıları siler. Bir girişte atılan SQL
+sorgularını da sayar. Gerçek User satırları açıp sildiği için yalnızca
+DEBUG=True (geliştirme) ortamında çalışır.
+
+Şifre hash'i (PBKDF2) bilerek yavaştır ve genelde süreyi o belirler.
+--hizli-hash ile ölçüm süresince MD5 hasher kullanılır; böylece yalnızca
+sorgu / oturum maliyeti görünür. Üretim ayarı değişmez.
+
+Kullanım:
+    python manage.py giris_olcumu
+    python manage.py giris_olcumu --isci 8 --adet 400 --hizli-hash
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+
+_SIFRE = "olcum-sifre-1234"
+
+
+class Command(BaseCommand):
+    help = "Eşzamanlı girişlerde saniyedeki giriş sayısını ve giriş başına sorgu sayısını ölçer."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--isci", type=int, default=4, help="Eşzamanlı iş parçacığı")
+        parser.add_argument("--adet", type=int, default=40, help="Toplam giriş denemesi")
+        parser.add_argument("--hizli-hash", action="store_true",
+                            help="Ölçüm boyunca MD5 hasher kullan (yalnızca sorgu maliyeti)")
+
+    def handle(self, *args, **opts):
+        if not settings.DEBUG:
+            raise CommandError("giris_olcumu kullanıcı tablosuna yazar; DEBUG=False ortamda çalıştırılmaz.")
+        ayar = {"ALLOWED_HOSTS": [*settings.ALLOWED_HOSTS, "testserver"]}
+        if opts["hizli_hash"]:
+            ayar["PASSWORD_HASHERS"] = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+        with override_settings(**ayar):
+            self._olc(opts["isci"], opts["adet"])
+
+    def _olc(self, isci: int, adet: int):
+        User = get_user_model()
+        kullanicilar = [
+            User.objects.create_user(username=f"_olcum_{i}", email=f"olcum{i}@olcum.invalid", password=_SIFRE)
+            for i in range(isci)
+        ]
+        url = reverse("login")
+        try:
+            istemci = Client()
+            with CaptureQueriesContext(connection) as q:
+                yanit = istemci.post(url, {"email": kullanicilar[0].email, "password": _SIFRE})
+            if yanit.status_code != 302:
+                self.stderr.write(self.style.ERROR(f"Giriş başarısız (HTTP {yanit.status_code})"))
+                return
+            self.stdout.write(f"Giriş başına SQL: {len(q.captured_queries)}")
+            for sorgu in q.captured_queries:
+                self.stdout.write(f"    {sorgu['sql'][:110]}")
+
+            sureler = []
+            kilit = threading.Lock()
+
+            def calis(i):
+                kullanici = kullanicilar[i % isci]
+                c = Client()
+                t0 = time.perf_counter()
+                yanit = c.post(url, {"email": kullanici.email, "password": _SIFRE})
+                with kilit:
+                    sureler.append(time.perf_counter() - t0)
+                connections.close_all()
+                return yanit.status_code == 302
+
+            t0 = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=isci) as havuz:
+                basarili = sum(havuz.map(calis, range(adet)))
+            toplam = time.perf_counter() - t0
+        finally:
+            User.objects.filter(pk__in=[k.pk for k in kullanicilar]).delete()
+
+        sureler.sort()
+        self.stdout.write(self.style.SUCCESS(
+            f"{basarili}/{adet} giriş, {isci} eşzamanlı: {adet / toplam:,.1f} giriş/sn, "
+            f"p50 {sureler[len(sureler) // 2] * 1e3:.0f} ms, p95 {sureler[int(len(sureler) * 0.95) - 1] * 1e3:.0f} ms"
+        ))
@@ -1,3 +1,88 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import authenticate, get_user_model
+from django.contrib.auth.models import Group
+from django.contrib.sessions.backends.signed_cookies import SessionStore
+from django.test import RequestFactory, TestCase
+
+from duzeltme.models import Kesinti
+from duzeltme.tests import dosya_olustur
+
+from .backends import EmailBackend
+from .kapsam import HEPSI, istek_kapsami, kapsam_coz, kapsamla
+
+
+class KapsamTesti(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        cls.kars = User.objects.create_user("kars", "kars@ornek.invalid", "x", il="KARS")
+        cls.aras = User.objects.create_user("aras", "aras@ornek.invalid", "x", il="ARAS")
+        cls.ilsiz = User.objects.create_user("ilsiz", "ilsiz@ornek.invalid", "x", il="")
+        cls.super = User.objects.create_superuser("super", "super@ornek.invalid", "x", il="KARS")
+        cls.yonetici = User.objects.create_user("yonetici", "yonetici@ornek.invalid", "x", il="AĞRI")
+        cls.yonetici.groups.add(Group.objects.get_or_create(name="OMS Admin")[0])
+
+    def test_kapsam_coz(self):
+        self.assertEqual(kapsam_coz(self.kars), "KARS")
+        self.assertEqual(kapsam_coz(self.aras), HEPSI)
+        self.assertEqual(kapsam_coz(self.super), HEPSI)
+        self.assertEqual(kapsam_coz(self.yonetici), HEPSI)
+        self.assertEqual(kapsam_coz(self.ilsiz), "")
+
+    def test_kapsamla(self):
+        iller = ["KARS", "KARS", "AĞRI", "ERZURUM"]
+        dosya = dosya_olustur("kapsam.csv", yil=2022)
+        Kesinti.objects.bulk_create([
+            Kesinti(dosya=dosya, satir_no=i, sistem="oms", yil=2022, il=il) for i, il in enumerate(iller)
+        ])
+        qs = Kesinti.objects.all()
+        self.assertEqual(kapsamla(qs, HEPSI).count(), 4)
+        self.assertEqual(kapsamla(qs, "").count(), 0)
+        self.assertEqual(set(kapsamla(qs, "KARS").values_list("il", flat=True)), {"KARS"})
+        self.assertEqual(kapsamla(qs, "KARS").count(), 2)
+
+    def _istek(self, kullanici, oturum):
+        request = RequestFactory().get("/")
+        request.user = kullanici
+        request.session = oturum
+        return request
+
+    def test_istek_kapsami_oturumda_saklanir(self):
+        oturum = SessionStore()
+        kullanici = get_user_model().objects.get(pk=self.kars.pk)
+        self.assertEqual(istek_kapsami(self._istek(kullanici, oturum)), "KARS")
+
+        # Grup değişikliği oturum boyunca görülmez; grup sorgusu yeniden çalışmaz
+        kullanici.groups.add(Group.objects.get_or_create(name="Admin")[0])
+        with self.assertNumQueries(0):
+            self.assertEqual(istek_kapsami(self._istek(kullanici, oturum)), "KARS")
+
+        # İl değişince kapsam yeniden çözülür
+        kullanici.il = "AĞRI"
+        self.assertEqual(istek_kapsami(self._istek(kullanici, oturum)), HEPSI)
+        self.assertEqual(istek_kapsami(self._istek(kullanici, SessionStore())), HEPSI)
+
+
+class EmailBackendTesti(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        cls.kullanici = User.objects.create_user("eposta", "eposta@ornek.invalid", "dogru-sifre")
+        cls.pasif = User.objects.create_user("pasif", "pasif@ornek.invalid", "dogru-sifre", is_active=False)
+
+    def test_tek_sorguyla_giris(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(EmailBackend().authenticate(None, email="eposta@ornek.invalid",
+                                                         password="dogru-sifre"), self.kullanici)
+        with self.assertNumQueries(1):
+            self.assertIsNone(EmailBackend().authenticate(None, email="eposta@ornek.invalid", password="yanlis"))
+        self.assertIsNone(EmailBackend().authenticate(None, email="pasif@ornek.invalid", password="dogru-sifre"))
+        self.assertEqual(authenticate(email="eposta@ornek.invalid", password="dogru-sifre"), self.kullanici)
+
+    def test_olmayan_eposta_da_sifre_hashler(self):
+        User = get_user_model()
+        with mock.patch.object(User, "set_password", autospec=True) as hashle, self.assertNumQueries(1):
+            self.assertIsNone(EmailBackend().authenticate(None, email="yok@ornek.invalid", password="herhangi"))
+        hashle.assert_called_once_with(mock.ANY, "herhangi")
+        self.assertIsNone(EmailBackend().authenticate(None, email=None, password="herhangi"))
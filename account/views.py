@@ -8,7 +8,7 @@ Mantık:
 """
 
 from django.shortcuts import render, redirect
-from django.contrib.auth import authenticate, login, get_user_model
+from django.contrib.auth import authenticate, login
 from .forms import LoginForm
 
 
@@ -20,20 +20,9 @@ def login_request(request):
     if request.method == "POST":
         form = LoginForm(request.POST)
         if form.is_valid():
-            email = form.cleaned_data["email"]
-            password = form.cleaned_data["password"]
-
-            # E-posta benzersiz olduğu için tek bir kullanıcı döner
-            User = get_user_model()
-            user_obj = User.objects.filter(email=email).first()
-
-            if not user_obj:
-                # Normalde buraya düşmez; form.clean_email zaten kontrol ediyor.
-                form.add_error("email", "Bu e-posta ile kullanıcı bulunamadı.")
-                return render(request, "account/login.html", {"form": form})
-
-            # Django authenticate kullanıcı adı (username) ister
-            user = authenticate(request, username=user_obj.username, password=password)
+            # Tek indeksli sorgu + tek şifre kontrolü (bkz. account/backends.py)
+            user = authenticate(request, email=form.cleaned_data["email"],
+                                password=form.cleaned_data["password"])
 
             if user is not None:
                 login(request, user)
@@ -42,8 +31,8 @@ def login_request(request):
                     request.session.set_expiry(0)
                 return redirect("index")
 
-            # Şifre yanlışsa
-            form.add_error(None, "E-posta doğru ama şifre hatalı.")
+            # E-posta mı şifre mi yanlış, bilerek söylemiyoruz
+            form.add_error(None, "E-posta ya da şifre hatalı.")
         # Form geçersizse aynı sayfayı hatalarla göster
         return render(request, "account/login.html", {"form": form})
 
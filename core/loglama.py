@@ -0,0 +1,23 @@
+"""
+Bu dosya: core/loglama.py
+--------------------------------
+settings.LOGGING'in dosya handler'ı.
+
+Ayarlar import edilirken dosya sistemine dokunulmaz: dosya (ve klasörü) ilk
+log satırı yazılırken açılır/oluşturulur. Sunucuda klasör deploy sırasında
+servis kullanıcısına verilir (bkz. digitalocean.py yazma_izinleri).
+"""
+
+import os
+from logging.handlers import WatchedFileHandler
+
+
+class KlasorluDosyaHandler(WatchedFileHandler):
+    """WatchedFileHandler; dosyayı ilk yazışta açar, klasör yoksa oluşturur."""
+
+    def __init__(self, filename, mode="a", encoding="utf-8", delay=True, errors=None):
+        super().__init__(filename, mode=mode, encoding=encoding, delay=delay, errors=errors)
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
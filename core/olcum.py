@@ -0,0 +1,150 @@
+"""
+Bu dosya: core/olcum.py
+--------------------------------
+İstek başına SQL / şablon / view süresi ölçümü.
+
+IstekOlcumMiddleware her istekte şunları toplar:
+- sorgu sayısı ve toplam SQL süresi (connection.execute_wrapper; DEBUG gerekmez),
+- şablon render süresi (en dıştaki Template.render; include'lar iki kez sayılmaz),
+- view süresi (process_view'dan yanıta kadar) ve toplam süre.
+
+Sonuç:
+- "Server-Timing" başlığı: tarayıcı geliştirici araçlarında (Network > Timing)
+  görünür. Yalnız oturum açmış kullanıcılara ya da DEBUG'da gönderilir.
+- YAVAS_ISTEK_MS'i aşan istekler "omsweb.olcum" logger'ına tek satır JSON
+  olarak yazılır (settings.LOGGING: var/log/yavas_istek.log).
+- Aynı SQL kalıbı (parametreler hariç) TEKRAR_SORGU_ESIGI kez ya da daha çok
+  çalıştıysa istek yavaş olmasa da N+1 şüphesi olarak loglanır.
+
+Akışlı yanıtlarda (export) gövde middleware'den sonra üretildiği için o
+sırada çalışan sorgular sayılmaz.
+"""
+
+import json
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connections
+from django.template.base import Template
+
+logger = logging.getLogger("omsweb.olcum")
+
+_aktif: ContextVar = ContextVar("istek_olcumu", default=None)
+_SAYI = re.compile(r"\b\d+\b")
+_ORNEK_SQL = 200
+
+
+class _Olcum:
+    __slots__ = ("sorgular", "sql_sn", "sablon_sn", "sablon_derinlik", "view_basi")
+
+    def __init__(self):
+        self.sorgular = []        # (kalıp, süre)
+        self.sql_sn = 0.0
+        self.sablon_sn = 0.0
+        self.sablon_derinlik = 0
+        self.view_basi = None
+
+    def sorgu_yakala(self, execute, sql, params, many, context):
+        t0 = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            sure = time.perf_counter() - t0
+            self.sql_sn += sure
+            # Parametreler %s olarak gelir; gömülü sayılar da kalıba indirgenir
+            self.sorgular.append((_SAYI.sub("?", sql), sure))
+
+    def tekrarlar(self, esik: int):
+        sayac = Counter(kalip for kalip, _ in self.sorgular)
+        return [(kalip, adet) for kalip, adet in sayac.most_common() if adet >= esik]
+
+
+_asil_render = Template.render
+
+
+def _olculen_render(self, context):
+    olcum = _aktif.get()
+    if olcum is None:
+        return _asil_render(self, context)
+    olcum.sablon_derinlik += 1
+    t0 = time.perf_counter()
+    try:
+        return _asil_render(self, context)
+    finally:
+        olcum.sablon_derinlik -= 1
+        if olcum.sablon_derinlik == 0:
+            olcum.sablon_sn += time.perf_counter() - t0
+
+
+Template.render = _olculen_render
+
+
+def _ms(sn: float) -> float:
+    return round(sn * 1000, 1)
+
+
+class IstekOlcumMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.yavas_sn = getattr(settings, "YAVAS_ISTEK_MS", 500) / 1000
+        self.tekrar_esigi = getattr(settings, "TEKRAR_SORGU_ESIGI", 3)
+
+    def __call__(self, request):
+        olcum = _Olcum()
+        belirtec = _aktif.set(olcum)
+        t0 = time.perf_counter()
+        try:
+            with ExitStack() as yigin:
+                for baglanti in connections.all():
+                    yigin.enter_context(baglanti.execute_wrapper(olcum.sorgu_yakala))
+                response = self.get_response(request)
+        finally:
+            _aktif.reset(belirtec)
+        bitis = time.perf_counter()
+        toplam = bitis - t0
+        view_sn = bitis - olcum.view_basi if olcum.view_basi else 0.0
+
+        tekrarlar = olcum.tekrarlar(self.tekrar_esigi)
+        kullanici = getattr(request, "user", None)
+        if settings.DEBUG or (kullanici is not None and kullanici.is_authenticated):
+            response["Server-Timing"] = ", ".join([
+                f'sql;dur={_ms(olcum.sql_sn)};desc="{len(olcum.sorgular)} sorgu"',
+                f"sablon;dur={_ms(olcum.sablon_sn)}",
+                f"view;dur={_ms(view_sn)}",
+                f"toplam;dur={_ms(toplam)}",
+            ] + ([f'tekrar;desc="{len(tekrarlar)} tekrarlanan sorgu"'] if tekrarlar else []))
+
+        if toplam >= self.yavas_sn or tekrarlar:
+            self._logla(request, response, olcum, toplam, view_sn, tekrarlar)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        olcum = _aktif.get()
+        if olcum is not None:
+            olcum.view_basi = time.perf_counter()
+
+    def _logla(self, request, response, olcum, toplam, view_sn, tekrarlar):
+        kayit = {
+            "yavas": toplam >= self.yavas_sn,
+            "metod": request.method,
+            "yol": request.get_full_path(),
+            "durum": response.status_code,
+            "kullanici": getattr(getattr(request, "user", None), "pk", None),
+            "toplam_ms": _ms(toplam),
+            "view_ms": _ms(view_sn),
+            "sablon_ms": _ms(olcum.sablon_sn),
+            "sql_ms": _ms(olcum.sql_sn),
+            "sorgu": len(olcum.sorgular),
+            "en_yavas_sql": [
+                {"ms": _ms(sure), "sql": kalip[:_ORNEK_SQL]}
+                for kalip, sure in sorted(olcum.sorgular, key=lambda s: -s[1])[:3]
+            ],
+            "tekrarlanan": [{"adet": adet, "sql": kalip[:_ORNEK_SQL]} for kalip, adet in tekrarlar],
+        }
+        logger.warning(json.dumps(kayit, ensure_ascii=False))
+
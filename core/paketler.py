@@ -0,0 +1,246 @@
+"""
+Bu dosya: core/paketler.py
+--------------------------------
+Sayfa tipi başına CSS / JS paketleri.
+
+Her sayfa tipi (genel, giris, duzeltme, ozet, grid) ihtiyaç duyduğu dosyaları
+PAKETLER'de bildirir; şablonlar {% paket_css %} / {% paket_js %} ile yalnızca
+kendi tipinin dosyalarını yükler (bkz. core/templatetags/paket.py).
+
+- DEBUG: kaynak dosyalar tek tek, değişiklikler anında görünür.
+- Üretim: "manage.py paketle" her tip için static/paket/<tip>.css ve .js
+  dosyalarını birleştirip küçültür; collectstatic bunları hash'leyip .gz'ler.
+  Sayfa başına bir CSS + bir JS isteği kalır.
+
+Birleştirilen CSS'teki göreli url(...) yolları paket/ klasörüne göre yeniden
+yazılır ki font ve görseller bulunmaya devam etsin.
+"""
+
+import posixpath
+import re
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+
+PAKET_KLASORU = "paket"
+
+# tip -> {"temel": miras alınan tip, "css": (...), "js": (...)}
+PAKETLER = {
+    "giris": {
+        "css": (
+            "vendors/typicons.font/font/typicons.css",
+            "vendors/css/vendor.bundle.base.css",
+            "css/vertical-layout-light/style.css",
+        ),
+        "js": (
+            "vendors/js/vendor.bundle.base.js",
+            "js/off-canvas.js",
+            "js/hoverable-collapse.js",
+            "js/template.js",
+        ),
+    },
+    # navbar + sidebar + tema ayar paneli olan sayfalar
+    "genel": {"temel": "giris", "js": ("js/settings.js",)},
+    "duzeltme": {"temel": "genel", "css": ("css/custom/top-tabs.css",)},
+    "ozet": {"temel": "duzeltme", "css": ("css/custom/timeline.css",), "js": ("js/custom/gorevler.js",)},
+    "grid": {"temel": "duzeltme", "js": ("js/custom/grid.js",)},
+}
+
+_CSS_URL = re.compile(r"""url\(\s*(['"]?)(?P<url>[^'")]+)\1\s*\)""")
+_CSS_YORUM = re.compile(r"/\*.*?\*/", re.S)
+_CSS_BOSLUK = re.compile(r"\s*([{};])\s*")
+
+
+def dosyalar(tip: str, tur: str) -> Tuple[str, ...]:
+    """Tipin (mirasla birlikte) sıralı css ya da js dosyaları."""
+    tanim = PAKETLER[tip]
+    onceki = dosyalar(tanim["temel"], tur) if "temel" in tanim else ()
+    return onceki + tuple(tanim.get(tur, ()))
+
+
+def paket_adi(tip: str, tur: str) -> str:
+    return f"{PAKET_KLASORU}/{tip}.{tur}"
+
+
+def paket_dosyalari() -> List[str]:
+    return [paket_adi(tip, tur) for tip in PAKETLER for tur in ("css", "js") if dosyalar(tip, tur)]
+
+
+def _css_yollarini_tasi(yol: str, metin: str) -> str:
+    """yol'daki CSS'in göreli url()'lerini paket/ klasörüne göre yeniden yazar."""
+    klasor = posixpath.dirname(yol)
+
+    def degistir(m):
+        url = m.group("url").strip()
+        if url.startswith(("data:", "http:", "https:", "//", "#", "/")):
+            return m.group(0)
+        hedef = posixpath.normpath(posixpath.join(klasor, url))
+        return f'url("{posixpath.relpath(hedef, PAKET_KLASORU)}")'
+
+    return _CSS_URL.sub(degistir, metin)
+
+
+def css_kucult(metin: str) -> str:
+    metin = _CSS_YORUM.sub("", metin)
+    metin = _CSS_BOSLUK.sub(r"\1", metin)
+    return re.sub(r"\s+", " ", metin).replace(";}", "}").strip()
+
+
+# Bu karakterlerden / anahtar kelimelerden sonra gelen "/" bölme değil düzenli ifadedir
+_REGEX_ONCESI = set("(,=:[!&|?{};+-*%<>~^")
+_REGEX_KELIMELERI = {"return", "typeof", "instanceof", "case", "do", "else", "in", "of", "new", "delete",
+                     "void", "throw", "yield", "await"}
+_KELIME_SONU = re.compile(r"[A-Za-z_$][\w$]*$")
+
+
+def _dize_sonu(metin: str, i: int, tirnak: str) -> int:
+    """'...' / "..." dizesinin bittiği yerin bir sonrası (satır sonunda da biter)."""
+    j = i + 1
+    while j < len(metin) and metin[j] not in (tirnak, "\n"):
+        j += 2 if metin[j] == "\\" else 1
+    return j + 1
+
+
+def _regex_sonu(metin: str, i: int) -> int:
+    """/.../bayraklar sabitinin bittiği yerin bir sonrası; sabit değilse -1."""
+    j, sinifta = i + 1, False
+    while j < len(metin):
+        c = metin[j]
+        if c == "\n":
+            return -1
+        if c == "\\":
+            j += 2
+            continue
+        if c == "[":
+            sinifta = True
+        elif c == "]":
+            sinifta = False
+        elif c == "/" and not sinifta:
+            j += 1
+            while j < len(metin) and (metin[j].isalnum() or metin[j] in "_$"):
+                j += 1
+            return j
+        j += 1
+    return -1
+
+
+def _regex_olabilir(cikti: List[str]) -> bool:
+    onceki = "".join(cikti[-40:]).rstrip()
+    if not onceki:
+        return True
+    if onceki[-1] in _REGEX_ONCESI:
+        return True
+    kelime = _KELIME_SONU.search(onceki)
+    return kelime is not None and kelime.group(0) in _REGEX_KELIMELERI
+
+
+def _bosluk_ekle(cikti: List[str], c: str) -> None:
+    """Satır başı boşluğu ve boş satır atılır, satır sonu boşluğu silinir, ardışık boşluk teke iner."""
+    if c == "\n":
+        while cikti and cikti[-1] in (" ", "\t", "\r"):
+            cikti.pop()
+        if cikti and cikti[-1] != "\n":
+            cikti.append(c)
+    elif cikti and cikti[-1] not in (" ", "\t", "\r", "\n"):
+        cikti.append(c)
+
+
+def js_kucult(metin: str) -> str:
+    """
+    Muhafazakâr küçültme, karakter düzeyinde: yorumlar (/*! lisans yorumları
+    hariç), satır başı/sonu boşlukları ve boş satırlar atılır; yorumun
+    yanındaki kod kalır. Dize, şablon (`...${...}...`) ve düzenli ifade
+    sabitlerinin içine dokunulmaz. Satır sonları korunur (ASI): çok satırlı
+    yorumun yerine bir satır sonu bırakılır.
+    .min.js dosyaları zaten küçük olduğu için bu fonksiyona girmez.
+    """
+    cikti: List[str] = []
+    sablonlar: List[int] = []  # açık ${ } ifadelerinin süslü parantez derinlikleri
+    i, n = 0, len(metin)
+    while i < n:
+        c = metin[i]
+        if c in ("'", '"'):
+            j = _dize_sonu(metin, i, c)
+        elif c == "`" or (c == "}" and sablonlar and sablonlar[-1] == 0):
+            if c == "}":
+                sablonlar.pop()
+            j = i + 1
+            while j < n:
+                if metin[j] == "\\":
+                    j += 2
+                elif metin[j] == "`":
+                    j += 1
+                    break
+                elif metin.startswith("${", j):
+                    j += 2
+                    sablonlar.append(0)
+                    break
+                else:
+                    j += 1
+        elif metin.startswith("//", i):
+            j = metin.find("\n", i)
+            i = n if j < 0 else j
+            continue
+        elif metin.startswith("/*", i):
+            j = metin.find("*/", i + 2)
+            j = n if j < 0 else j + 2
+            if metin.startswith("/*!", i):
+                cikti.append(metin[i:j])
+            else:
+                _bosluk_ekle(cikti, "\n" if "\n" in metin[i:j] else " ")
+            i = j
+            continue
+        elif c == "/" and _regex_olabilir(cikti):
+            j = _regex_sonu(metin, i)
+            j = i + 1 if j < 0 else j
+        else:
+            if c in " \t\r\n":
+                _bosluk_ekle(cikti, c)
+            else:
+                if sablonlar and c in "{}":
+                    sablonlar[-1] += 1 if c == "{" else -1
+                cikti.append(c)
+            i += 1
+            continue
+        cikti.append(metin[i:j])
+        i = j
+    _bosluk_ekle(cikti, "\n")
+    return "".join(cikti).rstrip("\n")
+
+
+def _oku(yol: str) -> str:
+    tam = finders.find(yol)
+    if not tam:
+        raise FileNotFoundError(f"Paket dosyası bulunamadı: {yol}")
+    return Path(tam).read_text(encoding="utf-8")
+
+
+def paket_icerigi(tip: str, tur: str) -> str:
+    parcalar = []
+    for yol in dosyalar(tip, tur):
+        metin = _oku(yol)
+        if tur == "css":
+            parcalar.append(css_kucult(_css_yollarini_tasi(yol, metin)))
+        else:
+            metin = metin if yol.endswith(".min.js") or "bundle" in yol else js_kucult(metin)
+            parcalar.append(metin.rstrip() + "\n;")  # son satır yorum olabilir
+    return "\n".join(parcalar) + "\n"
+
+
+def paketle(hedef: Path = None) -> Dict[str, Tuple[int, int]]:
+    """Bütün paketleri static/paket/ altına yazar; ad -> (kaynak bayt, paket bayt)."""
+    hedef = Path(hedef or Path(settings.STATICFILES_DIRS[0]) / PAKET_KLASORU)
+    hedef.mkdir(parents=True, exist_ok=True)
+    sonuc = {}
+    for tip in PAKETLER:
+        for tur in ("css", "js"):
+            kaynaklar = dosyalar(tip, tur)
+            if not kaynaklar:
+                continue
+            icerik = paket_icerigi(tip, tur).encode("utf-8")
+            (hedef / f"{tip}.{tur}").write_bytes(icerik)
+            kaynak = sum(Path(finders.find(y)).stat().st_size for y in kaynaklar)
+            sonuc[paket_adi(tip, tur)] = (kaynak, len(icerik))
+    return sonuc
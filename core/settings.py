@@ -45,7 +45,15 @@ INSTALLED_APPS = [
 
 AUTH_USER_MODEL = "account.User" 
 
+# Giriş e-postayla (tek sorgu); admin kullanıcı adıyla da girebilsin
+AUTHENTICATION_BACKENDS = [
+    "account.backends.EmailBackend",
+    "django.contrib.auth.backends.ModelBackend",
+]
+
 MIDDLEWARE = [
+    # En dışta: bütün katmanların SQL/şablon süresini ölçer (bkz. core/olcum.py)
+    'core.olcum.IstekOlcumMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -61,8 +69,19 @@ TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [BASE_DIR / "templates"],
-        'APP_DIRS': True,
         'OPTIONS': {
+            # Derlenmiş şablonlar süreç ömrü boyunca bellekte kalır
+            # (DEBUG'da şablon dosyası değişince runserver önbelleği sıfırlar).
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
+            # Sayfa tipi başına CSS/JS paketleri (bkz. core/paketler.py)
+            'libraries': {
+                'paket': 'core.templatetags.paket',
+            },
             'context_processors': [
                 'django.template.context_processors.debug',
                 'django.template.context_processors.request',
@@ -83,6 +102,64 @@ DATABASES = {
     "default": env.db("DATABASE_URL")
 }
 
+# PostgreSQL: psycopg 3 bağlantı havuzu (her gunicorn worker sürecinin kendi havuzu
+# olur; max_size worker başına thread sayısı kadar yeter). DB_POOL=False ile havuz
+# kapanır, yerine CONN_MAX_AGE ile kalıcı bağlantı kullanılır.
+if DATABASES["default"]["ENGINE"] == "django.db.backends.postgresql":
+    # Bağlantı kullanılmadan önce kısa bir sorguyla denenir (havuzda da, havuzsuz da)
+    DATABASES["default"]["CONN_HEALTH_CHECKS"] = env.bool("CONN_HEALTH_CHECKS", default=True)
+    if env.bool("DB_POOL", default=True):
+        DATABASES["default"]["CONN_MAX_AGE"] = 0  # havuzla birlikte kalıcı bağlantı olmaz
+        DATABASES["default"].setdefault("OPTIONS", {})["pool"] = {
+            "min_size": env.int("DB_POOL_MIN_SIZE", default=1),
+            "max_size": env.int("DB_POOL_MAX_SIZE", default=4),
+            "timeout": env.float("DB_POOL_TIMEOUT", default=10.0),      # boş bağlantı bekleme (sn)
+            "max_idle": env.float("DB_POOL_MAX_IDLE", default=300.0),   # boşta kalan fazlalık kapanır
+            "max_lifetime": env.float("DB_POOL_MAX_LIFETIME", default=1800.0),
+        }
+    else:
+        DATABASES["default"]["CONN_MAX_AGE"] = env.int("CONN_MAX_AGE", default=60)
+
+# İstek ölçümü: eşiği aşan ya da aynı sorguyu tekrar tekrar atan istekler
+# var/log/yavas_istek.log'a tek satır JSON olarak yazılır.
+YAVAS_ISTEK_MS = env.int("YAVAS_ISTEK_MS", default=500)
+TEKRAR_SORGU_ESIGI = env.int("TEKRAR_SORGU_ESIGI", default=3)
+YAVAS_ISTEK_LOG = Path(env.str("YAVAS_ISTEK_LOG", default=str(BASE_DIR / "var" / "log" / "yavas_istek.log")))
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "satir": {"format": "%(asctime)s %(levelname)s %(message)s"},
+    },
+    "handlers": {
+        "yavas_istek": {
+            # WatchedFileHandler (logrotate dosyayı değiştirirse yeniden açar); dosya ve
+            # klasörü ilk yazışta oluşur, settings import'u diske yazmaz.
+            "class": "core.loglama.KlasorluDosyaHandler",
+            "filename": str(YAVAS_ISTEK_LOG),
+            "formatter": "satir",
+        },
+    },
+    "loggers": {
+        "omsweb.olcum": {"handlers": ["yavas_istek"], "level": "WARNING", "propagate": False},
+    },
+}
+
+# Önbellek: bütün gunicorn worker'ları aynı dizini paylaşır, harici servis gerekmez.
+# CACHE_URL ile değiştirilebilir (ör. locmemcache:// yerelde, rediscache://... ileride).
+# Boyut sınırı: MAX_ENTRIES dolunca kayıtların 1/CULL_FREQUENCY'si atılır.
+# Anahtar düzeni ve sürümle toplu geçersiz kılma: duzeltme/onbellek.py
+CACHES = {
+    "default": env.cache_url("CACHE_URL", default=f"filecache://{BASE_DIR / 'var' / 'cache'}"),
+}
+CACHES["default"]["TIMEOUT"] = env.int("CACHE_TIMEOUT", default=24 * 3600)
+CACHES["default"]["KEY_PREFIX"] = env.str("CACHE_KEY_PREFIX", default="omsweb")
+CACHES["default"].setdefault("OPTIONS", {}).update(
+    MAX_ENTRIES=env.int("CACHE_MAX_ENTRIES", default=5000),
+    CULL_FREQUENCY=env.int("CACHE_CULL_FREQUENCY", default=4),
+)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
@@ -124,6 +201,19 @@ STATIC_URL = '/static/'
 STATICFILES_DIRS = [BASE_DIR / 'static']   # development için
 STATIC_ROOT = BASE_DIR / 'staticfiles'     # collectstatic çıktısı (prod için)
 
+# collectstatic static/ ağacının tamamını değil, şablonların kullandığı dosyaları
+# toplar; adlara hash ekler ve .gz kopyalarını yazar (bkz. core/statik.py).
+STATICFILES_FINDERS = [
+    "core.statik.KullanilanStatikFinder",
+    "django.contrib.staticfiles.finders.AppDirectoriesFinder",
+]
+# Şablonda değişkenle ({% static degisken %}) verilen yollar buraya yazılır.
+STATIC_EK_DOSYALAR = ()
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "core.statik.SikistirilmisManifestStorage"},
+}
+
 # Templates
 TEMPLATES[0]["DIRS"] = [BASE_DIR / 'templates']
 
@@ -0,0 +1,163 @@
+"""
+Bu dosya: core/statik.py
+--------------------------------
+Statik dosya hattı: yalnız kullanılan dosyalar, hash'li adlar, hazır .gz kopyalar.
+
+static/ klasörü tema paketinin tamamını içerir (node_modules, scss, demo
+pages, images/samples ...). collectstatic bunların hepsini değil yalnız
+şablonların gerçekten kullandıklarını toplar:
+
+- KullanilanStatikFinder: şablonlardaki {% static '...' %} yollarını ve bu
+  CSS'lerin url(...)/@import ile çektiği dosyaları (font, görsel) izler.
+  Şablonda değişkenle verilen yollar STATIC_EK_DOSYALAR'a elle yazılır;
+  core/paketler.py'nin birleşik paketleri (paket/<tip>.css|js) otomatik eklenir.
+  find() dokunulmadı: DEBUG'da runserver static/ altındaki her dosyayı sunar.
+  Şablonda geçip diskte olmayan yol manifest'te de olmaz ve DEBUG=False'ta
+  sayfayı 500'e düşürür; bu yüzden check() bunları hata olarak bildirir.
+  Paketler ise (static/paket/ git'te yok) yalnızca uyarıdır; temiz checkout'ta
+  migrate / paketle çalışabilsin. Eksik paketle collectstatic durur.
+- SikistirilmisManifestStorage: ManifestStaticFilesStorage (ad.<hash>.uzantı
+  + staticfiles.json) + metin dosyalarının .gz kopyası. Source map'ler
+  yayınlanmaz; sourceMappingURL yorumları hash'lenmez (vendor paketindeki
+  popper.min.js.map gibi kaynağı olmayan referanslar build'i durdurmasın). nginx bunları
+  gzip_static ile olduğu gibi gönderir, istek başına sıkıştırma yapılmaz.
+"""
+
+import gzip
+import posixpath
+import re
+from pathlib import Path
+from typing import Iterator, Set
+
+from django.conf import settings
+from django.core.checks import Error, Warning
+from django.core.management.base import CommandError
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.finders import FileSystemFinder
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.template import engines
+from django.template.utils import get_app_template_dirs
+
+from core import paketler
+
+_STATIC_ETIKETI = re.compile(r"""{%\s*static\s+(['"])(?P<yol>[^'"]+)\1""")
+_CSS_REFERANSI = re.compile(
+    r"""url\(\s*(['"]?)(?P<url>[^'")]+)\1\s*\)|@import\s+(['"])(?P<imp>[^'"]+)\3"""
+)
+
+# Bu uzantılar build sırasında .gz'lenir; görseller/fontlar zaten sıkıştırılmış.
+SIKISTIRILACAK = (".css", ".js", ".svg", ".json", ".txt", ".html", ".eot", ".ttf")
+_EN_AZ_BOYUT = 1024
+
+
+def _sablon_dosyalari() -> Iterator[Path]:
+    dizinler = list(engines["django"].engine.dirs) + list(get_app_template_dirs("templates"))
+    for dizin in dizinler:
+        yield from Path(dizin).rglob("*.html")
+
+
+def sablon_referanslari() -> Set[str]:
+    """Şablonlarda {% static '...' %} ile geçen (sabit) yollar."""
+    yollar = set()
+    for dosya in _sablon_dosyalari():
+        metin = dosya.read_text(encoding="utf-8", errors="ignore")
+        yollar.update(m.group("yol") for m in _STATIC_ETIKETI.finditer(metin))
+    return yollar
+
+
+def _css_referanslari(yol: str, metin: str) -> Iterator[str]:
+    klasor = posixpath.dirname(yol)
+    for m in _CSS_REFERANSI.finditer(metin):
+        url = (m.group("url") or m.group("imp") or "").strip()
+        if not url or url.startswith(("data:", "http:", "https:", "//", "#", "/")):
+            continue
+        url = url.split("#", 1)[0].split("?", 1)[0]
+        if url:
+            yield posixpath.normpath(posixpath.join(klasor, url))
+
+
+class KullanilanStatikFinder(FileSystemFinder):
+    """STATICFILES_DIRS'ten yalnızca şablonların kullandığı dosyaları listeler."""
+
+    _kullanilanlar = None
+
+    def kullanilanlar(self) -> Set[str]:
+        if self._kullanilanlar is None:
+            self._kullanilanlar = self._topla()
+        return self._kullanilanlar
+
+    def _topla(self) -> Set[str]:
+        bekleyen = list(sablon_referanslari() | set(getattr(settings, "STATIC_EK_DOSYALAR", ())))
+        bekleyen.extend(paketler.paket_dosyalari())
+        bulunan = set()
+        while bekleyen:
+            yol = bekleyen.pop()
+            if yol in bulunan or not self.find(yol):
+                continue
+            bulunan.add(yol)
+            if yol.endswith(".css"):
+                metin = Path(self.find(yol)).read_text(encoding="utf-8", errors="ignore")
+                bekleyen.extend(_css_referanslari(yol, metin))
+        return bulunan
+
+    def check(self, **kwargs):
+        hatalar = super().check(**kwargs)
+        for yol in sorted(sablon_referanslari()):
+            if not finders.find(yol):
+                hatalar.append(Error(
+                    f"Şablonlarda kullanılan statik dosya bulunamadı: {yol}",
+                    hint="Dosyayı static/ altına ekleyin ya da şablondaki referansı kaldırın.",
+                    id="statik.E001",
+                ))
+        if not settings.DEBUG:
+            for yol in self._eksik_paketler():
+                hatalar.append(Warning(
+                    f"Birleşik paket bulunamadı: {yol}",
+                    hint="collectstatic'ten önce 'python manage.py paketle' çalıştırın.",
+                    id="statik.W002",
+                ))
+        return hatalar
+
+    def _eksik_paketler(self) -> list:
+        return [yol for yol in paketler.paket_dosyalari() if not self.find(yol)]
+
+    def list(self, ignore_patterns):
+        # list() yalnızca collectstatic'te çağrılır: paketsiz build yayına çıkmasın
+        eksik = [] if settings.DEBUG else self._eksik_paketler()
+        if eksik:
+            raise CommandError(f"Birleşik paket bulunamadı: {', '.join(eksik)}. "
+                               "Önce 'python manage.py paketle' çalıştırın.")
+        kullanilanlar = self.kullanilanlar()
+        for yol, storage in super().list(ignore_patterns):
+            if yol.replace("\\", "/") in kullanilanlar:
+                yield yol, storage
+
+
+class SikistirilmisManifestStorage(ManifestStaticFilesStorage):
+    """Hash'li adlar + manifest; işlenen metin dosyalarının yanına .gz yazar."""
+
+    patterns = tuple(
+        (uzanti, tuple(p for p in kaliplar if "sourceMappingURL" not in str(p)))
+        for uzanti, kaliplar in ManifestStaticFilesStorage.patterns
+    )
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run, **options)
+        if dry_run:
+            return
+        for ad in list(self.hashed_files.values()) + list(paths):
+            self._gz_yaz(ad)
+
+    def _gz_yaz(self, ad: str) -> None:
+        if not ad.endswith(SIKISTIRILACAK):
+            return
+        kaynak = Path(self.path(ad))
+        hedef = kaynak.with_name(kaynak.name + ".gz")
+        if not kaynak.exists() or (hedef.exists() and hedef.stat().st_mtime >= kaynak.stat().st_mtime):
+            return
+        veri = kaynak.read_bytes()
+        if len(veri) < _EN_AZ_BOYUT:
+            return
+        sikismis = gzip.compress(veri, compresslevel=9, mtime=0)
+        if len(sikismis) < len(veri):
+            hedef.write_bytes(sikismis)
@@ -0,0 +1,42 @@
+"""
+Bu dosya: core/templatetags/paket.py
+--------------------------------
+{% paket_css tip %} (head) ve {% paket_js tip %} (body sonu) etiketleri.
+
+paket_css stilleri ve JS için preload ipucunu basar; tarayıcı JS'i HTML'i
+ayrıştırırken indirmeye başlar. paket_js aynı dosyaları defer ile yükler.
+DEBUG'da kaynak dosyalar tek tek, üretimde birleşik paket (bkz. core/paketler.py).
+"""
+
+from django import template
+from django.conf import settings
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+
+from core import paketler
+
+register = template.Library()
+
+
+def _yollar(tip: str, tur: str):
+    if settings.DEBUG:
+        return paketler.dosyalar(tip, tur)
+    return (paketler.paket_adi(tip, tur),) if paketler.dosyalar(tip, tur) else ()
+
+
+@register.simple_tag
+def paket_css(tip: str):
+    stiller = format_html_join(
+        "\n", '<link rel="stylesheet" href="{}">', ((static(y),) for y in _yollar(tip, "css"))
+    )
+    on_yukleme = format_html_join(
+        "\n", '<link rel="preload" href="{}" as="script">', ((static(y),) for y in _yollar(tip, "js"))
+    )
+    return format_html("{}\n{}", stiller, on_yukleme)
+
+
+@register.simple_tag
+def paket_js(tip: str):
+    return format_html_join(
+        "\n", '<script src="{}" defer></script>', ((static(y),) for y in _yollar(tip, "js"))
+    )
@@ -0,0 +1,157 @@
+import gzip
+import json
+import logging
+import re
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.management import call_command
+from django.db import connection
+from django.http import HttpResponse
+from django.template import Context, Template
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from . import paketler
+from .loglama import KlasorluDosyaHandler
+from .olcum import IstekOlcumMiddleware
+from .paketler import js_kucult
+from .statik import KullanilanStatikFinder
+
+
+class JsKucultTesti(SimpleTestCase):
+    def test_yorumdan_sonraki_kod_kalir(self):
+        self.assertEqual(js_kucult("/* x */ var a=1;\n  /* y\n */ b();  // son\n"), "var a=1;\nb();")
+
+    def test_sabitlerin_icine_dokunulmaz(self):
+        kaynak = "\n".join([
+            "var s = '/* dize */', t = \"// dize\";",
+            "var r = /\\/*[/]/g, u = a / 2 /* bolme */ / 1;",
+            "var k = `satır",
+            "  /* şablon */ ${ {a: `//`}.a } // şablon`;",
+            "/*! lisans */",
+        ])
+        self.assertEqual(js_kucult(kaynak), "\n".join([
+            "var s = '/* dize */', t = \"// dize\";",
+            "var r = /\\/*[/]/g, u = a / 2 / 1;",
+            "var k = `satır",
+            "  /* şablon */ ${ {a: `//`}.a } // şablon`;",
+            "/*! lisans */",
+        ]))
+
+    def test_cok_satirli_yorum_satir_sonu_birakir(self):
+        # ASI: yorum iki ifadeyi ayırıyorsa birleşmesinler
+        self.assertEqual(js_kucult("a = 1 /* x\ny */ b = 2"), "a = 1\nb = 2")
+
+
+class StatikTesti(SimpleTestCase):
+    def setUp(self):
+        gecici = tempfile.TemporaryDirectory()
+        self.addCleanup(gecici.cleanup)
+        kok = Path(gecici.name)
+        dosyalar = {
+            "static/css/a.css": '@import "b.css";\n.x { background: url("../img/kullanilan.png"); }\n',
+            "static/css/b.css": "@font-face { src: url('../fonts/f.woff?v=1#iefix'); }\n",
+            "static/fonts/f.woff": "woff",
+            "static/img/kullanilan.png": "png",
+            "static/img/kullanilmayan.png": "png",
+            "static/js/kullanilan.js": "var a = 1;\n" * 200,
+            "static/js/kullanilmayan.js": "var b = 2;\n" * 200,
+            "sablonlar/sayfa.html": ("{% load static %}<link href=\"{% static 'css/a.css' %}\">"
+                                     "<script src=\"{% static 'js/kullanilan.js' %}\"></script>"
+                                     "<script src=\"{% static 'js/yok.js' %}\"></script>"),
+        }
+        for ad, icerik in dosyalar.items():
+            (kok / ad).parent.mkdir(parents=True, exist_ok=True)
+            (kok / ad).write_text(icerik, encoding="utf-8")
+        self.hedef = kok / "toplanan"
+        ayarlar = override_settings(
+            STATICFILES_DIRS=[kok / "static"], STATIC_ROOT=self.hedef,
+            STATICFILES_FINDERS=["core.statik.KullanilanStatikFinder"],
+            TEMPLATES=[{"BACKEND": "django.template.backends.django.DjangoTemplates",
+                        "DIRS": [kok / "sablonlar"], "APP_DIRS": False}],
+        )
+        ayarlar.enable()
+        self.addCleanup(ayarlar.disable)
+        paketsiz = mock.patch.object(paketler, "paket_dosyalari", return_value=[])
+        paketsiz.start()
+        self.addCleanup(paketsiz.stop)
+
+    def test_yalniz_kullanilan_dosyalar_toplanir_ve_gzlenir(self):
+        call_command("collectstatic", interactive=False, verbosity=0)
+        toplanan = {p.relative_to(self.hedef).as_posix() for p in self.hedef.rglob("*") if p.is_file()}
+        kaynaklar = {ad.split(".")[0] for ad in toplanan if ad != "staticfiles.json"}
+        self.assertEqual(kaynaklar, {"css/a", "css/b", "fonts/f", "img/kullanilan", "js/kullanilan"})
+        # Hash'li js'in .gz'si var; 1 KB'tan küçük css'lerin ve görsellerin yok
+        js = next(ad for ad in toplanan if re.fullmatch(r"js/kullanilan\.[0-9a-f]{12}\.js", ad))
+        self.assertIn(js + ".gz", toplanan)
+        self.assertEqual(gzip.decompress((self.hedef / (js + ".gz")).read_bytes()),
+                         (self.hedef / js).read_bytes())
+        self.assertFalse([ad for ad in toplanan if ad.endswith(".gz") and not ad.startswith("js/")])
+
+    def test_eksik_sablon_referansi_hata(self):
+        # Uygulama şablonları (admin vb.) da taranır; bizim şablonun yalnız eksik yolu hata verir
+        eksikler = {h.msg.rsplit(": ", 1)[1] for h in KullanilanStatikFinder().check() if h.id == "statik.E001"}
+        self.assertIn("js/yok.js", eksikler)
+        self.assertFalse(eksikler & {"css/a.css", "js/kullanilan.js"})
+
+
+class IstekOlcumTesti(TestCase):
+    def _view(self, request):
+        with connection.cursor() as cursor:
+            for i in range(3):
+                cursor.execute(f"SELECT {i + 1}")  # sayılar kalıba indirgenir: üçü aynı sorgu
+        return HttpResponse(Template("{% for i in s %}{{ i }}{% endfor %}").render(Context({"s": range(3)})))
+
+    def _istek(self, kullanici):
+        request = RequestFactory().get("/olcum/?a=1")
+        request.user = kullanici
+        middleware = IstekOlcumMiddleware(self._view)
+        middleware.process_view(request, self._view, (), {})
+        return middleware(request)
+
+    @override_settings(DEBUG=False, YAVAS_ISTEK_MS=60_000, TEKRAR_SORGU_ESIGI=3)
+    def test_server_timing_ve_tekrar_logu(self):
+        kullanici = get_user_model()(username="olcen", pk=7)
+        with self.assertLogs("omsweb.olcum", "WARNING") as loglar:
+            yanit = self._istek(kullanici)
+        basliklar = [b.strip().split(";")[0] for b in yanit["Server-Timing"].split(",")]
+        self.assertEqual(basliklar, ["sql", "sablon", "view", "toplam", "tekrar"])
+        self.assertIn('desc="3 sorgu"', yanit["Server-Timing"])
+        # Yavaş değil ama aynı kalıp 3 kez: N+1 şüphesi olarak loglanır
+        kayit = json.loads(loglar.records[0].getMessage())
+        self.assertEqual((kayit["yavas"], kayit["yol"], kayit["kullanici"], kayit["sorgu"]),
+                         (False, "/olcum/?a=1", 7, 3))
+        self.assertEqual([t["adet"] for t in kayit["tekrarlanan"]], [3])
+
+    @override_settings(DEBUG=False, YAVAS_ISTEK_MS=0, TEKRAR_SORGU_ESIGI=10)
+    def test_anonim_istege_baslik_yok_yavas_istek_loglanir(self):
+        with self.assertLogs("omsweb.olcum", "WARNING") as loglar:
+            yanit = self._istek(AnonymousUser())
+        self.assertNotIn("Server-Timing", yanit)
+        kayit = json.loads(loglar.records[0].getMessage())
+        self.assertTrue(kayit["yavas"])
+        self.assertEqual(kayit["tekrarlanan"], [])
+
+    @override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+    def test_yigin_icinde_olculur(self):
+        self.client.force_login(get_user_model().objects.create_user("yigin", "yigin@ornek.invalid", "x"))
+        yanit = self.client.get(reverse("duzeltme:page_data", args=["inavitas", 2022, "oms_kesinti"]))
+        self.assertRegex(yanit["Server-Timing"], r'^sql;dur=[\d.]+;desc="\d+ sorgu", sablon;dur=[\d.]+, '
+                                                 r'view;dur=[\d.]+, toplam;dur=[\d.]+')
+
+
+class KlasorluDosyaHandlerTesti(SimpleTestCase):
+    def test_dosya_ilk_kayitta_olusur(self):
+        gecici = tempfile.TemporaryDirectory()
+        self.addCleanup(gecici.cleanup)
+        yol = Path(gecici.name) / "log" / "alt" / "yavas_istek.log"
+        handler = KlasorluDosyaHandler(str(yol))
+        self.addCleanup(handler.close)
+        self.assertFalse(yol.parent.exists())  # ayarlar yüklenirken dosya sistemine dokunulmaz
+
+        handler.emit(logging.LogRecord("omsweb.olcum", logging.WARNING, __file__, 1, "ilk satır", None, None))
+        self.assertEqual(yol.read_text(encoding="utf-8"), "ilk satır\n")
@@ -1,3 +1,33 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import DegisiklikSeti, Gorev, KesintiEndeksi, YuklenenDosya
+
+
+@admin.register(YuklenenDosya)
+class YuklenenDosyaAdmin(admin.ModelAdmin):
+    list_display = ("dosya_adi", "sistem", "kategori", "yil", "versiyon", "satir_sayisi", "durum", "bitis")
+    list_filter = ("sistem", "kategori", "yil", "durum")
+    search_fields = ("dosya_adi",)
+
+
+@admin.register(DegisiklikSeti)
+class DegisiklikSetiAdmin(admin.ModelAdmin):
+    list_display = ("hedef_tablo", "sistem", "yil", "yeni_dosya", "eklenen", "guncellenen", "silinen",
+                    "ayni", "tam_degisim", "olusturma")
+    list_filter = ("sistem", "yil", "hedef_tablo", "tam_degisim")
+    list_select_related = ("yeni_dosya",)
+
+
+@admin.register(Gorev)
+class GorevAdmin(admin.ModelAdmin):
+    list_display = ("id", "tur", "yil", "durum", "yuzde", "islenen", "satir_sn", "olusturan", "olusturma", "bitis")
+    list_filter = ("tur", "durum", "yil")
+    readonly_fields = ("islenen", "yuzde", "satir_sn", "mesaj", "sonuc", "hata_mesaji", "isci",
+                       "baslama", "bitis", "guncelleme")
+
+
+@admin.register(KesintiEndeksi)
+class KesintiEndeksiAdmin(admin.ModelAdmin):
+    list_display = ("sistem", "tablo", "yil", "il", "gerilim_seviyesi", "kesinti_sayisi", "kisa_kesinti_sayisi",
+                    "abone_kesinti", "abone_dakika", "en_uzun_dk")
+    list_filter = ("sistem", "tablo", "yil", "il", "gerilim_seviyesi")
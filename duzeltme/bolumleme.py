@@ -0,0 +1,142 @@
+"""
+Bu dosya: duzeltme/bolumleme.py
+--------------------------------
+Staging tablolarının (kesinti, tablo1, bildirim, osos) yıl / sistem bölümleri.
+
+PostgreSQL'de bu tablolar bölümlüdür (migration 0009_yil_bolumleri):
+
+    duzeltme_kesinti                    PARTITION BY RANGE (yil)
+    ├── duzeltme_kesinti_2022           PARTITION BY LIST (sistem)
+    │   ├── duzeltme_kesinti_2022_oms
+    │   ├── duzeltme_kesinti_2022_inavitas
+    │   └── duzeltme_kesinti_2022_diger     (DEFAULT)
+    └── duzeltme_kesinti_diger          (DEFAULT)
+
+- Bütün sorgular sistem + yil ile süzüldüğü için planlayıcı tek bölümü okur.
+- Yükleyici yazmadan önce bolum_hazirla() ile (yıl, sistem) bölümünü açar;
+  DEFAULT bölümler yalnız güvenlik ağıdır, normalde boş kalır.
+- Bir yılın bir sistemini silmek TRUNCATE'tir (bolum_bosalt / yil_bosalt):
+  milyonlarca satırlık DELETE + VACUUM yerine dosya düzeyinde bir işlem.
+- Zaman kolonlarında BRIN, şebeke unsuru / modem / kesinti no gibi varlık
+  anahtarlarında B-tree indeks vardır; bölümlü tablodaki indeks her bölümde
+  kendiliğinden oluşur.
+
+Diğer veritabanlarında (SQLite) tablolar düzdür; buradaki fonksiyonlar
+aynı işi DELETE ile yapar.
+"""
+
+import re
+from typing import Dict, List, Set, Tuple
+
+from django.db import connection, transaction
+
+from .kaynaklar import KAYNAKLAR
+from .models import Bildirim, Kesinti, OsosKesinti, Tablo1Satiri, YuklenenDosya
+from .ozet import kaynak_ozetini_yenile
+
+BOLUMLU_MODELLER = (Kesinti, Tablo1Satiri, Bildirim, OsosKesinti)
+VARSAYILAN_BOLUM = "diger"
+_SISTEM_RE = re.compile(r"[a-z0-9]+")
+
+# Süreç içinde açıldığı bilinen bölümler (her parçada katalog sorgusu olmasın)
+_hazir: Set[Tuple[str, int, str]] = set()
+
+
+def bolumlu_mu() -> bool:
+    return connection.vendor == "postgresql"
+
+
+def bolum_adi(tablo: str, yil: int, sistem: str = None) -> str:
+    return f"{tablo}_{yil}" if sistem is None else f"{tablo}_{yil}_{sistem}"
+
+
+def _sistem_dogrula(sistem: str) -> str:
+    if not _SISTEM_RE.fullmatch(sistem):
+        raise ValueError(f"Geçersiz sistem adı: {sistem!r}")
+    return sistem
+
+
+def _var_mi(cursor, ad: str) -> bool:
+    cursor.execute("SELECT to_regclass(%s) IS NOT NULL", [ad])
+    return cursor.fetchone()[0]
+
+
+def bolum_hazirla(model, yil: int, sistem: str) -> None:
+    """(yil, sistem) bölümü yoksa oluşturur. Paralel yükleyiciler için kilitli."""
+    if not bolumlu_mu():
+        return
+    tablo = model._meta.db_table
+    if (tablo, yil, sistem) in _hazir:
+        return
+    qn = connection.ops.quote_name
+    yil_tablosu, yaprak = bolum_adi(tablo, yil), bolum_adi(tablo, yil, sistem)
+    with transaction.atomic(), connection.cursor() as cursor:
+        if not _var_mi(cursor, yaprak):
+            # Aynı tabloya bölüm ekleyen başka süreç varsa onu bekle
+            cursor.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", [tablo])
+            if not _var_mi(cursor, yil_tablosu):
+                cursor.execute(
+                    f"CREATE TABLE {qn(yil_tablosu)} PARTITION OF {qn(tablo)} "
+                    f"FOR VALUES FROM ({int(yil)}) TO ({int(yil) + 1}) PARTITION BY LIST ({qn('sistem')})")
+                cursor.execute(
+                    f"CREATE TABLE {qn(bolum_adi(tablo, yil, VARSAYILAN_BOLUM))} "
+                    f"PARTITION OF {qn(yil_tablosu)} DEFAULT")
+            if not _var_mi(cursor, yaprak):
+                # DDL parametre almaz; sistem dosya adından gelir ve [a-z0-9] dışını içermez
+                cursor.execute(f"CREATE TABLE {qn(yaprak)} PARTITION OF {qn(yil_tablosu)} "
+                               f"FOR VALUES IN ('{_sistem_dogrula(sistem)}')")
+    _hazir.add((tablo, yil, sistem))
+
+
+def bolum_bosalt(model, yil: int, sistem: str) -> None:
+    """Modelin (yil, sistem) satırlarını siler: PostgreSQL'de TRUNCATE, aksi hâlde DELETE."""
+    qn = connection.ops.quote_name
+    tablo = model._meta.db_table
+    yaprak = bolum_adi(tablo, yil, sistem)
+    with connection.cursor() as cursor:
+        if bolumlu_mu() and _var_mi(cursor, yaprak):
+            cursor.execute(f"TRUNCATE {qn(yaprak)}")
+        else:
+            cursor.execute(f"DELETE FROM {qn(tablo)} WHERE {qn('yil')} = %s AND {qn('sistem')} = %s",
+                           [yil, sistem])
+
+
+def bolum_istatistigi_yenile(model, yil: int, sistem: str) -> None:
+    """
+    (yil, sistem) yaprağını ANALYZE eder. COPY ile yeni dolan bölümde planlayıcı
+    satır sayısını 1 sanıp büyük birleştirmelerde iç içe döngü seçer; autovacuum'u
+    beklemeden istatistik tazelenir. Bölümsüz veritabanında bir şey yapmaz.
+    """
+    if not bolumlu_mu():
+        return
+    yaprak = bolum_adi(model._meta.db_table, yil, sistem)
+    with connection.cursor() as cursor:
+        if _var_mi(cursor, yaprak):
+            cursor.execute(f"ANALYZE {connection.ops.quote_name(yaprak)}")
+
+
+def sistem_modelleri(sistem: str) -> List[type]:
+    """Sistemin dosyalarının yazıldığı staging modelleri (KAYNAKLAR'dan)."""
+    modeller = []
+    for (s, _), tanim in KAYNAKLAR.items():
+        if s == sistem and tanim.model not in modeller:
+            modeller.append(tanim.model)
+    return modeller
+
+
+def yil_bosalt(sistem: str, yil: int) -> Dict[str, int]:
+    """
+    Bir sistemin bir yılına ait bütün staging satırlarını ve yükleme kayıtlarını
+    siler; sonra dosyalar yeniden yüklenebilir. Dönüş: tablo -> silinen dosya kaydı.
+    Özet sayıları ve veri sürümü yenilenir (sayfalar boş veriyi göstersin).
+    """
+    sonuc = {}
+    with transaction.atomic():
+        for model in sistem_modelleri(sistem):
+            bolum_bosalt(model, yil, sistem)
+            tablo = model._meta.db_table
+            sonuc[tablo], _ = YuklenenDosya.objects.filter(sistem=sistem, yil=yil, hedef_tablo=tablo).delete()
+    for (s, kategori) in KAYNAKLAR:
+        if s == sistem:
+            kaynak_ozetini_yenile(sistem, kategori, yil)
+    return sonuc
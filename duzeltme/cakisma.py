@@ -0,0 +1,229 @@
+"""
+Bu dosya: duzeltme/cakisma.py
+--------------------------------
+Aynı şebeke unsuru (fider) üzerinde zamanca çakışan kesintileri bulur.
+
+Mantık (sweep-line):
+- Kesintiler şebeke unsuruna göre gruplanır, grup içinde başlamaya göre sıralanır.
+- Soldan sağa ilerlerken "aktif" kesintiler bitişe göre bir heap'te tutulur.
+  Yeni kesinti gelince bitişi başlamasından önce olanlar heap'ten atılır;
+  heap'te kalan HER kesinti yenisiyle çakışır.
+- Böylece n kesinti ve k çakışan çift için iş O(n log n + k) olur;
+  ikili karşılaştırmadaki O(n²) yok.
+
+Çift tipleri:
+- ic_ice : kesinti_a, kesinti_b'yi tamamen kapsar.
+- kismi  : yalnızca bir kısmı örtüşür.
+
+Aralıklar yarı açıktır [baslama, bitis): biri bitip öbürü aynı dakikada
+başlıyorsa çakışma sayılmaz.
+
+"Şu aralıkla ne çakışıyor?" soruları için AralikIndeksi (aralik_indeksi ile tek
+bir şebeke unsurundan kurulur; cakisma_hesapla --unsur ... --aralik ...).
+
+Artımlı çalışma (degisenler=True): çakışma yalnız aynı şebeke unsurundaki
+kesintiler arasında olduğundan, bekleyen değişiklik setlerinin (bkz.
+duzeltme.fark) dokunduğu unsurlar silinip yeniden hesaplanır.
+"""
+
+import heapq
+from bisect import bisect_left
+from datetime import timedelta
+from itertools import groupby
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Count
+
+from . import fark
+from .models import CakisanKesinti, Kesinti, OzetSayaci
+from .ozet import cakisma_ozetini_yenile
+from .yukleme import parca_yaz
+
+# (id, baslama, bitis)
+Aralik = Tuple[int, object, object]
+
+
+def cakismalari_bul(araliklar: Iterable[Aralik]) -> Iterator[tuple]:
+    """
+    Tek bir grubun aralıklarından çakışan çiftleri üretir.
+
+    Çıktı: (a_id, b_id, tip, cakisma_baslama, cakisma_bitis); a, b'den önce
+    başlar (aynı anda başlıyorlarsa uzun olan a'dır).
+    """
+    # Aynı başlamada uzun olan önce gelsin ki kapsayan hep "a" olsun.
+    sirali = sorted(araliklar, key=lambda x: (x[1], -_saniye(x[2] - x[1])))
+    aktif: List[tuple] = []  # (bitis, sira, id)
+    for sira, (id_, bas, bit) in enumerate(sirali):
+        while aktif and aktif[0][0] <= bas:
+            heapq.heappop(aktif)
+        for a_bit, _, a_id in aktif:
+            tip = CakisanKesinti.TIP_IC_ICE if a_bit >= bit else CakisanKesinti.TIP_KISMI
+            yield a_id, id_, tip, bas, min(a_bit, bit)
+        heapq.heappush(aktif, (bit, sira, id_))
+
+
+def _saniye(fark) -> float:
+    return fark.total_seconds() if isinstance(fark, timedelta) else float(fark)
+
+
+def _bitis(baslama, bitis, sure_dk):
+    """bitis boşsa süreden hesapla; ikisi de yoksa None."""
+    if bitis is not None:
+        return bitis
+    if sure_dk is not None:
+        return baslama + timedelta(minutes=sure_dk)
+    return None
+
+
+_IN_PARCASI = 2000  # IN (...) listesi başına unsur
+
+
+def _parcali(degerler, boyut: int = _IN_PARCASI) -> Iterator[list]:
+    degerler = sorted(degerler)
+    for i in range(0, len(degerler), boyut):
+        yield degerler[i:i + boyut]
+
+
+def _gruplu_araliklar(sistem: str, yil: int, unsurlar=None) -> Iterator[Tuple[str, List[Aralik], dict]]:
+    """(unsur, aralıklar, id -> il) üçlüleri; iki tarafın ili de sonuç satırına kopyalanır."""
+    qs = (
+        Kesinti.objects
+        .filter(sistem=sistem, yil=yil, baslama__isnull=False)
+        .exclude(sebeke_unsuru="")
+        .order_by("sebeke_unsuru")
+        .values_list("sebeke_unsuru", "id", "baslama", "bitis", "sure_dk", "il")
+    )
+    if unsurlar is None:
+        kayitlar = qs.iterator(chunk_size=20_000)
+    else:
+        kayitlar = (s for parca in _parcali(unsurlar)
+                    for s in qs.filter(sebeke_unsuru__in=parca).iterator(chunk_size=20_000))
+    for unsur, satirlar in groupby(kayitlar, key=lambda s: s[0]):
+        araliklar, iller = [], {}
+        for _, id_, bas, bit, sure, il in satirlar:
+            bit = _bitis(bas, bit, sure)
+            if bit is not None and bit > bas:
+                araliklar.append((id_, bas, bit))
+                iller[id_] = il
+        yield unsur, araliklar, iller
+
+
+@transaction.atomic
+def cakismalari_hesapla(sistem: str, yil: int, *, parca_boyutu: int = 10_000,
+                        degisenler: bool = False,
+                        ilerleme: Optional[Callable[[int], None]] = None) -> dict:
+    """
+    sistem/yıl için bütün çakışan çiftleri bulup CakisanKesinti tablosuna yazar.
+    Eski sonuçlar silinir; sayfa yalnızca bu tabloyu okur.
+
+    degisenler=True: daha önce tam hesap yapılmışsa yalnızca bekleyen
+    değişiklik setlerinin dokunduğu şebeke unsurları yeniden hesaplanır.
+    Dönüşte "unsur": yeniden hesaplanan unsur sayısı (tam hesapta None).
+    ilerleme(kesinti): her şebeke unsurundan sonra işlenen kesinti sayısıyla çağrılır.
+    """
+    setler = fark.bekleyen_setler(Kesinti, sistem, yil, "cakisma")
+    unsurlar = None
+    if degisenler and OzetSayaci.objects.filter(sistem=sistem, yil=yil, bolum="cakisma").exists():
+        etkilenen = fark.etkilenenler(setler)
+        if not etkilenen.tam:
+            unsurlar = etkilenen.varliklar
+
+    eski = CakisanKesinti.objects.filter(sistem=sistem, yil=yil)
+    if unsurlar is None:
+        eski.delete()
+    else:
+        for parca in _parcali(unsurlar):
+            eski.filter(sebeke_unsuru__in=parca).delete()
+
+    alanlar = ["sistem", "yil", "sebeke_unsuru", "il", "il_b", "kesinti_a", "kesinti_b", "tip",
+               "cakisma_baslama", "cakisma_bitis", "cakisma_dk"]
+    sayac = {CakisanKesinti.TIP_KISMI: 0, CakisanKesinti.TIP_IC_ICE: 0}
+    kesinti_sayisi = 0
+    tampon = []
+    for unsur, araliklar, iller in _gruplu_araliklar(sistem, yil, unsurlar):
+        kesinti_sayisi += len(araliklar)
+        for a_id, b_id, tip, bas, bit in cakismalari_bul(araliklar):
+            sayac[tip] += 1
+            tampon.append((sistem, yil, unsur, iller[a_id], iller[b_id], a_id, b_id, tip, bas, bit,
+                           _saniye(bit - bas) / 60))
+            if len(tampon) >= parca_boyutu:
+                parca_yaz(CakisanKesinti, alanlar, tampon)
+                tampon = []
+        if ilerleme is not None:
+            ilerleme(kesinti_sayisi)
+    if tampon:
+        parca_yaz(CakisanKesinti, alanlar, tampon)
+    if unsurlar is not None:
+        # Özet sayıları bütün yılın toplamıdır
+        sayac.update({tip: 0 for tip in sayac})
+        sayac.update(eski.values_list("tip").annotate(adet=Count("id")).order_by())
+    cakisma_ozetini_yenile(sistem, yil, sayac)
+    fark.islendi_isaretle(setler, "cakisma")
+    return {"kesinti": kesinti_sayisi, **sayac, "unsur": None if unsurlar is None else len(unsurlar)}
+
+
+class AralikIndeksi:
+    """
+    "Şu aralıkla hangi kesintiler çakışıyor?" sorusu için statik indeks.
+
+    Aralıklar başlamaya göre sıralanır; üstüne bitişlerin maksimumunu tutan bir
+    segment ağacı kurulur. Sorgu [q0, q1):
+      1) başlaması q1'den küçük olan önek ikili aramayla bulunur,
+      2) önek içinde bitişi q0'dan büyük olanlar ağaçta yalnızca max > q0 olan
+         dallara inilerek toplanır.
+    Kurulum O(n log n), sorgu O(log n + k log n).
+    """
+
+    def __init__(self, araliklar: Iterable[Aralik]):
+        sirali = sorted(araliklar, key=lambda x: x[1])
+        self.idler = [a[0] for a in sirali]
+        self.baslamalar = [a[1] for a in sirali]
+        self.bitisler = [a[2] for a in sirali]
+        n = len(sirali)
+        self._boyut = 1
+        while self._boyut < max(n, 1):
+            self._boyut *= 2
+        self._max: List[Optional[object]] = [None] * (2 * self._boyut)
+        for i, bit in enumerate(self.bitisler):
+            self._max[self._boyut + i] = bit
+        for dugum in range(self._boyut - 1, 0, -1):
+            sol, sag = self._max[2 * dugum], self._max[2 * dugum + 1]
+            self._max[dugum] = sol if sag is None or (sol is not None and sol >= sag) else sag
+
+    def __len__(self):
+        return len(self.idler)
+
+    def cakisanlar(self, baslama, bitis) -> List[int]:
+        """[baslama, bitis) ile çakışan aralıkların id'leri (başlama sırasıyla)."""
+        son = bisect_left(self.baslamalar, bitis)  # [0, son) aralığı adaylar
+        bulunan: List[int] = []
+        yigin = [(1, 0, self._boyut)]
+        while yigin:
+            dugum, sol, sag = yigin.pop()
+            enbuyuk = self._max[dugum]
+            if sol >= son or enbuyuk is None or enbuyuk <= baslama:
+                continue
+            if sag - sol == 1:
+                bulunan.append(sol)
+                continue
+            orta = (sol + sag) // 2
+            yigin.append((2 * dugum + 1, orta, sag))
+            yigin.append((2 * dugum, sol, orta))
+        return [self.idler[i] for i in sorted(bulunan)]
+
+
+def aralik_indeksi(sistem: str, yil: int, sebeke_unsuru: str) -> AralikIndeksi:
+    """Tek bir şebeke unsurunun kesintilerinden indeks kurar."""
+    qs = (
+        Kesinti.objects
+        .filter(sistem=sistem, yil=yil, sebeke_unsuru=sebeke_unsuru, baslama__isnull=False)
+        .order_by("baslama")  # kesinti_unsur_baslama_idx sırasıyla okunur
+        .values_list("id", "baslama", "bitis", "sure_dk")
+    )
+    araliklar = []
+    for id_, bas, bit, sure in qs:
+        bit = _bitis(bas, bit, sure)
+        if bit is not None and bit > bas:
+            araliklar.append((id_, bas, bit))
+    return AralikIndeksi(araliklar)
@@ -0,0 +1,240 @@
+"""
+Bu dosya: duzeltme/disa_aktarma.py
+--------------------------------
+Tablo1 / kesinti / bildirim listelerini CSV ya da XLSX olarak indirtir.
+
+Mantık:
+- Satırlar sunucu tarafı imleçle (QuerySet.iterator, PostgreSQL'de named
+  cursor) parça parça okunur; bütün liste hiçbir zaman belleğe alınmaz.
+- CSV: her parça yazıldığı anda StreamingHttpResponse ile gönderilir,
+  ilk baytlar sorgu başlar başlamaz yola çıkar.
+- XLSX: xlsx bir zip'tir. zipfile aranamayan (unseekable) bir çıktıya yazınca
+  her girdinin boyutunu sonuna "data descriptor" olarak ekler; böylece zip
+  baştan sona tek geçişte üretilebilir. Sabit parçalar (içerik türleri, kitap,
+  stiller) hemen, sayfa XML'i satırlar okundukça sıkıştırılıp gönderilir. İlk
+  baytlar sorgu başlar başlamaz yola çıkar; geçici dosya ve sabit dışı bellek
+  yoktur. Metinler satır içi (inlineStr) yazılır, paylaşılan metin tablosu
+  (sonda bilinebilecek bir şey) gerekmez.
+
+CSV biçimi ham_veri csv'leriyle aynıdır: ";" ayraç, gg.aa.yyyy ss:dd, ondalık virgül.
+"""
+
+import csv
+import io
+import math
+import re
+import zipfile
+from datetime import date, datetime
+from typing import Dict, Iterator
+from xml.sax.saxutils import escape
+
+from .grid import GRIDLER, GridTanimi, grid_sorgusu, istenen_kolonlar
+from .models import Bildirim
+
+OKUMA_PARCASI = 2_000
+
+_BILDIRIM_KOLONLARI = ("satir_no", "bildirim_no", "il", "ilce", "sebeke_unsuru", "bildirim_zamani", "kesinti_no")
+
+
+def _bildirim(sistem: str) -> GridTanimi:
+    return GridTanimi(Bildirim, sistem, _BILDIRIM_KOLONLARI, siralama=("id",),
+                      filtreler=("il", "sebeke_unsuru", "kesinti_no"), tarih_kolonu="bildirim_zamani")
+
+
+# page slug -> tablo tanımı (grid sekmeleri + bildirim sekmeleri)
+AKTARIMLAR: Dict[str, GridTanimi] = {
+    **GRIDLER,
+    "crm_bildirim": _bildirim("crm"),
+    "oms_bildirim": _bildirim("oms"),
+    "inavitas_bildirim": _bildirim("inavitas"),
+}
+
+BICIMLER = {
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+
+def _satirlar(tanim: GridTanimi, yil: int, params, kapsam: str):
+    """(başlıklar, satır iteratörü) — satırlar id sırasıyla, sunucu imleciyle."""
+    kolonlar = istenen_kolonlar(tanim, params)
+    basliklar = [str(tanim.model._meta.get_field(k).verbose_name) for k in kolonlar]
+    qs = grid_sorgusu(tanim, yil, params, kapsam).order_by("id").values_list(*kolonlar)
+    return basliklar, qs.iterator(chunk_size=OKUMA_PARCASI)
+
+
+def _hucre(deger):
+    if deger is None:
+        return ""
+    if isinstance(deger, datetime):
+        return deger.strftime("%d.%m.%Y %H:%M")
+    if isinstance(deger, float):
+        return f"{deger:g}".replace(".", ",")
+    return deger
+
+
+class _Tampon:
+    """csv.writer'ın yazdığını biriktirip parça parça geri veren küçük tampon."""
+
+    def __init__(self):
+        self.parcalar = []
+
+    def write(self, metin):
+        self.parcalar.append(metin)
+
+    def bosalt(self) -> bytes:
+        veri = "".join(self.parcalar).encode("utf-8")
+        self.parcalar = []
+        return veri
+
+
+def csv_akisi(basliklar, satirlar) -> Iterator[bytes]:
+    tampon = _Tampon()
+    yazici = csv.writer(tampon, delimiter=";", lineterminator="\r\n")
+    yazici.writerow(basliklar)
+    yield b"\xef\xbb\xbf" + tampon.bosalt()  # BOM: Excel Türkçe karakterleri doğru açsın
+    for i, satir in enumerate(satirlar, 1):
+        yazici.writerow([_hucre(d) for d in satir])
+        if i % OKUMA_PARCASI == 0:
+            yield tampon.bosalt()
+    yield tampon.bosalt()
+
+
+# ---- XLSX (akışlı) ----
+_XLSX_SABIT = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '<Override PartName="/xl/styles.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        '</Types>'),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/'
+        'officeDocument" Target="xl/workbook.xml"/></Relationships>'),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/'
+        'worksheet" Target="worksheets/sheet1.xml"/>'
+        '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/'
+        'styles" Target="styles.xml"/></Relationships>'),
+    # s="1": gg.aa.yyyy ss:dd, s="2": gg.aa.yyyy
+    "xl/styles.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        '<numFmts count="2"><numFmt numFmtId="164" formatCode="dd\\.mm\\.yyyy\\ hh:mm"/>'
+        '<numFmt numFmtId="165" formatCode="dd\\.mm\\.yyyy"/></numFmts>'
+        '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="gray125"/></fill></fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        '<cellXfs count="3"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+        '<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+        '<xf numFmtId="165" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/></cellXfs>'
+        '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+        '</styleSheet>'),
+}
+_SAYFA_BASI = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_SAYFA_SONU = "</sheetData></worksheet>"
+_EXCEL_SIFIR = datetime(1899, 12, 30)
+_XML_DISI = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+_SAYFA_ADI_DISI = re.compile(r"[\[\]:*?/\\]")
+
+
+class _AkisCiktisi(io.RawIOBase):
+    """zipfile'ın yazdıklarını biriktirir; aranamaz, zip data descriptor kullanır."""
+
+    def __init__(self):
+        self.parcalar = []
+
+    def writable(self):
+        return True
+
+    def write(self, veri):
+        self.parcalar.append(bytes(veri))
+        return len(veri)
+
+    def bosalt(self) -> bytes:
+        veri = b"".join(self.parcalar)
+        self.parcalar = []
+        return veri
+
+
+def _kolon_harfi(sira: int) -> str:
+    harf = ""
+    while sira:
+        sira, kalan = divmod(sira - 1, 26)
+        harf = chr(65 + kalan) + harf
+    return harf
+
+
+def _xlsx_hucre(ref: str, deger) -> str:
+    if deger is None or deger == "":
+        return ""
+    if isinstance(deger, bool):
+        return f'<c r="{ref}" t="b"><v>{int(deger)}</v></c>'
+    if isinstance(deger, (int, float)) and math.isfinite(deger):
+        return f'<c r="{ref}"><v>{deger!r}</v></c>'
+    if isinstance(deger, datetime):
+        return f'<c r="{ref}" s="1"><v>{(deger - _EXCEL_SIFIR).total_seconds() / 86400!r}</v></c>'
+    if isinstance(deger, date):
+        return f'<c r="{ref}" s="2"><v>{(deger - _EXCEL_SIFIR.date()).days}</v></c>'
+    metin = escape(_XML_DISI.sub("", str(deger)))
+    return f'<c r="{ref}" t="inlineStr"><is><t xml:space="preserve">{metin}</t></is></c>'
+
+
+def _xlsx_satir(no: int, harfler, degerler) -> str:
+    hucreler = "".join(_xlsx_hucre(f"{h}{no}", d) for h, d in zip(harfler, degerler))
+    return f'<row r="{no}">{hucreler}</row>'
+
+
+def xlsx_akisi(basliklar, satirlar, sayfa_adi: str = "Sayfa1") -> Iterator[bytes]:
+    cikti = _AkisCiktisi()
+    sayfa_adi = escape(_SAYFA_ADI_DISI.sub("", sayfa_adi)[:31] or "Sayfa1", {'"': "&quot;"})
+    harfler = [_kolon_harfi(i) for i in range(1, len(basliklar) + 1)]
+    with zipfile.ZipFile(cikti, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for ad, icerik in _XLSX_SABIT.items():
+            zf.writestr(ad, icerik)
+        zf.writestr("xl/workbook.xml", (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+            f'<sheets><sheet name="{sayfa_adi}" sheetId="1" r:id="rId1"/></sheets></workbook>'))
+        yield cikti.bosalt()
+
+        with zf.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as sayfa:
+            tampon = [_SAYFA_BASI, _xlsx_satir(1, harfler, basliklar)]
+            for no, satir in enumerate(satirlar, 2):
+                tampon.append(_xlsx_satir(no, harfler, satir))
+                if no % OKUMA_PARCASI == 0:
+                    sayfa.write("".join(tampon).encode("utf-8"))
+                    tampon = []
+                    veri = cikti.bosalt()
+                    if veri:
+                        yield veri
+            tampon.append(_SAYFA_SONU)
+            sayfa.write("".join(tampon).encode("utf-8"))
+    yield cikti.bosalt()
+
+
+def akis(bicim: str, tanim: GridTanimi, yil: int, params, kapsam: str) -> Iterator[bytes]:
+    """
+    Parametre hataları (GridHatasi) burada, yanıt başlamadan yükselir;
+    dönen üreteç yalnızca veriyi akıtır. kapsam: kullanıcının il kapsamı.
+    """
+    basliklar, satirlar = _satirlar(tanim, yil, params, kapsam)
+    if bicim == "csv":
+        return csv_akisi(basliklar, satirlar)
+    return xlsx_akisi(basliklar, satirlar, str(tanim.model._meta.verbose_name_plural))
@@ -0,0 +1,216 @@
+"""
+Bu dosya: duzeltme/endeks.py
+--------------------------------
+Tablo1 / kesinti kayıtlarından il + gerilim seviyesi başına kesinti süre ve
+sıklık göstergelerini NumPy ile hesaplar (KesintiEndeksi tablosu).
+
+Göstergeler (uzun kesintiler, süre > KISA_KESINTI_DK):
+- kesinti_sayisi  : uzun kesinti adedi
+- abone_kesinti   : Σ etkilenen abone            (kesintiye uğrayan abone)
+- abone_dakika    : Σ etkilenen abone × süre (dk) (kayıp abone-dakika)
+- toplam_sure_dk, en_uzun_dk
+Kısa kesintiler (≤ 3 dk) yalnızca kisa_kesinti_sayisi'nda sayılır.
+Abone başına ortalama (OKSÜRE / OKSIK) için il'in toplam abone sayısı gerekir;
+o sayı kaynak dosyalarda yok, bölme işi raporu hazırlayana kalır.
+
+Mantık (osos_ozet ile aynı):
+- Satırlar bir kez okunur: il, gerilim, süre, başlama, bitiş, abone -> diziler.
+  sure_dk boşsa süre bitiş - başlama'dan bulunur; ikisi de yoksa satır sayılmaz
+  (suresiz).
+- İl ekseni sabittir: IL_LIST (ARAS hariç, o bütün bölgedir) + "" (listede
+  olmayan / boş il). Gerilim ekseni veriden çıkar (AG, OG, ...).
+- (il, gerilim) hücresi tek bir tam sayı koddur; toplamlar np.bincount, en uzun
+  np.maximum.at ile bulunur. Python'da satır satır döngü yoktur.
+
+Tek il yeniden hesaplanabilir (iller=[...]): bir düzeltmeden sonra yalnızca o
+il'in satırları okunur ve yalnızca o il'in hücreleri silinip yazılır. Tablodaki
+il yazımları ("Kars", " KARS") bütün yıldaki gibi normalleştirilip eşlenir;
+tek il sonucu bütün yıl hesabındaki hücreyle aynıdır.
+"""
+
+from typing import Callable, Iterable, List, Optional
+
+import numpy as np
+from django.db import transaction
+from django.db.models import Q, Value
+from django.db.models.functions import Coalesce
+
+from account.constants import IL_LIST
+
+from .models import Kesinti, KesintiEndeksi, Tablo1Satiri
+from .ozet import endeks_ozetini_yenile
+from .yukleme import parca_yaz
+
+TABLOLAR = {"tablo1": Tablo1Satiri, "kesinti": Kesinti}
+ILLER = [il for il in IL_LIST if il != "ARAS"]
+KISA_KESINTI_DK = 3.0
+_OKUMA_PARCASI = 100_000
+_TR_BUYUK = str.maketrans({"i": "İ", "ı": "I"})
+
+
+def _buyuk(metin: str) -> str:
+    return metin.strip().translate(_TR_BUYUK).upper()
+
+
+def _kodla(metinler: np.ndarray, eksen=None):
+    """
+    Metinleri tam sayı koda çevirir; normalleştirme yalnızca farklı değerler
+    üzerinde yapılır. eksen verilirse kodlar o listenin sırasıdır, listede
+    olmayanlar len(eksen) kodunu alır. Dönüş: (adlar, kodlar).
+    """
+    farkli, ters = np.unique(metinler, return_inverse=True)
+    normal = [_buyuk(m) for m in farkli.tolist()]
+    if eksen is None:
+        adlar, eslem = np.unique(np.array(normal, dtype=str), return_inverse=True)
+        return adlar, eslem[ters]
+    sira = {ad: i for i, ad in enumerate(eksen)}
+    eslem = np.array([sira.get(ad, len(eksen)) for ad in normal], dtype=np.int64)
+    return np.array(list(eksen) + [""], dtype=str), eslem[ters]
+
+
+def il_yazimlari(model, sistem: str, yil: int, iller: Iterable[str]) -> List[str]:
+    """
+    Tablodaki il değerlerinden normal hâli iller'de olanlar ("Kars" -> KARS).
+    Farklı değerler (sistem, yil, il, ...) indeksinden okunur.
+    """
+    iller = set(iller)
+    farkli = (model.objects.filter(sistem=sistem, yil=yil)
+              .order_by().values_list("il", flat=True).distinct())
+    return [il for il in farkli if il is not None and _buyuk(il) in iller]
+
+
+def kolonlari_yukle(model, sistem: str, yil: int, iller: Optional[Iterable[str]] = None,
+                    ilerleme: Optional[Callable[[int], None]] = None) -> dict:
+    """iller: tablodaki ham il değerleri (bkz. il_yazimlari); None ise bütün yıl."""
+    qs = model.objects.filter(sistem=sistem, yil=yil)
+    if iller is not None:
+        qs = qs.filter(il__in=list(iller))
+    metin = (Coalesce("il", Value("")), Coalesce("gerilim_seviyesi", Value("")))
+    parcalar = []
+    # Satırların çoğunda süre dolu: tarih nesnesi üretmeden yalnız dört kolon okunur
+    # (1M satırda okuma ~12 sn'den ~2 sn'ye iner). Süresi boş olanlar ikinci sorguda.
+    sorgular = (
+        (qs.filter(sure_dk__isnull=False).values_list(*metin, "sure_dk", "etkilenen_abone"), False),
+        (qs.filter(sure_dk__isnull=True, baslama__isnull=False, bitis__isnull=False)
+         .values_list(*metin, "baslama", "bitis", "etkilenen_abone"), True),
+    )
+    for sorgu, tarihli in sorgular:
+        parca = []
+        for satir in sorgu.iterator(chunk_size=_OKUMA_PARCASI):
+            parca.append(satir)
+            if len(parca) >= _OKUMA_PARCASI:
+                parcalar.append(_parca_dizileri(parca, tarihli))
+                parca = []
+                if ilerleme is not None:
+                    ilerleme(sum(len(p["sure"]) for p in parcalar))
+        if parca:
+            parcalar.append(_parca_dizileri(parca, tarihli))
+    if not parcalar:
+        return {"il": np.array([], dtype=str), "gerilim": np.array([], dtype=str),
+                "sure": np.array([], dtype=float), "abone": np.array([], dtype=np.int64)}
+    return {ad: np.concatenate([p[ad] for p in parcalar]) for ad in parcalar[0]}
+
+
+def _parca_dizileri(parca, tarihli: bool) -> dict:
+    if tarihli:
+        il, gerilim, bas, bit, abone = zip(*parca)
+        sure = (np.array(bit, dtype="datetime64[s]") - np.array(bas, dtype="datetime64[s]")) / np.timedelta64(1, "m")
+    else:
+        il, gerilim, sure, abone = zip(*parca)
+        sure = np.array(sure, dtype=float)
+    return {
+        "il": np.array(il, dtype=str),
+        "gerilim": np.array(gerilim, dtype=str),
+        "sure": sure,
+        "abone": np.nan_to_num(np.array(abone, dtype=float)).astype(np.int64),  # None -> 0
+    }
+
+
+def hesapla(k: dict) -> dict:
+    """
+    Kolon dizilerinden (il, gerilim) hücrelerinin göstergelerini hesaplar.
+    Dönüş: yalnızca en az bir kesintisi olan hücreler, kolon dizileri hâlinde.
+    """
+    gecerli = ~np.isnan(k["sure"])
+    il_adlari, il_kod = _kodla(k["il"][gecerli], ILLER)
+    gerilim_adlari, gerilim_kod = _kodla(k["gerilim"][gecerli])
+    sure = np.maximum(k["sure"][gecerli], 0.0)
+    abone = k["abone"][gecerli]
+
+    n_gerilim = max(len(gerilim_adlari), 1)
+    n_hucre = len(il_adlari) * n_gerilim
+    hucre = il_kod * n_gerilim + gerilim_kod
+    uzun = sure > KISA_KESINTI_DK
+    h, s, a = hucre[uzun], sure[uzun], abone[uzun]
+
+    kesinti = np.bincount(h, minlength=n_hucre)
+    kisa = np.bincount(hucre[~uzun], minlength=n_hucre)
+    abone_kesinti = np.bincount(h, weights=a, minlength=n_hucre).astype(np.int64)
+    abone_dakika = np.bincount(h, weights=a * s, minlength=n_hucre)
+    toplam_sure = np.bincount(h, weights=s, minlength=n_hucre)
+    en_uzun = np.zeros(n_hucre)
+    np.maximum.at(en_uzun, h, s)
+
+    dolu = np.flatnonzero(kesinti + kisa)
+    return {
+        "il": il_adlari[dolu // n_gerilim],
+        "gerilim_seviyesi": gerilim_adlari[dolu % n_gerilim],
+        "kesinti_sayisi": kesinti[dolu],
+        "kisa_kesinti_sayisi": kisa[dolu],
+        "abone_kesinti": abone_kesinti[dolu],
+        "abone_dakika": np.round(abone_dakika[dolu], 2),
+        "toplam_sure_dk": np.round(toplam_sure[dolu], 2),
+        "en_uzun_dk": np.round(en_uzun[dolu], 2),
+    }
+
+
+_ALANLAR = ("il", "gerilim_seviyesi", "kesinti_sayisi", "kisa_kesinti_sayisi", "abone_kesinti",
+            "abone_dakika", "toplam_sure_dk", "en_uzun_dk")
+
+
+@transaction.atomic
+def endeks_yaz(sistem: str, tablo: str, yil: int, sonuc: dict, iller: Optional[Iterable[str]] = None) -> None:
+    eski = KesintiEndeksi.objects.filter(sistem=sistem, tablo=tablo, yil=yil)
+    if iller is not None:
+        eski = eski.filter(il__in=iller)
+    eski.delete()
+    n = len(sonuc["il"])
+    parca_yaz(KesintiEndeksi, ["sistem", "tablo", "yil", *_ALANLAR],
+               list(zip([sistem] * n, [tablo] * n, [yil] * n, *(sonuc[a].tolist() for a in _ALANLAR))))
+
+
+def endeksleri_hesapla(sistem: str, yil: int, *, tablo: str = "tablo1",
+                       iller: Optional[Iterable[str]] = None,
+                       ilerleme: Optional[Callable[[int], None]] = None) -> dict:
+    """
+    Bir (sistem, yıl) tablosunun göstergelerini baştan hesaplar; iller
+    verilirse yalnızca o illerin hücrelerini (ör. il'e ait bir düzeltmeden sonra).
+
+    Bir satırın il'i düzeltildiyse eski ve yeni il birlikte verilmelidir.
+    Tek tek yalnızca ILLER'deki iller hesaplanabilir; "" hücresi (listede
+    olmayan iller) yalnızca bütün yılla birlikte yenilenir.
+    """
+    if tablo not in TABLOLAR:
+        raise ValueError(f"Bilinmeyen tablo: {tablo}")
+    if iller is not None:
+        iller = sorted({_buyuk(il) for il in iller})
+        bilinmeyen = [il for il in iller if il not in ILLER]
+        if bilinmeyen:
+            raise ValueError(f"IL_LIST'te olmayan il: {', '.join(bilinmeyen)}")
+    model = TABLOLAR[tablo]
+    yazimlar = None if iller is None else il_yazimlari(model, sistem, yil, iller)
+    k = kolonlari_yukle(model, sistem, yil, yazimlar, ilerleme)
+    sonuc = hesapla(k)
+    endeks_yaz(sistem, tablo, yil, sonuc, iller)
+    endeks_ozetini_yenile(sistem, yil, tablo)
+    suresiz = model.objects.filter(sistem=sistem, yil=yil, sure_dk__isnull=True).filter(
+        Q(baslama__isnull=True) | Q(bitis__isnull=True))
+    if iller is not None:
+        suresiz = suresiz.filter(il__in=yazimlar)
+    return {
+        "satir": len(k["sure"]),
+        "suresiz": suresiz.count(),
+        "hucre": len(sonuc["il"]),
+        "il": None if iller is None else len(iller),
+    }
+
@@ -0,0 +1,275 @@
+"""
+Bu dosya: duzeltme/eslestirme.py
+--------------------------------
+Müşteri bildirimlerini (CRM / OMS / Inavitas) kesintilere bağlar.
+
+Mantık (iç içe döngü yok, sıralı dizi + ikili arama):
+1) Bildirimde kesinti_no yazıyorsa ve o numara kesinti listesinde varsa
+   doğrudan bağlanır (np.unique + np.searchsorted).
+2) Diğerleri şebeke unsuru + zaman penceresiyle bağlanır:
+   - Kesintiler (unsur_kodu, baslama) sırasına dizilir.
+   - Her bildirim için "başlaması t + ONCE'den küçük olan en son kesinti"
+     np.searchsorted ile bulunur. O kesinti t - SONRA'dan sonra bitiyorsa eşleşir.
+   - Bitmiyorsa, aynı unsurda daha önce başlayıp daha geç biten (uzun) bir
+     kesinti olabilir: bunun için grup içi "o ana kadarki en geç bitiş"
+     dizisi (np.maximum.accumulate) tutulur.
+   n kesinti, m bildirim için iş O((n + m) log n).
+
+Artımlı çalışma: her (bildirim sistemi, kesinti sistemi, yıl) için girdi
+dosyalarının parmak izi saklanır; yalnızca dosyası değişen kaynak yeniden
+eşleştirilir. degisenler=True ile bu da daraltılır: bir bildirimin sonucu
+yalnızca aynı şebeke unsurundaki ya da aynı kesinti_no'lu kesintilere
+bağlıdır. Bekleyen değişiklik setlerinden (bkz. duzeltme.fark) etkilenen
+bildirimler ve onların unsur / kesinti_no'larındaki kesintiler okunup
+yalnız o bildirimlerin eşleşmesi yeniden yazılır.
+"""
+
+import hashlib
+from datetime import timedelta
+
+import numpy as np
+from django.db import transaction
+from django.db.models import Count, Q
+
+from . import fark
+from .models import Bildirim, BildirimEslesme, EslestirmeCalismasi, Kesinti, YuklenenDosya
+from .ozet import eslestirme_ozetini_yenile
+from .yukleme import parca_yaz
+
+# Bildirim kesintiden biraz önce gelebilir (OMS kaydı geç açılır),
+# kesinti bittikten kısa süre sonra da gelebilir.
+PENCERE_ONCE_DK = 30
+PENCERE_SONRA_DK = 15
+
+# Bildirim sistemi -> hangi sistemin kesintileriyle eşleşir
+KESINTI_KAYNAGI = {
+    "crm": "oms",
+    "oms": "oms",
+    "inavitas": "inavitas",
+}
+
+_GRUP_CARPANI = np.int64(1) << 34  # ~540 yıl saniye; unsur kodu * bu + zaman taşmaz
+
+
+def _epoch(tarihler) -> np.ndarray:
+    return np.array(tarihler, dtype="datetime64[s]").astype(np.int64)
+
+
+def eslestir(k_unsur, k_bas, k_bit, k_no, b_unsur, b_zaman, b_no, *,
+             once_sn: int = PENCERE_ONCE_DK * 60, sonra_sn: int = PENCERE_SONRA_DK * 60):
+    """
+    Dizi tabanlı eşleştirme çekirdeği.
+
+    Girdi: kesinti ve bildirim kolon dizileri (zamanlar epoch saniye).
+    Dönüş: (kesinti_indeksi, yontem) — eşleşmeyen bildirimde indeks -1,
+    yontem 0 (yok) / 1 (kesinti_no) / 2 (zaman).
+    """
+    m = len(b_zaman)
+    secilen = np.full(m, -1, dtype=np.int64)
+    yontem = np.zeros(m, dtype=np.int8)
+    if not len(k_bas) or not m:
+        return secilen, yontem
+
+    # 1) kesinti_no ile doğrudan eşleşme
+    no_sirali, no_ilk = np.unique(k_no, return_index=True)
+    konum = np.clip(np.searchsorted(no_sirali, b_no), 0, len(no_sirali) - 1)
+    no_var = (b_no != "") & (no_sirali[konum] == b_no)
+    secilen[no_var] = no_ilk[konum[no_var]]
+    yontem[no_var] = 1
+
+    # 2) şebeke unsuru + zaman penceresi
+    unsurlar, kod = np.unique(np.concatenate([k_unsur, b_unsur]), return_inverse=True)
+    k_kod, b_kod = kod[:len(k_bas)].astype(np.int64), kod[len(k_bas):].astype(np.int64)
+    bos_kod = np.searchsorted(unsurlar, "")
+    bos_var = bos_kod < len(unsurlar) and unsurlar[bos_kod] == ""
+
+    anahtar = k_kod * _GRUP_CARPANI + k_bas
+    sira = np.argsort(anahtar, kind="stable")
+    anahtar_s, kod_s, bit_s = anahtar[sira], k_kod[sira], k_bit[sira]
+    # Grup içi "şimdiye kadarki en geç bitiş"in indeksi. Kod çarpanı sayesinde
+    # önceki grupların değerleri her zaman küçük kalır; ayrıca sıfırlama gerekmez.
+    bitis_anahtari = kod_s * _GRUP_CARPANI + bit_s
+    birikimli = np.maximum.accumulate(bitis_anahtari)
+    en_gec = np.maximum.accumulate(np.where(bitis_anahtari == birikimli, np.arange(len(sira)), 0))
+
+    aday = np.searchsorted(anahtar_s, b_kod * _GRUP_CARPANI + b_zaman + once_sn, side="right") - 1
+    gecerli = (aday >= 0) & ~no_var
+    if bos_var:
+        gecerli &= b_kod != bos_kod
+    aday = np.maximum(aday, 0)
+
+    son_kapsar = gecerli & (kod_s[aday] == b_kod) & (bit_s[aday] + sonra_sn >= b_zaman)
+    uzun = en_gec[aday]
+    uzun_kapsar = gecerli & ~son_kapsar & (kod_s[uzun] == b_kod) & (bit_s[uzun] + sonra_sn >= b_zaman)
+
+    secilen[son_kapsar] = sira[aday[son_kapsar]]
+    secilen[uzun_kapsar] = sira[uzun[uzun_kapsar]]
+    yontem[son_kapsar | uzun_kapsar] = 2
+    return secilen, yontem
+
+
+def _parmak_izi(bildirim_sistemi: str, kesinti_sistemi: str, yil: int) -> str:
+    dosyalar = (
+        YuklenenDosya.objects
+        .filter(yil=yil, durum=YuklenenDosya.DURUM_TAMAM)
+        .filter(Q(sistem=bildirim_sistemi, hedef_tablo=Bildirim._meta.db_table)
+                | Q(sistem=kesinti_sistemi, hedef_tablo=Kesinti._meta.db_table))
+        .order_by("dosya_adi")
+        .values_list("dosya_adi", "sha256", "bitis")
+    )
+    # bitis: aynı dosya yeniden yüklenince satır id'leri değişir, iz de değişmeli
+    h = hashlib.sha256()
+    for ad, ozet, bitis in dosyalar:
+        h.update(f"{ad}:{ozet}:{bitis.isoformat() if bitis else ''}\n".encode())
+    return h.hexdigest()
+
+
+def _kesintiler(sistem: str, yil: int, kosul: Q = Q()):
+    qs = (
+        Kesinti.objects
+        .filter(kosul, sistem=sistem, yil=yil, baslama__isnull=False)
+        .order_by("id")  # eşit adaylarda seçim sırası tam ve artımlı hesapta aynı olsun
+        .values_list("id", "sebeke_unsuru", "kesinti_no", "baslama", "bitis", "sure_dk")
+    )
+    satirlar = []
+    for id_, unsur, no, bas, bit, sure in qs.iterator(chunk_size=50_000):
+        if bit is None:
+            bit = bas + timedelta(minutes=sure or 0)
+        satirlar.append((id_, unsur, no, bas, bit))
+    if not satirlar:
+        bos = np.array([], dtype=np.int64)
+        return bos, np.array([], dtype=str), np.array([], dtype=str), bos, bos
+    idler, unsur, no, bas, bit = zip(*satirlar)
+    return (np.array(idler, dtype=np.int64), np.array(unsur, dtype=str), np.array(no, dtype=str),
+            _epoch(bas), _epoch(bit))
+
+
+def _bildirimler(sistem: str, yil: int, kosul: Q = Q()):
+    qs = (
+        Bildirim.objects
+        .filter(kosul, sistem=sistem, yil=yil, bildirim_zamani__isnull=False)
+        .values_list("id", "sebeke_unsuru", "kesinti_no", "bildirim_zamani", "il")
+    )
+    satirlar = list(qs.iterator(chunk_size=50_000))
+    if not satirlar:
+        bos = np.array([], dtype=np.int64)
+        return bos, np.array([], dtype=str), np.array([], dtype=str), bos, np.array([], dtype=str)
+    idler, unsur, no, zaman, il = zip(*satirlar)
+    return (np.array(idler, dtype=np.int64), np.array(unsur, dtype=str), np.array(no, dtype=str),
+            _epoch(zaman), np.array(il, dtype=str))
+
+
+_IN_PARCASI = 2000  # IN (...) listesi başına değer
+
+
+def _in_kosullari(**alanlar) -> list:
+    """alan=değerler -> her biri en çok _IN_PARCASI değerli Q listesi (boş değerler atılır)."""
+    kosullar = []
+    for alan, degerler in alanlar.items():
+        degerler = sorted(v for v in degerler if v not in ("", None))
+        for i in range(0, len(degerler), _IN_PARCASI):
+            kosullar.append(Q(**{f"{alan}__in": degerler[i:i + _IN_PARCASI]}))
+    return kosullar
+
+
+def _parcali_oku(oku, sistem: str, yil: int, kosullar: list):
+    """oku()'yu her koşul için ayrı çalıştırıp kolonları birleştirir; id'ye göre tekilleştirir."""
+    parcalar = [oku(sistem, yil, q) for q in kosullar] or [oku(sistem, yil, Q(pk__in=[]))]
+    kolonlar = [np.concatenate(kolon) for kolon in zip(*parcalar)]
+    _, ilk = np.unique(kolonlar[0], return_index=True)
+    return tuple(kolon[ilk] for kolon in kolonlar)
+
+
+def _etkilenen_bildirimler(kesinti_setleri, bildirim_setleri):
+    """
+    (bildirim koşulları, eşleşmesi silinecek bildirim id'leri) ya da tam hesap
+    gerekiyorsa None. Etkilenen bildirim: kendisi değişen, ya da unsuru /
+    kesinti_no'su değişen bir kesintiyle aynı olan.
+    """
+    k = fark.etkilenenler(kesinti_setleri)
+    b = fark.etkilenenler(bildirim_setleri)
+    if k.tam or b.tam:
+        return None
+    kosullar = _in_kosullari(id=b.satirlar, sebeke_unsuru=k.varliklar, kesinti_no=k.anahtarlar)
+    return kosullar, b.satirlar | b.silinenler
+
+
+@transaction.atomic
+def kaynagi_eslestir(bildirim_sistemi: str, yil: int, *, kesinti_sistemi: str = None,
+                     zorla: bool = False, degisenler: bool = False) -> dict:
+    """
+    Tek bir bildirim kaynağını eşleştirip BildirimEslesme'ye yazar.
+    Girdi dosyaları değişmediyse (ve zorla=False) hiçbir şey yapmaz.
+    degisenler=True: önceki tam eşleştirmenin üstüne yalnız değişiklik
+    setlerinden etkilenen bildirimler yeniden eşleştirilir ("kapsam" sayısı).
+    """
+    kesinti_sistemi = kesinti_sistemi or KESINTI_KAYNAGI.get(bildirim_sistemi, bildirim_sistemi)
+    tuketici = f"eslestirme:{bildirim_sistemi}"
+    setler = (fark.bekleyen_setler(Kesinti, kesinti_sistemi, yil, tuketici),
+              fark.bekleyen_setler(Bildirim, bildirim_sistemi, yil, tuketici))
+    iz = _parmak_izi(bildirim_sistemi, kesinti_sistemi, yil)
+    calisma, _ = EslestirmeCalismasi.objects.select_for_update().get_or_create(
+        bildirim_sistemi=bildirim_sistemi, kesinti_sistemi=kesinti_sistemi, yil=yil,
+        defaults={"parmak_izi": ""},
+    )
+    if calisma.parmak_izi == iz and not zorla:
+        return {"atlandi": True, "bildirim": calisma.bildirim_sayisi,
+                "eslesen": calisma.eslesen, "eslesmeyen": calisma.eslesmeyen, "kapsam": None}
+
+    kapsam = _etkilenen_bildirimler(*setler) if degisenler and calisma.parmak_izi and not zorla else None
+    eslesmeler = BildirimEslesme.objects.filter(bildirim_sistemi=bildirim_sistemi, yil=yil)
+    if kapsam is None:
+        k_id, k_unsur, k_no, k_bas, k_bit = _kesintiler(kesinti_sistemi, yil)
+        b_id, b_unsur, b_no, b_zaman, b_il = _bildirimler(bildirim_sistemi, yil)
+        eslesmeler.delete()
+    else:
+        b_kosullari, silinecek = kapsam
+        b_id, b_unsur, b_no, b_zaman, b_il = _parcali_oku(_bildirimler, bildirim_sistemi, yil, b_kosullari)
+        k_id, k_unsur, k_no, k_bas, k_bit = _parcali_oku(
+            _kesintiler, kesinti_sistemi, yil,
+            _in_kosullari(sebeke_unsuru=set(b_unsur.tolist()), kesinti_no=set(b_no.tolist())))
+        for q in _in_kosullari(bildirim_id=silinecek | set(b_id.tolist())):
+            eslesmeler.filter(q).delete()
+    secilen, yontem = eslestir(k_unsur, k_bas, k_bit, k_no, b_unsur, b_zaman, b_no)
+
+    eslesti = secilen >= 0
+    if len(k_id):
+        kesinti_idler = k_id[np.maximum(secilen, 0)]
+        fark_dk = (b_zaman - k_bas[np.maximum(secilen, 0)]) / 60
+    else:
+        kesinti_idler = fark_dk = np.zeros(len(b_id))
+    yontem_adi = np.array(["", BildirimEslesme.YONTEM_KESINTI_NO, BildirimEslesme.YONTEM_ZAMAN])[yontem]
+
+    alanlar = ["bildirim_sistemi", "kesinti_sistemi", "yil", "bildirim", "il", "kesinti", "yontem", "fark_dk"]
+    satirlar = [
+        (bildirim_sistemi, kesinti_sistemi, yil, bid, il, kid if var else None, ad, dk if var else None)
+        for bid, il, kid, var, ad, dk in zip(b_id.tolist(), b_il.tolist(), kesinti_idler.tolist(),
+                                             eslesti.tolist(), yontem_adi.tolist(), fark_dk.tolist())
+    ]
+    for i in range(0, len(satirlar), 10_000):
+        parca_yaz(BildirimEslesme, alanlar, satirlar[i:i + 10_000])
+
+    calisma.parmak_izi = iz
+    if kapsam is None:
+        calisma.bildirim_sayisi = len(b_id)
+        calisma.eslesen = int(eslesti.sum())
+    else:
+        toplam = eslesmeler.aggregate(bildirim=Count("id"), eslesen=Count("kesinti"))
+        calisma.bildirim_sayisi, calisma.eslesen = toplam["bildirim"], toplam["eslesen"]
+    calisma.eslesmeyen = calisma.bildirim_sayisi - calisma.eslesen
+    calisma.save()
+    fark.islendi_isaretle(setler[0] + setler[1], tuketici)
+    eslestirme_ozetini_yenile(bildirim_sistemi, yil, {
+        "bildirim": calisma.bildirim_sayisi, "eslesen": calisma.eslesen, "eslesmeyen": calisma.eslesmeyen})
+    return {"atlandi": False, "bildirim": calisma.bildirim_sayisi,
+            "eslesen": calisma.eslesen, "eslesmeyen": calisma.eslesmeyen,
+            "kapsam": None if kapsam is None else len(b_id)}
+
+
+def eslestirmeleri_hesapla(yil: int, kaynaklar=None, *, zorla: bool = False,
+                           degisenler: bool = False) -> dict:
+    """Bütün (ya da verilen) bildirim kaynaklarını eşleştirir; kaynak -> sonuç."""
+    return {
+        kaynak: kaynagi_eslestir(kaynak, yil, zorla=zorla, degisenler=degisenler)
+        for kaynak in (kaynaklar or KESINTI_KAYNAGI)
+    }
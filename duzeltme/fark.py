@@ -0,0 +1,234 @@
+"""
+Bu dosya: duzeltme/fark.py
+--------------------------------
+Bir dosyanın yeni sürümü (..._v02) eskisinin (..._v01) yerine geçerken
+yalnızca farkı uygular ve farkı bir değişiklik seti olarak kaydeder.
+
+Mantık:
+- Yükleyici her satır için iki 64 bitlik özet yazar (satir_ozetleri):
+    anahtar_ozeti : doğal anahtar (DOGAL_ANAHTAR); anahtar boşsa satırın tamamı
+    satir_ozeti   : satırdaki bütün değerler
+- Yeni sürüm önce kendi dosya kaydıyla olduğu gibi yüklenir. Sonra iki sürümün
+  satırları anahtar_ozeti (+ aynı anahtarın dosyadaki kaçıncı tekrarı) ile
+  tek bir SQL birleştirmesinde eşlenir:
+    eşleşen, özet aynı       -> değişmedi : eski satır yeni dosyaya taşınır
+    eşleşen, özet farklı     -> güncellendi: eski satıra yeni değerler yazılır
+    yalnız yeni sürümde      -> eklendi    : yeni satır kalır
+    yalnız eski sürümde      -> silindi    : eski satır silinir
+  Eşleşen satırların id'si değişmez; çakışma ve eşleştirme sonuçları
+  geçerliliğini korur.
+- Fark DegisiklikSeti + DegisenSatir'a yazılır. Çakışma / eşleştirme
+  hesapları bekleyen setlerden etkilenen varlıkları (şebeke unsuru, modem)
+  ve anahtarları (kesinti_no) alıp yalnız onları yeniden hesaplar.
+
+Önceki sürümü olmayan (yeni parça / ay) ya da yeniden=True ile baştan yüklenen
+dosya için de tam_degisim seti yazılır; satır id'leri değiştiğinden tüketiciler
+baştan hesaplar.
+
+Eski sürüm satırlarının özeti yoksa (bu özellikten önce yüklenmiş) fark
+çıkarılamaz: eski satırlar silinir, set tam_degisim olarak işaretlenir ve
+tüketiciler baştan hesaplar.
+"""
+
+import hashlib
+import struct
+from typing import Iterable, List, NamedTuple, Optional, Set
+
+from django.db import connection
+
+from .bolumleme import bolum_istatistigi_yenile
+from .models import Bildirim, DegisenSatir, DegisiklikSeti, Kesinti, OsosKesinti, Tablo1Satiri, YuklenenDosya
+
+# model -> doğal anahtar kolonları (ilki DegisenSatir.anahtar'a yazılır)
+DOGAL_ANAHTAR = {
+    Kesinti: ("kesinti_no",),
+    Tablo1Satiri: ("kesinti_no",),
+    Bildirim: ("bildirim_no",),
+    OsosKesinti: ("modem_no", "baslama"),
+}
+# model -> etkilenen hesaplamaların gruplandığı varlık kolonu
+VARLIK = {
+    Kesinti: "sebeke_unsuru",
+    Tablo1Satiri: "sebeke_unsuru",
+    Bildirim: "sebeke_unsuru",
+    OsosKesinti: "modem_no",
+}
+
+
+_INT64 = struct.Struct(">q").unpack
+
+
+def _ozet(deger) -> int:
+    return _INT64(hashlib.blake2b(repr(deger).encode(), digest_size=8).digest())[0]
+
+
+def satir_ozetleri(kolonlar, anahtar_indeksleri, degerler: tuple) -> tuple:
+    """(anahtar_ozeti, satir_ozeti). Anahtar kolonları boşsa anahtar satırın kendisidir."""
+    satir = _ozet(degerler)
+    anahtar = tuple(degerler[i] for i in anahtar_indeksleri)
+    if all(v in (None, "") for v in anahtar):
+        return satir, satir
+    return _ozet(anahtar), satir
+
+
+def anahtar_indeksleri(model, kolonlar) -> tuple:
+    return tuple(list(kolonlar).index(k) for k in DOGAL_ANAHTAR[model] if k in kolonlar)
+
+
+def onceki_surum(kayit: YuklenenDosya) -> Optional[YuklenenDosya]:
+    """Aynı sistem/kategori/yıl/ay/parçanın bu dosyadan önceki, yüklü son sürümü."""
+    adaylar = (
+        YuklenenDosya.objects
+        .filter(sistem=kayit.sistem, kategori=kayit.kategori, yil=kayit.yil, ay=kayit.ay,
+                part=kayit.part, durum=YuklenenDosya.DURUM_TAMAM)
+        .exclude(pk=kayit.pk)
+        .order_by("-versiyon", "-cekim_tarihi")
+    )
+    for aday in adaylar:
+        if (aday.versiyon, aday.cekim_tarihi) < (kayit.versiyon, kayit.cekim_tarihi):
+            return aday
+    return None
+
+
+def sonraki_surum_var_mi(kayit: YuklenenDosya) -> bool:
+    return any(
+        (v, c) > (kayit.versiyon, kayit.cekim_tarihi)
+        for v, c in YuklenenDosya.objects
+        .filter(sistem=kayit.sistem, kategori=kayit.kategori, yil=kayit.yil, ay=kayit.ay,
+                part=kayit.part, durum=YuklenenDosya.DURUM_TAMAM)
+        .exclude(pk=kayit.pk).values_list("versiyon", "cekim_tarihi")
+    )
+
+
+def tam_set_kaydet(model, yeni: YuklenenDosya) -> DegisiklikSeti:
+    """Önceki sürümü olmayan yüklemenin seti: bütün satırlar eklendi, tüketiciler baştan hesaplar."""
+    return DegisiklikSeti.objects.create(
+        sistem=yeni.sistem, kategori=yeni.kategori, yil=yeni.yil, hedef_tablo=model._meta.db_table,
+        yeni_dosya=yeni, tam_degisim=True,
+        eklenen=model.objects.filter(sistem=yeni.sistem, yil=yeni.yil, dosya_id=yeni.pk).count())
+
+
+def farki_uygula(model, eski: YuklenenDosya, yeni: YuklenenDosya) -> DegisiklikSeti:
+    """
+    Yeni sürümün satırları yüklendikten sonra çağrılır (çağıranın transaction'ında).
+    Eski dosyanın satırları ya yeni dosyaya taşınır ya da silinir.
+    """
+    qn = connection.ops.quote_name
+    tablo = qn(model._meta.db_table)
+    kosul = f"{qn('sistem')} = %s AND {qn('yil')} = %s AND {qn('dosya_id')} = %s"
+    eski_p, yeni_p = [eski.sistem, eski.yil, eski.pk], [yeni.sistem, yeni.yil, yeni.pk]
+    toplam_eski = model.objects.filter(sistem=eski.sistem, yil=eski.yil, dosya_id=eski.pk).count()
+    seti = DegisiklikSeti.objects.create(
+        sistem=yeni.sistem, kategori=yeni.kategori, yil=yeni.yil, hedef_tablo=model._meta.db_table,
+        eski_dosya=eski, yeni_dosya=yeni)
+
+    with connection.cursor() as cursor:
+        ozetsiz = model.objects.filter(sistem=eski.sistem, yil=eski.yil, dosya_id=eski.pk,
+                                       anahtar_ozeti__isnull=True).exists()
+        if ozetsiz:
+            cursor.execute(f"DELETE FROM {tablo} WHERE {kosul}", eski_p)
+            seti.tam_degisim = True
+            seti.silinen = toplam_eski
+            seti.eklenen = model.objects.filter(sistem=yeni.sistem, yil=yeni.yil, dosya_id=yeni.pk).count()
+            seti.save()
+            return seti
+
+        # İki sürüm aynı yaprakta; istatistiksiz yaprakta birleştirme iç içe döngüye düşer
+        bolum_istatistigi_yenile(model, yeni.yil, yeni.sistem)
+        varlik, anahtar = qn(VARLIK[model]), qn(DOGAL_ANAHTAR[model][0])
+        sira = f"ROW_NUMBER() OVER (PARTITION BY {qn('anahtar_ozeti')} ORDER BY {qn('satir_no')})"
+        cursor.execute("DROP TABLE IF EXISTS fark_eslesme")
+        cursor.execute(
+            f"CREATE TEMPORARY TABLE fark_eslesme AS "
+            f"SELECT e.id AS eski_id, y.id AS yeni_id, y.satir_no AS yeni_satir_no, "
+            f"CASE WHEN e.satir_ozeti = y.satir_ozeti THEN 0 ELSE 1 END AS degisti, e.varlik AS eski_varlik "
+            f"FROM (SELECT id, anahtar_ozeti, satir_ozeti, {varlik} AS varlik, {sira} AS sira "
+            f"      FROM {tablo} WHERE {kosul}) e "
+            f"JOIN (SELECT id, satir_no, anahtar_ozeti, satir_ozeti, {sira} AS sira "
+            f"      FROM {tablo} WHERE {kosul}) y "
+            f"ON e.anahtar_ozeti = y.anahtar_ozeti AND e.sira = y.sira",
+            eski_p + yeni_p)
+        cursor.execute("CREATE INDEX fark_eslesme_eski ON fark_eslesme (eski_id)")
+        cursor.execute("CREATE INDEX fark_eslesme_yeni ON fark_eslesme (yeni_id)")
+
+        # 1) Değişiklik satırları (silinenlerin varlığı silmeden önce okunur)
+        ekle = (f"INSERT INTO {qn(DegisenSatir._meta.db_table)} "
+                f"(degisiklik_id, tur, satir_id, anahtar, varlik, eski_varlik) ")
+        cursor.execute(
+            ekle + f"SELECT %s, %s, f.eski_id, y.{anahtar}, y.{varlik}, f.eski_varlik "
+                   f"FROM fark_eslesme f JOIN {tablo} y ON y.id = f.yeni_id WHERE f.degisti = 1",
+            [seti.pk, DegisenSatir.TUR_GUNCELLENDI])
+        cursor.execute(
+            ekle + f"SELECT %s, %s, id, {anahtar}, {varlik}, '' FROM {tablo} "
+                   f"WHERE {kosul} AND id NOT IN (SELECT yeni_id FROM fark_eslesme)",
+            [seti.pk, DegisenSatir.TUR_EKLENDI] + yeni_p)
+        cursor.execute(
+            ekle + f"SELECT %s, %s, id, {anahtar}, {varlik}, '' FROM {tablo} "
+                   f"WHERE {kosul} AND id NOT IN (SELECT eski_id FROM fark_eslesme)",
+            [seti.pk, DegisenSatir.TUR_SILINDI] + eski_p)
+
+        # 2) Güncellenen satırlara yeni değerler (id korunur)
+        kolonlar = [f.column for f in model._meta.concrete_fields
+                    if f.column not in ("id", "dosya_id", "satir_no", "sistem", "yil")]
+        atama = ", ".join(f"{qn(k)} = y.{qn(k)}" for k in kolonlar)
+        cursor.execute(
+            f"UPDATE {tablo} SET {atama} FROM fark_eslesme f, {tablo} y "
+            f"WHERE {tablo}.id = f.eski_id AND y.id = f.yeni_id AND f.degisti = 1 "
+            f"AND {tablo}.{qn('sistem')} = %s AND {tablo}.{qn('yil')} = %s "
+            f"AND y.{qn('sistem')} = %s AND y.{qn('yil')} = %s",
+            [eski.sistem, eski.yil, yeni.sistem, yeni.yil])
+        # 3) Eşleşen yeni satırlar gereksiz; eski satırlar yeni dosyaya taşınır
+        cursor.execute(f"DELETE FROM {tablo} WHERE {kosul} AND id IN (SELECT yeni_id FROM fark_eslesme)",
+                       yeni_p)
+        cursor.execute(
+            f"UPDATE {tablo} SET {qn('dosya_id')} = %s, {qn('satir_no')} = f.yeni_satir_no "
+            f"FROM fark_eslesme f WHERE {tablo}.id = f.eski_id "
+            f"AND {tablo}.{qn('sistem')} = %s AND {tablo}.{qn('yil')} = %s",
+            [yeni.pk, eski.sistem, eski.yil])
+        # 4) Eski dosyada kalanlar yeni sürümde yok
+        cursor.execute(f"DELETE FROM {tablo} WHERE {kosul}", eski_p)
+
+        cursor.execute("SELECT COUNT(*), COALESCE(SUM(degisti), 0) FROM fark_eslesme")
+        eslesen, degisen = cursor.fetchone()
+        cursor.execute("DROP TABLE fark_eslesme")
+
+    seti.guncellenen = degisen
+    seti.ayni = eslesen - degisen
+    seti.silinen = toplam_eski - eslesen
+    seti.eklenen = model.objects.filter(sistem=yeni.sistem, yil=yeni.yil, dosya_id=yeni.pk).count() - eslesen
+    seti.save()
+    return seti
+
+
+# ---- Tüketiciler (çakışma, eşleştirme) ----
+class Etkilenen(NamedTuple):
+    tam: bool                 # en az bir set tam_degisim: baştan hesapla
+    varliklar: Set[str]       # eski ve yeni şebeke unsuru / modem
+    anahtarlar: Set[str]      # eski ve yeni kesinti_no / bildirim_no
+    satirlar: Set[int]        # eklenen + güncellenen satır id'leri
+    silinenler: Set[int]      # silinen satır id'leri
+
+
+def bekleyen_setler(model, sistem: str, yil: int, tuketici: str) -> List[DegisiklikSeti]:
+    setler = DegisiklikSeti.objects.filter(hedef_tablo=model._meta.db_table, sistem=sistem, yil=yil)
+    return [s for s in setler if tuketici not in s.islenenler]
+
+
+def etkilenenler(setler: Iterable[DegisiklikSeti]) -> Etkilenen:
+    setler = list(setler)
+    sonuc = Etkilenen(any(s.tam_degisim for s in setler), set(), set(), set(), set())
+    satirlar = (DegisenSatir.objects.filter(degisiklik__in=[s.pk for s in setler])
+                .values_list("tur", "satir_id", "anahtar", "varlik", "eski_varlik"))
+    for tur, satir_id, anahtar, varlik, eski_varlik in satirlar.iterator(chunk_size=20_000):
+        sonuc.varliklar.update(v for v in (varlik, eski_varlik) if v)
+        if anahtar:
+            sonuc.anahtarlar.add(anahtar)
+        (sonuc.silinenler if tur == DegisenSatir.TUR_SILINDI else sonuc.satirlar).add(satir_id)
+    return sonuc
+
+
+def islendi_isaretle(setler: Iterable[DegisiklikSeti], tuketici: str) -> None:
+    for s in setler:
+        if tuketici not in s.islenenler:
+            s.islenenler = [*s.islenenler, tuketici]
+            s.save(update_fields=["islenenler"])
@@ -0,0 +1,311 @@
+"""
+Bu dosya: duzeltme/gorevler.py
+--------------------------------
+Uzun işler için veritabanı tabanlı görev kuyruğu.
+
+Yükleme, çakışma, eşleştirme, endeks ve özet hesapları dakikalar sürebilir: istek
+içinde çalışınca gunicorn'un 120 sn timeout'una takılır, cron'dan çalışınca
+da ilerlemeyi kimse göremez. Bunun yerine:
+
+- gorev_ekle() Gorev tablosuna "bekliyor" kaydı yazar (özet sayfası, gorev_ekle
+  komutu ya da cron).
+- gorev_isci komutu (systemd: gorev_isci_v1) bekleyenleri sırayla alır ve süreç
+  havuzunda gorevi_calistir() ile çalıştırır. Aynı yılın görevleri sırayla,
+  farklı yılların görevleri paralel çalışır (yükleme -> çakışma -> eşleştirme
+  sırası korunur). Yılı belirsiz görev tek başına çalışır.
+- Görev fonksiyonu Ilerleme'ye işlenen satır / yüzde / mesaj bildirir. Bildirim
+  ayrı bir veritabanı bağlantısından, en çok saniyede bir yazılır; görevin kendi
+  transaction'ı (ör. atomic cakismalari_hesapla) bitmeden de görünür.
+- Özet sayfası son görevleri gorev_durumu uç noktasından yoklar (bkz. views.py).
+
+Yeni görev türü: GOREVLER'e tur -> GorevTanimi(etiket, fonksiyon, web) eklenir;
+fonksiyon(parametreler, ilerleme) JSON'a yazılabilir bir dict döner.
+"""
+
+import logging
+import time
+from pathlib import Path
+from typing import Callable, Dict, NamedTuple, Optional
+
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connection, connections
+from django.db.models import Q
+from django.utils import timezone
+
+from .cakisma import cakismalari_hesapla
+from .endeks import TABLOLAR, endeksleri_hesapla
+from .eslestirme import KESINTI_KAYNAGI, kaynagi_eslestir
+from .kaynaklar import dosya_adi_coz
+from .models import Gorev, Kesinti, OzetSayaci
+from .osos_ozet import osos_ozet_hesapla
+from .ozet import hepsini_yenile
+from .paralel_yukleme import paralel_yukle, varsayilan_isci_sayisi
+from .yukleme import PARCA_BOYUTU, dosyalari_bul
+
+logger = logging.getLogger("omsweb.gorev")
+
+
+class GorevHatasi(Exception):
+    pass
+
+
+class Ilerleme:
+    """
+    Görevin ilerleme bildirimi. Çağırmak ucuzdur; veritabanına en çok `aralik`
+    saniyede bir (ya da zorla=True ile hemen) yazılır.
+    """
+
+    def __init__(self, gorev_id: int, aralik: float = 1.0):
+        self.gorev_id = gorev_id
+        self.aralik = aralik
+        self.islenen = 0
+        self.yuzde = 0.0
+        self.mesaj = ""
+        self._t0 = time.monotonic()
+        self._son = 0.0
+        self._baglanti = None
+
+    def __call__(self, islenen: Optional[int] = None, *, yuzde: Optional[float] = None,
+                 mesaj: Optional[str] = None, zorla: bool = False) -> None:
+        if islenen is not None:
+            self.islenen = islenen
+        if yuzde is not None:
+            self.yuzde = min(100.0, max(0.0, yuzde))
+        if mesaj is not None:
+            self.mesaj = mesaj[:255]
+        simdi = time.monotonic()
+        if zorla or simdi - self._son >= self.aralik:
+            self._son = simdi
+            self._yaz()
+
+    @property
+    def satir_sn(self) -> Optional[float]:
+        gecen = time.monotonic() - self._t0
+        return round(self.islenen / gecen, 1) if self.islenen and gecen > 0 else None
+
+    def _yaz(self) -> None:
+        # SQLite tek yazıcılı: görevin açık transaction'ı varken ikinci bağlantı
+        # kilitte bekler. Orada ilerleme transaction dışına ertelenir.
+        if connection.vendor == "sqlite" and connection.in_atomic_block:
+            return
+        if self._baglanti is None:
+            self._baglanti = connections.create_connection(DEFAULT_DB_ALIAS)
+        b = self._baglanti
+        qn = b.ops.quote_name
+        try:
+            with b.cursor() as cursor:
+                cursor.execute(
+                    f"UPDATE {qn(Gorev._meta.db_table)} SET {qn('islenen')} = %s, {qn('yuzde')} = %s, "
+                    f"{qn('satir_sn')} = %s, {qn('mesaj')} = %s, {qn('guncelleme')} = %s WHERE id = %s",
+                    [self.islenen, self.yuzde, self.satir_sn, self.mesaj,
+                     b.ops.adapt_datetimefield_value(timezone.now()), self.gorev_id])
+        except DatabaseError:
+            logger.warning("Görev %s: ilerleme yazılamadı", self.gorev_id, exc_info=True)
+
+    def kapat(self) -> None:
+        if self._baglanti is not None:
+            self._baglanti.close()
+            self._baglanti = None
+
+
+# ---- Görev türleri ----
+def _yukleme(p: dict, ilerleme: Ilerleme) -> dict:
+    dosyalar = [y for y in dosyalari_bul(p["yollar"]) if dosya_adi_coz(y.name) is not None]
+    if not dosyalar:
+        raise GorevHatasi("Yüklenecek xlsx/csv dosyası bulunamadı.")
+    boyutlar = {yol.name: yol.stat().st_size for yol in dosyalar}
+    csvler = {yol.name for yol in dosyalar if yol.suffix.lower() == ".csv"}
+    toplam_bayt = sum(boyutlar.values()) or 1
+    # Süren dosyaların son bildirimi: ad -> (satır, bayt); biten dosyalar buradan düşer
+    surenler: Dict[str, tuple] = {}
+    biten_bayt = satir = 0
+    sonuc = {"dosya": len(dosyalar), "yuklenen": 0, "atlanan": 0, "satir": 0, "hatalar": []}
+
+    def bildir(ad: str, zorla: bool = False) -> None:
+        bayt = biten_bayt + sum(b for a, (_, b) in surenler.items() if a in csvler)
+        ilerleme(satir + sum(s for s, _ in surenler.values()), yuzde=100 * bayt / toplam_bayt,
+                 mesaj=f"{sonuc['yuklenen'] + sonuc['atlanan'] + len(sonuc['hatalar'])}/{len(dosyalar)} {ad}",
+                 zorla=zorla)
+
+    def dosya_ilerlemesi(ad: str, dosya_satiri: int, bayt: int) -> None:
+        if ad in boyutlar:
+            surenler[ad] = (dosya_satiri, bayt)
+            bildir(ad)
+
+    ilerleme(0, yuzde=0, mesaj=f"0/{len(dosyalar)}", zorla=True)
+    # v01 -> v02 farkı için sürümler katman katman, katman içi paralel (bkz. paralel_yukleme)
+    for s in paralel_yukle(dosyalar, isci_sayisi=p.get("isci_sayisi") or varsayilan_isci_sayisi(),
+                           parca_boyutu=PARCA_BOYUTU, yeniden=p.get("yeniden", False),
+                           ilerleme=dosya_ilerlemesi, sinyalleri_yoksay=True):
+        ad = s["dosya"]
+        surenler.pop(ad, None)
+        biten_bayt += boyutlar.pop(ad, 0)
+        if s.get("hata"):  # bir dosyanın hatası diğerlerini durdurmasın
+            sonuc["hatalar"].append(f"{ad}: {s['hata']}")
+        elif s["atlandi"]:
+            sonuc["atlanan"] += 1
+        else:
+            sonuc["yuklenen"] += 1
+            satir += s["satir"] - s["devam"]
+        bildir(ad, zorla=True)
+
+    sonuc["satir"] = satir
+    ilerleme(satir, yuzde=100)
+    if sonuc["hatalar"]:
+        raise GorevHatasi(f"{len(sonuc['hatalar'])} dosya yüklenemedi: " + "; ".join(sonuc["hatalar"]))
+    return sonuc
+
+
+def _cakisma(p: dict, ilerleme: Ilerleme) -> dict:
+    sistem, yil = p["sistem"], p["yil"]
+    toplam = Kesinti.objects.filter(sistem=sistem, yil=yil).count()
+    ilerleme(mesaj=f"{sistem} {yil} çakışmaları", zorla=True)
+    return cakismalari_hesapla(
+        sistem, yil, degisenler=p.get("degisenler", False),
+        ilerleme=lambda n: ilerleme(n, yuzde=100 * n / toplam if toplam else None))
+
+
+def _eslestirme(p: dict, ilerleme: Ilerleme) -> dict:
+    yil = p["yil"]
+    kaynaklar = p.get("kaynaklar") or list(KESINTI_KAYNAGI)
+    sonuc, islenen = {}, 0
+    for sira, kaynak in enumerate(kaynaklar):
+        ilerleme(islenen, yuzde=100 * sira / len(kaynaklar), mesaj=f"{kaynak} {yil} bildirimleri", zorla=True)
+        sonuc[kaynak] = kaynagi_eslestir(kaynak, yil, zorla=p.get("zorla", False),
+                                         degisenler=p.get("degisenler", False))
+        s = sonuc[kaynak]
+        if not s["atlandi"]:
+            islenen += s["bildirim"] if s["kapsam"] is None else s["kapsam"]
+    ilerleme(islenen, yuzde=100)
+    return sonuc
+
+
+def _endeks(p: dict, ilerleme: Ilerleme) -> dict:
+    sistem, yil, tablo = p["sistem"], p["yil"], p.get("tablo", "tablo1")
+    iller = p.get("iller") or None
+    toplam = TABLOLAR[tablo].objects.filter(sistem=sistem, yil=yil).count()
+    kapsam = f" ({', '.join(iller)})" if iller else ""
+    ilerleme(mesaj=f"{sistem} {tablo} {yil} endeksleri{kapsam}", zorla=True)
+    sonuc = endeksleri_hesapla(
+        sistem, yil, tablo=tablo, iller=iller,
+        ilerleme=lambda n: ilerleme(n, yuzde=100 * n / toplam if toplam and not iller else None))
+    ilerleme(sonuc["satir"], yuzde=100)
+    return sonuc
+
+
+def _osos_ozet(p: dict, ilerleme: Ilerleme) -> dict:
+    ilerleme(mesaj=f"OSOS {p['yil']} özetleri", zorla=True)
+    sonuc = osos_ozet_hesapla(p["yil"])
+    ilerleme(sonuc["kesinti"], yuzde=100)
+    return sonuc
+
+
+def _ozet_yenile(p: dict, ilerleme: Ilerleme) -> dict:
+    ilerleme(mesaj=f"{p['yil']} özet sayaçları", zorla=True)
+    hepsini_yenile(p["yil"])
+    return {"sayac": OzetSayaci.objects.filter(yil=p["yil"]).count()}
+
+
+class GorevTanimi(NamedTuple):
+    etiket: str
+    fonksiyon: Callable[[dict, Ilerleme], dict]
+    web: bool          # özet sayfasından başlatılabilir mi
+
+
+GOREVLER: Dict[str, GorevTanimi] = {
+    "yukleme": GorevTanimi("Ham veri yükleme", _yukleme, False),
+    "cakisma": GorevTanimi("Çakışma hesabı", _cakisma, True),
+    "eslestirme": GorevTanimi("Bildirim eşleştirme", _eslestirme, True),
+    "endeks": GorevTanimi("Kesinti endeksleri", _endeks, True),
+    "osos_ozet": GorevTanimi("OSOS özeti", _osos_ozet, True),
+    "ozet_yenile": GorevTanimi("Özet sayaçları", _ozet_yenile, True),
+}
+
+
+# ---- Kuyruk ----
+def gorev_ekle(tur: str, *, yil: Optional[int] = None, kullanici=None, **parametreler) -> Gorev:
+    """
+    Görevi kuyruğa ekler. Aynı tür ve parametrelerle bekleyen görev varsa
+    yenisi eklenmez, o döner (art arda tıklamalar kuyruğu şişirmesin).
+    """
+    if tur not in GOREVLER:
+        raise GorevHatasi(f"Bilinmeyen görev türü: {tur}")
+    if yil is not None:
+        parametreler["yil"] = yil
+    if "yollar" in parametreler:
+        # İşçinin çalışma klasörü farklı olabilir
+        parametreler["yollar"] = [str(Path(y).resolve()) for y in parametreler["yollar"]]
+    for bekleyen in Gorev.objects.filter(tur=tur, yil=yil, durum=Gorev.DURUM_BEKLIYOR):
+        if bekleyen.parametreler == parametreler:
+            return bekleyen
+    return Gorev.objects.create(tur=tur, yil=yil, parametreler=parametreler, olusturan=kullanici)
+
+
+def siradaki_gorevi_al(isci: str) -> Optional[Gorev]:
+    """
+    Çalışabilecek en eski bekleyen görevi "calisiyor" yapıp döner. Aynı yılda
+    çalışan görev varsa o yılınkiler bekler; yılsız görev hepsinin bitmesini bekler
+    ve arkasındakiler onu geçemez. Koşullu UPDATE: iki işçi aynı görevi alamaz.
+    """
+    calisan = set(Gorev.objects.filter(durum=Gorev.DURUM_CALISIYOR).values_list("yil", flat=True))
+    if None in calisan:
+        return None
+    for pk, yil in (Gorev.objects.filter(durum=Gorev.DURUM_BEKLIYOR)
+                    .order_by("olusturma", "id").values_list("pk", "yil")):
+        if yil is None and calisan:
+            return None
+        if yil in calisan:
+            continue
+        simdi = timezone.now()
+        alindi = Gorev.objects.filter(pk=pk, durum=Gorev.DURUM_BEKLIYOR).update(
+            durum=Gorev.DURUM_CALISIYOR, isci=isci, baslama=simdi, guncelleme=simdi)
+        if alindi:
+            return Gorev.objects.get(pk=pk)
+    return None
+
+
+def yarim_kalanlari_kapat() -> int:
+    """İşçi açılırken: önceki işçiden "calisiyor" kalan görevler hataya çekilir."""
+    return Gorev.objects.filter(durum=Gorev.DURUM_CALISIYOR).update(
+        durum=Gorev.DURUM_HATA, hata_mesaji="İşçi yeniden başladı; görev yarıda kaldı.",
+        bitis=timezone.now())
+
+
+def gorevi_calistir(gorev_id: int) -> str:
+    """Görevi çalıştırıp sonucunu yazar (havuz sürecinde). Dönüş: son durum."""
+    gorev = Gorev.objects.get(pk=gorev_id)
+    ilerleme = Ilerleme(gorev_id)
+    try:
+        sonuc = GOREVLER[gorev.tur].fonksiyon(gorev.parametreler, ilerleme)
+    except Exception as exc:
+        logger.exception("Görev %s (%s) hata verdi", gorev_id, gorev.tur)
+        durum, alanlar = Gorev.DURUM_HATA, {"hata_mesaji": f"{type(exc).__name__}: {exc}"}
+    else:
+        durum, alanlar = Gorev.DURUM_TAMAM, {"sonuc": sonuc, "yuzde": 100}
+    finally:
+        ilerleme.kapat()
+    simdi = timezone.now()
+    Gorev.objects.filter(pk=gorev_id).update(
+        durum=durum, islenen=ilerleme.islenen, satir_sn=ilerleme.satir_sn, mesaj=ilerleme.mesaj,
+        bitis=simdi, guncelleme=simdi, **alanlar)
+    return durum
+
+
+def son_gorevler(yil: int, adet: int = 8) -> list:
+    """Özet sayfası için: yılın (ve yılsız) son görevleri, JSON'a hazır."""
+    gorevler = (Gorev.objects.filter(Q(yil=yil) | Q(yil__isnull=True))
+                .order_by("-olusturma", "-id")[:adet])
+    simdi = timezone.now()
+    return [{
+        "id": g.pk,
+        "tur": g.tur,
+        "etiket": GOREVLER[g.tur].etiket if g.tur in GOREVLER else g.tur,
+        "durum": g.durum,
+        "durum_etiketi": g.get_durum_display(),
+        "yuzde": round(g.yuzde, 1),
+        "islenen": g.islenen,
+        "satir_sn": g.satir_sn,
+        "mesaj": g.mesaj,
+        "hata": g.hata_mesaji,
+        "sure_sn": round(((g.bitis or simdi) - g.baslama).total_seconds()) if g.baslama else None,
+        "olusturma": g.olusturma.isoformat(),
+    } for g in gorevler]
@@ -0,0 +1,210 @@
+"""
+Bu dosya: duzeltme/grid.py
+--------------------------------
+Tablo1 / kesinti sekmelerinin JSON tablo (grid) verisi.
+
+Sayfa HTML'i yalnızca boş bir tablo iskeleti gönderir; satırlar
+<vendor>/<year>/<page>/data adresinden parça parça çekilir.
+
+Mantık:
+- Keyset sayfalama: OFFSET yok. İmleç (cursor) son satırın (sıralama değeri, id)
+  ikilisidir; sonraki sayfa "bu ikiliden sonra gelenler" diye sorgulanır.
+  Böylece 1. sayfa da 5000. sayfa da aynı sürede gelir.
+- İmleç koşulu tek bir satır karşılaştırmasıdır: (kolon, id) > (değer, id).
+  OR zinciri olmadığından (sistem, yil, kolon, id) indeksinde aralık
+  taraması olur; azalan sıralama aynı indeksi geriye doğru okur.
+- Sıralama kolonu NULL olan satırlar her iki yönde de sonda, ayrı bir parça
+  olarak gelir: önce dolu değerler, sonra NULL'lar id sırasıyla.
+- Sıralama ve filtre yalnızca indeksli kolonlarda yapılabilir
+  (bkz. models.Kesinti / Tablo1Satiri Meta.indexes).
+- Kolon seçimi (projection): istemci hangi kolonları isterse yalnızca onlar
+  SELECT edilir; satırlar sözlük değil liste olarak döner.
+- Toplam satır sayısı (COUNT) bilerek hesaplanmaz.
+- İl kapsamı (bkz. account.kapsam) her sorguya eklenir. Varsayılan (id)
+  sıralamada (sistem, yil, il, id) indeksi il kullanıcısının yalnız kendi
+  dilimini okur; baslama / sure_dk sıralamasında aynı (sistem, yil, kolon, id)
+  indeksi il süzgeciyle okunur. Her sıralamanın il'li eşi tutulmaz: her indeks
+  COPY yüklemesine bakım maliyeti ekler.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from django.db.models import F, Field, Func, Q, Value
+from django.db.models.lookups import GreaterThan, LessThan
+from django.utils.dateparse import parse_datetime
+
+from account.kapsam import kapsamla
+
+from .models import Kesinti, Tablo1Satiri
+
+VARSAYILAN_ADET = 100
+EN_FAZLA_ADET = 1000
+
+_KESINTI_KOLONLARI = (
+    "satir_no", "kesinti_no", "il", "ilce", "sebeke_unsuru", "gerilim_seviyesi",
+    "baslama", "bitis", "sure_dk", "etkilenen_abone", "kesinti_tipi",
+)
+
+
+class GridHatasi(ValueError):
+    """İstemcinin gönderdiği parametre geçersiz (400 döner)."""
+
+
+class GridTanimi(NamedTuple):
+    model: type
+    sistem: str
+    kolonlar: Tuple[str, ...]
+    # Sıralanabilen kolonlar: hepsi (sistem, yil, <kolon>) indeksinde
+    siralama: Tuple[str, ...] = ("id", "baslama", "sure_dk")
+    # Eşitlik filtresi uygulanabilen kolonlar
+    filtreler: Tuple[str, ...] = ("il", "gerilim_seviyesi", "sebeke_unsuru", "kesinti_no")
+    # <tarih_kolonu>_min / _max aralık filtresinin kolonu
+    tarih_kolonu: str = "baslama"
+
+
+# page slug -> grid tanımı
+GRIDLER: Dict[str, GridTanimi] = {
+    "inavitas_tablo1": GridTanimi(Tablo1Satiri, "inavitas", _KESINTI_KOLONLARI),
+    "oms_tablo1": GridTanimi(Tablo1Satiri, "oms", _KESINTI_KOLONLARI),
+    "oms_kesinti": GridTanimi(Kesinti, "oms", _KESINTI_KOLONLARI),
+    "tablo1_detay": GridTanimi(Kesinti, "inavitas", _KESINTI_KOLONLARI),
+}
+
+
+def kolon_basliklari(tanim: GridTanimi) -> list:
+    """Şablondaki tablo başlığı için: [(kolon, başlık, sıralanabilir mi), ...]"""
+    return [
+        (k, tanim.model._meta.get_field(k).verbose_name, k in tanim.siralama)
+        for k in tanim.kolonlar
+    ]
+
+
+def imlec_yaz(deger, id_: int) -> str:
+    if isinstance(deger, datetime):
+        deger = deger.isoformat()
+    ham = json.dumps([deger, id_], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(ham).decode().rstrip("=")
+
+
+def imlec_oku(imlec: str, tarih: bool = False) -> Tuple[object, int]:
+    try:
+        ham = base64.urlsafe_b64decode(imlec + "=" * (-len(imlec) % 4))
+        deger, id_ = json.loads(ham)
+        id_ = int(id_)
+        if tarih and deger is not None:
+            deger = parse_datetime(deger)
+    except (ValueError, TypeError):
+        raise GridHatasi("Geçersiz imleç")
+    return deger, id_
+
+
+class _Satir(Func):
+    """SQL satır değeri: (a, b). Satır karşılaştırmasının iki yanı için."""
+    function = ""
+    output_field = Field()
+
+
+def _keyset_kosulu(tanim: GridTanimi, kolon: str, azalan: bool, deger, id_: int):
+    """
+    (kolon, id) sırasında imleçten sonra gelen satırlar.
+    deger None ise imleç NULL kuyruğundadır: yalnızca id ile ilerlenir.
+    """
+    ops = "lt" if azalan else "gt"
+    if kolon == "id" or deger is None:
+        return Q(**{f"id__{ops}": id_})
+    karsilastir = LessThan if azalan else GreaterThan
+    alan = tanim.model._meta.get_field(kolon)
+    return karsilastir(_Satir(F(kolon), F("id")), _Satir(Value(deger, output_field=alan), Value(id_)))
+
+
+def istenen_kolonlar(tanim: GridTanimi, params) -> list:
+    kolonlar = [k for k in (params.get("kolonlar") or "").split(",") if k] or list(tanim.kolonlar)
+    bilinmeyen = set(kolonlar) - set(tanim.kolonlar)
+    if bilinmeyen:
+        raise GridHatasi(f"Bilinmeyen kolon: {', '.join(sorted(bilinmeyen))}")
+    return kolonlar
+
+
+def grid_sorgusu(tanim: GridTanimi, yil: int, params, kapsam: str):
+    """sistem/yıl + il kapsamı + istemci filtreleri uygulanmış queryset (sıralamasız)."""
+    qs = kapsamla(tanim.model.objects.filter(sistem=tanim.sistem, yil=yil), kapsam)
+    for alan in tanim.filtreler:
+        if params.get(alan):
+            qs = qs.filter(**{alan: params[alan]})
+    for ek, ops in (("min", "gte"), ("max", "lt")):
+        sinir = params.get(f"{tanim.tarih_kolonu}_{ek}")
+        if sinir:
+            try:
+                zaman = parse_datetime(sinir) or parse_datetime(f"{sinir}T00:00:00")
+            except ValueError:
+                zaman = None
+            if zaman is None:
+                raise GridHatasi(f"{tanim.tarih_kolonu}_{ek} tarih olmalı")
+            qs = qs.filter(**{f"{tanim.tarih_kolonu}__{ops}": zaman})
+    return qs
+
+
+def grid_sayfasi(tanim: GridTanimi, yil: int, params, kapsam: str) -> dict:
+    """
+    params: request.GET benzeri sözlük.
+      kolonlar=il,baslama   siralama=-baslama   adet=100   imlec=...
+      il=KARS  sebeke_unsuru=...  baslama_min=2022-01-01  baslama_max=2022-02-01
+    """
+    kolonlar = istenen_kolonlar(tanim, params)
+
+    siralama = params.get("siralama") or "id"
+    azalan = siralama.startswith("-")
+    kolon = siralama.lstrip("-")
+    if kolon not in tanim.siralama:
+        raise GridHatasi(f"Bu kolona göre sıralanamaz: {kolon}")
+
+    try:
+        adet = min(max(int(params.get("adet") or VARSAYILAN_ADET), 1), EN_FAZLA_ADET)
+    except ValueError:
+        raise GridHatasi("adet sayı olmalı")
+
+    qs = grid_sorgusu(tanim, yil, params, kapsam)
+    imlec: Optional[str] = params.get("imlec")
+    kosul = None
+    if imlec:
+        deger, id_ = imlec_oku(imlec, kolon == tanim.tarih_kolonu)
+        kosul = _keyset_kosulu(tanim, kolon, azalan, deger, id_)
+
+    secilen = list(dict.fromkeys([*kolonlar, kolon, "id"]))
+    id_sirasi = "-id" if azalan else "id"
+    if kolon == "id":
+        if kosul is not None:
+            qs = qs.filter(kosul)
+        satirlar = list(qs.order_by(id_sirasi).values_list(*secilen)[:adet + 1])
+    else:
+        satirlar = []
+        if not imlec or deger is not None:
+            # Dolu değerler: NULL'lar dışarıda olduğundan varsayılan NULLS
+            # sırası indeksle aynıdır; sıralama indeksten okunur.
+            dolu = qs.filter(**{f"{kolon}__isnull": False})
+            if kosul is not None:
+                dolu = dolu.filter(kosul)
+            sira = [f"-{kolon}", "-id"] if azalan else [kolon, "id"]
+            satirlar = list(dolu.order_by(*sira).values_list(*secilen)[:adet + 1])
+        if len(satirlar) <= adet:
+            # NULL kuyruğu: (…, kolon IS NULL, id) indeks aralığı
+            bos = qs.filter(**{f"{kolon}__isnull": True})
+            if imlec and deger is None:
+                bos = bos.filter(kosul)
+            satirlar += list(bos.order_by(id_sirasi).values_list(*secilen)[:adet + 1 - len(satirlar)])
+    devam = len(satirlar) > adet
+    satirlar = satirlar[:adet]
+
+    sonraki = None
+    if devam:
+        son = satirlar[-1]
+        sonraki = imlec_yaz(son[secilen.index(kolon)], son[secilen.index("id")])
+    n = len(kolonlar)
+    return {
+        "kolonlar": kolonlar,
+        "satirlar": [list(s[:n]) for s in satirlar],
+        "sonraki": sonraki,
+    }
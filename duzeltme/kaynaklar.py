@@ -0,0 +1,131 @@
+"""
+Bu dosya: duzeltme/kaynaklar.py
+--------------------------------
+Hangi ham_veri dosyası hangi staging tablosuna, hangi kolonlarla yüklenir?
+
+Dosya adı kuralı (tools/rename/normalize_fn_api .py -> donusturme()):
+    <system>_<kategori>_<yil[-ay]>_<cekim_tarihi>[_part-PP]_v<NN>.<xlsx|csv>
+örn: osos_haberlesme_unitesi_2022_2025-07-12_part-03_v01.xlsx
+
+Başlık eşleştirme: Excel/CSV başlıkları _slug() ile normalleştirilir
+("Kesinti Başlama Tarihi" -> "kesinti_baslama_tarihi") ve aşağıdaki takma
+adlarla karşılaştırılır. İlk eşleşen başlık kullanılır.
+"""
+
+import re
+from datetime import date
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from . import models
+
+DOSYA_ADI_RE = re.compile(
+    r"^(?P<sistem>[a-z0-9]+)_(?P<kategori>[a-z0-9_]+?)"
+    r"_(?P<yil>\d{4})(?:-(?P<ay>0[1-9]|1[0-2]))?"
+    r"_(?P<cekim>\d{4}-\d{2}-\d{2})"
+    r"(?:_part-(?P<part>\d{2}))?"
+    r"_v(?P<versiyon>\d{2})\.(?P<uzanti>xlsx|csv)$",
+    re.IGNORECASE,
+)
+
+_TR_MAP = str.maketrans({
+    "ç": "c", "ğ": "g", "ı": "i", "ö": "o", "ş": "s", "ü": "u",
+    "Ç": "c", "Ğ": "g", "İ": "i", "I": "i", "Ö": "o", "Ş": "s", "Ü": "u",
+})
+
+
+def _slug(s) -> str:
+    # normalize_fn_api._slug ile aynı kural (başlıklar için)
+    s = str(s or "").strip().translate(_TR_MAP).lower()
+    s = s.replace(" ", "_").replace("-", "_").replace(".", "_")
+    s = re.sub(r"[^a-z0-9_]+", "", s)
+    return re.sub(r"_+", "_", s).strip("_")
+
+
+class DosyaKimligi(NamedTuple):
+    sistem: str
+    kategori: str
+    yil: int
+    ay: Optional[int]
+    cekim_tarihi: date
+    part: int
+    versiyon: int
+    uzanti: str
+
+
+def dosya_adi_coz(ad: str) -> Optional[DosyaKimligi]:
+    """Kurala uymayan adlar için None döner."""
+    m = DOSYA_ADI_RE.match(ad)
+    if not m:
+        return None
+    try:
+        cekim = date.fromisoformat(m["cekim"])
+    except ValueError:
+        return None
+    return DosyaKimligi(
+        sistem=m["sistem"].lower(),
+        kategori=m["kategori"].lower(),
+        yil=int(m["yil"]),
+        ay=int(m["ay"]) if m["ay"] else None,
+        cekim_tarihi=cekim,
+        part=int(m["part"]) if m["part"] else 1,
+        versiyon=int(m["versiyon"]),
+        uzanti=m["uzanti"].lower(),
+    )
+
+
+class KaynakTanimi(NamedTuple):
+    model: type
+    # model alanı -> kabul edilen başlıklar (slug hâlinde)
+    kolonlar: Dict[str, Tuple[str, ...]]
+
+
+_KESINTI_KOLONLARI = {
+    "kesinti_no": ("kesinti_no", "kesinti_id", "kesinti_numarasi", "id"),
+    "il": ("il", "il_adi"),
+    "ilce": ("ilce", "ilce_adi"),
+    "sebeke_unsuru": ("sebeke_unsuru", "sebeke_unsuru_kodu", "fider", "fider_adi",
+                      "cikis_fideri", "trafo_no"),
+    "gerilim_seviyesi": ("gerilim_seviyesi", "kesinti_gerilim_seviyesi", "gerilim"),
+    "baslama": ("baslama_tarihi", "kesinti_baslama_tarihi", "baslangic_tarihi",
+                "baslangic", "baslama"),
+    "bitis": ("bitis_tarihi", "kesinti_bitis_tarihi", "sona_erme_tarihi", "bitis"),
+    "sure_dk": ("sure_dk", "sure_dakika", "kesinti_suresi", "sure"),
+    "etkilenen_abone": ("etkilenen_abone", "etkilenen_abone_sayisi",
+                        "etkilenen_kullanici_sayisi", "kullanici_sayisi"),
+    "kesinti_tipi": ("kesinti_tipi", "kesinti_turu", "planli_plansiz"),
+}
+
+_BILDIRIM_KOLONLARI = {
+    "bildirim_no": ("bildirim_no", "bildirim_id", "ihbar_no", "crm_id"),
+    "il": ("il", "il_adi"),
+    "ilce": ("ilce", "ilce_adi"),
+    "sebeke_unsuru": ("sebeke_unsuru", "sebeke_unsuru_kodu", "tesisat_no", "fider", "trafo_no"),
+    "bildirim_zamani": ("bildirim_tarihi", "bildirim_zamani", "ihbar_tarihi", "olusturma_tarihi"),
+    "kesinti_no": ("kesinti_no", "kesinti_id", "iliskili_kesinti_no"),
+}
+
+_OSOS_KOLONLARI = {
+    "modem_no": ("modem_no", "modem_id", "modem_seri_no", "seri_no", "cihaz_no"),
+    "il": ("il", "il_adi"),
+    "baslama": ("kesinti_baslangic", "kesinti_baslama_tarihi", "baslangic_tarihi",
+                "baslangic", "baslama_tarihi"),
+    "bitis": ("kesinti_bitis", "kesinti_bitis_tarihi", "bitis_tarihi", "bitis"),
+}
+
+# (sistem, kategori) -> tanım. Listede olmayan kategoriler yüklenmez.
+KAYNAKLAR: Dict[Tuple[str, str], KaynakTanimi] = {
+    ("oms", "tablo1"): KaynakTanimi(models.Tablo1Satiri, _KESINTI_KOLONLARI),
+    ("oms", "kesinti"): KaynakTanimi(models.Kesinti, _KESINTI_KOLONLARI),
+    ("oms", "bildirim"): KaynakTanimi(models.Bildirim, _BILDIRIM_KOLONLARI),
+    ("crm", "bildirim"): KaynakTanimi(models.Bildirim, _BILDIRIM_KOLONLARI),
+    ("osos", "haberlesme_unitesi"): KaynakTanimi(models.OsosKesinti, _OSOS_KOLONLARI),
+    ("inavitas", "tablo1"): KaynakTanimi(models.Tablo1Satiri, _KESINTI_KOLONLARI),
+    ("inavitas", "duzeltme_kesinti_tahminleme_kesintiler"):
+        KaynakTanimi(models.Kesinti, _KESINTI_KOLONLARI),
+    ("inavitas", "duzeltme_kesinti_tahminleme_bildirimler"):
+        KaynakTanimi(models.Bildirim, _BILDIRIM_KOLONLARI),
+}
+
+
+def kaynak_bul(kimlik: DosyaKimligi) -> Optional[KaynakTanimi]:
+    return KAYNAKLAR.get((kimlik.sistem, kimlik.kategori))
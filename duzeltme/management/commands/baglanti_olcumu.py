@@ -0,0 +1,164 @@
+"""
+Bu dosya: duzeltme/management/commands/baglanti_olcumu.py
+--------------------------------
+Veritabanı bağlantı havuzunun istek süresine etkisini ölçer.
+
+Aynı sayfaya eşzamanlı istekler iki ayrı süreçte atılır:
+- havuzsuz: DB_POOL=False, CONN_MAX_AGE=0 -> her istek yeni bağlantı açar
+- havuzlu : DB_POOL=True                  -> bağlantılar psycopg havuzundan gelir
+İstekler test Client'ı yerine doğrudan WSGIHandler'a verilir: Client istek
+sonunda bağlantıyı kapatmaz, gunicorn ise kapatır (ya da havuza iade eder).
+Her süreç p50/p95 süreyi ve açılan yeni bağlantı sayısını raporlar. Ayarlar
+.env'den değil ortam değişkenlerinden verildiği için üretim ayarı değişmez.
+
+Havuz yalnızca PostgreSQL'de vardır; başka veritabanında yalnız havuzsuz ölçülür.
+
+Kullanım:
+    python manage.py baglanti_olcumu
+    python manage.py baglanti_olcumu --isci 4 --adet 400 --url /duzeltme/inavitas/2022/
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from wsgiref.util import setup_testing_defaults
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.db.backends.signals import connection_created
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+_MODLAR = {
+    "havuzsuz": {"DB_POOL": "False", "CONN_MAX_AGE": "0"},
+    "havuzlu": {"DB_POOL": "True"},
+}
+
+
+def _acilan_baglanti() -> int:
+    """Şimdiye kadar açılan fiziksel bağlantı sayısı (havuz istatistiği ya da sayaç)."""
+    havuz = getattr(connection, "pool", None)
+    if havuz is not None:
+        return havuz.get_stats().get("connections_num", 0)
+    return _sayac["acilan"]
+
+
+_sayac = {"acilan": 0}
+
+
+def _bagladi(sender, connection, **kwargs):
+    # Havuzsuzken her connection_created gerçekten yeni bir bağlantıdır
+    _sayac["acilan"] += 1
+
+
+connection_created.connect(_bagladi)
+
+
+class Command(BaseCommand):
+    help = "Bağlantı havuzlu ve havuzsuz istek sürelerini (p50/p95) karşılaştırır."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--isci", type=int, default=4, help="Eşzamanlı iş parçacığı")
+        parser.add_argument("--adet", type=int, default=200, help="Toplam istek")
+        parser.add_argument("--url", default=None, help="Ölçülecek sayfa (varsayılan: inavitas 2022 özet)")
+        parser.add_argument("--kullanici", default=None, help="Oturum açılacak kullanıcı adı")
+        parser.add_argument("--tek", choices=sorted(_MODLAR),
+                            help="(iç kullanım) yalnızca bu süreçte ölç, sonucu JSON yaz")
+
+    def handle(self, *args, **opts):
+        if opts["tek"]:
+            with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+                sonuc = self._olc(opts)
+            self.stdout.write(json.dumps(sonuc))
+            return
+
+        modlar = list(_MODLAR)
+        if connection.vendor != "postgresql":
+            self.stderr.write(self.style.WARNING("Havuz yalnızca PostgreSQL'de; yalnız havuzsuz ölçülüyor."))
+            modlar = ["havuzsuz"]
+
+        sonuclar = {mod: self._alt_surec(mod, opts) for mod in modlar}
+        for mod, s in sonuclar.items():
+            self.stdout.write(
+                f"{mod:<9} {s['adet']} istek, {opts['isci']} eşzamanlı: {s['istek_sn']:,.1f} istek/sn, "
+                f"p50 {s['p50_ms']:.1f} ms, p95 {s['p95_ms']:.1f} ms, yeni bağlantı {s['yeni_baglanti']}"
+            )
+        if len(sonuclar) == 2:
+            once, sonra = sonuclar["havuzsuz"], sonuclar["havuzlu"]
+            self.stdout.write(self.style.SUCCESS(
+                f"Havuz p50'yi {once['p50_ms'] - sonra['p50_ms']:.1f} ms, "
+                f"p95'i {once['p95_ms'] - sonra['p95_ms']:.1f} ms kısalttı."
+            ))
+
+    def _alt_surec(self, mod: str, opts) -> dict:
+        komut = [sys.executable, sys.argv[0], "baglanti_olcumu", "--tek", mod,
+                 "--isci", str(opts["isci"]), "--adet", str(opts["adet"])]
+        for ad in ("url", "kullanici"):
+            if opts[ad]:
+                komut += [f"--{ad}", opts[ad]]
+        cikti = subprocess.run(komut, env={**os.environ, **_MODLAR[mod]},
+                               capture_output=True, text=True)
+        if cikti.returncode != 0:
+            raise CommandError(f"{mod} ölçümü başarısız:\n{cikti.stderr}")
+        return json.loads(cikti.stdout.strip().splitlines()[-1])
+
+    def _olc(self, opts) -> dict:
+        User = get_user_model()
+        kullanicilar = User.objects.filter(is_active=True)
+        kullanici = (kullanicilar.filter(username=opts["kullanici"]) if opts["kullanici"] else kullanicilar).first()
+        if kullanici is None:
+            raise CommandError("Oturum açacak aktif kullanıcı yok (--kullanici).")
+        url = opts["url"] or reverse("duzeltme:ozet", args=["inavitas", 2022])
+        istemci = Client()
+        istemci.force_login(kullanici)
+        cerez = f"{settings.SESSION_COOKIE_NAME}={istemci.cookies[settings.SESSION_COOKIE_NAME].value}"
+        connections.close_all()
+
+        uygulama = WSGIHandler()
+        kilit = threading.Lock()
+        sureler = []
+
+        def calis(_):
+            ortam = {"PATH_INFO": url, "HTTP_HOST": "testserver", "HTTP_COOKIE": cerez}
+            setup_testing_defaults(ortam)
+            durum = []
+            t0 = time.perf_counter()
+            yanit = uygulama(ortam, lambda st, basliklar, exc_info=None: durum.append(st))
+            try:
+                b"".join(yanit)
+            finally:
+                yanit.close()  # request_finished: bağlantı kapanır ya da havuza döner
+            with kilit:
+                sureler.append(time.perf_counter() - t0)
+            return durum[0].startswith("200")
+
+        # Isınma: URL'ler, şablonlar ve havuz hazır olsun
+        with ThreadPoolExecutor(max_workers=opts["isci"]) as havuz:
+            list(havuz.map(calis, range(opts["isci"])))
+        sureler.clear()
+        acilan = _acilan_baglanti()
+
+        t0 = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=opts["isci"]) as havuz:
+            basarili = sum(havuz.map(calis, range(opts["adet"])))
+        toplam = time.perf_counter() - t0
+        acilan = _acilan_baglanti() - acilan
+
+        if basarili != opts["adet"]:
+            raise CommandError(f"{opts['adet'] - basarili} istek 200 dönmedi ({url}).")
+        sureler.sort()
+        return {
+            "adet": opts["adet"],
+            "istek_sn": opts["adet"] / toplam,
+            "p50_ms": sureler[len(sureler) // 2] * 1e3,
+            "p95_ms": sureler[int(len(sureler) * 0.95) - 1] * 1e3,
+            "yeni_baglanti": acilan,
+        }
@@ -0,0 +1,43 @@
+"""
+Bu dosya: duzeltme/management/commands/bildirim_eslestir.py
+--------------------------------
+CRM / OMS / Inavitas bildirimlerini kesintilere bağlar.
+
+Kullanım:
+    python manage.py bildirim_eslestir 2022
+    python manage.py bildirim_eslestir 2022 --kaynak crm --zorla
+    python manage.py bildirim_eslestir 2022 --degisenler   # yalnız yeni sürümlerin etkiledikleri
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from duzeltme.eslestirme import KESINTI_KAYNAGI, kaynagi_eslestir
+
+
+class Command(BaseCommand):
+    help = "Bildirimleri şebeke unsuru + zaman penceresiyle kesintilere eşleştirir."
+
+    def add_arguments(self, parser):
+        parser.add_argument("yillar", nargs="+", type=int)
+        parser.add_argument("--kaynak", action="append", choices=sorted(KESINTI_KAYNAGI),
+                            help="Yalnızca bu bildirim kaynağı (tekrar verilebilir)")
+        parser.add_argument("--zorla", action="store_true",
+                            help="Girdi dosyaları değişmemiş olsa da yeniden eşleştir")
+        parser.add_argument("--degisenler", action="store_true",
+                            help="Yalnızca değişiklik setlerinin etkilediği bildirimleri yeniden eşleştir")
+
+    def handle(self, *args, **opts):
+        for yil in opts["yillar"]:
+            for kaynak in opts["kaynak"] or KESINTI_KAYNAGI:
+                t0 = time.perf_counter()
+                sonuc = kaynagi_eslestir(kaynak, yil, zorla=opts["zorla"], degisenler=opts["degisenler"])
+                if sonuc["atlandi"]:
+                    self.stdout.write(f"[ATLA] {kaynak} {yil}: girdiler değişmedi.")
+                    continue
+                kapsam = "" if sonuc["kapsam"] is None else f" ({sonuc['kapsam']} bildirim yeniden eşleşti)"
+                self.stdout.write(self.style.SUCCESS(
+                    f"[OK] {kaynak} {yil}{kapsam}: {sonuc['bildirim']} bildirim, {sonuc['eslesen']} eşleşti, "
+                    f"{sonuc['eslesmeyen']} eşleşmedi ({time.perf_counter() - t0:.1f} sn)"
+                ))
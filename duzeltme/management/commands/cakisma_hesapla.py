@@ -0,0 +1,61 @@
+"""
+Bu dosya: duzeltme/management/commands/cakisma_hesapla.py
+--------------------------------
+Çakışan kesintileri hesaplayıp CakisanKesinti tablosuna yazar.
+
+Kullanım:
+    python manage.py cakisma_hesapla 2022
+    python manage.py cakisma_hesapla 2021 2022 2023 --sistem oms
+    python manage.py cakisma_hesapla 2022 --degisenler   # yalnız yeni sürümlerin dokunduğu unsurlar
+    python manage.py cakisma_hesapla 2022 --unsur F-123 --aralik "2022-03-01 08:00" "2022-03-01 12:00"
+        # hesap yapmaz; unsurun o aralıkla çakışan kesintilerini listeler
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_datetime
+
+from duzeltme.cakisma import aralik_indeksi, cakismalari_hesapla
+from duzeltme.models import Kesinti
+
+
+class Command(BaseCommand):
+    help = "Aynı şebeke unsurunda çakışan / iç içe kesintileri hesaplar."
+
+    def add_arguments(self, parser):
+        parser.add_argument("yillar", nargs="+", type=int)
+        parser.add_argument("--sistem", default="inavitas", help="Kesinti kaynağı (varsayılan inavitas)")
+        parser.add_argument("--degisenler", action="store_true",
+                            help="Yalnızca değişiklik setlerinin etkilediği şebeke unsurlarını hesapla")
+        parser.add_argument("--unsur", help="--aralik ile: sorgulanacak şebeke unsuru")
+        parser.add_argument("--aralik", nargs=2, metavar=("BASLAMA", "BITIS"),
+                            help="Unsurun bu aralıkla çakışan kesintilerini listele")
+
+    def handle(self, *args, **opts):
+        if opts["aralik"] or opts["unsur"]:
+            return self._aralik_sorgusu(opts)
+        for yil in opts["yillar"]:
+            t0 = time.perf_counter()
+            sonuc = cakismalari_hesapla(opts["sistem"], yil, degisenler=opts["degisenler"])
+            kapsam = "" if sonuc["unsur"] is None else f" ({sonuc['unsur']} değişen unsur)"
+            self.stdout.write(self.style.SUCCESS(
+                f"[OK] {opts['sistem']} {yil}{kapsam}: {sonuc['kesinti']} kesinti, "
+                f"{sonuc['kismi']} kısmi, {sonuc['ic_ice']} iç içe çakışma "
+                f"({time.perf_counter() - t0:.1f} sn)"
+            ))
+
+    def _aralik_sorgusu(self, opts):
+        if not (opts["aralik"] and opts["unsur"]):
+            raise CommandError("--unsur ve --aralik birlikte verilmeli.")
+        baslama, bitis = (parse_datetime(d) for d in opts["aralik"])
+        if baslama is None or bitis is None or bitis <= baslama:
+            raise CommandError("--aralik: 'YYYY-AA-GG SS:DD' biçiminde iki zaman, bitiş başlamadan sonra.")
+        for yil in opts["yillar"]:
+            indeks = aralik_indeksi(opts["sistem"], yil, opts["unsur"])
+            idler = indeks.cakisanlar(baslama, bitis)
+            self.stdout.write(f"{opts['sistem']} {yil} {opts['unsur']}: {len(indeks)} kesintiden {len(idler)} çakışıyor")
+            kesintiler = Kesinti.objects.in_bulk(idler)
+            for id_ in idler:
+                k = kesintiler[id_]
+                self.stdout.write(f"  {k.kesinti_no or id_}  {k.baslama:%d.%m.%Y %H:%M}  {k.sure_dk or 0:.0f} dk  {k.il}")
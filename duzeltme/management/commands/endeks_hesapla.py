@@ -0,0 +1,44 @@
+"""
+Bu dosya: duzeltme/management/commands/endeks_hesapla.py
+--------------------------------
+İl + gerilim seviyesi başına kesinti süre / sıklık göstergelerini hesaplayıp
+KesintiEndeksi tablosuna yazar (bkz. duzeltme/endeks.py).
+
+Kullanım:
+    python manage.py endeks_hesapla 2022
+    python manage.py endeks_hesapla 2021 2022 --sistem oms --tablo kesinti
+    python manage.py endeks_hesapla 2022 --il KARS            # yalnız bir il (düzeltmeden sonra)
+    python manage.py endeks_hesapla 2022 --il KARS --il ARDAHAN
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from duzeltme.endeks import TABLOLAR, endeksleri_hesapla
+
+
+class Command(BaseCommand):
+    help = "İl ve gerilim seviyesi başına kesinti göstergelerini (abone-dakika, abone-kesinti) hesaplar."
+
+    def add_arguments(self, parser):
+        parser.add_argument("yillar", nargs="+", type=int)
+        parser.add_argument("--sistem", default="inavitas", help="Kesinti kaynağı (varsayılan inavitas)")
+        parser.add_argument("--tablo", default="tablo1", choices=sorted(TABLOLAR))
+        parser.add_argument("--il", action="append", dest="iller",
+                            help="Yalnızca bu il (tekrar verilebilir); verilmezse bütün yıl")
+
+    def handle(self, *args, **opts):
+        sistem, tablo = opts["sistem"], opts["tablo"]
+        for yil in opts["yillar"]:
+            t0 = time.perf_counter()
+            try:
+                sonuc = endeksleri_hesapla(sistem, yil, tablo=tablo, iller=opts["iller"])
+            except ValueError as exc:
+                raise CommandError(str(exc))
+            kapsam = "" if sonuc["il"] is None else f" ({', '.join(opts['iller'])})"
+            suresiz = f", {sonuc['suresiz']} süresiz satır atlandı" if sonuc["suresiz"] else ""
+            self.stdout.write(self.style.SUCCESS(
+                f"[OK] {sistem} {tablo} {yil}{kapsam}: {sonuc['satir']} satır, "
+                f"{sonuc['hucre']} il/gerilim hücresi{suresiz} ({time.perf_counter() - t0:.1f} sn)"
+            ))
@@ -0,0 +1,68 @@
+"""
+Bu dosya: duzeltme/management/commands/gorev_ekle.py
+--------------------------------
+Görev kuyruğuna iş ekler; işi gorev_isci çalıştırır, ilerleme özet sayfasında
+görünür. Cron betikleri hesapları doğrudan çalıştırmak yerine bunu çağırır.
+
+Kullanım:
+    python manage.py gorev_ekle yukleme data/rapor/ham_veri/oms/ --yeniden --isci 4
+    python manage.py gorev_ekle cakisma 2022 --sistem oms --degisenler
+    python manage.py gorev_ekle eslestirme 2022 --kaynak crm --degisenler
+    python manage.py gorev_ekle endeks 2022 --il KARS
+    python manage.py gorev_ekle osos_ozet 2022
+    python manage.py gorev_ekle ozet_yenile 2022
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from duzeltme.endeks import TABLOLAR
+from duzeltme.eslestirme import KESINTI_KAYNAGI
+from duzeltme.gorevler import GOREVLER, GorevHatasi, gorev_ekle
+from duzeltme.kaynaklar import dosya_adi_coz
+from duzeltme.yukleme import dosyalari_bul
+
+
+class Command(BaseCommand):
+    help = "Görev kuyruğuna yükleme / çakışma / eşleştirme / endeks / özet işi ekler."
+
+    def add_arguments(self, parser):
+        parser.add_argument("tur", choices=sorted(GOREVLER))
+        parser.add_argument("hedef", nargs="+", help="yukleme için dosya/klasör yolları, diğerleri için yıl")
+        parser.add_argument("--sistem", default="inavitas", help="cakisma / endeks: kesinti kaynağı")
+        parser.add_argument("--tablo", default="tablo1", choices=sorted(TABLOLAR), help="endeks: kaynak tablo")
+        parser.add_argument("--il", action="append", dest="iller", help="endeks: yalnızca bu il (tekrar verilebilir)")
+        parser.add_argument("--kaynak", action="append", choices=sorted(KESINTI_KAYNAGI),
+                            help="eslestirme: yalnızca bu bildirim kaynağı (tekrar verilebilir)")
+        parser.add_argument("--degisenler", action="store_true",
+                            help="cakisma / eslestirme: yalnızca değişiklik setlerinin etkilediklerini hesapla")
+        parser.add_argument("--zorla", action="store_true", help="eslestirme: girdiler değişmese de")
+        parser.add_argument("--yeniden", action="store_true", help="yukleme: yüklü dosyaları da sil-yükle")
+        parser.add_argument("--isci", type=int, help="yukleme: paralel süreç sayısı (varsayılan: çekirdek sayısı)")
+
+    def handle(self, *args, **opts):
+        tur = opts["tur"]
+        try:
+            if tur == "yukleme":
+                yillar = {k.yil for k in (dosya_adi_coz(y.name) for y in dosyalari_bul(opts["hedef"])) if k}
+                if not yillar:
+                    raise CommandError("Yüklenecek xlsx/csv dosyası bulunamadı.")
+                # Tek yıllık yükleme o yılın kuyruğuna girer; karışık yıllar tek başına çalışır
+                gorevler = [gorev_ekle(tur, yil=yillar.pop() if len(yillar) == 1 else None,
+                                       yollar=opts["hedef"], yeniden=opts["yeniden"], isci_sayisi=opts["isci"])]
+            else:
+                try:
+                    yillar = [int(h) for h in opts["hedef"]]
+                except ValueError:
+                    raise CommandError(f"{tur}: yıl bekleniyor, verilen: {' '.join(opts['hedef'])}")
+                ek = {
+                    "cakisma": {"sistem": opts["sistem"], "degisenler": opts["degisenler"]},
+                    "endeks": {"sistem": opts["sistem"], "tablo": opts["tablo"], "iller": opts["iller"] or []},
+                    "eslestirme": {"kaynaklar": opts["kaynak"] or [], "zorla": opts["zorla"],
+                                   "degisenler": opts["degisenler"]},
+                }.get(tur, {})
+                gorevler = [gorev_ekle(tur, yil=yil, **ek) for yil in yillar]
+        except GorevHatasi as exc:
+            raise CommandError(str(exc))
+        for gorev in gorevler:
+            self.stdout.write(self.style.SUCCESS(
+                f"[OK] #{gorev.pk} {GOREVLER[tur].etiket} kuyrukta ({gorev.get_durum_display()})."))
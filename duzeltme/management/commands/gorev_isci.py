@@ -0,0 +1,108 @@
+"""
+Bu dosya: duzeltme/management/commands/gorev_isci.py
+--------------------------------
+Görev kuyruğunun işçisi (bkz. duzeltme/gorevler.py). Sunucuda gunicorn_v1'in
+yanında kendi systemd biriminde (gorev_isci_v1) sürekli çalışır.
+
+- Bekleyen görevleri sırayla alıp süreç havuzunda çalıştırır; havuz "spawn"
+  ile açılır, çocuklar ebeveynin veritabanı bağlantısını devralmaz.
+- SIGTERM / Ctrl+C: yeni görev almaz, çalışanların bitmesini bekler
+  (systemd TimeoutStopSec'i aşarsa öldürülür; açılışta yarıda kalanlar
+  "hata" olarak kapatılır, yüklemeler kontrol noktasından devam eder).
+- SQLite'ta tek süreç çalışır (eşzamanlı yazma yok).
+
+Kullanım:
+    python manage.py gorev_isci
+    python manage.py gorev_isci --isci 2 --bekleme 5
+    python manage.py gorev_isci --bir-kez      # kuyruk boşalınca çık
+"""
+
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, close_old_connections, connection
+from django.utils import timezone
+
+from duzeltme.gorevler import gorevi_calistir, siradaki_gorevi_al, yarim_kalanlari_kapat
+from duzeltme.models import Gorev
+from duzeltme.paralel_yukleme import _isci_baslat, varsayilan_isci_sayisi
+
+
+class Command(BaseCommand):
+    help = "Görev kuyruğundaki bekleyen işleri süreç havuzunda çalıştırır."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--isci", type=int, default=max(1, varsayilan_isci_sayisi() // 2),
+                            help="Aynı anda çalışacak görev sayısı (varsayılan: çekirdeklerin yarısı)")
+        parser.add_argument("--bekleme", type=float, default=2.0, help="Kuyruk yoklama aralığı (sn)")
+        parser.add_argument("--bir-kez", action="store_true", help="Kuyruk boşalınca çık")
+
+    def handle(self, *args, **opts):
+        isci_sayisi = opts["isci"] if connection.vendor == "postgresql" else 1
+        ad = f"{socket.gethostname()}:{os.getpid()}"
+        durdur = threading.Event()
+        for sinyal in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(sinyal, lambda *_: durdur.set())
+
+        kapatilan = yarim_kalanlari_kapat()
+        if kapatilan:
+            self.stdout.write(self.style.WARNING(f"[UYARI] Yarıda kalmış {kapatilan} görev hataya çekildi."))
+        self.stdout.write(f"İşçi {ad}: {isci_sayisi} süreç, {opts['bekleme']} sn yoklama.")
+
+        calisan = {}  # future -> Gorev
+        baglam = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=isci_sayisi, mp_context=baglam,
+                                 initializer=_isci_baslat, initargs=(True,)) as havuz:
+            while True:
+                for is_ in [f for f in calisan if f.done()]:
+                    self._bitti(calisan.pop(is_), is_)
+                if not durdur.is_set():
+                    self._gorev_al(havuz, calisan, isci_sayisi, ad)
+                if not calisan and (durdur.is_set() or opts["bir_kez"]):
+                    break
+                if calisan:
+                    wait(calisan, timeout=opts["bekleme"], return_when=FIRST_COMPLETED)
+                else:
+                    durdur.wait(opts["bekleme"])
+        self.stdout.write("İşçi durdu.")
+
+    def _gorev_al(self, havuz, calisan, isci_sayisi, ad):
+        close_old_connections()
+        try:
+            while len(calisan) < isci_sayisi:
+                gorev = siradaki_gorevi_al(ad)
+                if gorev is None:
+                    return
+                try:
+                    calisan[havuz.submit(gorevi_calistir, gorev.pk)] = gorev
+                except BrokenProcessPool:
+                    # Havuz kullanılamaz: görev kuyruğa döner, işçi çıkar (systemd yeniden başlatır)
+                    Gorev.objects.filter(pk=gorev.pk).update(durum=Gorev.DURUM_BEKLIYOR, isci="", baslama=None)
+                    raise
+                self.stdout.write(f"[BASLA] #{gorev.pk} {gorev.tur} {gorev.parametreler}")
+        except DatabaseError as exc:  # veritabanı yeniden başlarken işçi düşmesin
+            self.stderr.write(self.style.ERROR(f"[HATA] Kuyruk okunamadı: {exc}"))
+            connection.close()
+
+    def _bitti(self, gorev, is_):
+        try:
+            durum = is_.result()
+        except Exception as exc:  # havuz süreci öldü (ör. bellek yetmedi)
+            durum = Gorev.DURUM_HATA
+            Gorev.objects.filter(pk=gorev.pk).update(
+                durum=durum, hata_mesaji=f"Görev süreci sonlandı: {type(exc).__name__}: {exc}",
+                bitis=timezone.now())
+        gorev.refresh_from_db()
+        sure = (gorev.bitis - gorev.baslama).total_seconds() if gorev.bitis and gorev.baslama else 0
+        if durum == Gorev.DURUM_TAMAM:
+            self.stdout.write(self.style.SUCCESS(
+                f"[OK] #{gorev.pk} {gorev.tur}: {gorev.islenen:,} satır, {sure:.1f} sn"
+                + (f" ({gorev.satir_sn:,.0f} satır/sn)" if gorev.satir_sn else "")))
+        else:
+            self.stderr.write(self.style.ERROR(f"[HATA] #{gorev.pk} {gorev.tur}: {gorev.hata_mesaji}"))
@@ -0,0 +1,91 @@
+"""
+Bu dosya: duzeltme/management/commands/ham_veri_yukle.py
+--------------------------------
+data/rapor/ham_veri altındaki dosyaları staging tablolarına yükler.
+
+Kullanım:
+    python manage.py ham_veri_yukle data/rapor/ham_veri/osos/haberlesme_unitesi/2022/
+    python manage.py ham_veri_yukle data/rapor/ham_veri/ --isci 4
+    python manage.py ham_veri_yukle dosya1.xlsx dosya2.csv --parca 20000 --yeniden
+
+Yarıda kalan bir yükleme aynı komutla tekrar çalıştırılırsa son commit edilen
+parçadan devam eder (bkz. duzeltme.yukleme.dosya_yukle).
+Bir parçanın yeni sürümü (_v02) yalnızca eski sürümle farkını uygular; fark
+değişiklik seti olarak kaydedilir ve "cakisma_hesapla --degisenler",
+"bildirim_eslestir --degisenler" yalnız etkilenen kayıtları yeniden hesaplar.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from duzeltme.kaynaklar import dosya_adi_coz
+from duzeltme.paralel_yukleme import paralel_yukle, varsayilan_isci_sayisi
+from duzeltme.yukleme import PARCA_BOYUTU, dosyalari_bul
+
+
+class Command(BaseCommand):
+    help = "ham_veri xlsx/csv dosyalarını akış hâlinde okuyup staging tablolarına yükler."
+
+    def add_arguments(self, parser):
+        parser.add_argument("yollar", nargs="+", help="Dosya ya da klasör yolları")
+        parser.add_argument("--parca", type=int, default=PARCA_BOYUTU,
+                            help=f"Bir seferde yazılacak satır sayısı (varsayılan {PARCA_BOYUTU})")
+        parser.add_argument("--isci", type=int, default=varsayilan_isci_sayisi(),
+                            help="Paralel çalışacak süreç sayısı (varsayılan: çekirdek sayısı)")
+        parser.add_argument("--yeniden", action="store_true",
+                            help="Daha önce yüklenmiş dosyaları da sil-yükle")
+
+    def handle(self, *args, **opts):
+        dosyalar = []
+        for yol in dosyalari_bul(opts["yollar"]):
+            if dosya_adi_coz(yol.name) is None:
+                self.stdout.write(self.style.WARNING(f"[ATLA] İsim kuralına uymuyor: {yol.name}"))
+                continue
+            dosyalar.append(yol)
+        if not dosyalar:
+            raise CommandError("Yüklenecek xlsx/csv dosyası bulunamadı.")
+
+        t0 = time.perf_counter()
+        toplam = hatali_dosya = 0
+        for sonuc in paralel_yukle(dosyalar, isci_sayisi=opts["isci"],
+                                   parca_boyutu=opts["parca"], yeniden=opts["yeniden"]):
+            ad = sonuc["dosya"]
+            if sonuc.get("hata"):
+                hatali_dosya += 1
+                self.stderr.write(self.style.ERROR(f"[HATA] {ad}: {sonuc['hata']}"))
+                continue
+            if sonuc["atlandi"]:
+                self.stdout.write(f"[ATLA] Zaten yüklü: {ad} ({sonuc['satir']} satır)")
+                continue
+
+            sure = sonuc["sure"]
+            yeni = sonuc["satir"] - sonuc["devam"]
+            toplam += yeni
+            if sonuc["devam"]:
+                self.stdout.write(f"[DEVAM] {ad}: {sonuc['devam']} satır önceki çalıştırmada yüklenmişti.")
+            self.stdout.write(self.style.SUCCESS(
+                f"[OK] {ad}: {yeni} satır, {sure:.1f} sn "
+                f"({yeni / sure if sure else 0:,.0f} satır/sn, pid {sonuc['pid']})"
+            ))
+            if sonuc["hatali_hucre"]:
+                self.stdout.write(self.style.WARNING(
+                    f"     {sonuc['hatali_hucre']} hücre dönüştürülemedi, NULL yazıldı."))
+            fark = sonuc.get("fark")
+            if fark and fark["tam_degisim"]:
+                self.stdout.write(self.style.WARNING(
+                    f"     {fark['onceki']} yerine geçti; eski satırların özeti yok, tamamı değişti sayıldı."))
+            elif fark:
+                self.stdout.write(
+                    f"     {fark['onceki']} yerine geçti: +{fark['eklenen']} eklenen, "
+                    f"~{fark['guncellenen']} güncellenen, -{fark['silinen']} silinen, {fark['ayni']} aynı.")
+            if sonuc["eksik_kolonlar"]:
+                self.stdout.write(self.style.WARNING(
+                    f"     Başlıkta bulunamayan kolonlar: {', '.join(sonuc['eksik_kolonlar'])}"))
+
+        sure = time.perf_counter() - t0
+        self.stdout.write(
+            f"Toplam {toplam} satır, {sure:.1f} sn ({toplam / sure if sure else 0:,.0f} satır/sn)."
+        )
+        if hatali_dosya:
+            raise CommandError(f"{hatali_dosya} dosya yüklenemedi.")
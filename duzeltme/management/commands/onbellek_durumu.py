@@ -0,0 +1,36 @@
+"""
+Bu dosya: duzeltme/management/commands/onbellek_durumu.py
+--------------------------------
+Paylaşılan önbelleğin isabet / ıska sayaçlarını gösterir.
+
+Kullanım:
+    python manage.py onbellek_durumu
+    python manage.py onbellek_durumu --gecersiz 2022     # yılın kayıtlarını eskit
+    python manage.py onbellek_durumu --sifirla           # sayaçları sıfırla
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from duzeltme import onbellek
+
+
+class Command(BaseCommand):
+    help = "Önbellek isabet/ıska sayaçlarını gösterir; yıl bazında geçersiz kılar."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--gecersiz", type=int, action="append", metavar="YIL")
+        parser.add_argument("--sifirla", action="store_true")
+
+    def handle(self, *args, **opts):
+        ayar = settings.CACHES["default"]
+        self.stdout.write(f"Arka uç: {ayar['BACKEND']} ({ayar.get('LOCATION', '')}), "
+                          f"en fazla {ayar.get('OPTIONS', {}).get('MAX_ENTRIES', 300)} kayıt")
+        for yil in opts["gecersiz"] or []:
+            onbellek.gecersiz_kil(yil)
+            self.stdout.write(self.style.SUCCESS(f"[OK] {yil} kayıtları geçersiz kılındı."))
+        s = onbellek.sayaclar()
+        self.stdout.write(f"İsabet: {s['isabet']}  Iska: {s['iska']}  Oran: %{s['oran'] * 100:.1f}")
+        if opts["sifirla"]:
+            onbellek.sayaclari_sifirla()
+            self.stdout.write("Sayaçlar sıfırlandı.")
@@ -0,0 +1,31 @@
+"""
+Bu dosya: duzeltme/management/commands/osos_ozet_hesapla.py
+--------------------------------
+OSOS haberleşme kesintilerinden modem / il / gün özet tablolarını üretir.
+
+Kullanım:
+    python manage.py osos_ozet_hesapla 2022
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from duzeltme.osos_ozet import osos_ozet_hesapla
+
+
+class Command(BaseCommand):
+    help = "OSOS haberleşme kesintisi özetlerini NumPy ile hesaplayıp özet tablolarına yazar."
+
+    def add_arguments(self, parser):
+        parser.add_argument("yillar", nargs="+", type=int)
+
+    def handle(self, *args, **opts):
+        for yil in opts["yillar"]:
+            t0 = time.perf_counter()
+            sonuc = osos_ozet_hesapla(yil)
+            self.stdout.write(self.style.SUCCESS(
+                f"[OK] OSOS {yil}: {sonuc['kesinti']} kesinti, {sonuc['modem']} modem, "
+                f"{sonuc['il']} il, {sonuc['gun_satiri']} il-gün satırı, {sonuc['yazilan']} satır yazıldı "
+                f"({time.perf_counter() - t0:.1f} sn)"
+            ))
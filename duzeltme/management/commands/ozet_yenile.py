@@ -0,0 +1,31 @@
+"""
+Bu dosya: duzeltme/management/commands/ozet_yenile.py
+--------------------------------
+Özet sayfasının sayaçlarını (OzetSayaci) baştan kurar.
+
+Normalde gerekmez: yükleme ve hesaplama komutları kendi bölümlerini zaten
+günceller. İlk kurulumda ya da elle veri silindiğinde kullanılır.
+
+Kullanım:
+    python manage.py ozet_yenile 2022 [2023 ...]
+
+Her yıl ayrı transaction'da commit edilir.
+"""
+
+from django.core.management.base import BaseCommand
+
+from duzeltme.models import OzetSayaci
+from duzeltme.ozet import hepsini_yenile
+
+
+class Command(BaseCommand):
+    help = "Özet sayfası sayaçlarını mevcut sonuç tablolarından yeniden kurar."
+
+    def add_arguments(self, parser):
+        parser.add_argument("yillar", nargs="+", type=int)
+
+    def handle(self, *args, **opts):
+        for yil in opts["yillar"]:
+            hepsini_yenile(yil)  # yıl yıl: biri biter bitmez commit edilir ve yazılır
+            adet = OzetSayaci.objects.filter(yil=yil).count()
+            self.stdout.write(self.style.SUCCESS(f"[OK] {yil}: {adet} sayaç yazıldı."))
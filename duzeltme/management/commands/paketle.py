@@ -0,0 +1,24 @@
+"""
+Bu dosya: duzeltme/management/commands/paketle.py
+--------------------------------
+Sayfa tipi başına birleşik, küçültülmüş CSS/JS paketlerini static/paket/ altına yazar.
+collectstatic'ten önce çalışır (deploy betiği ikisini sırayla çağırır).
+
+Kullanım:
+    python manage.py paketle
+"""
+
+from django.core.management.base import BaseCommand
+
+from core import paketler
+
+
+class Command(BaseCommand):
+    help = "static/paket/<tip>.css|js paketlerini üretir (bkz. core/paketler.py)."
+    # Paketleri üreten komut, paketlerin varlığını soran kontrollere takılmasın
+    requires_system_checks = []
+
+    def handle(self, *args, **opts):
+        for ad, (kaynak, paket) in paketler.paketle().items():
+            self.stdout.write(f"{ad:<20} {kaynak / 1024:8.1f} KB -> {paket / 1024:8.1f} KB")
+        self.stdout.write(self.style.SUCCESS("[OK] Paketler yazıldı."))
@@ -0,0 +1,102 @@
+"""
+Bu dosya: duzeltme/management/commands/performans.py
+--------------------------------
+Web ve yükleme sıcak yollarının tekrarlanabilir performans ölçümü
+(senaryolar ve istatistikler: duzeltme/performans.py).
+
+Temel (baseline) yoksa ya da --temel-kaydet verildiyse sonuçlar temel dosyasına
+yazılır. Temel varsa karşılaştırılır: p50/p95 gecikme ya da işlem/sn --tolerans
+oranından fazla kötüleştiyse komut hata koduyla biter (CI'da kullanılabilir).
+Temel dosyası makineye özgüdür; farklı donanımda yeniden kaydedilmelidir.
+
+Kullanım:
+    python manage.py performans --temel-kaydet
+    python manage.py performans
+    python manage.py performans --senaryo veri: --adet 50 --tolerans 0.15
+    python manage.py performans --tohumla 20000      # boş veritabanı için
+"""
+
+import platform
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import override_settings
+
+from duzeltme import performans
+
+_VARSAYILAN_TEMEL = Path(settings.BASE_DIR) / "var" / "performans_temel.json"
+
+
+class Command(BaseCommand):
+    help = "Web ve yükleme senaryolarını ölçer (işlem/sn, p50/p95/p99) ve temelle karşılaştırır."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--adet", type=int, default=30, help="Senaryo başına ölçülen istek")
+        parser.add_argument("--aktarim-adedi", type=int, default=5, help="Dışa aktarım başına istek")
+        parser.add_argument("--yukleme-adedi", type=int, default=3, help="Sentetik dosya başına yükleme")
+        parser.add_argument("--satir", type=int, default=5000, help="Sentetik dosya başına satır")
+        parser.add_argument("--senaryo", default=None, help="Yalnız adında bu metin geçen senaryolar")
+        parser.add_argument("--yuklemesiz", action="store_true", help="Yükleme senaryolarını atla")
+        parser.add_argument("--temel", default=str(_VARSAYILAN_TEMEL), help="Temel JSON dosyası")
+        parser.add_argument("--temel-kaydet", action="store_true", help="Sonuçları yeni temel yap")
+        parser.add_argument("--tolerans", type=float, default=0.25, help="İzin verilen kötüleşme oranı")
+        parser.add_argument("--en-az-ms", type=float, default=2.0,
+                            help="Bundan küçük gecikme farkları gürültü sayılır")
+        parser.add_argument("--tohumla", type=int, default=0, metavar="SATIR",
+                            help="Önce sentetik veri yükle (kalıcı; boş veritabanı için)")
+
+    def handle(self, *args, **opts):
+        if opts["tohumla"]:
+            yil = next(iter(performans.kayit_defteri()))[1]
+            for ad, satir in performans.tohumla(yil, opts["tohumla"]).items():
+                self.stdout.write(f"tohum {ad}: {satir:,} satır ({yil})")
+
+        # Ölçüm istekleri yavaş istek loguna düşmesin
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"], YAVAS_ISTEK_MS=10**9):
+            t0 = time.perf_counter()
+            sonuclar = performans.web_senaryolari(opts["adet"], opts["aktarim_adedi"], opts["senaryo"])
+            if not opts["yuklemesiz"]:
+                sonuclar.update(performans.yukleme_senaryolari(
+                    opts["yukleme_adedi"], opts["satir"], opts["senaryo"]))
+            sure = time.perf_counter() - t0
+        if not sonuclar:
+            raise CommandError("Hiç senaryo seçilmedi (--senaryo).")
+
+        self._yazdir(sonuclar)
+        self.stdout.write(f"{len(sonuclar)} senaryo, {sure:.1f} sn")
+
+        yol = Path(opts["temel"])
+        temel = performans.temel_oku(yol)
+        if temel is None or opts["temel_kaydet"]:
+            performans.temel_yaz(yol, sonuclar, {
+                "tarih": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "makine": platform.node(),
+                "python": platform.python_version(),
+                "veritabani": connection.vendor,
+                "adet": opts["adet"],
+                "satir": opts["satir"],
+            })
+            self.stdout.write(self.style.SUCCESS(f"Temel kaydedildi: {yol}"))
+            return
+
+        gerilemeler = performans.karsilastir(temel["senaryolar"], sonuclar, opts["tolerans"], opts["en_az_ms"])
+        eksik = sorted(set(sonuclar) - set(temel["senaryolar"]))
+        if eksik:
+            self.stdout.write(self.style.WARNING(f"Temelde olmayan senaryolar: {', '.join(eksik)}"))
+        if gerilemeler:
+            raise CommandError(
+                f"{len(gerilemeler)} metrik %{opts['tolerans'] * 100:.0f} toleransı aştı:\n  "
+                + "\n  ".join(gerilemeler))
+        self.stdout.write(self.style.SUCCESS(
+            f"Gerileme yok (tolerans %{opts['tolerans'] * 100:.0f}, temel: {temel['bilgi'].get('tarih')})."))
+
+    def _yazdir(self, sonuclar):
+        genislik = max(len(ad) for ad in sonuclar)
+        self.stdout.write(f"{'senaryo':<{genislik}}  {'adet':>5} {'işlem/sn':>10} "
+                          f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+        for ad, s in sonuclar.items():
+            self.stdout.write(f"{ad:<{genislik}}  {s['adet']:>5} {s['islem_sn']:>10,.1f} "
+                              f"{s['p50_ms']:>9.1f} {s['p95_ms']:>9.1f} {s['p99_ms']:>9.1f}")
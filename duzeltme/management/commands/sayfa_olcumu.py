@@ -0,0 +1,75 @@
+"""
+Bu dosya: duzeltme/management/commands/sayfa_olcumu.py
+--------------------------------
+Sayfa isteği başına "hazırlık" maliyetini ölçer (mikro kıyas).
+
+eski : her istekte sekme listesi için reverse() çağrıları + şablonun
+       önbelleksiz loader'larla dosya sisteminden bulunup derlenmesi
+yeni : duzeltme.sayfalar kayıt defterinden tek sözlük araması
+
+Kullanım:
+    python manage.py sayfa_olcumu
+    python manage.py sayfa_olcumu --tekrar 20000 --sayfa oms_kesinti
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.template import Engine, engines
+from django.urls import reverse
+
+from duzeltme.sayfalar import SAYFALAR, _template_path, kayit_defteri, sayfa_sablonu
+
+
+def _eski_hazirlik(motor: Engine, vendor: str, year: int, page: str):
+    tabs = [
+        {"slug": slug, "label": etiket,
+         "url": reverse("duzeltme:ozet", args=[vendor, year]) if slug == "ozet"
+         else reverse("duzeltme:page", args=[vendor, year, slug])}
+        for slug, etiket in SAYFALAR[vendor]["sekmeler"]
+    ]
+    return tabs, motor.get_template(_template_path(vendor, year, page))
+
+
+class Command(BaseCommand):
+    help = "Sayfa kayıt defteri öncesi/sonrası istek başına hazırlık süresini ölçer."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--vendor", default="inavitas")
+        parser.add_argument("--yil", type=int, default=2022)
+        parser.add_argument("--sayfa", default="ozet")
+        parser.add_argument("--tekrar", type=int, default=2000)
+
+    def handle(self, *args, **opts):
+        vendor, yil, sayfa, n = opts["vendor"], opts["yil"], opts["sayfa"], opts["tekrar"]
+        if sayfa_sablonu(vendor, yil, sayfa) is None:
+            raise CommandError(f"Kayıt defterinde yok: {vendor}/{yil}/{sayfa}")
+
+        # "Eski" yol: önbelleksiz loader'larla ayrı bir motor
+        gercek = engines["django"].engine
+        motor = Engine(
+            dirs=gercek.dirs, libraries=gercek.libraries, debug=gercek.debug,
+            loaders=["django.template.loaders.filesystem.Loader",
+                     "django.template.loaders.app_directories.Loader"],
+        )
+
+        t0 = time.perf_counter()
+        for _ in range(n):
+            _eski_hazirlik(motor, vendor, yil, sayfa)
+        eski = (time.perf_counter() - t0) / n
+
+        kayit_defteri.cache_clear()
+        t0 = time.perf_counter()
+        kayit_defteri()
+        kurulum = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        for _ in range(n):
+            sayfa_sablonu(vendor, yil, sayfa)
+        yeni = (time.perf_counter() - t0) / n
+
+        self.stdout.write(f"{vendor}/{yil}/{sayfa}, {n} tekrar")
+        self.stdout.write(f"  eski : {eski * 1e6:10.1f} µs/istek")
+        self.stdout.write(f"  yeni : {yeni * 1e6:10.1f} µs/istek  (defter kurulumu bir kez: {kurulum * 1e3:.1f} ms)")
+        if yeni:
+            self.stdout.write(self.style.SUCCESS(f"  {eski / yeni:,.0f}x daha hızlı"))
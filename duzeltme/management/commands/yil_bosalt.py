@@ -0,0 +1,39 @@
+"""
+Bu dosya: duzeltme/management/commands/yil_bosalt.py
+--------------------------------
+Bir sistemin bir yılına ait staging satırlarını ve yükleme kayıtlarını siler.
+
+PostgreSQL'de (sistem, yıl) bölümü TRUNCATE edilir: milyonlarca satır için de
+saniyenin altında biter (bkz. duzeltme/bolumleme.py). Ardından dosyalar
+ham_veri_yukle ile baştan yüklenebilir.
+
+Kullanım:
+    python manage.py yil_bosalt inavitas 2022
+    python manage.py yil_bosalt inavitas 2022 --onayla
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from duzeltme.bolumleme import sistem_modelleri, yil_bosalt
+from duzeltme.models import YuklenenDosya
+
+
+class Command(BaseCommand):
+    help = "Bir sistemin bir yılındaki ham verisini (staging + yükleme kayıtları) siler."
+
+    def add_arguments(self, parser):
+        parser.add_argument("sistem")
+        parser.add_argument("yil", type=int)
+        parser.add_argument("--onayla", action="store_true", help="Sormadan sil")
+
+    def handle(self, *args, **opts):
+        sistem, yil = opts["sistem"], opts["yil"]
+        if not sistem_modelleri(sistem):
+            raise CommandError(f"Tanımsız sistem: {sistem}")
+        dosya = YuklenenDosya.objects.filter(sistem=sistem, yil=yil).count()
+        if not opts["onayla"]:
+            cevap = input(f"{sistem} {yil}: {dosya} dosyanın bütün satırları silinecek. Devam? [e/H] ")
+            if cevap.strip().lower() not in ("e", "evet"):
+                raise CommandError("Vazgeçildi.")
+        for tablo, adet in yil_bosalt(sistem, yil).items():
+            self.stdout.write(self.style.SUCCESS(f"[OK] {tablo}: boşaltıldı, {adet} dosya kaydı silindi."))
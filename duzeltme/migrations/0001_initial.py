@@ -0,0 +1,132 @@
+# Generated by Django 5.2.6 on 2026-10-18 11:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='YuklenenDosya',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dosya_adi', models.CharField(max_length=255, unique=True, verbose_name='Dosya adı')),
+                ('yol', models.CharField(max_length=500, verbose_name='Yol')),
+                ('sistem', models.CharField(max_length=20, verbose_name='Sistem')),
+                ('kategori', models.CharField(max_length=80, verbose_name='Kategori')),
+                ('yil', models.PositiveSmallIntegerField(verbose_name='Yıl')),
+                ('ay', models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='Ay')),
+                ('cekim_tarihi', models.DateField(verbose_name='Çekim tarihi')),
+                ('part', models.PositiveSmallIntegerField(default=1, verbose_name='Parça')),
+                ('versiyon', models.PositiveSmallIntegerField(verbose_name='Versiyon')),
+                ('hedef_tablo', models.CharField(max_length=63, verbose_name='Hedef tablo')),
+                ('satir_sayisi', models.PositiveIntegerField(default=0, verbose_name='Yüklenen satır')),
+                ('hatali_hucre', models.PositiveIntegerField(default=0, verbose_name='Dönüştürülemeyen hücre')),
+                ('durum', models.CharField(choices=[('yukleniyor', 'Yükleniyor'), ('tamam', 'Tamamlandı'), ('hata', 'Hata')], default='yukleniyor', max_length=12, verbose_name='Durum')),
+                ('hata_mesaji', models.TextField(blank=True, verbose_name='Hata mesajı')),
+                ('baslama', models.DateTimeField(auto_now_add=True, verbose_name='Başlama')),
+                ('bitis', models.DateTimeField(blank=True, null=True, verbose_name='Bitiş')),
+            ],
+            options={
+                'verbose_name': 'Yüklenen dosya',
+                'verbose_name_plural': 'Yüklenen dosyalar',
+                'indexes': [models.Index(fields=['sistem', 'kategori', 'yil'], name='duzeltme_yu_sistem_fa8656_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='Tablo1Satiri',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('satir_no', models.PositiveIntegerField(verbose_name='Satır no')),
+                ('sistem', models.CharField(max_length=20, verbose_name='Sistem')),
+                ('yil', models.PositiveSmallIntegerField(verbose_name='Yıl')),
+                ('kesinti_no', models.CharField(blank=True, max_length=50, verbose_name='Kesinti no')),
+                ('il', models.CharField(blank=True, max_length=20, verbose_name='İl')),
+                ('ilce', models.CharField(blank=True, max_length=50, verbose_name='İlçe')),
+                ('sebeke_unsuru', models.CharField(blank=True, max_length=100, verbose_name='Şebeke unsuru / fider')),
+                ('gerilim_seviyesi', models.CharField(blank=True, max_length=10, verbose_name='Gerilim seviyesi')),
+                ('baslama', models.DateTimeField(blank=True, null=True, verbose_name='Başlama')),
+                ('bitis', models.DateTimeField(blank=True, null=True, verbose_name='Bitiş')),
+                ('sure_dk', models.FloatField(blank=True, null=True, verbose_name='Süre (dk)')),
+                ('etkilenen_abone', models.PositiveIntegerField(blank=True, null=True, verbose_name='Etkilenen abone')),
+                ('kesinti_tipi', models.CharField(blank=True, max_length=30, verbose_name='Kesinti tipi')),
+                ('dosya', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='duzeltme.yuklenendosya')),
+            ],
+            options={
+                'verbose_name': 'Tablo1 satırı',
+                'verbose_name_plural': 'Tablo1 satırları',
+                'constraints': [models.UniqueConstraint(fields=('dosya', 'satir_no'), name='tablo1_dosya_satir_tekil')],
+            },
+        ),
+        migrations.CreateModel(
+            name='OsosKesinti',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('satir_no', models.PositiveIntegerField(verbose_name='Satır no')),
+                ('sistem', models.CharField(max_length=20, verbose_name='Sistem')),
+                ('yil', models.PositiveSmallIntegerField(verbose_name='Yıl')),
+                ('modem_no', models.CharField(blank=True, max_length=50, verbose_name='Modem no')),
+                ('il', models.CharField(blank=True, max_length=20, verbose_name='İl')),
+                ('baslama', models.DateTimeField(blank=True, null=True, verbose_name='Başlama')),
+                ('bitis', models.DateTimeField(blank=True, null=True, verbose_name='Bitiş')),
+                ('dosya', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='duzeltme.yuklenendosya')),
+            ],
+            options={
+                'verbose_name': 'OSOS haberleşme kesintisi',
+                'verbose_name_plural': 'OSOS haberleşme kesintileri',
+                'constraints': [models.UniqueConstraint(fields=('dosya', 'satir_no'), name='osos_dosya_satir_tekil')],
+            },
+        ),
+        migrations.CreateModel(
+            name='Kesinti',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('satir_no', models.PositiveIntegerField(verbose_name='Satır no')),
+                ('sistem', models.CharField(max_length=20, verbose_name='Sistem')),
+                ('yil', models.PositiveSmallIntegerField(verbose_name='Yıl')),
+                ('kesinti_no', models.CharField(blank=True, max_length=50, verbose_name='Kesinti no')),
+                ('il', models.CharField(blank=True, max_length=20, verbose_name='İl')),
+                ('ilce', models.CharField(blank=True, max_length=50, verbose_name='İlçe')),
+                ('sebeke_unsuru', models.CharField(blank=True, max_length=100, verbose_name='Şebeke unsuru / fider')),
+                ('gerilim_seviyesi', models.CharField(blank=True, max_length=10, verbose_name='Gerilim seviyesi')),
+                ('baslama', models.DateTimeField(blank=True, null=True, verbose_name='Başlama')),
+                ('bitis', models.DateTimeField(blank=True, null=True, verbose_name='Bitiş')),
+                ('sure_dk', models.FloatField(blank=True, null=True, verbose_name='Süre (dk)')),
+                ('etkilenen_abone', models.PositiveIntegerField(blank=True, null=True, verbose_name='Etkilenen abone')),
+                ('kesinti_tipi', models.CharField(blank=True, max_length=30, verbose_name='Kesinti tipi')),
+                ('dosya', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='duzeltme.yuklenendosya')),
+            ],
+            options={
+                'verbose_name': 'Kesinti',
+                'verbose_name_plural': 'Kesintiler',
+                'constraints': [models.UniqueConstraint(fields=('dosya', 'satir_no'), name='kesinti_dosya_satir_tekil')],
+            },
+        ),
+        migrations.CreateModel(
+            name='Bildirim',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('satir_no', models.PositiveIntegerField(verbose_name='Satır no')),
+                ('sistem', models.CharField(max_length=20, verbose_name='Sistem')),
+                ('yil', models.PositiveSmallIntegerField(verbose_name='Yıl')),
+                ('bildirim_no', models.CharField(blank=True, max_length=50, verbose_name='Bildirim no')),
+                ('il', models.CharField(blank=True, max_length=20, verbose_name='İl')),
+                ('ilce', models.CharField(blank=True, max_length=50, verbose_name='İlçe')),
+                ('sebeke_unsuru', models.CharField(blank=True, max_length=100, verbose_name='Şebeke unsuru / tesisat')),
+                ('bildirim_zamani', models.DateTimeField(blank=True, null=True, verbose_name='Bildirim zamanı')),
+                ('kesinti_no', models.CharField(blank=True, max_length=50, verbose_name='Kesinti no')),
+                ('dosya', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='duzeltme.yuklenendosya')),
+            ],
+            options={
+                'verbose_name': 'Bildirim',
+                'verbose_name_plural': 'Bildirimler',
+                'constraints': [models.UniqueConstraint(fields=('dosya', 'satir_no'), name='bildirim_dosya_satir_tekil')],
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.6 on 2026-10-18 11:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('duzeltme', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='yuklenendosya',
+            name='sha256',
+            field=models.CharField(blank=True, max_length=64, verbose_name='Dosya özeti (sha256)'),
+        ),
+        migrations.AddField(
+            model_name='yuklenendosya',
+            name='son_bayt',
+            field=models.BigIntegerField(default=0, verbose_name='Son bayt (csv)'),
+        ),
+        migrations.AddField(
+            model_name='yuklenendosya',
+            name='son_sayfa',
+            field=models.CharField(blank=True, max_length=100, verbose_name='Son sayfa'),
+        ),
+        migrations.AddField(
+            model_name='yuklenendosya',
+            name='son_sayfa_satiri',
+            field=models.PositiveIntegerField(default=0, verbose_name='Son sayfa satırı'),
+        ),
+    ]
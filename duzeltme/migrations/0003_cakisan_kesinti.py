@@ -0,0 +1,49 @@
+# Generated by Django 5.2.6 on 2026-10-18 11:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('duzeltme', '0002_yukleme_kontrol_noktasi'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CakisanKesinti',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sistem', models.CharField(max_length=20, verbose_name='Sistem')),
+                ('yil', models.PositiveSmallIntegerField(verbose_name='Yıl')),
+                ('sebeke_unsuru', models.CharField(max_length=100, verbose_name='Şebeke unsuru / fider')),
+                ('tip', models.CharField(choices=[('kismi', 'Kısmi çakışma'), ('ic_ice', 'İç içe')], max_length=10, verbose_name='Tip')),
+                ('cakisma_baslama', models.DateTimeField(verbose_name='Çakışma başlama')),
+                ('cakisma_bitis', models.DateTimeField(verbose_name='Çakışma bitiş')),
+                ('cakisma_dk', models.FloatField(verbose_name='Çakışma (dk)')),
+            ],
+            options={
+                'verbose_name': 'Çakışan kesinti',
+                'verbose_name_plural': 'Çakışan kesintiler',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='kesinti',
+            index=models.Index(fields=['sistem', 'yil', 'sebeke_unsuru', 'baslama'], name='kesinti_unsur_baslama_idx'),
+        ),
+        migrations.AddField(
+            model_name='cakisankesinti',
+            name='kesinti_a',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='duzeltme.kesinti'),
+        ),
+        migrations.AddField(
+            model_name='cakisankesinti',
+            name='kesinti_b',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='duzeltme.kesinti'),
+        ),
+        migrations.AddIndex(
+            model_name='cakisankesinti',
+            index=models.Index(fields=['sistem', 'yil', 'tip'], name='duzeltme_ca_sistem_b9821e_idx'),
+        ),
+    ]
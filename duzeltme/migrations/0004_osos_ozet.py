@@ -0,0 +1,65 @@
+# Generated by Django 5.2.6 on 2026-10-18 11:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('duzeltme', '0003_cakisan_kesinti'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OsosGunlukOzet',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('yil', models.PositiveSmallIntegerField(verbose_name='Yıl')),
+                ('il', models.CharField(blank=True, max_length=20, verbose_name='İl')),
+                ('gun', models.DateField(verbose_name='Gün')),
+                ('kesinti_sayisi', models.PositiveIntegerField(verbose_name='O gün başlayan kesinti')),
+                ('modem_sayisi', models.PositiveIntegerField(verbose_name='Etkilenen modem')),
+                ('toplam_sure_sn', models.BigIntegerField(verbose_name='Toplam süre (sn)')),
+            ],
+            options={
+                'verbose_name': 'OSOS günlük özet',
+                'verbose_name_plural': 'OSOS günlük özetler',
+                'constraints': [models.UniqueConstraint(fields=('yil', 'il', 'gun'), name='osos_gunluk_ozet_tekil')],
+            },
+        ),
+        migrations.CreateModel(
+            name='OsosIlOzet',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('yil', models.PositiveSmallIntegerField(verbose_name='Yıl')),
+                ('il', models.CharField(blank=True, max_length=20, verbose_name='İl')),
+                ('modem_sayisi', models.PositiveIntegerField(verbose_name='Modem sayısı')),
+                ('kesinti_sayisi', models.PositiveIntegerField(verbose_name='Kesinti sayısı')),
+                ('toplam_sure_sn', models.BigIntegerField(verbose_name='Toplam süre (sn)')),
+                ('en_uzun_sn', models.BigIntegerField(verbose_name='En uzun kesinti (sn)')),
+            ],
+            options={
+                'verbose_name': 'OSOS il özeti',
+                'verbose_name_plural': 'OSOS il özetleri',
+                'constraints': [models.UniqueConstraint(fields=('yil', 'il'), name='osos_il_ozet_tekil')],
+            },
+        ),
+        migrations.CreateModel(
+            name='OsosModemOzet',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('yil', models.PositiveSmallIntegerField(verbose_name='Yıl')),
+                ('modem_no', models.CharField(max_length=50, verbose_name='Modem no')),
+                ('il', models.CharField(blank=True, max_length=20, verbose_name='İl')),
+                ('kesinti_sayisi', models.PositiveIntegerField(verbose_name='Kesinti sayısı')),
+                ('toplam_sure_sn', models.BigIntegerField(verbose_name='Toplam süre (sn)')),
+                ('en_uzun_sn', models.BigIntegerField(verbose_name='En uzun kesinti (sn)')),
+            ],
+            options={
+                'verbose_name': 'OSOS modem özeti',
+                'verbose_name_plural': 'OSOS modem özetleri',
+                'indexes': [models.Index(fields=['yil', 'il', '-toplam_sure_sn'], name='osos_modem_il_sure_idx')],
+                'constraints': [models.UniqueConstraint(fields=('yil', 'modem_no'), name='osos_modem_ozet_tekil')],
+            },
+        ),
+    ]
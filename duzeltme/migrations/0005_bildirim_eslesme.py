@@ -0,0 +1,69 @@
+# Generated by Django 5.2.6 on 2026-10-18 11:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('duzeltme', '0004_osos_ozet'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BildirimEslesme',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('bildirim_sistemi', models.CharField(max_length=20, verbose_name='Bildirim sistemi')),
+                ('kesinti_sistemi', models.CharField(max_length=20, verbose_name='Kesinti sistemi')),
+                ('yil', models.PositiveSmallIntegerField(verbose_name='Yıl')),
+                ('yontem', models.CharField(blank=True, choices=[('kesinti_no', 'Kesinti no'), ('zaman', 'Şebeke unsuru + zaman')], max_length=12, verbose_name='Yöntem')),
+                ('fark_dk', models.FloatField(blank=True, null=True, verbose_name='Bildirim - kesinti başlama (dk)')),
+            ],
+            options={
+                'verbose_name': 'Bildirim eşleşmesi',
+                'verbose_name_plural': 'Bildirim eşleşmeleri',
+            },
+        ),
+        migrations.CreateModel(
+            name='EslestirmeCalismasi',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('bildirim_sistemi', models.CharField(max_length=20, verbose_name='Bildirim sistemi')),
+                ('kesinti_sistemi', models.CharField(max_length=20, verbose_name='Kesinti sistemi')),
+                ('yil', models.PositiveSmallIntegerField(verbose_name='Yıl')),
+                ('parmak_izi', models.CharField(max_length=64, verbose_name='Parmak izi')),
+                ('bildirim_sayisi', models.PositiveIntegerField(default=0, verbose_name='Bildirim')),
+                ('eslesen', models.PositiveIntegerField(default=0, verbose_name='Eşleşen')),
+                ('eslesmeyen', models.PositiveIntegerField(default=0, verbose_name='Eşleşmeyen')),
+                ('tarih', models.DateTimeField(auto_now=True, verbose_name='Tarih')),
+            ],
+            options={
+                'verbose_name': 'Eşleştirme çalışması',
+                'verbose_name_plural': 'Eşleştirme çalışmaları',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='bildirim',
+            index=models.Index(fields=['sistem', 'yil'], name='bildirim_sistem_yil_idx'),
+        ),
+        migrations.AddField(
+            model_name='bildirimeslesme',
+            name='bildirim',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='duzeltme.bildirim'),
+        ),
+        migrations.AddField(
+            model_name='bildirimeslesme',
+            name='kesinti',
+            field=models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='duzeltme.kesinti'),
+        ),
+        migrations.AddConstraint(
+            model_name='eslestirmecalismasi',
+            constraint=models.UniqueConstraint(fields=('bildirim_sistemi', 'kesinti_sistemi', 'yil'), name='eslestirme_calismasi_tekil'),
+        ),
+        migrations.AddIndex(
+            model_name='bildirimeslesme',
+            index=models.Index(fields=['bildirim_sistemi', 'yil', 'kesinti'], name='duzeltme_bi_bildiri_d8fc72_idx'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.6 on 2026-10-18 11:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('duzeltme', '0005_bildirim_eslesme'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='kesinti',
+            index=models.Index(fields=['sistem', 'yil', 'baslama', 'id'], name='kesinti_baslama_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='kesinti',
+            index=models.Index(fields=['sistem', 'yil', 'sure_dk', 'id'], name='kesinti_sure_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='kesinti',
+            index=models.Index(fields=['sistem', 'yil', 'il', 'baslama'], name='kesinti_il_baslama_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tablo1satiri',
+            index=models.Index(fields=['sistem', 'yil', 'id'], name='tablo1_sistem_yil_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tablo1satiri',
+            index=models.Index(fields=['sistem', 'yil', 'baslama', 'id'], name='tablo1_baslama_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tablo1satiri',
+            index=models.Index(fields=['sistem', 'yil', 'sure_dk', 'id'], name='tablo1_sure_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tablo1satiri',
+            index=models.Index(fields=['sistem', 'yil', 'il', 'baslama'], name='tablo1_il_baslama_idx'),
+        ),
+    ]
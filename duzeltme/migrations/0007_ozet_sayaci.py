@@ -0,0 +1,32 @@
+# Generated by Django 5.2.6 on 2026-10-18 11:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('duzeltme', '0006_grid_indeksleri'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OzetSayaci',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sistem', models.CharField(max_length=20, verbose_name='Sistem')),
+                ('yil', models.PositiveSmallIntegerField(verbose_name='Yıl')),
+                ('bolum', models.CharField(max_length=20, verbose_name='Bölüm')),
+                ('anahtar', models.CharField(max_length=80, verbose_name='Anahtar')),
+                ('deger', models.BigIntegerField(default=0, verbose_name='Değer')),
+                ('tarih', models.DateField(blank=True, null=True, verbose_name='Tarih')),
+                ('guncelleme', models.DateTimeField(auto_now=True, verbose_name='Güncelleme')),
+            ],
+            options={
+                'verbose_name': 'Özet sayacı',
+                'verbose_name_plural': 'Özet sayaçları',
+                'indexes': [models.Index(fields=['yil', 'sistem'], name='duzeltme_oz_yil_ed099c_idx')],
+                'constraints': [models.UniqueConstraint(fields=('sistem', 'yil', 'bolum', 'anahtar'), name='ozet_sayaci_tekil')],
+            },
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.6 on 2026-10-18 11:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('duzeltme', '0007_ozet_sayaci'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VeriSurumu',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sistem', models.CharField(max_length=20, verbose_name='Sistem')),
+                ('yil', models.PositiveSmallIntegerField(verbose_name='Yıl')),
+                ('surum', models.PositiveIntegerField(default=0, verbose_name='Sürüm')),
+                ('degisme', models.DateTimeField(verbose_name='Son değişme')),
+            ],
+            options={
+                'verbose_name': 'Veri sürümü',
+                'verbose_name_plural': 'Veri sürümleri',
+                'constraints': [models.UniqueConstraint(fields=('sistem', 'yil'), name='veri_surumu_tekil')],
+            },
+        ),
+    ]
@@ -0,0 +1,142 @@
+# Generated by Django 5.2.6 on 2026-10-18 12:02
+
+import re
+
+from django.db import migrations, models
+
+# PostgreSQL: staging tabloları yıla (RANGE) ve her yıl sisteme (LIST) göre
+# bölümlenir (bkz. duzeltme/bolumleme.py). Tablo yeniden kurulur: eski tablo
+# yeniden adlandırılır, bölümlü eşi oluşturulur, satırlar kopyalanır, indeks
+# ve kısıtlar (Django'nun adlarıyla) yeni tabloda tekrar yaratılır.
+# Bölüm anahtarı her tekil kısıtta olmak zorunda: birincil anahtar (id, yil, sistem).
+# SQLite'ta bu adım atlanır.
+
+TABLOLAR = {
+    "duzeltme_kesinti": ("baslama", "bitis"),
+    "duzeltme_tablo1satiri": ("baslama", "bitis"),
+    "duzeltme_bildirim": ("bildirim_zamani",),
+    "duzeltme_ososkesinti": ("baslama", "bitis"),
+}
+
+
+def _yeniden_kur(cursor, tablo, bolumlu):
+    # Kısıtlara bağlı olmayan indeksler ve tekil / yabancı anahtar kısıtları
+    cursor.execute(
+        "SELECT pg_get_indexdef(x.indexrelid) FROM pg_index x WHERE x.indrelid = %s::regclass "
+        "AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = x.indexrelid)",
+        [tablo])
+    indeksler = [r[0].replace(" ON ONLY ", " ON ") for r in cursor.fetchall()]
+    cursor.execute(
+        "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+        "WHERE conrelid = %s::regclass AND contype IN ('u', 'f') ORDER BY contype DESC, conname",
+        [tablo])
+    kisitlar = cursor.fetchall()
+    cursor.execute(f'SELECT DISTINCT yil, sistem FROM "{tablo}" ORDER BY 1, 2')
+    bolumler = cursor.fetchall()
+
+    cursor.execute(f'ALTER TABLE "{tablo}" RENAME TO "{tablo}_eski"')
+    cursor.execute(
+        f'CREATE TABLE "{tablo}" (LIKE "{tablo}_eski" INCLUDING DEFAULTS INCLUDING CONSTRAINTS '
+        f'INCLUDING IDENTITY)' + (' PARTITION BY RANGE ("yil")' if bolumlu else ""))
+    if bolumlu:
+        cursor.execute(f'CREATE TABLE "{tablo}_diger" PARTITION OF "{tablo}" DEFAULT')
+        for yil in sorted({y for y, _ in bolumler}):
+            cursor.execute(f'CREATE TABLE "{tablo}_{yil}" PARTITION OF "{tablo}" '
+                           f'FOR VALUES FROM ({yil}) TO ({yil + 1}) PARTITION BY LIST ("sistem")')
+            cursor.execute(f'CREATE TABLE "{tablo}_{yil}_diger" PARTITION OF "{tablo}_{yil}" DEFAULT')
+        for yil, sistem in bolumler:
+            if re.fullmatch(r"[a-z0-9]+", sistem):  # değilse DEFAULT bölümde kalır
+                cursor.execute(f'CREATE TABLE "{tablo}_{yil}_{sistem}" PARTITION OF "{tablo}_{yil}" '
+                               f"FOR VALUES IN ('{sistem}')")
+    cursor.execute(f'INSERT INTO "{tablo}" OVERRIDING SYSTEM VALUE SELECT * FROM "{tablo}_eski"')
+    cursor.execute(f'SELECT COALESCE(MAX("id"), 0) + 1 FROM "{tablo}"')
+    cursor.execute(f'ALTER TABLE "{tablo}" ALTER COLUMN "id" RESTART WITH {cursor.fetchone()[0]}')
+    cursor.execute(f'DROP TABLE "{tablo}_eski" CASCADE')
+
+    anahtar = '"id", "yil", "sistem"' if bolumlu else '"id"'
+    cursor.execute(f'ALTER TABLE "{tablo}" ADD CONSTRAINT "{tablo}_pkey" PRIMARY KEY ({anahtar})')
+    for ad, tanim in kisitlar:
+        cursor.execute(f'ALTER TABLE "{tablo}" ADD CONSTRAINT "{ad}" {tanim}')
+    for tanim in indeksler:
+        if bolumlu or " USING brin " not in tanim:
+            cursor.execute(tanim)
+    if bolumlu:
+        # Zaman kolonları dosya sırasıyla kabaca artan yazılır: BRIN küçük ve yeterli
+        for kolon in TABLOLAR[tablo]:
+            cursor.execute(f'CREATE INDEX "{tablo[9:]}_{kolon}_brin" ON "{tablo}" USING brin ("{kolon}")')
+    cursor.execute(f'ANALYZE "{tablo}"')
+
+
+def bolumle(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for tablo in TABLOLAR:
+            _yeniden_kur(cursor, tablo, bolumlu=True)
+
+
+def bolumu_kaldir(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for tablo in TABLOLAR:
+            _yeniden_kur(cursor, tablo, bolumlu=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('duzeltme', '0008_veri_surumu'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='bildirim',
+            name='bildirim_dosya_satir_tekil',
+        ),
+        migrations.RemoveConstraint(
+            model_name='kesinti',
+            name='kesinti_dosya_satir_tekil',
+        ),
+        migrations.RemoveConstraint(
+            model_name='ososkesinti',
+            name='osos_dosya_satir_tekil',
+        ),
+        migrations.RemoveConstraint(
+            model_name='tablo1satiri',
+            name='tablo1_dosya_satir_tekil',
+        ),
+        migrations.AddIndex(
+            model_name='bildirim',
+            index=models.Index(fields=['sistem', 'yil', 'sebeke_unsuru', 'bildirim_zamani'], name='bildirim_unsur_zaman_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bildirim',
+            index=models.Index(fields=['sistem', 'yil', 'kesinti_no'], name='bildirim_kesinti_no_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='kesinti',
+            index=models.Index(fields=['sistem', 'yil', 'kesinti_no'], name='kesinti_no_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ososkesinti',
+            index=models.Index(fields=['yil', 'modem_no', 'baslama'], name='osos_modem_baslama_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='bildirim',
+            constraint=models.UniqueConstraint(fields=('dosya', 'satir_no', 'sistem', 'yil'), name='bildirim_dosya_satir_tekil'),
+        ),
+        migrations.AddConstraint(
+            model_name='kesinti',
+            constraint=models.UniqueConstraint(fields=('dosya', 'satir_no', 'sistem', 'yil'), name='kesinti_dosya_satir_tekil'),
+        ),
+        migrations.AddConstraint(
+            model_name='ososkesinti',
+            constraint=models.UniqueConstraint(fields=('dosya', 'satir_no', 'sistem', 'yil'), name='osos_dosya_satir_tekil'),
+        ),
+        migrations.AddConstraint(
+            model_name='tablo1satiri',
+            constraint=models.UniqueConstraint(fields=('dosya', 'satir_no', 'sistem', 'yil'), name='tablo1_dosya_satir_tekil'),
+        ),
+        migrations.RunPython(bolumle, bolumu_kaldir),
+    ]
@@ -0,0 +1,102 @@
+# Generated by Django 5.2.6 on 2026-10-18 12:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('duzeltme', '0009_yil_bolumleri'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bildirim',
+            name='anahtar_ozeti',
+            field=models.BigIntegerField(blank=True, editable=False, null=True, verbose_name='Anahtar özeti'),
+        ),
+        migrations.AddField(
+            model_name='bildirim',
+            name='satir_ozeti',
+            field=models.BigIntegerField(blank=True, editable=False, null=True, verbose_name='Satır özeti'),
+        ),
+        migrations.AddField(
+            model_name='kesinti',
+            name='anahtar_ozeti',
+            field=models.BigIntegerField(blank=True, editable=False, null=True, verbose_name='Anahtar özeti'),
+        ),
+        migrations.AddField(
+            model_name='kesinti',
+            name='satir_ozeti',
+            field=models.BigIntegerField(blank=True, editable=False, null=True, verbose_name='Satır özeti'),
+        ),
+        migrations.AddField(
+            model_name='ososkesinti',
+            name='anahtar_ozeti',
+            field=models.BigIntegerField(blank=True, editable=False, null=True, verbose_name='Anahtar özeti'),
+        ),
+        migrations.AddField(
+            model_name='ososkesinti',
+            name='satir_ozeti',
+            field=models.BigIntegerField(blank=True, editable=False, null=True, verbose_name='Satır özeti'),
+        ),
+        migrations.AddField(
+            model_name='tablo1satiri',
+            name='anahtar_ozeti',
+            field=models.BigIntegerField(blank=True, editable=False, null=True, verbose_name='Anahtar özeti'),
+        ),
+        migrations.AddField(
+            model_name='tablo1satiri',
+            name='satir_ozeti',
+            field=models.BigIntegerField(blank=True, editable=False, null=True, verbose_name='Satır özeti'),
+        ),
+        migrations.AlterField(
+            model_name='yuklenendosya',
+            name='durum',
+            field=models.CharField(choices=[('yukleniyor', 'Yükleniyor'), ('tamam', 'Tamamlandı'), ('hata', 'Hata'), ('eski', 'Yeni sürümle değişti')], default='yukleniyor', max_length=12, verbose_name='Durum'),
+        ),
+        migrations.CreateModel(
+            name='DegisiklikSeti',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sistem', models.CharField(max_length=20, verbose_name='Sistem')),
+                ('kategori', models.CharField(max_length=80, verbose_name='Kategori')),
+                ('yil', models.PositiveSmallIntegerField(verbose_name='Yıl')),
+                ('hedef_tablo', models.CharField(max_length=63, verbose_name='Hedef tablo')),
+                ('eklenen', models.PositiveIntegerField(default=0, verbose_name='Eklenen')),
+                ('guncellenen', models.PositiveIntegerField(default=0, verbose_name='Güncellenen')),
+                ('silinen', models.PositiveIntegerField(default=0, verbose_name='Silinen')),
+                ('ayni', models.PositiveIntegerField(default=0, verbose_name='Değişmeyen')),
+                ('tam_degisim', models.BooleanField(default=False, verbose_name='Tam değişim')),
+                ('islenenler', models.JSONField(blank=True, default=list, verbose_name='İşleyen hesaplamalar')),
+                ('olusturma', models.DateTimeField(auto_now_add=True, verbose_name='Oluşturma')),
+                ('eski_dosya', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='duzeltme.yuklenendosya')),
+                ('yeni_dosya', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='duzeltme.yuklenendosya')),
+            ],
+            options={
+                'verbose_name': 'Değişiklik seti',
+                'verbose_name_plural': 'Değişiklik setleri',
+            },
+        ),
+        migrations.CreateModel(
+            name='DegisenSatir',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tur', models.CharField(choices=[('eklendi', 'Eklendi'), ('guncellendi', 'Güncellendi'), ('silindi', 'Silindi')], max_length=12, verbose_name='Tür')),
+                ('satir_id', models.BigIntegerField(verbose_name='Satır id')),
+                ('anahtar', models.CharField(blank=True, max_length=100, verbose_name='Anahtar')),
+                ('varlik', models.CharField(blank=True, max_length=100, verbose_name='Varlık')),
+                ('eski_varlik', models.CharField(blank=True, max_length=100, verbose_name='Eski varlık')),
+                ('degisiklik', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='satirlar', to='duzeltme.degisiklikseti')),
+            ],
+            options={
+                'verbose_name': 'Değişen satır',
+                'verbose_name_plural': 'Değişen satırlar',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='degisiklikseti',
+            index=models.Index(fields=['hedef_tablo', 'sistem', 'yil'], name='duzeltme_de_hedef_t_3f1dba_idx'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.6 on 2026-10-18 12:17
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('duzeltme', '0010_surum_farki'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Gorev',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tur', models.CharField(max_length=20, verbose_name='Tür')),
+                ('parametreler', models.JSONField(blank=True, default=dict, verbose_name='Parametreler')),
+                ('yil', models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='Yıl')),
+                ('durum', models.CharField(choices=[('bekliyor', 'Bekliyor'), ('calisiyor', 'Çalışıyor'), ('tamam', 'Tamamlandı'), ('hata', 'Hata')], default='bekliyor', max_length=12, verbose_name='Durum')),
+                ('islenen', models.BigIntegerField(default=0, verbose_name='İşlenen satır')),
+                ('yuzde', models.FloatField(default=0, verbose_name='İlerleme (%)')),
+                ('satir_sn', models.FloatField(blank=True, null=True, verbose_name='Satır/sn')),
+                ('mesaj', models.CharField(blank=True, max_length=255, verbose_name='Mesaj')),
+                ('sonuc', models.JSONField(blank=True, null=True, verbose_name='Sonuç')),
+                ('hata_mesaji', models.TextField(blank=True, verbose_name='Hata')),
+                ('isci', models.CharField(blank=True, max_length=100, verbose_name='İşçi (makine:pid)')),
+                ('olusturma', models.DateTimeField(auto_now_add=True, verbose_name='Oluşturma')),
+                ('baslama', models.DateTimeField(blank=True, null=True, verbose_name='Başlama')),
+                ('bitis', models.DateTimeField(blank=True, null=True, verbose_name='Bitiş')),
+                ('guncelleme', models.DateTimeField(blank=True, null=True, verbose_name='Son ilerleme')),
+                ('olusturan', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Görev',
+                'verbose_name_plural': 'Görevler',
+                'indexes': [models.Index(fields=['durum', 'olusturma'], name='gorev_kuyruk_idx'), models.Index(fields=['yil', '-olusturma'], name='gorev_yil_idx')],
+            },
+        ),
+    ]
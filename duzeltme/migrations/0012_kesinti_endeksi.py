@@ -0,0 +1,35 @@
+# Generated by Django 5.2.6 on 2026-10-18 12:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('duzeltme', '0011_gorev'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='KesintiEndeksi',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sistem', models.CharField(max_length=20, verbose_name='Sistem')),
+                ('tablo', models.CharField(max_length=10, verbose_name='Tablo')),
+                ('yil', models.PositiveSmallIntegerField(verbose_name='Yıl')),
+                ('il', models.CharField(blank=True, max_length=20, verbose_name='İl')),
+                ('gerilim_seviyesi', models.CharField(blank=True, max_length=10, verbose_name='Gerilim seviyesi')),
+                ('kesinti_sayisi', models.PositiveIntegerField(verbose_name='Uzun kesinti')),
+                ('kisa_kesinti_sayisi', models.PositiveIntegerField(verbose_name='Kısa kesinti (≤ 3 dk)')),
+                ('abone_kesinti', models.BigIntegerField(verbose_name='Kesintiye uğrayan abone')),
+                ('abone_dakika', models.FloatField(verbose_name='Kayıp abone-dakika')),
+                ('toplam_sure_dk', models.FloatField(verbose_name='Toplam süre (dk)')),
+                ('en_uzun_dk', models.FloatField(verbose_name='En uzun kesinti (dk)')),
+            ],
+            options={
+                'verbose_name': 'Kesinti endeksi',
+                'verbose_name_plural': 'Kesinti endeksleri',
+                'constraints': [models.UniqueConstraint(fields=('sistem', 'tablo', 'yil', 'il', 'gerilim_seviyesi'), name='kesinti_endeksi_tekil')],
+            },
+        ),
+    ]
@@ -0,0 +1,106 @@
+# Generated by Django 5.2.6 on 2026-10-18 12:30
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+# Çakışma ve eşleşme sonuçlarına il kolonu eklenir (il kapsamıyla süzmek için);
+# mevcut satırlar kaynak kesinti / bildirimden doldurulur. Özet sayaçlarının il
+# kırılımı bir sonraki hesapta (ya da ozet_yenile ile) oluşur.
+
+
+def il_doldur(apps, schema_editor):
+    Kesinti = apps.get_model("duzeltme", "Kesinti")
+    Bildirim = apps.get_model("duzeltme", "Bildirim")
+    apps.get_model("duzeltme", "CakisanKesinti").objects.update(il=Coalesce(Subquery(
+        Kesinti.objects.filter(pk=OuterRef("kesinti_a_id"), sistem=OuterRef("sistem"), yil=OuterRef("yil"))
+        .values("il")[:1]), Value("")))
+    apps.get_model("duzeltme", "BildirimEslesme").objects.update(il=Coalesce(Subquery(
+        Bildirim.objects.filter(pk=OuterRef("bildirim_id"), sistem=OuterRef("bildirim_sistemi"), yil=OuterRef("yil"))
+        .values("il")[:1]), Value("")))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('duzeltme', '0012_kesinti_endeksi'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='ozetsayaci',
+            name='ozet_sayaci_tekil',
+        ),
+        migrations.RemoveIndex(
+            model_name='kesinti',
+            name='kesinti_il_baslama_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='ozetsayaci',
+            name='duzeltme_oz_yil_ed099c_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='tablo1satiri',
+            name='tablo1_il_baslama_idx',
+        ),
+        migrations.AddField(
+            model_name='bildirimeslesme',
+            name='il',
+            field=models.CharField(blank=True, max_length=20, verbose_name='İl'),
+        ),
+        migrations.AddField(
+            model_name='cakisankesinti',
+            name='il',
+            field=models.CharField(blank=True, max_length=20, verbose_name='İl'),
+        ),
+        migrations.AddField(
+            model_name='ozetsayaci',
+            name='il',
+            field=models.CharField(blank=True, default='', max_length=20, verbose_name='İl'),
+        ),
+        migrations.RunPython(il_doldur, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='bildirim',
+            index=models.Index(fields=['sistem', 'yil', 'il', 'id'], name='bildirim_il_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bildirimeslesme',
+            index=models.Index(fields=['bildirim_sistemi', 'yil', 'il', 'kesinti'], name='eslesme_il_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cakisankesinti',
+            index=models.Index(fields=['sistem', 'yil', 'il', 'tip'], name='cakisan_il_tip_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='kesinti',
+            index=models.Index(fields=['sistem', 'yil', 'il', 'baslama', 'id'], name='kesinti_il_baslama_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='kesinti',
+            index=models.Index(fields=['sistem', 'yil', 'il', 'id'], name='kesinti_il_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='kesinti',
+            index=models.Index(fields=['sistem', 'yil', 'il', 'sure_dk', 'id'], name='kesinti_il_sure_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ozetsayaci',
+            index=models.Index(fields=['yil', 'il', 'sistem'], name='ozet_sayaci_yil_il_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tablo1satiri',
+            index=models.Index(fields=['sistem', 'yil', 'il', 'baslama', 'id'], name='tablo1_il_baslama_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tablo1satiri',
+            index=models.Index(fields=['sistem', 'yil', 'il', 'id'], name='tablo1_il_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tablo1satiri',
+            index=models.Index(fields=['sistem', 'yil', 'il', 'sure_dk', 'id'], name='tablo1_il_sure_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='ozetsayaci',
+            constraint=models.UniqueConstraint(fields=('sistem', 'yil', 'bolum', 'anahtar', 'il'), name='ozet_sayaci_tekil'),
+        ),
+    ]
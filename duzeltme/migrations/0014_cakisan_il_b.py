@@ -0,0 +1,34 @@
+# Generated by Django 5.2.6 on 2026-10-18 12:58
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+# Çakışan çiftin kesinti_b tarafının ili de saklanır (il sınırındaki unsurlar);
+# mevcut satırlar kesinti_b'den doldurulur.
+
+
+def il_b_doldur(apps, schema_editor):
+    Kesinti = apps.get_model("duzeltme", "Kesinti")
+    apps.get_model("duzeltme", "CakisanKesinti").objects.update(il_b=Coalesce(Subquery(
+        Kesinti.objects.filter(pk=OuterRef("kesinti_b_id"), sistem=OuterRef("sistem"), yil=OuterRef("yil"))
+        .values("il")[:1]), Value("")))
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('duzeltme', '0013_il_kapsami'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cakisankesinti',
+            name='il_b',
+            field=models.CharField(blank=True, max_length=20, verbose_name='İl (kesinti_b)'),
+        ),
+        migrations.RunPython(il_b_doldur, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='cakisankesinti',
+            index=models.Index(fields=['sistem', 'yil', 'il_b', 'tip'], name='cakisan_il_b_tip_idx'),
+        ),
+    ]
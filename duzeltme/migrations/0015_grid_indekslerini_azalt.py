@@ -0,0 +1,37 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:04
+
+from django.db import migrations
+
+# Grid'in kullanmadığı sıralama indeksleri kaldırılır: her indeks COPY ile
+# yüklenen staging tablolarına yazma maliyeti ekliyordu. id sıralaması
+# birincil anahtardan, il kullanıcısının id sıralaması *_il_idx'ten okunur.
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('duzeltme', '0014_cakisan_il_b'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='kesinti',
+            name='kesinti_il_baslama_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='kesinti',
+            name='kesinti_il_sure_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='tablo1satiri',
+            name='tablo1_sistem_yil_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='tablo1satiri',
+            name='tablo1_il_baslama_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='tablo1satiri',
+            name='tablo1_il_sure_idx',
+        ),
+    ]
@@ -1,2 +1,556 @@
-# duzeltme/models.py
+"""
+Bu dosya: duzeltme/models.py
+--------------------------------
+ham_veri dosyalarının yüklendiği staging tabloları.
+
+Basit anlatım:
+- YuklenenDosya : Her ham dosya için bir "irsaliye". Hangi sistem/kategori/yıl,
+                  hangi versiyon, kaç satır yüklendi, durum ne?
+- Kesinti, Tablo1Satiri, Bildirim, OsosKesinti : Dosyadaki satırların tipli
+  (tarih, sayı, metin) hâlleri. Satırlar COPY ile toplu yazılır.
+- DegisiklikSeti / DegisenSatir : Bir dosyanın yeni sürümü (v01 -> v02)
+  yüklendiğinde eski sürüme göre eklenen / değişen / silinen satırlar.
+- Gorev : Arka plan işçisinin (gorev_isci) kuyruğundaki uzun işler ve ilerlemeleri.
+- KesintiEndeksi : İl + gerilim seviyesi başına kesinti süre / sıklık göstergeleri.
+
+Not: Staging tablolarındaki alanların çoğu boş bırakılabilir; ham dosyalarda
+eksik/bozuk hücre olabiliyor, yükleme bunları NULL olarak yazar.
+"""
+
+from django.conf import settings
 from django.db import models
+
+
+class YuklenenDosya(models.Model):
+    """
+    Bir ham_veri dosyasının yükleme kaydı.
+
+    Dosya adından gelen alanlar (sistem, kategori, yil, ay, cekim_tarihi,
+    part, versiyon) donusturme() isim kuralıyla birebir aynıdır.
+    """
+
+    DURUM_YUKLENIYOR = "yukleniyor"
+    DURUM_TAMAM = "tamam"
+    DURUM_HATA = "hata"
+    DURUM_ESKI = "eski"
+    DURUM_CHOICES = [
+        (DURUM_YUKLENIYOR, "Yükleniyor"),
+        (DURUM_TAMAM, "Tamamlandı"),
+        (DURUM_HATA, "Hata"),
+        (DURUM_ESKI, "Yeni sürümle değişti"),
+    ]
+
+    dosya_adi = models.CharField("Dosya adı", max_length=255, unique=True)
+    yol = models.CharField("Yol", max_length=500)
+    sistem = models.CharField("Sistem", max_length=20)
+    kategori = models.CharField("Kategori", max_length=80)
+    yil = models.PositiveSmallIntegerField("Yıl")
+    ay = models.PositiveSmallIntegerField("Ay", null=True, blank=True)
+    cekim_tarihi = models.DateField("Çekim tarihi")
+    part = models.PositiveSmallIntegerField("Parça", default=1)
+    versiyon = models.PositiveSmallIntegerField("Versiyon")
+    hedef_tablo = models.CharField("Hedef tablo", max_length=63)
+
+    sha256 = models.CharField("Dosya özeti (sha256)", max_length=64, blank=True)
+
+    # Kontrol noktası: en son commit edilen parçanın bittiği yer.
+    # Yarım kalan yükleme buradan devam eder (bkz. yukleme.dosya_yukle).
+    son_sayfa = models.CharField("Son sayfa", max_length=100, blank=True)
+    son_sayfa_satiri = models.PositiveIntegerField("Son sayfa satırı", default=0)
+    son_bayt = models.BigIntegerField("Son bayt (csv)", default=0)
+
+    satir_sayisi = models.PositiveIntegerField("Yüklenen satır", default=0)
+    hatali_hucre = models.PositiveIntegerField("Dönüştürülemeyen hücre", default=0)
+    durum = models.CharField("Durum", max_length=12, choices=DURUM_CHOICES, default=DURUM_YUKLENIYOR)
+    hata_mesaji = models.TextField("Hata mesajı", blank=True)
+    baslama = models.DateTimeField("Başlama", auto_now_add=True)
+    bitis = models.DateTimeField("Bitiş", null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Yüklenen dosya"
+        verbose_name_plural = "Yüklenen dosyalar"
+        indexes = [models.Index(fields=["sistem", "kategori", "yil"])]
+
+    def __str__(self):
+        return self.dosya_adi
+
+
+class StagingSatiri(models.Model):
+    """
+    Bütün staging tablolarının ortak alanları.
+
+    dosya + satir_no ikilisi bir satırın ham dosyadaki yerini gösterir; aynı
+    satırın iki kez yazılmasını da bu ikili üzerindeki tekillik engeller
+    (sistem ve yil de tekilliğe girer: PostgreSQL'de tablolar yıl ve sisteme
+    göre bölümlüdür, bölüm anahtarı her tekil kısıtta bulunmak zorundadır;
+    bkz. duzeltme.bolumleme). Dosya zaten tek sistem/yıla ait, anlam değişmez.
+    """
+
+    # Milyonlarca satırı ORM cascade ile silmemek için DO_NOTHING;
+    # silme işini yükleyici ham SQL ile kendisi yapar.
+    dosya = models.ForeignKey(YuklenenDosya, on_delete=models.DO_NOTHING, related_name="+")
+    satir_no = models.PositiveIntegerField("Satır no")
+    sistem = models.CharField("Sistem", max_length=20)
+    yil = models.PositiveSmallIntegerField("Yıl")
+    # Sürüm farkı için 64 bitlik özetler (bkz. duzeltme.fark): doğal anahtar ve
+    # satırın bütün içeriği. Bu alanlardan önce yüklenen satırlarda boştur.
+    anahtar_ozeti = models.BigIntegerField("Anahtar özeti", null=True, blank=True, editable=False)
+    satir_ozeti = models.BigIntegerField("Satır özeti", null=True, blank=True, editable=False)
+
+    class Meta:
+        abstract = True
+
+
+class KesintiTabani(StagingSatiri):
+    """Kesinti ve Tablo1 satırlarının ortak alanları."""
+
+    kesinti_no = models.CharField("Kesinti no", max_length=50, blank=True)
+    il = models.CharField("İl", max_length=20, blank=True)
+    ilce = models.CharField("İlçe", max_length=50, blank=True)
+    sebeke_unsuru = models.CharField("Şebeke unsuru / fider", max_length=100, blank=True)
+    gerilim_seviyesi = models.CharField("Gerilim seviyesi", max_length=10, blank=True)
+    baslama = models.DateTimeField("Başlama", null=True, blank=True)
+    bitis = models.DateTimeField("Bitiş", null=True, blank=True)
+    sure_dk = models.FloatField("Süre (dk)", null=True, blank=True)
+    etkilenen_abone = models.PositiveIntegerField("Etkilenen abone", null=True, blank=True)
+    kesinti_tipi = models.CharField("Kesinti tipi", max_length=30, blank=True)
+
+    class Meta:
+        abstract = True
+
+
+class Kesinti(KesintiTabani):
+    """OMS / Inavitas kesinti listeleri."""
+
+    class Meta:
+        verbose_name = "Kesinti"
+        verbose_name_plural = "Kesintiler"
+        constraints = [
+            models.UniqueConstraint(fields=["dosya", "satir_no", "sistem", "yil"], name="kesinti_dosya_satir_tekil"),
+        ]
+        indexes = [
+            # Çakışma motoru ve "bu aralıkla ne çakışıyor" sorguları için
+            models.Index(fields=["sistem", "yil", "sebeke_unsuru", "baslama"], name="kesinti_unsur_baslama_idx"),
+            # Grid'in sıralamaları (bkz. grid.py): id birincil anahtardan, baslama ve sure_dk bunlardan.
+            # Her indeks COPY ile yüklemenin maliyetine eklenir; yalnız grid'de tıklanan sıralamalar var.
+            models.Index(fields=["sistem", "yil", "baslama", "id"], name="kesinti_baslama_idx"),
+            models.Index(fields=["sistem", "yil", "sure_dk", "id"], name="kesinti_sure_idx"),
+            # İl kapsamlı kullanıcının varsayılan (id) sıralaması (bkz. account.kapsam)
+            models.Index(fields=["sistem", "yil", "il", "id"], name="kesinti_il_idx"),
+            # Bildirim eşleştirmede kesinti_no ile doğrudan arama
+            models.Index(fields=["sistem", "yil", "kesinti_no"], name="kesinti_no_idx"),
+        ]
+
+
+class Tablo1Satiri(KesintiTabani):
+    """Düzenleyiciye verilen Tablo1 satırları."""
+
+    class Meta:
+        verbose_name = "Tablo1 satırı"
+        verbose_name_plural = "Tablo1 satırları"
+        constraints = [
+            models.UniqueConstraint(fields=["dosya", "satir_no", "sistem", "yil"], name="tablo1_dosya_satir_tekil"),
+        ]
+        indexes = [
+            # Grid'in sıralamaları (bkz. Kesinti.Meta ve grid.py)
+            models.Index(fields=["sistem", "yil", "baslama", "id"], name="tablo1_baslama_idx"),
+            models.Index(fields=["sistem", "yil", "sure_dk", "id"], name="tablo1_sure_idx"),
+            models.Index(fields=["sistem", "yil", "il", "id"], name="tablo1_il_idx"),
+        ]
+
+
+class Bildirim(StagingSatiri):
+    """OMS / CRM / Inavitas müşteri bildirimleri."""
+
+    bildirim_no = models.CharField("Bildirim no", max_length=50, blank=True)
+    il = models.CharField("İl", max_length=20, blank=True)
+    ilce = models.CharField("İlçe", max_length=50, blank=True)
+    sebeke_unsuru = models.CharField("Şebeke unsuru / tesisat", max_length=100, blank=True)
+    bildirim_zamani = models.DateTimeField("Bildirim zamanı", null=True, blank=True)
+    kesinti_no = models.CharField("Kesinti no", max_length=50, blank=True)
+
+    class Meta:
+        verbose_name = "Bildirim"
+        verbose_name_plural = "Bildirimler"
+        constraints = [
+            models.UniqueConstraint(fields=["dosya", "satir_no", "sistem", "yil"], name="bildirim_dosya_satir_tekil"),
+        ]
+        indexes = [
+            models.Index(fields=["sistem", "yil"], name="bildirim_sistem_yil_idx"),
+            models.Index(fields=["sistem", "yil", "il", "id"], name="bildirim_il_idx"),
+            models.Index(fields=["sistem", "yil", "sebeke_unsuru", "bildirim_zamani"],
+                         name="bildirim_unsur_zaman_idx"),
+            models.Index(fields=["sistem", "yil", "kesinti_no"], name="bildirim_kesinti_no_idx"),
+        ]
+
+
+class OsosKesinti(StagingSatiri):
+    """OSOS modemlerinin haberleşme kesintileri (HAYEN raporu)."""
+
+    modem_no = models.CharField("Modem no", max_length=50, blank=True)
+    il = models.CharField("İl", max_length=20, blank=True)
+    baslama = models.DateTimeField("Başlama", null=True, blank=True)
+    bitis = models.DateTimeField("Bitiş", null=True, blank=True)
+
+    class Meta:
+        verbose_name = "OSOS haberleşme kesintisi"
+        verbose_name_plural = "OSOS haberleşme kesintileri"
+        constraints = [
+            models.UniqueConstraint(fields=["dosya", "satir_no", "sistem", "yil"], name="osos_dosya_satir_tekil"),
+        ]
+        indexes = [models.Index(fields=["yil", "modem_no", "baslama"], name="osos_modem_baslama_idx")]
+
+
+class CakisanKesinti(models.Model):
+    """
+    Aynı şebeke unsurunda zamanca çakışan iki kesinti (önceden hesaplanmış).
+
+    Hesaplama: duzeltme.cakisma.cakismalari_hesapla (sweep-line).
+    kesinti_a önce başlayan / kapsayan kesintidir.
+    """
+
+    TIP_KISMI = "kismi"
+    TIP_IC_ICE = "ic_ice"
+    TIP_CHOICES = [
+        (TIP_KISMI, "Kısmi çakışma"),
+        (TIP_IC_ICE, "İç içe"),
+    ]
+
+    sistem = models.CharField("Sistem", max_length=20)
+    yil = models.PositiveSmallIntegerField("Yıl")
+    sebeke_unsuru = models.CharField("Şebeke unsuru / fider", max_length=100)
+    # İki kesintinin illeri (il kapsamıyla süzmek için kopyalanır). İl sınırındaki bir
+    # unsurda farklı olabilirler; çift, ikisinden birinin ilindeki kullanıcıya görünür.
+    il = models.CharField("İl", max_length=20, blank=True)
+    il_b = models.CharField("İl (kesinti_b)", max_length=20, blank=True)
+    # Staging satırları yeniden yüklenince silinebilir; sonuçlar yeniden hesaplanır.
+    kesinti_a = models.ForeignKey(Kesinti, on_delete=models.DO_NOTHING, db_constraint=False, related_name="+")
+    kesinti_b = models.ForeignKey(Kesinti, on_delete=models.DO_NOTHING, db_constraint=False, related_name="+")
+    tip = models.CharField("Tip", max_length=10, choices=TIP_CHOICES)
+    cakisma_baslama = models.DateTimeField("Çakışma başlama")
+    cakisma_bitis = models.DateTimeField("Çakışma bitiş")
+    cakisma_dk = models.FloatField("Çakışma (dk)")
+
+    class Meta:
+        verbose_name = "Çakışan kesinti"
+        verbose_name_plural = "Çakışan kesintiler"
+        indexes = [
+            models.Index(fields=["sistem", "yil", "tip"]),
+            models.Index(fields=["sistem", "yil", "il", "tip"], name="cakisan_il_tip_idx"),
+            models.Index(fields=["sistem", "yil", "il_b", "tip"], name="cakisan_il_b_tip_idx"),
+        ]
+
+
+class OsosModemOzet(models.Model):
+    """Modem başına yıllık haberleşme kesintisi özeti (bkz. duzeltme.osos_ozet)."""
+
+    yil = models.PositiveSmallIntegerField("Yıl")
+    modem_no = models.CharField("Modem no", max_length=50)
+    il = models.CharField("İl", max_length=20, blank=True)
+    kesinti_sayisi = models.PositiveIntegerField("Kesinti sayısı")
+    toplam_sure_sn = models.BigIntegerField("Toplam süre (sn)")
+    en_uzun_sn = models.BigIntegerField("En uzun kesinti (sn)")
+
+    class Meta:
+        verbose_name = "OSOS modem özeti"
+        verbose_name_plural = "OSOS modem özetleri"
+        constraints = [
+            models.UniqueConstraint(fields=["yil", "modem_no"], name="osos_modem_ozet_tekil"),
+        ]
+        indexes = [models.Index(fields=["yil", "il", "-toplam_sure_sn"], name="osos_modem_il_sure_idx")]
+
+
+class OsosGunlukOzet(models.Model):
+    """İl + gün başına haberleşme kesintisi özeti. Günü aşan kesintiler günlere bölünür."""
+
+    yil = models.PositiveSmallIntegerField("Yıl")
+    il = models.CharField("İl", max_length=20, blank=True)
+    gun = models.DateField("Gün")
+    kesinti_sayisi = models.PositiveIntegerField("O gün başlayan kesinti")
+    modem_sayisi = models.PositiveIntegerField("Etkilenen modem")
+    toplam_sure_sn = models.BigIntegerField("Toplam süre (sn)")
+
+    class Meta:
+        verbose_name = "OSOS günlük özet"
+        verbose_name_plural = "OSOS günlük özetler"
+        constraints = [
+            models.UniqueConstraint(fields=["yil", "il", "gun"], name="osos_gunluk_ozet_tekil"),
+        ]
+
+
+class OsosIlOzet(models.Model):
+    """İl başına yıllık haberleşme kesintisi özeti."""
+
+    yil = models.PositiveSmallIntegerField("Yıl")
+    il = models.CharField("İl", max_length=20, blank=True)
+    modem_sayisi = models.PositiveIntegerField("Modem sayısı")
+    kesinti_sayisi = models.PositiveIntegerField("Kesinti sayısı")
+    toplam_sure_sn = models.BigIntegerField("Toplam süre (sn)")
+    en_uzun_sn = models.BigIntegerField("En uzun kesinti (sn)")
+
+    class Meta:
+        verbose_name = "OSOS il özeti"
+        verbose_name_plural = "OSOS il özetleri"
+        constraints = [
+            models.UniqueConstraint(fields=["yil", "il"], name="osos_il_ozet_tekil"),
+        ]
+
+
+class KesintiEndeksi(models.Model):
+    """
+    İl + gerilim seviyesi başına yıllık kesinti süre / sıklık göstergeleri
+    (bkz. duzeltme.endeks). tablo: "tablo1" (Tablo1Satiri) ya da "kesinti" (Kesinti).
+
+    Göstergeler uzun kesintilerden (süre > 3 dk) hesaplanır; kısa kesintiler
+    yalnızca sayılır. il boşsa kayıt IL_LIST dışındaki / il'i boş satırlardır.
+    """
+
+    sistem = models.CharField("Sistem", max_length=20)
+    tablo = models.CharField("Tablo", max_length=10)
+    yil = models.PositiveSmallIntegerField("Yıl")
+    il = models.CharField("İl", max_length=20, blank=True)
+    gerilim_seviyesi = models.CharField("Gerilim seviyesi", max_length=10, blank=True)
+    kesinti_sayisi = models.PositiveIntegerField("Uzun kesinti")
+    kisa_kesinti_sayisi = models.PositiveIntegerField("Kısa kesinti (≤ 3 dk)")
+    abone_kesinti = models.BigIntegerField("Kesintiye uğrayan abone")
+    abone_dakika = models.FloatField("Kayıp abone-dakika")
+    toplam_sure_dk = models.FloatField("Toplam süre (dk)")
+    en_uzun_dk = models.FloatField("En uzun kesinti (dk)")
+
+    class Meta:
+        verbose_name = "Kesinti endeksi"
+        verbose_name_plural = "Kesinti endeksleri"
+        constraints = [
+            models.UniqueConstraint(fields=["sistem", "tablo", "yil", "il", "gerilim_seviyesi"],
+                                    name="kesinti_endeksi_tekil"),
+        ]
+
+    @property
+    def ortalama_sure_dk(self):
+        """Kesintiye uğrayan abone başına ortalama süre (CAIDI)."""
+        return self.abone_dakika / self.abone_kesinti if self.abone_kesinti else None
+
+
+class BildirimEslesme(models.Model):
+    """
+    Bir bildirimin eşleştiği kesinti. Eşleşmeyen bildirimler de burada durur
+    (kesinti boş) — "eşleşmeyenler listesi" bu satırlardır.
+
+    Hesaplama: duzeltme.eslestirme.eslestirmeleri_hesapla
+    """
+
+    YONTEM_KESINTI_NO = "kesinti_no"
+    YONTEM_ZAMAN = "zaman"
+    YONTEM_CHOICES = [
+        (YONTEM_KESINTI_NO, "Kesinti no"),
+        (YONTEM_ZAMAN, "Şebeke unsuru + zaman"),
+    ]
+
+    bildirim_sistemi = models.CharField("Bildirim sistemi", max_length=20)
+    kesinti_sistemi = models.CharField("Kesinti sistemi", max_length=20)
+    yil = models.PositiveSmallIntegerField("Yıl")
+    bildirim = models.ForeignKey(Bildirim, on_delete=models.DO_NOTHING, db_constraint=False, related_name="+")
+    # Bildirimin ili (il kapsamıyla süzmek için kopyalanır)
+    il = models.CharField("İl", max_length=20, blank=True)
+    kesinti = models.ForeignKey(Kesinti, on_delete=models.DO_NOTHING, db_constraint=False,
+                                null=True, blank=True, related_name="+")
+    yontem = models.CharField("Yöntem", max_length=12, choices=YONTEM_CHOICES, blank=True)
+    fark_dk = models.FloatField("Bildirim - kesinti başlama (dk)", null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Bildirim eşleşmesi"
+        verbose_name_plural = "Bildirim eşleşmeleri"
+        indexes = [
+            models.Index(fields=["bildirim_sistemi", "yil", "kesinti"]),
+            models.Index(fields=["bildirim_sistemi", "yil", "il", "kesinti"], name="eslesme_il_idx"),
+        ]
+
+
+class EslestirmeCalismasi(models.Model):
+    """
+    Son eşleştirmenin hangi girdilerle yapıldığı.
+
+    parmak_izi, bildirim ve kesinti dosyalarının (ad + sha256) özetidir; değişmeyen
+    kaynak için eşleştirme yeniden çalıştırılmaz.
+    """
+
+    bildirim_sistemi = models.CharField("Bildirim sistemi", max_length=20)
+    kesinti_sistemi = models.CharField("Kesinti sistemi", max_length=20)
+    yil = models.PositiveSmallIntegerField("Yıl")
+    parmak_izi = models.CharField("Parmak izi", max_length=64)
+    bildirim_sayisi = models.PositiveIntegerField("Bildirim", default=0)
+    eslesen = models.PositiveIntegerField("Eşleşen", default=0)
+    eslesmeyen = models.PositiveIntegerField("Eşleşmeyen", default=0)
+    tarih = models.DateTimeField("Tarih", auto_now=True)
+
+    class Meta:
+        verbose_name = "Eşleştirme çalışması"
+        verbose_name_plural = "Eşleştirme çalışmaları"
+        constraints = [
+            models.UniqueConstraint(fields=["bildirim_sistemi", "kesinti_sistemi", "yil"],
+                                    name="eslestirme_calismasi_tekil"),
+        ]
+
+
+class OzetSayaci(models.Model):
+    """
+    Özet sayfasının sayıları: (sistem, yıl, bölüm, anahtar) -> değer.
+
+    Bölümler birbirinden bağımsız yenilenir; her yükleme / hesaplama yalnızca
+    kendi dokunduğu (sistem, yıl, bölüm) satırlarını günceller.
+    il boşsa bütün bölgenin sayısıdır; doluysa o ilin (il kapsamlı kullanıcılar
+    yalnızca kendi ilinin satırlarını görür, bkz. account.kapsam).
+    Örn. (osos, 2022, kayit, haberlesme_unitesi) = 2_325_845
+         (inavitas, 2022, cakisma, ic_ice) = 412
+    Yazma: duzeltme.ozet
+    """
+
+    sistem = models.CharField("Sistem", max_length=20)
+    yil = models.PositiveSmallIntegerField("Yıl")
+    bolum = models.CharField("Bölüm", max_length=20)
+    anahtar = models.CharField("Anahtar", max_length=80)
+    il = models.CharField("İl", max_length=20, blank=True, default="")
+    deger = models.BigIntegerField("Değer", default=0)
+    # Kaynak dosyalar için son çekim tarihi (zaman çizelgesinde gösterilir)
+    tarih = models.DateField("Tarih", null=True, blank=True)
+    guncelleme = models.DateTimeField("Güncelleme", auto_now=True)
+
+    class Meta:
+        verbose_name = "Özet sayacı"
+        verbose_name_plural = "Özet sayaçları"
+        constraints = [
+            models.UniqueConstraint(fields=["sistem", "yil", "bolum", "anahtar", "il"], name="ozet_sayaci_tekil"),
+        ]
+        indexes = [models.Index(fields=["yil", "il", "sistem"], name="ozet_sayaci_yil_il_idx")]
+
+
+class VeriSurumu(models.Model):
+    """
+    (sistem, yıl) verisinin sürüm sayacı. Yükleme / hesaplama işi bitince
+    bir artar; sayfaların ETag'i buradan üretilir (bkz. duzeltme.surum).
+    """
+
+    sistem = models.CharField("Sistem", max_length=20)
+    yil = models.PositiveSmallIntegerField("Yıl")
+    surum = models.PositiveIntegerField("Sürüm", default=0)
+    degisme = models.DateTimeField("Son değişme")
+
+    class Meta:
+        verbose_name = "Veri sürümü"
+        verbose_name_plural = "Veri sürümleri"
+        constraints = [
+            models.UniqueConstraint(fields=["sistem", "yil"], name="veri_surumu_tekil"),
+        ]
+
+
+class DegisiklikSeti(models.Model):
+    """
+    Bir dosyanın yeni sürümü eski sürümün yerine geçtiğinde ikisi arasındaki fark.
+
+    Satırlar doğal anahtarla (kesinti_no, bildirim_no, modem_no + başlama)
+    eşlenir. Değişmeyen ve güncellenen satırlar id'lerini korur; böylece
+    çakışma / eşleştirme sonuçları yalnızca etkilenen anahtarlar için yeniden
+    hesaplanabilir. Hangi hesaplamanın bu seti işlediği islenenler'de tutulur.
+    tam_degisim: fark çıkarılamadı (önceki sürüm yok ya da eski satırların
+    özeti yok); tüketiciler bu durumda baştan hesaplar.
+    """
+
+    sistem = models.CharField("Sistem", max_length=20)
+    kategori = models.CharField("Kategori", max_length=80)
+    yil = models.PositiveSmallIntegerField("Yıl")
+    hedef_tablo = models.CharField("Hedef tablo", max_length=63)
+    eski_dosya = models.ForeignKey(YuklenenDosya, on_delete=models.CASCADE, related_name="+",
+                                   null=True, blank=True)
+    yeni_dosya = models.ForeignKey(YuklenenDosya, on_delete=models.CASCADE, related_name="+")
+    eklenen = models.PositiveIntegerField("Eklenen", default=0)
+    guncellenen = models.PositiveIntegerField("Güncellenen", default=0)
+    silinen = models.PositiveIntegerField("Silinen", default=0)
+    ayni = models.PositiveIntegerField("Değişmeyen", default=0)
+    tam_degisim = models.BooleanField("Tam değişim", default=False)
+    islenenler = models.JSONField("İşleyen hesaplamalar", default=list, blank=True)
+    olusturma = models.DateTimeField("Oluşturma", auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Değişiklik seti"
+        verbose_name_plural = "Değişiklik setleri"
+        indexes = [models.Index(fields=["hedef_tablo", "sistem", "yil"])]
+
+    def __str__(self):
+        return f"{self.eski_dosya_id} -> {self.yeni_dosya_id}"
+
+
+class DegisenSatir(models.Model):
+    """Değişiklik setindeki tek satır. Silinen satırın id'si artık tabloda yoktur."""
+
+    TUR_EKLENDI = "eklendi"
+    TUR_GUNCELLENDI = "guncellendi"
+    TUR_SILINDI = "silindi"
+    TUR_CHOICES = [
+        (TUR_EKLENDI, "Eklendi"),
+        (TUR_GUNCELLENDI, "Güncellendi"),
+        (TUR_SILINDI, "Silindi"),
+    ]
+
+    degisiklik = models.ForeignKey(DegisiklikSeti, on_delete=models.CASCADE, related_name="satirlar")
+    tur = models.CharField("Tür", max_length=12, choices=TUR_CHOICES)
+    satir_id = models.BigIntegerField("Satır id")
+    # Doğal anahtarın ilk kolonu (kesinti_no / bildirim_no / modem_no)
+    anahtar = models.CharField("Anahtar", max_length=100, blank=True)
+    # Varlık: şebeke unsuru ya da modem; güncellemede eski değeri de tutulur
+    varlik = models.CharField("Varlık", max_length=100, blank=True)
+    eski_varlik = models.CharField("Eski varlık", max_length=100, blank=True)
+
+    class Meta:
+        verbose_name = "Değişen satır"
+        verbose_name_plural = "Değişen satırlar"
+
+
+class Gorev(models.Model):
+    """
+    Arka plan kuyruğundaki bir iş (yükleme, çakışma, eşleştirme, özet).
+
+    Web isteği ya da cron yalnızca kayıt ekler; gorev_isci komutu bekleyenleri
+    sırayla alıp süreç havuzunda çalıştırır (bkz. duzeltme/gorevler.py).
+    Çalışırken islenen / yuzde / satir_sn / mesaj en çok saniyede bir güncellenir;
+    özet sayfası bunları gorev_durumu uç noktasından okur.
+    """
+
+    DURUM_BEKLIYOR = "bekliyor"
+    DURUM_CALISIYOR = "calisiyor"
+    DURUM_TAMAM = "tamam"
+    DURUM_HATA = "hata"
+    DURUM_CHOICES = [
+        (DURUM_BEKLIYOR, "Bekliyor"),
+        (DURUM_CALISIYOR, "Çalışıyor"),
+        (DURUM_TAMAM, "Tamamlandı"),
+        (DURUM_HATA, "Hata"),
+    ]
+
+    tur = models.CharField("Tür", max_length=20)
+    parametreler = models.JSONField("Parametreler", default=dict, blank=True)
+    yil = models.PositiveSmallIntegerField("Yıl", null=True, blank=True)
+    durum = models.CharField("Durum", max_length=12, choices=DURUM_CHOICES, default=DURUM_BEKLIYOR)
+    islenen = models.BigIntegerField("İşlenen satır", default=0)
+    yuzde = models.FloatField("İlerleme (%)", default=0)
+    satir_sn = models.FloatField("Satır/sn", null=True, blank=True)
+    mesaj = models.CharField("Mesaj", max_length=255, blank=True)
+    sonuc = models.JSONField("Sonuç", null=True, blank=True)
+    hata_mesaji = models.TextField("Hata", blank=True)
+    isci = models.CharField("İşçi (makine:pid)", max_length=100, blank=True)
+    olusturan = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL,
+                                  null=True, blank=True, related_name="+")
+    olusturma = models.DateTimeField("Oluşturma", auto_now_add=True)
+    baslama = models.DateTimeField("Başlama", null=True, blank=True)
+    bitis = models.DateTimeField("Bitiş", null=True, blank=True)
+    guncelleme = models.DateTimeField("Son ilerleme", null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Görev"
+        verbose_name_plural = "Görevler"
+        indexes = [
+            models.Index(fields=["durum", "olusturma"], name="gorev_kuyruk_idx"),
+            models.Index(fields=["yil", "-olusturma"], name="gorev_yil_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.tur} #{self.pk} ({self.durum})"
@@ -0,0 +1,107 @@
+"""
+Bu dosya: duzeltme/onbellek.py
+--------------------------------
+vendor / yıl ad alanlı önbellek.
+
+Önbelleğin kendisi settings.CACHES["default"]'tur (varsayılan: bütün
+worker'ların paylaştığı dosya önbelleği). Burada üstüne üç şey eklenir:
+
+- Ad alanı: anahtarlar "dz:<vendor>:<yıl>:<ns>:..." biçimindedir.
+- Toplu geçersiz kılma: <ns>, vendor/yıl için önbellekte tutulan bir sürüm
+  damgasıdır. gecersiz_kil(yil) damgayı değiştirir; eski anahtarlar bir daha
+  okunmaz, zamanla ya da boyut sınırına gelince silinir. Tek tek silmek gerekmez.
+  Veri sürümü her arttığında (duzeltme.surum.surumu_artir) bu da, transaction
+  commit edildikten sonra, çağrılır.
+- İsabet / ıska sayaçları: süreç içinde biriktirilip her _BOSALTMA_ARALIGI
+  işlemde bir önbelleğe eklenir; böylece her okumaya bir yazma eklenmez.
+  Dosya önbelleğinde incr atomik olmadığı için sayılar yaklaşıktır.
+"""
+
+import hashlib
+import threading
+import time
+from typing import Callable, Iterable
+
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+
+from .sayfalar import SAYFALAR
+
+_BOSALTMA_ARALIGI = 100
+_yerel = {"isabet": 0, "iska": 0}
+_kilit = threading.Lock()
+
+
+def _ns_anahtari(vendor: str, yil: int) -> str:
+    return f"dz:ns:{vendor}:{yil}"
+
+
+def _ns(vendor: str, yil: int) -> int:
+    anahtar = _ns_anahtari(vendor, yil)
+    surum = cache.get(anahtar)
+    if surum is None:
+        # Zaman tabanlı başlangıç: damga silinse bile eski anahtarlar geri gelmez
+        cache.add(anahtar, time.time_ns(), None)
+        surum = cache.get(anahtar)
+    return surum
+
+
+def anahtar(vendor: str, yil: int, parcalar: Iterable) -> str:
+    ozet = hashlib.md5(":".join(str(p) for p in parcalar).encode()).hexdigest()
+    return f"dz:{vendor}:{yil}:{_ns(vendor, yil)}:{ozet}"
+
+
+def _say(tur: str) -> None:
+    with _kilit:
+        _yerel[tur] += 1
+        if _yerel["isabet"] + _yerel["iska"] < _BOSALTMA_ARALIGI:
+            return
+        biriken = dict(_yerel)
+        _yerel.update(isabet=0, iska=0)
+    _sayaclari_yaz(biriken)
+
+
+def _sayaclari_yaz(biriken: dict) -> None:
+    for tur, adet in biriken.items():
+        if not adet:
+            continue
+        k = f"dz:sayac:{tur}"
+        if not cache.add(k, adet, None):
+            try:
+                cache.incr(k, adet)
+            except ValueError:
+                cache.set(k, adet, None)
+
+
+def getir(vendor: str, yil: int, parcalar: Iterable, hesapla: Callable, timeout=DEFAULT_TIMEOUT):
+    """Önbellekte varsa döner; yoksa hesapla() çağrılır ve sonucu saklanır."""
+    k = anahtar(vendor, yil, parcalar)
+    deger = cache.get(k)
+    if deger is not None:
+        _say("isabet")
+        return deger
+    _say("iska")
+    deger = hesapla()
+    cache.set(k, deger, timeout)
+    return deger
+
+
+def gecersiz_kil(yil: int, vendor: str = None) -> None:
+    """Bir yılın (ya da tek vendor/yılın) bütün önbellek kayıtlarını eskitir."""
+    for v in ([vendor] if vendor else SAYFALAR):
+        cache.set(_ns_anahtari(v, yil), time.time_ns(), None)
+
+
+def sayaclar() -> dict:
+    with _kilit:
+        biriken = dict(_yerel)
+        _yerel.update(isabet=0, iska=0)
+    _sayaclari_yaz(biriken)
+    isabet = cache.get("dz:sayac:isabet") or 0
+    iska = cache.get("dz:sayac:iska") or 0
+    toplam = isabet + iska
+    return {"isabet": isabet, "iska": iska, "oran": isabet / toplam if toplam else 0.0}
+
+
+def sayaclari_sifirla() -> None:
+    cache.delete_many(["dz:sayac:isabet", "dz:sayac:iska"])
@@ -0,0 +1,195 @@
+"""
+Bu dosya: duzeltme/osos_ozet.py
+--------------------------------
+OSOS haberleşme kesintilerini (HAYEN raporu, yılda ~2.3 milyon satır) NumPy
+kolon dizilerine alıp modem / il / gün özetlerini vektörel hesaplar.
+
+Mantık:
+- Satırlar bir kez okunur: modem_no, il, baslama, bitis -> dört dizi.
+- Modem ve il metinleri np.unique ile tam sayı kodlara çevrilir.
+- Sayılar, toplam süreler np.bincount; en uzun kesinti np.maximum.at ile bulunur.
+- Günlük özet için gece yarısını aşan kesintiler np.repeat ile gün parçalarına
+  bölünür; Python'da satır satır döngü yoktur.
+- Sonuçlar OsosModemOzet / OsosGunlukOzet / OsosIlOzet tablolarına yazılır;
+  sayfalar ham tabloya değil bu küçük özet tablolarına bakar.
+- Hesap her seferinde bütün yıl üzerinden yapılır (saniyeler sürer), ama
+  tablolara yalnızca değeri değişen, yeni gelen ya da artık olmayan anahtarlar
+  yazılır; tekrar hesapta yıl baştan silinip yazılmaz.
+"""
+
+import numpy as np
+from django.db import transaction
+
+from .models import OsosGunlukOzet, OsosIlOzet, OsosKesinti, OsosModemOzet
+from .ozet import haberlesme_ozetini_yenile
+from .yukleme import parca_yaz
+
+GUN_SN = 86_400
+_OKUMA_PARCASI = 100_000
+_BITMAP_SINIRI = 100_000_000  # ~100 MB bool dizi
+
+
+def _epoch(tarihler) -> np.ndarray:
+    return np.array(tarihler, dtype="datetime64[s]").astype(np.int64)
+
+
+def kolonlari_yukle(yil: int) -> dict:
+    """OSOS kesintilerini kolon dizileri olarak döner (saniye cinsinden epoch)."""
+    qs = (
+        OsosKesinti.objects
+        .filter(yil=yil, baslama__isnull=False, bitis__isnull=False)
+        .values_list("modem_no", "il", "baslama", "bitis")
+    )
+    modem, il, bas, bit = [], [], [], []
+    parca = []
+    for satir in qs.iterator(chunk_size=_OKUMA_PARCASI):
+        parca.append(satir)
+        if len(parca) >= _OKUMA_PARCASI:
+            _parca_ekle(parca, modem, il, bas, bit)
+            parca = []
+    if parca:
+        _parca_ekle(parca, modem, il, bas, bit)
+
+    if not bas:
+        bos = np.array([], dtype=np.int64)
+        return {"modem": np.array([], dtype=str), "il": np.array([], dtype=str), "baslama": bos, "bitis": bos}
+    return {
+        "modem": np.concatenate(modem),
+        "il": np.concatenate(il),
+        "baslama": np.concatenate(bas),
+        "bitis": np.concatenate(bit),
+    }
+
+
+def _parca_ekle(parca, modem, il, bas, bit) -> None:
+    m, i, b, e = zip(*parca)
+    modem.append(np.array(m, dtype=str))
+    il.append(np.array(i, dtype=str))
+    bas.append(_epoch(b))
+    bit.append(_epoch(e))
+
+
+def _farkli_say(grup: np.ndarray, eleman: np.ndarray, n_grup: int, n_eleman: int) -> np.ndarray:
+    """Her grupta kaç farklı eleman var? (ör. il başına farklı modem)"""
+    if n_grup * n_eleman <= _BITMAP_SINIRI:
+        # Sıralama yerine doğrusal zamanlı "görüldü" tablosu
+        gorulen = np.zeros(n_grup * n_eleman, dtype=bool)
+        gorulen[grup.astype(np.int64) * n_eleman + eleman] = True
+        return gorulen.reshape(n_grup, n_eleman).sum(axis=1)
+    return np.bincount(np.unique(grup.astype(np.int64) * n_eleman + eleman) // n_eleman, minlength=n_grup)
+
+
+def ozetle(k: dict) -> dict:
+    """
+    Kolon dizilerinden modem, il ve (il, gün) özetlerini hesaplar.
+    Dönüş değerleri de dizilerdir; yazma işi ozet_yaz()'dadır.
+    """
+    bas, bit = k["baslama"], k["bitis"]
+    if not len(bas):
+        bos = np.array([], dtype=np.int64)
+        bos_metin = np.array([], dtype=str)
+        return {"modem": (bos_metin, bos_metin, bos, bos, bos),
+                "il": (bos_metin, bos, bos, bos, bos),
+                "gun": (bos_metin, bos, bos, bos, bos)}
+    sure = np.maximum(bit - bas, 0)
+
+    modem_adlari, modem_ilk, modem_kod = np.unique(k["modem"], return_index=True, return_inverse=True)
+    il_adlari, il_kod = np.unique(k["il"], return_inverse=True)
+    n_modem, n_il = len(modem_adlari), len(il_adlari)
+
+    # ---- Modem başına ----
+    modem_sayi = np.bincount(modem_kod, minlength=n_modem)
+    modem_toplam = np.bincount(modem_kod, weights=sure, minlength=n_modem).astype(np.int64)
+    modem_en_uzun = np.zeros(n_modem, dtype=np.int64)
+    np.maximum.at(modem_en_uzun, modem_kod, sure)
+
+    # ---- İl başına ----
+    il_sayi = np.bincount(il_kod, minlength=n_il)
+    il_toplam = np.bincount(il_kod, weights=sure, minlength=n_il).astype(np.int64)
+    il_en_uzun = np.zeros(n_il, dtype=np.int64)
+    np.maximum.at(il_en_uzun, il_kod, sure)
+    il_modem = _farkli_say(il_kod, modem_kod, n_il, n_modem)
+
+    # ---- (İl, gün) başına: kesintiyi gün parçalarına böl ----
+    bas_gun = bas // GUN_SN
+    bit_gun = np.maximum((bit - 1) // GUN_SN, bas_gun)  # [bas, bit) yarı açık
+    gun_sayisi = bit_gun - bas_gun + 1
+    tekrar = np.repeat(np.arange(len(bas)), gun_sayisi)
+    ofset = np.arange(len(tekrar)) - np.repeat(np.cumsum(gun_sayisi) - gun_sayisi, gun_sayisi)
+    gun = bas_gun[tekrar] + ofset
+    parca_sure = np.maximum(
+        np.minimum(bit[tekrar], (gun + 1) * GUN_SN) - np.maximum(bas[tekrar], gun * GUN_SN), 0
+    )
+    gun0 = gun.min()
+    n_gun = int(gun.max() - gun0 + 1)
+    anahtar = il_kod[tekrar].astype(np.int64) * n_gun + (gun - gun0)
+    n_anahtar = n_il * n_gun
+    gun_toplam = np.bincount(anahtar, weights=parca_sure, minlength=n_anahtar).astype(np.int64)
+    gun_sayi = np.bincount(anahtar[ofset == 0], minlength=n_anahtar)
+    gun_modem = _farkli_say(anahtar, modem_kod[tekrar], n_anahtar, n_modem)
+    dolu = np.flatnonzero(gun_modem)
+
+    return {
+        "modem": (modem_adlari, il_adlari[il_kod[modem_ilk]], modem_sayi, modem_toplam, modem_en_uzun),
+        "il": (il_adlari, il_modem, il_sayi, il_toplam, il_en_uzun),
+        "gun": (il_adlari[dolu // n_gun], gun0 + dolu % n_gun,
+                gun_sayi[dolu], gun_modem[dolu], gun_toplam[dolu]),
+    }
+
+
+_SILME_PARCASI = 2000
+
+
+def _degisenleri_yaz(model, yil: int, anahtar_alanlari: tuple, deger_alanlari: tuple, satirlar) -> int:
+    """
+    satirlar: (anahtar..., deger...) demetleri. Tablodaki yıl satırlarıyla
+    karşılaştırılır; yalnız değişen / yeni / kalkan anahtarlar yazılır.
+    Dönüş: yazılan (silinen + eklenen) satır sayısı.
+    """
+    n = len(anahtar_alanlari)
+    yeni = {tuple(s[:n]): tuple(s[n:]) for s in satirlar}
+    ayni, silinecek = set(), []
+    mevcut = model.objects.filter(yil=yil).values_list("pk", *anahtar_alanlari, *deger_alanlari)
+    for pk, *satir in mevcut.iterator(chunk_size=_OKUMA_PARCASI):
+        anahtar = tuple(satir[:n])
+        if yeni.get(anahtar) == tuple(satir[n:]):
+            ayni.add(anahtar)
+        else:
+            silinecek.append(pk)
+    for i in range(0, len(silinecek), _SILME_PARCASI):
+        model.objects.filter(pk__in=silinecek[i:i + _SILME_PARCASI]).delete()
+    yazilacak = [(yil, *anahtar, *deger) for anahtar, deger in yeni.items() if anahtar not in ayni]
+    if yazilacak:
+        parca_yaz(model, ["yil", *anahtar_alanlari, *deger_alanlari], yazilacak)
+    return len(silinecek) + len(yazilacak)
+
+
+@transaction.atomic
+def ozet_yaz(yil: int, ozet: dict) -> int:
+    """Özetleri yazar; dönüş: üç tabloda yazılan satır sayısı."""
+    adlar, iller, sayi, toplam, en_uzun = ozet["modem"]
+    yazilan = _degisenleri_yaz(
+        OsosModemOzet, yil, ("modem_no",), ("il", "kesinti_sayisi", "toplam_sure_sn", "en_uzun_sn"),
+        zip(adlar.tolist(), iller.tolist(), sayi.tolist(), toplam.tolist(), en_uzun.tolist()))
+
+    iller, modem, sayi, toplam, en_uzun = ozet["il"]
+    yazilan += _degisenleri_yaz(
+        OsosIlOzet, yil, ("il",), ("modem_sayisi", "kesinti_sayisi", "toplam_sure_sn", "en_uzun_sn"),
+        zip(iller.tolist(), modem.tolist(), sayi.tolist(), toplam.tolist(), en_uzun.tolist()))
+
+    iller, gunler, sayi, modem, toplam = ozet["gun"]
+    yazilan += _degisenleri_yaz(
+        OsosGunlukOzet, yil, ("il", "gun"), ("kesinti_sayisi", "modem_sayisi", "toplam_sure_sn"),
+        zip(iller.tolist(), gunler.astype("datetime64[D]").tolist(), sayi.tolist(), modem.tolist(),
+            toplam.tolist()))
+    return yazilan
+
+
+def osos_ozet_hesapla(yil: int) -> dict:
+    k = kolonlari_yukle(yil)
+    ozet = ozetle(k)
+    yazilan = ozet_yaz(yil, ozet)
+    sonuc = {"kesinti": len(k["baslama"]), "modem": len(ozet["modem"][0]),
+             "il": len(ozet["il"][0]), "gun_satiri": len(ozet["gun"][0]), "yazilan": yazilan}
+    haberlesme_ozetini_yenile(yil, sonuc)
+    return sonuc
@@ -0,0 +1,226 @@
+"""
+Bu dosya: duzeltme/ozet.py
+--------------------------------
+Özet sayfasının sayılarını OzetSayaci tablosunda güncel tutar.
+
+Sayfa açılırken ham tablolar (milyonlarca satır) hiç saymaz; yalnızca
+OzetSayaci'dan birkaç düzine satır okunur. Sayılar, onları değiştiren iş
+bittiğinde ve yalnızca o işin dokunduğu bölüm için yenilenir:
+
+    bölüm        kim yeniler                         anahtarlar
+    kayit        yukleme.dosya_yukle / paralel_yukle kategori -> satır sayısı
+    dosya        yukleme.dosya_yukle / paralel_yukle kategori -> dosya sayısı
+    cakisma      cakisma.cakismalari_hesapla         kismi / ic_ice
+    eslestirme   eslestirme.kaynagi_eslestir         bildirim / eslesen / eslesmeyen
+    haberlesme   osos_ozet.osos_ozet_hesapla         modem / kesinti / il
+    endeks       endeks.endeksleri_hesapla           <tablo>_kesinti / _abone_kesinti / _abone_dakika
+
+Her yenileme (sistem, yıl) veri sürümünü de bir artırır (bkz. duzeltme.surum).
+
+İl kırılımı: IL_BOLUMLERI'ndeki bölümler bütün bölge satırının (il = "") yanında
+IL_LIST'teki her il için ayrı satır da yazar. Sayılar küçük sonuç tablolarının
+(sistem, yıl, il, ...) indekslerinden ya da staging tablosunun il indeksinden
+GROUP BY ile gelir. İl kapsamlı kullanıcı (bkz. account.kapsam) yalnızca kendi
+ilinin satırlarını görür; dosya sayıları ile değil.
+
+Hepsini baştan kurmak için: python manage.py ozet_yenile 2022 [2023 ...]
+"""
+
+from collections import defaultdict
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Max, Sum
+
+from account.constants import IL_LIST
+from account.kapsam import HEPSI
+
+from .kaynaklar import KAYNAKLAR
+from .models import (BildirimEslesme, CakisanKesinti, EslestirmeCalismasi, KesintiEndeksi, OsosIlOzet,
+                     OsosModemOzet, OzetSayaci, YuklenenDosya)
+from .surum import surumu_artir
+
+IL_BOLUMLERI = ("kayit", "cakisma", "eslestirme", "haberlesme", "endeks")
+
+
+# Zaman çizelgesindeki başlıklar; listede olmayan kaynak "sistem kategori" yazılır.
+KAYNAK_ADLARI = {
+    ("osos", "haberlesme_unitesi"): "HAYEN Firmasından OSOS Haberleşme Ünitesi Verileri",
+    ("oms", "tablo1"): "OMS Tablo1",
+    ("oms", "kesinti"): "OMS Kesinti Listesi",
+    ("oms", "bildirim"): "OMS Bildirimleri",
+    ("crm", "bildirim"): "CRM Bildirimleri",
+    ("inavitas", "tablo1"): "İnavitas Tablo1",
+    ("inavitas", "duzeltme_kesinti_tahminleme_kesintiler"): "İnavitas Kesinti Tahminleme – Kesintiler",
+    ("inavitas", "duzeltme_kesinti_tahminleme_bildirimler"): "İnavitas Kesinti Tahminleme – Bildirimler",
+}
+
+
+def _yaz(sistem: str, yil: int, bolum: str, degerler: dict, tarihler: dict = None) -> None:
+    tarihler = tarihler or {}
+    for anahtar, deger in degerler.items():
+        alanlar = {"deger": int(deger or 0), "tarih": tarihler.get(anahtar)}
+        try:
+            with transaction.atomic():
+                OzetSayaci.objects.update_or_create(
+                    sistem=sistem, yil=yil, bolum=bolum, anahtar=anahtar, il="", defaults=alanlar)
+        except IntegrityError:
+            # Paralel yükleyici aynı satırı bizden önce oluşturdu
+            OzetSayaci.objects.filter(sistem=sistem, yil=yil, bolum=bolum, anahtar=anahtar, il="").update(**alanlar)
+
+
+def _il_yaz(sistem: str, yil: int, bolum: str, anahtarlar, il_degerleri: dict, tarihler: dict = None) -> None:
+    """
+    Bölümün anahtarlarının il kırılımını yazar: {il: {anahtar: deger}}.
+    IL_LIST dışındaki iller atlanır; artık değeri olmayan il satırları silinir.
+    """
+    tarihler = tarihler or {}
+    satirlar = [
+        OzetSayaci(sistem=sistem, yil=yil, bolum=bolum, anahtar=anahtar, il=il,
+                   deger=int(degerler.get(anahtar) or 0), tarih=tarihler.get(anahtar))
+        for il, degerler in il_degerleri.items() if il in IL_LIST
+        for anahtar in anahtarlar
+    ]
+    with transaction.atomic():
+        (OzetSayaci.objects.filter(sistem=sistem, yil=yil, bolum=bolum, anahtar__in=list(anahtarlar))
+         .exclude(il="").exclude(il__in={s.il for s in satirlar}).delete())
+        # Paralel yükleyiciler aynı satırları yazabilir: çakışan satır güncellenir
+        OzetSayaci.objects.bulk_create(
+            satirlar, update_conflicts=True, unique_fields=["sistem", "yil", "bolum", "anahtar", "il"],
+            update_fields=["deger", "tarih", "guncelleme"])
+
+
+def kaynak_ozetini_yenile(sistem: str, kategori: str, yil: int) -> None:
+    """Bir kaynağın (sistem/kategori/yıl) yüklü satır ve dosya sayısı; yalnızca irsaliyelerden."""
+    toplam = (
+        YuklenenDosya.objects
+        .filter(sistem=sistem, kategori=kategori, yil=yil, durum=YuklenenDosya.DURUM_TAMAM)
+        .aggregate(satir=Sum("satir_sayisi"), dosya=Count("id"), tarih=Max("cekim_tarihi"))
+    )
+    _yaz(sistem, yil, "kayit", {kategori: toplam["satir"]}, {kategori: toplam["tarih"]})
+    _yaz(sistem, yil, "dosya", {kategori: toplam["dosya"]}, {kategori: toplam["tarih"]})
+    kaynak = KAYNAKLAR.get((sistem, kategori))
+    if kaynak is not None:
+        # Sistem içinde her kategorinin kendi staging tablosu var; (sistem, yil, il) indeksinden sayılır.
+        # Toplamla aynı: yüklenmekte olan ya da hatalı dosyaların satırları sayılmaz.
+        il_satir = (kaynak.model.objects
+                    .filter(sistem=sistem, yil=yil, dosya__durum=YuklenenDosya.DURUM_TAMAM)
+                    .values_list("il").annotate(adet=Count("id")).order_by())
+        _il_yaz(sistem, yil, "kayit", [kategori], {il: {kategori: adet} for il, adet in il_satir},
+                {kategori: toplam["tarih"]})
+    surumu_artir(sistem, yil)
+
+
+def cakisma_ozetini_yenile(sistem: str, yil: int, sonuc: dict) -> None:
+    tipler = (CakisanKesinti.TIP_KISMI, CakisanKesinti.TIP_IC_ICE)
+    _yaz(sistem, yil, "cakisma", {tip: sonuc.get(tip, 0) for tip in tipler})
+    # İki ayrı ildeki kesintilerin çifti iki ilde de sayılır
+    il_tip = defaultdict(lambda: defaultdict(int))
+    qs = CakisanKesinti.objects.filter(sistem=sistem, yil=yil)
+    for il, tip, adet in qs.values_list("il", "tip").annotate(adet=Count("id")).order_by():
+        il_tip[il][tip] += adet
+    for il, tip, adet in (qs.exclude(il_b=F("il"))
+                          .values_list("il_b", "tip").annotate(adet=Count("id")).order_by()):
+        il_tip[il][tip] += adet
+    _il_yaz(sistem, yil, "cakisma", tipler, il_tip)
+    surumu_artir(sistem, yil)
+
+
+def eslestirme_ozetini_yenile(bildirim_sistemi: str, yil: int, sonuc: dict) -> None:
+    anahtarlar = ("bildirim", "eslesen", "eslesmeyen")
+    _yaz(bildirim_sistemi, yil, "eslestirme", {k: sonuc[k] for k in anahtarlar})
+    il_sayilari = {
+        s["il"]: {**s, "eslesmeyen": s["bildirim"] - s["eslesen"]}
+        for s in (BildirimEslesme.objects.filter(bildirim_sistemi=bildirim_sistemi, yil=yil)
+                  .values("il").annotate(bildirim=Count("id"), eslesen=Count("kesinti")).order_by())
+    }
+    _il_yaz(bildirim_sistemi, yil, "eslestirme", anahtarlar, il_sayilari)
+    surumu_artir(bildirim_sistemi, yil)
+
+
+def haberlesme_ozetini_yenile(yil: int, sonuc: dict) -> None:
+    anahtarlar = ("modem", "kesinti", "il")
+    _yaz("osos", yil, "haberlesme", {k: sonuc[k] for k in anahtarlar})
+    _il_yaz("osos", yil, "haberlesme", anahtarlar, {
+        il: {"modem": modem, "kesinti": kesinti, "il": 1}
+        for il, modem, kesinti in OsosIlOzet.objects.filter(yil=yil).values_list("il", "modem_sayisi", "kesinti_sayisi")
+    })
+    surumu_artir("osos", yil)
+
+
+def endeks_ozetini_yenile(sistem: str, yil: int, tablo: str) -> None:
+    """Tek il yeniden hesaplanmış olabilir; toplamlar her seferinde bütün hücrelerden alınır."""
+    hucreler = KesintiEndeksi.objects.filter(sistem=sistem, tablo=tablo, yil=yil)
+    toplamlar = {"kesinti": Sum("kesinti_sayisi"), "abone_kesinti": Sum("abone_kesinti"),
+                 "abone_dakika": Sum("abone_dakika")}
+    toplam = hucreler.aggregate(**toplamlar)
+    _yaz(sistem, yil, "endeks", {f"{tablo}_{k}": round(v or 0) for k, v in toplam.items()})
+    _il_yaz(sistem, yil, "endeks", [f"{tablo}_{k}" for k in toplamlar], {
+        s.pop("il"): {f"{tablo}_{k}": round(v or 0) for k, v in s.items()}
+        for s in hucreler.values("il").annotate(**toplamlar).order_by()
+    })
+    surumu_artir(sistem, yil)
+
+
+def ozet_sayaclari(yil: int, kapsam: str = HEPSI) -> dict:
+    """
+    Sayfa için: {sistem: {bolum: {anahtar: deger}}} ve zaman çizelgesi
+    satırları (kaynak dosyalar, çekim tarihine göre).
+    kapsam bir il ise il kırılımlı bölümler o ilin satırlarından okunur.
+    """
+    qs = OzetSayaci.objects.filter(yil=yil)
+    if kapsam == HEPSI:
+        qs = qs.filter(il="")
+    else:
+        qs = qs.filter(il__in=["", kapsam]).exclude(il="", bolum__in=IL_BOLUMLERI)
+    sayac = defaultdict(lambda: defaultdict(dict))
+    kaynaklar = []
+    for s in qs.order_by("tarih", "sistem", "anahtar"):
+        sayac[s.sistem][s.bolum][s.anahtar] = s.deger
+        if s.bolum == "kayit" and s.deger:
+            s.baslik = KAYNAK_ADLARI.get((s.sistem, s.anahtar), f"{s.sistem.upper()} {s.anahtar}")
+            kaynaklar.append(s)
+    # Şablonda defaultdict'in __getitem__'ı yeni anahtar üretmesin
+    return {
+        "sayac": {sistem: dict(bolumler) for sistem, bolumler in sayac.items()},
+        "kaynaklar": kaynaklar,
+    }
+
+
+def hepsini_yenile(*yillar: int) -> None:
+    """
+    Bütün bölümleri mevcut sonuç tablolarından yeniden kurar (ilk kurulum / onarım).
+    Her yıl kendi transaction'ında commit edilir: bir yılın hatası öncekileri geri
+    almaz, kilitler de yıl yıl bırakılır.
+    """
+    for yil in yillar:
+        _yili_yenile(yil)
+
+
+@transaction.atomic
+def _yili_yenile(yil: int) -> None:
+    OzetSayaci.objects.filter(yil=yil).delete()
+    kaynaklar = (YuklenenDosya.objects.filter(yil=yil, durum=YuklenenDosya.DURUM_TAMAM)
+                 .values_list("sistem", "kategori").distinct())
+    for sistem, kategori in kaynaklar:
+        kaynak_ozetini_yenile(sistem, kategori, yil)
+
+    cakisma = (CakisanKesinti.objects.filter(yil=yil)
+               .values_list("sistem", "tip").annotate(adet=Count("id")))
+    sistemler = defaultdict(dict)
+    for sistem, tip, adet in cakisma:
+        sistemler[sistem][tip] = adet
+    for sistem, sonuc in sistemler.items():
+        cakisma_ozetini_yenile(sistem, yil, sonuc)
+
+    for c in EslestirmeCalismasi.objects.filter(yil=yil):
+        eslestirme_ozetini_yenile(c.bildirim_sistemi, yil, {
+            "bildirim": c.bildirim_sayisi, "eslesen": c.eslesen, "eslesmeyen": c.eslesmeyen})
+
+    il = OsosIlOzet.objects.filter(yil=yil).aggregate(kesinti=Sum("kesinti_sayisi"), il=Count("id"))
+    if il["il"]:
+        il["modem"] = OsosModemOzet.objects.filter(yil=yil).count()
+        haberlesme_ozetini_yenile(yil, il)
+
+    endeksler = KesintiEndeksi.objects.filter(yil=yil).values_list("sistem", "tablo").distinct()
+    for sistem, tablo in endeksler:
+        endeks_ozetini_yenile(sistem, yil, tablo)
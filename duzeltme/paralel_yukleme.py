@@ -0,0 +1,157 @@
+"""
+Bu dosya: duzeltme/paralel_yukleme.py
+--------------------------------
+part-01 … part-NN dosyalarını bir süreç havuzunda (ProcessPoolExecutor)
+paralel yükler. Her işçi kendi dosyasını okur ve kendi veritabanı
+bağlantısıyla aynı hedef tabloya COPY eder.
+
+Notlar:
+- Havuz kurulmadan önce ana süreçteki DB bağlantıları kapatılır; fork ile
+  açık bir bağlantının çocuk süreçlere kopyalanmasını istemiyoruz.
+- Büyük dosyalar önce gönderilir; böylece iş sonunda tek bir dev dosyanın
+  tek başına çalıştığı "kuyruk" süresi kısalır.
+- SQLite eşzamanlı yazmayı kaldırmadığı için orada tek işçiye düşülür.
+- Aynı parçanın birden çok sürümü (v01, v02) varsa sürümler katman katman
+  sırayla yüklenir: v02, farkını çıkaracağı v01 bitmeden başlamaz.
+- Özet sayaçları (duzeltme.ozet) dosya başına değil, bütün dosyalar bittiğinde
+  her kaynak (sistem, kategori, yıl) için bir kez yenilenir. il kırılımı
+  staging yaprağını baştan sayar; her parçadan sonra saymak yükü karesel
+  büyütürdü. Yükleme yarıda kesilse de (hata, iptal) o ana kadar
+  yüklenenler için yenilenir.
+- ilerleme(dosya_adi, satir, bayt) verilirse her parça commit edildikçe ana
+  süreçte çağrılır (bkz. dosya_yukle). İşçiler bildirimi havuz kurulurken
+  verilen bir kuyruğa yazar; ana süreç iş beklerken kuyruğu boşaltır.
+"""
+
+import multiprocessing
+import os
+import queue
+import signal
+import time
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional
+
+from django.db import connection, connections
+
+
+_KUYRUK_BEKLEME = 0.5
+_ilerleme_kuyrugu = None  # işçi süreçte: ilerleme bildirimlerinin gittiği kuyruk
+
+
+def varsayilan_isci_sayisi() -> int:
+    return os.cpu_count() or 1
+
+
+def _isci_baslat(sinyalleri_yoksay: bool = False, kuyruk=None) -> None:
+    global _ilerleme_kuyrugu
+    _ilerleme_kuyrugu = kuyruk
+    # Durdurma sinyalini yalnızca ana süreç karşılasın, çocuk işini bitirsin (gorev_isci)
+    if sinyalleri_yoksay:
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    # spawn kullanan platformlarda (Windows/macOS) Django'yu çocukta kur
+    from django.apps import apps
+    if not apps.ready:
+        import django
+        os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+        django.setup()
+
+
+def _dosya_isi(yol: str, parca_boyutu: int, yeniden: bool,
+               ilerleme: Optional[Callable[[str, int, int], None]] = None) -> dict:
+    from .yukleme import dosya_yukle
+
+    ad = Path(yol).name
+
+    def dosya_ilerlemesi(satir: int, bayt: int) -> None:
+        if ilerleme is not None:
+            ilerleme(ad, satir, bayt)
+        else:
+            _ilerleme_kuyrugu.put((ad, satir, bayt))
+
+    bildir = ilerleme is not None or _ilerleme_kuyrugu is not None
+    t0 = time.perf_counter()
+    try:
+        sonuc = dosya_yukle(yol, parca_boyutu=parca_boyutu, yeniden=yeniden, ozet_yenile=False,
+                            ilerleme=dosya_ilerlemesi if bildir else None)
+    except Exception as exc:  # bir dosyanın hatası diğerlerini durdurmasın
+        sonuc = {"satir": 0, "hata": f"{type(exc).__name__}: {exc}"}
+    sonuc["dosya"] = ad
+    sonuc["sure"] = time.perf_counter() - t0
+    sonuc["pid"] = os.getpid()
+    return sonuc
+
+
+def surum_katmanlari(dosyalar: List[Path]) -> List[List[Path]]:
+    """Katman i: her parçanın i. sürümü (eskiden yeniye). Kurala uymayanlar ilk katmanda."""
+    from .kaynaklar import dosya_adi_coz
+
+    parcalar = defaultdict(list)
+    for yol in dosyalar:
+        k = dosya_adi_coz(yol.name)
+        anahtar = (k.sistem, k.kategori, k.yil, k.ay, k.part) if k else yol.name
+        parcalar[anahtar].append(((k.versiyon, k.cekim_tarihi) if k else (0, None), yol))
+    katmanlar: List[List[Path]] = []
+    for surumler in parcalar.values():
+        for i, (_, yol) in enumerate(sorted(surumler, key=lambda s: s[0])):
+            if i == len(katmanlar):
+                katmanlar.append([])
+            katmanlar[i].append(yol)
+    return katmanlar
+
+
+def _kuyrugu_bosalt(kuyruk, ilerleme: Callable[[str, int, int], None]) -> None:
+    while True:
+        try:
+            bildirim = kuyruk.get_nowait()
+        except queue.Empty:
+            return
+        ilerleme(*bildirim)
+
+
+def paralel_yukle(dosyalar: List[Path], *, isci_sayisi: int, parca_boyutu: int, yeniden: bool = False,
+                  ilerleme: Optional[Callable[[str, int, int], None]] = None,
+                  sinyalleri_yoksay: bool = False) -> Iterator[dict]:
+    """
+    Her dosya bittikçe sonucunu (satır, süre, hata) verir.
+    sinyalleri_yoksay: işçiler SIGINT/SIGTERM'i yoksayar, durdurmayı çağıran yönetir (gorev_isci).
+    """
+    if connection.vendor == "sqlite":
+        isci_sayisi = 1
+    isci_sayisi = max(1, min(isci_sayisi, len(dosyalar)))
+
+    katmanlar = surum_katmanlari(dosyalar)
+    try:
+        if isci_sayisi == 1:
+            for katman in katmanlar:
+                for yol in katman:
+                    yield _dosya_isi(str(yol), parca_boyutu, yeniden, ilerleme)
+            return
+
+        connections.close_all()
+        kuyruk = multiprocessing.get_context().Queue() if ilerleme else None
+        with ProcessPoolExecutor(max_workers=isci_sayisi, initializer=_isci_baslat,
+                                 initargs=(sinyalleri_yoksay, kuyruk)) as havuz:
+            for katman in katmanlar:
+                sirali = sorted(katman, key=lambda p: p.stat().st_size, reverse=True)
+                bekleyen = {havuz.submit(_dosya_isi, str(yol), parca_boyutu, yeniden) for yol in sirali}
+                while bekleyen:
+                    biten, bekleyen = wait(bekleyen, timeout=_KUYRUK_BEKLEME if kuyruk else None,
+                                           return_when=FIRST_COMPLETED)
+                    if kuyruk is not None:
+                        _kuyrugu_bosalt(kuyruk, ilerleme)
+                    for is_ in biten:
+                        yield is_.result()
+    finally:
+        _ozetleri_yenile(dosyalar)
+
+
+def _ozetleri_yenile(dosyalar: List[Path]) -> None:
+    from .kaynaklar import dosya_adi_coz
+    from .ozet import kaynak_ozetini_yenile
+
+    kaynaklar = {(k.sistem, k.kategori, k.yil) for k in map(dosya_adi_coz, (p.name for p in dosyalar)) if k}
+    for sistem, kategori, yil in sorted(kaynaklar):
+        kaynak_ozetini_yenile(sistem, kategori, yil)
@@ -0,0 +1,270 @@
+"""
+Bu dosya: duzeltme/performans.py
+--------------------------------
+Tekrarlanabilir performans ölçümleri: web sıcak yolları + ham veri yükleme.
+
+Senaryolar (sırayla, tek iş parçacığında; her biri önce ısınır):
+- giris            : login POST (gerçek şifre hash'iyle)
+- index            : /index/ -> duzeltme:ozet yönlendirmesi dahil
+- sekme:<v>/<y>/<s>: kayıt defterindeki her sekme ve ek sayfa
+- veri:<sayfa>     : grid JSON'u önbellekten; ":soguk" her istekte önbelleği boşaltır
+- aktar:<sayfa>.csv: bütün dışa aktarımlar, gövde sonuna kadar okunur
+- yukle:<kaynak>   : sentetik csv'lerin dosya_yukle ile yüklenmesi (satır/sn)
+
+Her senaryo için işlem/sn ve p50/p95/p99 (ms) raporlanır. Sonuçlar bir temel
+(baseline) JSON'a kaydedilebilir. Sonraki koşularda temelle karşılaştırılır ve
+p50/p95 gecikme ya da işlem/sn toleranstan fazla kötüleştiyse koşu başarısız
+sayılır.
+
+Yükleme senaryosu PERFORMANS_YILI'na (gerçek verinin olmadığı bir yıl) yazar
+ve bitince kendi satırlarını siler. Web senaryoları veritabanında ne varsa onu
+okur; boş bir veritabanında anlamlı sayılar için önce tohumla() çalıştırılır.
+"""
+
+import csv
+import json
+import math
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from django.contrib.auth import get_user_model
+from django.test import Client
+from django.urls import reverse
+
+from account.constants import IL_LIST
+
+from . import onbellek
+from .bolumleme import yil_bosalt
+from .disa_aktarma import AKTARIMLAR
+from .grid import GRIDLER
+from .models import OzetSayaci, VeriSurumu, YuklenenDosya
+from .sayfalar import kayit_defteri
+from .yukleme import dosya_yukle
+
+PERFORMANS_YILI = 2099
+_SIFRE = "performans-sifre-1234"
+_KULLANICI = "_performans"
+_GERILIMLER = ("AG", "OG")
+
+# metrik -> kötüleşme yönü (+1: büyümesi kötü, -1: küçülmesi kötü)
+KARSILASTIRILAN = {"p50_ms": +1, "p95_ms": +1, "islem_sn": -1}
+
+
+# ---- İstatistik ----
+def yuzdelik(sirali: List[float], oran: float) -> float:
+    """En yakın sıra yöntemi (nearest-rank); sirali küçükten büyüğe."""
+    if not sirali:
+        return 0.0
+    sira = max(1, math.ceil(round(oran * len(sirali), 6)))
+    return sirali[min(sira, len(sirali)) - 1]
+
+
+def ozetle(sureler: List[float], toplam_sn: float, birim: int = 1) -> dict:
+    sirali = sorted(sureler)
+    return {
+        "adet": len(sirali),
+        "islem_sn": round(len(sirali) * birim / toplam_sn, 2) if toplam_sn else 0.0,
+        "p50_ms": round(yuzdelik(sirali, 0.50) * 1e3, 2),
+        "p95_ms": round(yuzdelik(sirali, 0.95) * 1e3, 2),
+        "p99_ms": round(yuzdelik(sirali, 0.99) * 1e3, 2),
+    }
+
+
+def olc(is_: Callable[[], None], adet: int, isinma: int = 2, birim: int = 1) -> dict:
+    for _ in range(isinma):
+        is_()
+    sureler = []
+    t0 = time.perf_counter()
+    for _ in range(adet):
+        t = time.perf_counter()
+        is_()
+        sureler.append(time.perf_counter() - t)
+    return ozetle(sureler, time.perf_counter() - t0, birim)
+
+
+# ---- Sentetik dosyalar ----
+def _zaman(rnd: random.Random, yil: int) -> datetime:
+    return datetime(yil, 1, 1) + timedelta(minutes=rnd.randrange(365 * 24 * 60))
+
+
+def _yaz(yol: Path, baslik, satirlar) -> Path:
+    with open(yol, "w", encoding="utf-8", newline="") as f:
+        yazici = csv.writer(f, delimiter=";")
+        yazici.writerow(baslik)
+        yazici.writerows(satirlar)
+    return yol
+
+
+def sentetik_dosyalar(klasor: Path, yil: int, satir: int, tohum: int = 42) -> Dict[str, Path]:
+    """kaynak adı -> dosya yolu. Aynı tohumla her seferinde aynı içerik."""
+    rnd = random.Random(tohum)
+    iller = [il for il in IL_LIST if il != "ARAS"]
+    fmt = "%d.%m.%Y %H:%M"
+
+    kesintiler = []
+    for i in range(satir):
+        bas = _zaman(rnd, yil)
+        sure = rnd.randint(1, 600)
+        kesintiler.append((i + 1, rnd.choice(iller), f"F{rnd.randrange(2000)}", rnd.choice(_GERILIMLER),
+                           bas.strftime(fmt), (bas + timedelta(minutes=sure)).strftime(fmt),
+                           str(sure).replace(".", ","), rnd.randrange(500)))
+    bildirimler = [
+        (i + 1, rnd.choice(iller), f"F{rnd.randrange(2000)}", _zaman(rnd, yil).strftime(fmt), "")
+        for i in range(satir)
+    ]
+    osos = []
+    for i in range(satir):
+        bas = _zaman(rnd, yil)
+        osos.append((f"M{rnd.randrange(satir // 4 + 1)}", rnd.choice(iller), bas.strftime(fmt),
+                     (bas + timedelta(minutes=rnd.randint(1, 240))).strftime(fmt)))
+
+    return {
+        "oms_kesinti": _yaz(
+            klasor / f"oms_kesinti_{yil}_2025-01-01_part-01_v01.csv",
+            ("Kesinti No", "İl", "Fider", "Gerilim Seviyesi", "Başlama Tarihi", "Bitiş Tarihi",
+             "Süre", "Etkilenen Abone Sayısı"), kesintiler),
+        "crm_bildirim": _yaz(
+            klasor / f"crm_bildirim_{yil}_2025-01-01_v01.csv",
+            ("Bildirim No", "İl", "Fider", "Bildirim Tarihi", "Kesinti No"), bildirimler),
+        "osos_haberlesme": _yaz(
+            klasor / f"osos_haberlesme_unitesi_{yil}_2025-01-01_part-01_v01.csv",
+            ("Modem No", "İl", "Kesinti Başlangıç", "Kesinti Bitiş"), osos),
+    }
+
+
+def _yuklenenleri_sil(yil: int) -> None:
+    for sistem in set(YuklenenDosya.objects.filter(yil=yil).values_list("sistem", flat=True)):
+        yil_bosalt(sistem, yil)
+    OzetSayaci.objects.filter(yil=yil).delete()
+    VeriSurumu.objects.filter(yil=yil).delete()
+
+
+def tohumla(yil: int, satir: int) -> Dict[str, int]:
+    """Boş veritabanına web senaryoları için sentetik veri yükler (kalıcı)."""
+    with tempfile.TemporaryDirectory() as klasor:
+        return {ad: dosya_yukle(yol)["satir"] for ad, yol in sentetik_dosyalar(Path(klasor), yil, satir).items()}
+
+
+# ---- Senaryolar ----
+def _kullanici():
+    User = get_user_model()
+    kullanici, _ = User.objects.get_or_create(
+        username=_KULLANICI, defaults={"email": "performans@olcum.invalid"})
+    kullanici.set_password(_SIFRE)
+    kullanici.il = "ARAS"  # bütün bölge: ölçümler il kapsamıyla küçülmesin
+    kullanici.save()
+    return kullanici
+
+
+def _get(istemci: Client, url: str, akis: bool = False) -> Callable[[], None]:
+    def is_():
+        yanit = istemci.get(url, follow=not akis)
+        if yanit.status_code != 200:
+            raise AssertionError(f"{url}: HTTP {yanit.status_code}")
+        if akis:
+            b"".join(yanit.streaming_content)
+    return is_
+
+
+def web_senaryolari(adet: int, aktarim_adedi: int, filtre: Optional[str] = None) -> Dict[str, dict]:
+    kullanici = _kullanici()
+    try:
+        senaryolar = {}
+
+        def ekle(ad, is_, n):
+            if filtre and filtre not in ad:
+                return
+            senaryolar[ad] = olc(is_, n)
+
+        def giris():
+            yanit = Client().post(reverse("login"), {"email": kullanici.email, "password": _SIFRE})
+            if yanit.status_code != 302:
+                raise AssertionError(f"giriş: HTTP {yanit.status_code}")
+
+        ekle("giris", giris, max(3, adet // 10))
+
+        istemci = Client()
+        istemci.force_login(kullanici)
+        ekle("index", _get(istemci, reverse("index")), adet)
+
+        for (vendor, yil), sayfalar in kayit_defteri().items():
+            for slug in sayfalar.sablonlar:
+                url = (reverse("duzeltme:ozet", args=[vendor, yil]) if slug == "ozet"
+                       else reverse("duzeltme:page", args=[vendor, yil, slug]))
+                ekle(f"sekme:{vendor}/{yil}/{slug}", _get(istemci, url), adet)
+
+        for (vendor, yil), sayfalar in kayit_defteri().items():
+            for slug in GRIDLER:
+                if slug not in sayfalar.sablonlar:
+                    continue
+                url = reverse("duzeltme:page_data", args=[vendor, yil, slug])
+                ekle(f"veri:{vendor}/{yil}/{slug}", _get(istemci, url), adet)
+                soguk = _get(istemci, url)
+
+                def onbelleksiz(soguk=soguk, vendor=vendor, yil=yil):
+                    onbellek.gecersiz_kil(yil, vendor)
+                    soguk()
+                ekle(f"veri:{vendor}/{yil}/{slug}:soguk", onbelleksiz, adet)
+
+        vendor, yil = next(iter(kayit_defteri()))
+        for slug in AKTARIMLAR:
+            url = reverse("duzeltme:page_export", args=[vendor, yil, slug, "csv"])
+            ekle(f"aktar:{slug}.csv", _get(istemci, url, akis=True), aktarim_adedi)
+        ilk = next(iter(GRIDLER))
+        url = reverse("duzeltme:page_export", args=[vendor, yil, ilk, "xlsx"])
+        ekle(f"aktar:{ilk}.xlsx", _get(istemci, url, akis=True), aktarim_adedi)
+        return senaryolar
+    finally:
+        kullanici.delete()
+
+
+def yukleme_senaryolari(adet: int, satir: int, filtre: Optional[str] = None) -> Dict[str, dict]:
+    """islem_sn burada satır/sn'dir."""
+    senaryolar = {}
+    _yuklenenleri_sil(PERFORMANS_YILI)
+    try:
+        with tempfile.TemporaryDirectory() as klasor:
+            for ad, yol in sentetik_dosyalar(Path(klasor), PERFORMANS_YILI, satir).items():
+                if filtre and filtre not in f"yukle:{ad}":
+                    continue
+                senaryolar[f"yukle:{ad}"] = olc(lambda: dosya_yukle(yol, yeniden=True),
+                                                adet, isinma=1, birim=satir)
+    finally:
+        _yuklenenleri_sil(PERFORMANS_YILI)
+    return senaryolar
+
+
+# ---- Temel (baseline) ----
+def temel_oku(yol: Path) -> Optional[dict]:
+    if not yol.exists():
+        return None
+    return json.loads(yol.read_text(encoding="utf-8"))
+
+
+def temel_yaz(yol: Path, sonuclar: Dict[str, dict], bilgi: dict) -> None:
+    yol.parent.mkdir(parents=True, exist_ok=True)
+    yol.write_text(json.dumps({"bilgi": bilgi, "senaryolar": sonuclar}, ensure_ascii=False, indent=2),
+                   encoding="utf-8")
+
+
+def karsilastir(temel: Dict[str, dict], simdi: Dict[str, dict], tolerans: float,
+                en_az_ms: float) -> List[str]:
+    """Toleransı aşan kötüleşmeler; en_az_ms'den küçük gecikme farkları gürültü sayılır."""
+    gerilemeler = []
+    for ad, yeni in simdi.items():
+        eski = temel.get(ad)
+        if not eski:
+            continue
+        for metrik, yon in KARSILASTIRILAN.items():
+            once, sonra = eski.get(metrik), yeni.get(metrik)
+            if not once or sonra is None:
+                continue
+            degisim = (sonra - once) / once * yon
+            fark_ms = abs(sonra - once) if metrik.endswith("_ms") else None
+            if degisim > tolerans and (fark_ms is None or fark_ms >= en_az_ms):
+                gerilemeler.append(f"{ad} {metrik}: {once} -> {sonra} (%{degisim * 100:+.0f})")
+    return gerilemeler
@@ -0,0 +1,121 @@
+"""
+Bu dosya: duzeltme/sayfalar.py
+--------------------------------
+vendor / yıl / sayfa kayıt defteri.
+
+Hangi vendor'ın hangi yılda hangi sekmeleri (sayfaları) olduğu aşağıda
+SAYFALAR'da elle yazılır. Defter süreç başına bir kez kurulur:
+- sekme URL'leri reverse() ile bir kez hesaplanır,
+- her sayfanın şablonu bir kez derlenir (get_template),
+- şablonu olmayan sayfa deftere girmez; istek 404 alır (TemplateDoesNotExist/500 değil).
+
+İstek sırasında yapılan iş bir sözlük aramasıdır.
+"""
+
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from django.conf import settings
+from django.template import TemplateDoesNotExist
+from django.template.loader import get_template
+from django.urls import reverse
+
+# vendor -> yıllar, sekmeler (slug, etiket) ve sekmesi olmayan ek sayfalar.
+# "ozet" slug'ı vendor/yıl ana sayfasıdır.
+SAYFALAR = {
+    "inavitas": {
+        "yillar": (2022,),
+        "sekmeler": (
+            ("ozet", "Özet"),
+            ("inavitas_tablo1", "Inavitas-Tablo1"),
+            ("inavitas_bildirim", "Inavitas-Bildirim"),
+            ("inavitas_cakisanlar", "Inavitas-Cakisanlar"),
+            ("oms_tablo1", "OMS Tablo1"),
+            ("oms_kesinti", "OMS Kesinti"),
+            ("oms_bildirim", "OMS Bildirim"),
+            ("crm_bildirim", "CRM Bildirim"),
+            ("osos_haberlesme", "OSOS Haberleşme"),
+        ),
+        "ek_sayfalar": ("tablo1_detay", "tablo1_yeni"),
+    },
+    "oms": {
+        "yillar": (2022,),
+        "sekmeler": (
+            ("ag_duzeltmeler", "AG Düzeltmeler"),
+            ("ic_ice_duzeltmeler", "İç İçe Düzeltmeler"),
+        ),
+        "ek_sayfalar": (),
+    },
+}
+
+
+# page slug -> CSS/JS paket tipi (core/paketler.py). Listede olmayan sayfa "duzeltme".
+SAYFA_PAKETLERI = {
+    "ozet": "ozet",
+    "inavitas_tablo1": "grid",
+    "oms_tablo1": "grid",
+    "oms_kesinti": "grid",
+    "tablo1_detay": "grid",
+}
+
+
+class YilSayfalari(NamedTuple):
+    sekmeler: Tuple[dict, ...]        # _top_tabs.html için {"slug", "label", "url"}
+    sablonlar: Dict[str, object]      # page slug -> derlenmiş şablon (DEBUG'da şablon adı)
+
+
+def _template_path(vendor: str, year: int, page: str) -> str:
+    # Örn: templates/duzeltme/inavitas/2022/ozet.html
+    return f"duzeltme/{vendor}/{year}/{page}.html"
+
+
+def _url(vendor: str, year: int, page: str) -> str:
+    if page == "ozet":
+        return reverse("duzeltme:ozet", args=[vendor, year])
+    return reverse("duzeltme:page", args=[vendor, year, page])
+
+
+def _sablon(ad: str):
+    """Şablonu derler; yoksa None. DEBUG'da adı döner ki değişiklikler anında görünsün."""
+    try:
+        sablon = get_template(ad)
+    except TemplateDoesNotExist:
+        return None
+    return ad if settings.DEBUG else sablon
+
+
+@lru_cache(maxsize=None)
+def kayit_defteri() -> Dict[Tuple[str, int], YilSayfalari]:
+    defter = {}
+    for vendor, tanim in SAYFALAR.items():
+        sayfalar = [slug for slug, _ in tanim["sekmeler"]] + list(tanim["ek_sayfalar"])
+        for yil in tanim["yillar"]:
+            sablonlar = {}
+            for slug in sayfalar:
+                sablon = _sablon(_template_path(vendor, yil, slug))
+                if sablon is not None:
+                    sablonlar[slug] = sablon
+            if not sablonlar:
+                continue
+            sekmeler = tuple(
+                {"slug": slug, "label": etiket, "url": _url(vendor, yil, slug)}
+                for slug, etiket in tanim["sekmeler"] if slug in sablonlar
+            )
+            defter[(vendor, yil)] = YilSayfalari(sekmeler, sablonlar)
+    return defter
+
+
+def yil_sayfalari(vendor: str, year: int) -> Optional[YilSayfalari]:
+    return kayit_defteri().get((vendor, year))
+
+
+def sayfa_paketi(page: str) -> str:
+    return SAYFA_PAKETLERI.get(page, "duzeltme")
+
+
+def sayfa_sablonu(vendor: str, year: int, page: str):
+    """(sekmeler, şablon) ya da bilinmeyen vendor/yıl/sayfa için None."""
+    yil = kayit_defteri().get((vendor, year))
+    if yil is None or page not in yil.sablonlar:
+        return None
+    return yil.sekmeler, yil.sablonlar[page]
@@ -0,0 +1,77 @@
+"""
+Bu dosya: duzeltme/surum.py
+--------------------------------
+Veri sürüm damgası: bir yılın verisi değişti mi?
+
+Yükleme ve hesaplama işleri bittiğinde (sistem, yıl) için sürümü bir artırır
+(bkz. duzeltme.ozet). Sayfalar ETag / Last-Modified'ı bu damgadan üretir;
+tarayıcı aynı damgayla tekrar sorduğunda ağır sorgular hiç çalışmadan
+304 Not Modified döner.
+
+Damgaya kodun kendisi de girer (şablon / python dosyalarının en son
+değişme zamanı): deploy sonrası eski sayfa önbellekten gelmesin.
+"""
+
+import hashlib
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from . import onbellek
+from .models import VeriSurumu
+
+
+class Damga(NamedTuple):
+    etag: str
+    son_degisme: datetime
+
+
+def surumu_artir(sistem: str, yil: int) -> None:
+    simdi = timezone.now()
+    # Yılın önbellek kayıtları da eskisin (bkz. duzeltme.onbellek). Çağıran çoğu zaman
+    # atomic içindedir: commit'ten önce eskitilirse arada gelen istek eski veriyi yeni
+    # ad alanına yazar; geri alınan iş ise önbelleği boşuna boşaltır.
+    transaction.on_commit(lambda: onbellek.gecersiz_kil(yil))
+    guncellenen = VeriSurumu.objects.filter(sistem=sistem, yil=yil).update(surum=F("surum") + 1, degisme=simdi)
+    if guncellenen:
+        return
+    try:
+        with transaction.atomic():
+            VeriSurumu.objects.create(sistem=sistem, yil=yil, surum=1, degisme=simdi)
+    except IntegrityError:
+        # Paralel iş bizden önce oluşturdu
+        VeriSurumu.objects.filter(sistem=sistem, yil=yil).update(surum=F("surum") + 1, degisme=simdi)
+
+
+@lru_cache(maxsize=None)
+def kod_damgasi() -> float:
+    """Şablon ve duzeltme python dosyalarının en son değişme zamanı (süreç başına bir kez)."""
+    yollar = [Path(d) for d in settings.TEMPLATES[0]["DIRS"]]
+    paket = Path(__file__).resolve().parent
+    yollar.append(paket)
+    enbuyuk = 0.0
+    for kok in yollar:
+        for dosya in kok.rglob("*"):
+            if dosya.suffix in (".html", ".py") and dosya.is_file():
+                enbuyuk = max(enbuyuk, dosya.stat().st_mtime)
+    return enbuyuk
+
+
+def yil_damgasi(yil: int) -> Damga:
+    """Yılın bütün sistemlerinin sürümlerinden tek damga (tek küçük sorgu)."""
+    surumler = list(VeriSurumu.objects.filter(yil=yil).order_by("sistem").values_list("sistem", "surum", "degisme"))
+    kod = kod_damgasi()
+    h = hashlib.sha1(f"{yil}:{kod}".encode())
+    son = datetime.fromtimestamp(kod)
+    if settings.USE_TZ:
+        son = timezone.make_aware(son)
+    for sistem, surum, degisme in surumler:
+        h.update(f"|{sistem}:{surum}".encode())
+        son = max(son, degisme)
+    return Damga(h.hexdigest()[:20], son)
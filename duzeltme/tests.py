@@ -1,3 +1,788 @@
-from django.test import TestCase
+import io
+import json
+import random
+from collections import defaultdict
+import tempfile
+from datetime import date, datetime, timedelta
+from itertools import combinations
+from pathlib import Path
+from unittest import mock, skipUnless
 
-# Create your tests here.
+import numpy as np
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.http import QueryDict
+from django.core.management import CommandError, call_command
+from django.db import connection, transaction
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from openpyxl import load_workbook
+
+from account.kapsam import HEPSI
+
+from . import gorevler, onbellek, ozet, performans, sayfalar, yukleme
+from .cakisma import aralik_indeksi, cakismalari_bul, cakismalari_hesapla
+from .disa_aktarma import xlsx_akisi
+from .management.commands import baglanti_olcumu
+from .endeks import endeksleri_hesapla
+from .eslestirme import eslestir
+from .grid import GRIDLER, grid_sayfasi
+from .models import (CakisanKesinti, Kesinti, KesintiEndeksi, OsosGunlukOzet, OsosIlOzet, OsosKesinti, OsosModemOzet,
+                     OzetSayaci, YuklenenDosya)
+from .osos_ozet import osos_ozet_hesapla
+from .ozet import hepsini_yenile
+from .paralel_yukleme import paralel_yukle, surum_katmanlari
+from .surum import surumu_artir
+from .views import _cakisanlar_verisi
+from .yukleme import dosya_yukle
+
+_BASLIK = "Kesinti No;İl;Fider;Gerilim Seviyesi;Başlama Tarihi;Bitiş Tarihi;Süre;Etkilenen Abone Sayısı;Kesinti Tipi"
+
+
+def dosya_olustur(ad: str, sistem: str = "oms", kategori: str = "kesinti", yil: int = 2091, **kwargs) -> YuklenenDosya:
+    return YuklenenDosya.objects.create(
+        dosya_adi=ad, yol=f"/tmp/{ad}", sistem=sistem, kategori=kategori, yil=yil,
+        cekim_tarihi=date(yil, 1, 1), versiyon=1, hedef_tablo=Kesinti._meta.db_table,
+        durum=YuklenenDosya.DURUM_TAMAM, **kwargs,
+    )
+
+
+def kesinti_satiri(no: int, il: str = "KARS", sure: int = 30, tip: str = "Plansız") -> str:
+    bas = datetime(2091, 3, 1, 8, 0) + timedelta(hours=no)
+    bit = bas + timedelta(minutes=sure)
+    return (f"{no};{il};F{no % 3};OG;{bas:%d.%m.%Y %H:%M};{bit:%d.%m.%Y %H:%M};{sure};{10 * no};"
+            f"{tip}")
+
+
+class _GeciciKlasor:
+    def setUp(self):
+        super().setUp()
+        gecici = tempfile.TemporaryDirectory()
+        self.addCleanup(gecici.cleanup)
+        self.klasor = Path(gecici.name)
+
+    def csv_yaz(self, ad: str, satirlar) -> Path:
+        yol = self.klasor / ad
+        yol.write_text("\n".join([_BASLIK, *satirlar]) + "\n", encoding="utf-8")
+        return yol
+
+
+class _Kesildi(Exception):
+    pass
+
+
+class DevamTesti(_GeciciKlasor, TestCase):
+    def test_yarida_kalan_yukleme_kaldigi_yerden_devam_eder(self):
+        # Tırnak içinde satır sonu olan kayıtlar: bayt konumu kayıt sınırında kalmalı
+        satirlar = [kesinti_satiri(no, tip='"Plan\nlı"' if no in (5, 8) else "Plansız") for no in range(1, 11)]
+        yol = self.csv_yaz("oms_kesinti_2091_2025-01-01_part-02_v01.csv", satirlar)
+
+        yaz = yukleme.parca_yaz
+        cagri = []
+
+        def kes(*args):
+            cagri.append(args)
+            if len(cagri) == 3:
+                raise _Kesildi
+            yaz(*args)
+
+        # Üçüncü parça yazılırken kesilir: ilk iki parça (6 satır) commit edilmiştir
+        with mock.patch.object(yukleme, "parca_yaz", kes), self.assertRaises(_Kesildi):
+            dosya_yukle(yol, parca_boyutu=3)
+        kayit = YuklenenDosya.objects.get(dosya_adi=yol.name)
+        self.assertEqual(kayit.durum, YuklenenDosya.DURUM_HATA)
+        self.assertEqual(Kesinti.objects.filter(dosya=kayit).count(), 6)
+
+        sonuc = dosya_yukle(yol, parca_boyutu=3)
+        self.assertEqual((sonuc["devam"], sonuc["satir"]), (6, 10))
+        yuklenen = list(Kesinti.objects.filter(dosya=kayit).order_by("satir_no")
+                        .values_list("satir_no", "kesinti_no", "kesinti_tipi"))
+        self.assertEqual([s for s, _, _ in yuklenen], list(range(1, 11)))
+        self.assertEqual([n for _, n, _ in yuklenen], [str(no) for no in range(1, 11)])
+        self.assertEqual([t for _, _, t in yuklenen if t != "Plansız"], ["Plan\nlı", "Plan\nlı"])
+
+
+class ParalelYuklemeTesti(_GeciciKlasor, TestCase):
+    def test_surum_katmanlari(self):
+        ad = "oms_kesinti_{yil}_2025-0{v}-01_part-0{part}_v0{v}.csv"
+        p1 = [Path(ad.format(yil=2091, part=1, v=v)) for v in (1, 2, 3)]
+        p2 = Path(ad.format(yil=2091, part=2, v=1))
+        baska_yil = Path(ad.format(yil=2092, part=1, v=2))
+        kuralsiz = Path("notlar.csv")
+
+        katmanlar = surum_katmanlari([p1[2], kuralsiz, p1[0], baska_yil, p2, p1[1]])
+        # Her parçanın i. sürümü i. katmanda; farklı yılın aynı part'ı ayrı parça
+        self.assertEqual([set(k) for k in katmanlar],
+                         [{p1[0], p2, baska_yil, kuralsiz}, {p1[1]}, {p1[2]}])
+
+    def test_tek_isci_surumleri_sirayla_yukler(self):
+        v01 = self.csv_yaz("oms_kesinti_2091_2025-01-01_part-01_v01.csv", [kesinti_satiri(no) for no in range(1, 5)])
+        v02 = self.csv_yaz("oms_kesinti_2091_2025-02-01_part-01_v02.csv",
+                           [kesinti_satiri(no) for no in (1, 2, 3, 5)])
+        p2 = self.csv_yaz("oms_kesinti_2091_2025-01-01_part-02_v01.csv", [kesinti_satiri(no) for no in (10, 11, 12)])
+        bozuk = self.klasor / "oms_kesinti_2091_2025-01-01_part-03_v01.csv"
+        bozuk.write_text("a;b;c\n1;2;3\n", encoding="utf-8")
+
+        sonuclar = {s["dosya"]: s for s in paralel_yukle([v02, bozuk, p2, v01], isci_sayisi=1, parca_boyutu=2)}
+        sira = list(sonuclar)
+        self.assertLess(sira.index(v01.name), sira.index(v02.name))
+        self.assertIn("hata", sonuclar[bozuk.name])  # bir dosyanın hatası diğerlerini durdurmaz
+        self.assertEqual(sonuclar[v02.name]["fark"]["eklenen"], 1)
+        self.assertEqual(sorted(Kesinti.objects.filter(sistem="oms", yil=2091).values_list("kesinti_no", flat=True),
+                                key=int), ["1", "2", "3", "5", "10", "11", "12"])
+
+    def test_ozet_sayaclari_yuklemenin_sonunda_bir_kez_yenilenir(self):
+        dosyalar = [
+            self.csv_yaz(f"oms_kesinti_2091_2025-01-01_part-0{part}_v01.csv",
+                         [kesinti_satiri(no, il=("KARS", "ARDAHAN")[no % 2]) for no in range(10 * part, 10 * part + 5)])
+            for part in (1, 2, 3)
+        ]
+        yenile = mock.Mock(wraps=ozet.kaynak_ozetini_yenile)
+        with mock.patch.object(ozet, "kaynak_ozetini_yenile", yenile), \
+                mock.patch.object(yukleme, "kaynak_ozetini_yenile", yenile):
+            list(paralel_yukle(dosyalar, isci_sayisi=1, parca_boyutu=2))
+        yenile.assert_called_once_with("oms", "kesinti", 2091)
+        kayit = dict(OzetSayaci.objects.filter(sistem="oms", yil=2091, bolum="kayit", anahtar="kesinti")
+                     .values_list("il", "deger"))
+        self.assertEqual(kayit, {"": 15, "KARS": 9, "ARDAHAN": 6})
+
+
+class _KayitliIlerleme:
+    def __init__(self):
+        self.cagrilar = []
+
+    def __call__(self, islenen=None, *, yuzde=None, mesaj=None, zorla=False):
+        self.cagrilar.append((islenen, yuzde, mesaj))
+
+
+class YuklemeGoreviTesti(_GeciciKlasor, TestCase):
+    def test_gorev_paralel_yukle_ile_surumleri_sirayla_yukler(self):
+        self.csv_yaz("oms_kesinti_2091_2025-01-01_part-01_v01.csv", [kesinti_satiri(no) for no in range(1, 5)])
+        self.csv_yaz("oms_kesinti_2091_2025-02-01_part-01_v02.csv", [kesinti_satiri(no) for no in (1, 2, 3, 5)])
+        self.csv_yaz("oms_kesinti_2091_2025-01-01_part-02_v01.csv", [kesinti_satiri(no) for no in (10, 11, 12)])
+        ilerleme = _KayitliIlerleme()
+        with mock.patch.object(gorevler, "paralel_yukle", wraps=gorevler.paralel_yukle) as paralel:
+            sonuc = gorevler._yukleme({"yollar": [str(self.klasor)], "isci_sayisi": 1}, ilerleme)
+
+        self.assertEqual(paralel.call_args.kwargs["isci_sayisi"], 1)
+        self.assertEqual(sonuc, {"dosya": 3, "yuklenen": 3, "atlanan": 0, "satir": 11, "hatalar": []})
+        self.assertEqual(sorted(Kesinti.objects.filter(sistem="oms", yil=2091).values_list("kesinti_no", flat=True),
+                                key=int), ["1", "2", "3", "5", "10", "11", "12"])
+        islenen = [i for i, _, _ in ilerleme.cagrilar if i is not None]
+        yuzdeler = [y for _, y, _ in ilerleme.cagrilar if y is not None]
+        self.assertEqual(islenen, sorted(islenen))
+        self.assertEqual(yuzdeler, sorted(yuzdeler))
+        self.assertEqual(ilerleme.cagrilar[-1][:2], (11, 100))
+
+    def test_hatali_dosya_gorevi_hataya_dusurur(self):
+        self.csv_yaz("oms_kesinti_2091_2025-01-01_part-01_v01.csv", [kesinti_satiri(1)])
+        (self.klasor / "oms_kesinti_2091_2025-01-01_part-02_v01.csv").write_text("a;b\n1;2\n", encoding="utf-8")
+        with self.assertRaisesRegex(gorevler.GorevHatasi, "1 dosya yüklenemedi: oms_kesinti_2091_2025-01-01_part-02"):
+            gorevler._yukleme({"yollar": [str(self.klasor)], "isci_sayisi": 1}, _KayitliIlerleme())
+        self.assertEqual(Kesinti.objects.filter(sistem="oms", yil=2091).count(), 1)
+
+
+class CakismaTesti(TestCase):
+    def test_sweep_line_kaba_kuvvetle_ayni(self):
+        rnd = random.Random(7)
+        t0 = datetime(2091, 1, 1)
+        araliklar = []
+        for id_ in range(1, 301):
+            bas = t0 + timedelta(minutes=rnd.randrange(0, 2000, 5))  # eş başlamalar olsun
+            araliklar.append((id_, bas, bas + timedelta(minutes=rnd.randrange(5, 300, 5))))
+
+        bulunan = {
+            (frozenset((a, b)), tip, c0, c1) for a, b, tip, c0, c1 in cakismalari_bul(araliklar)
+        }
+        beklenen = set()
+        for x, y in combinations(araliklar, 2):
+            if x[1] < y[2] and y[1] < x[2]:  # yarı açık aralıklar
+                a, b = sorted((x, y), key=lambda r: (r[1], -(r[2] - r[1])))
+                tip = CakisanKesinti.TIP_IC_ICE if a[2] >= b[2] else CakisanKesinti.TIP_KISMI
+                beklenen.add((frozenset((a[0], b[0])), tip, b[1], min(a[2], b[2])))
+        self.assertTrue(beklenen)
+        self.assertEqual(bulunan, beklenen)
+
+    def test_aralik_indeksi_kaba_kuvvetle_ayni(self):
+        rnd = random.Random(11)
+        dosya = dosya_olustur("aralik.csv")
+        t0 = datetime(2091, 2, 1)
+        kesintiler = []
+        for i in range(200):
+            bas = t0 + timedelta(minutes=rnd.randrange(0, 5000, 5))
+            sure = rnd.randrange(0, 400, 5)
+            # Bitişi boş olanlar süreden hesaplanır; süresiz ve başlamasız olanlar dışarıda kalır
+            kesintiler.append(Kesinti(
+                dosya=dosya, satir_no=i, sistem="oms", yil=2091, sebeke_unsuru="F1" if i % 4 else "F2",
+                baslama=None if i % 50 == 7 else bas, bitis=bas + timedelta(minutes=sure) if i % 3 else None,
+                sure_dk=None if i % 30 == 1 else sure))
+        Kesinti.objects.bulk_create(kesintiler)
+
+        araliklar = []
+        for k in Kesinti.objects.filter(sebeke_unsuru="F1", baslama__isnull=False):
+            bit = k.bitis or (k.baslama + timedelta(minutes=k.sure_dk) if k.sure_dk is not None else None)
+            if bit is not None and bit > k.baslama:
+                araliklar.append((k.id, k.baslama, bit))
+        indeks = aralik_indeksi("oms", 2091, "F1")
+        self.assertEqual(len(indeks), len(araliklar))
+        for _ in range(100):
+            q0 = t0 + timedelta(minutes=rnd.randrange(-100, 5500, 5))
+            q1 = q0 + timedelta(minutes=rnd.randrange(5, 300, 5))
+            beklenen = {id_ for id_, bas, bit in araliklar if bas < q1 and q0 < bit}
+            self.assertEqual(set(indeks.cakisanlar(q0, q1)), beklenen, (q0, q1))
+
+    def test_farkli_illerdeki_cift_iki_ilde_de_gorunur(self):
+        dosya = dosya_olustur("il_siniri.csv")
+        bas = datetime(2091, 4, 1, 10)
+        Kesinti.objects.bulk_create([
+            Kesinti(dosya=dosya, satir_no=1, sistem="oms", yil=2091, il="KARS", sebeke_unsuru="F9",
+                    baslama=bas, sure_dk=120),
+            Kesinti(dosya=dosya, satir_no=2, sistem="oms", yil=2091, il="ARDAHAN", sebeke_unsuru="F9",
+                    baslama=bas + timedelta(minutes=30), sure_dk=30),
+        ])
+        cakismalari_hesapla("oms", 2091)
+
+        cift = CakisanKesinti.objects.get(sistem="oms", yil=2091)
+        self.assertEqual((cift.il, cift.il_b, cift.tip), ("KARS", "ARDAHAN", CakisanKesinti.TIP_IC_ICE))
+        for il in ("KARS", "ARDAHAN"):
+            self.assertEqual(len(_cakisanlar_verisi("oms", 2091, il)["cakisanlar"]), 1, il)
+            self.assertEqual(OzetSayaci.objects.get(sistem="oms", yil=2091, bolum="cakisma", il=il,
+                                                    anahtar=CakisanKesinti.TIP_IC_ICE).deger, 1)
+        self.assertEqual(len(_cakisanlar_verisi("oms", 2091, "AĞRI")["cakisanlar"]), 0)
+        self.assertEqual(len(_cakisanlar_verisi("oms", 2091, HEPSI)["cakisanlar"]), 1)
+
+
+class OsosOzetTesti(TestCase):
+    YIL = 2091
+
+    @classmethod
+    def setUpTestData(cls):
+        rnd = random.Random(5)
+        cls.dosya = dosya_olustur("osos.csv", sistem="osos", kategori="haberlesme_unitesi", yil=cls.YIL)
+        t0 = datetime(cls.YIL, 6, 1)
+        satirlar = []
+        for i in range(400):
+            modem = rnd.randrange(40)
+            bas = t0 + timedelta(minutes=rnd.randrange(0, 14 * 24 * 60))
+            # Gece yarısını (birkaç kez) aşanlar ve sıfır süreliler de olsun
+            sure = timedelta(minutes=rnd.choice([0, 5, 90, 600, 1440, 3000]) + rnd.randrange(60))
+            satirlar.append(OsosKesinti(dosya=cls.dosya, satir_no=i, sistem="osos", yil=cls.YIL,
+                                        modem_no=f"M{modem:03d}", il=("KARS", "AĞRI", "IĞDIR")[modem % 3],
+                                        baslama=bas, bitis=bas + sure))
+        satirlar.append(OsosKesinti(dosya=cls.dosya, satir_no=400, sistem="osos", yil=cls.YIL,
+                                    modem_no="M000", il="KARS", baslama=t0, bitis=None))  # sayılmaz
+        OsosKesinti.objects.bulk_create(satirlar)
+
+    def _dongu_ile(self) -> tuple:
+        """Satır satır Python döngüsüyle aynı özetler (karşılaştırma için)."""
+        modem, il, gun = {}, {}, {}
+        il_modemleri, gun_modemleri = defaultdict(set), defaultdict(set)
+        for k in OsosKesinti.objects.filter(yil=self.YIL, bitis__isnull=False):
+            sure = max(int((k.bitis - k.baslama).total_seconds()), 0)
+            m = modem.setdefault(k.modem_no, [k.il, 0, 0, 0])
+            m[1], m[2], m[3] = m[1] + 1, m[2] + sure, max(m[3], sure)
+            i = il.setdefault(k.il, [0, 0, 0, 0])
+            i[1], i[2], i[3] = i[1] + 1, i[2] + sure, max(i[3], sure)
+            il_modemleri[k.il].add(k.modem_no)
+
+            gece = datetime.combine(k.baslama.date(), datetime.min.time())
+            ilk = True
+            while True:
+                sonraki = gece + timedelta(days=1)
+                g = gun.setdefault((k.il, gece.date()), [0, 0, 0])
+                g[0] += ilk
+                g[2] += max(int((min(k.bitis, sonraki) - max(k.baslama, gece)).total_seconds()), 0)
+                gun_modemleri[(k.il, gece.date())].add(k.modem_no)
+                if k.bitis <= sonraki:
+                    break
+                gece, ilk = sonraki, False
+        for anahtar, modemler in il_modemleri.items():
+            il[anahtar][0] = len(modemler)
+        for anahtar, modemler in gun_modemleri.items():
+            gun[anahtar][1] = len(modemler)
+        return ({a: tuple(d) for a, d in modem.items()}, {a: tuple(d) for a, d in il.items()},
+                {a: tuple(d) for a, d in gun.items()})
+
+    def _tablolar(self) -> tuple:
+        return (
+            {m: tuple(d) for m, *d in OsosModemOzet.objects.filter(yil=self.YIL).values_list(
+                "modem_no", "il", "kesinti_sayisi", "toplam_sure_sn", "en_uzun_sn")},
+            {i: tuple(d) for i, *d in OsosIlOzet.objects.filter(yil=self.YIL).values_list(
+                "il", "modem_sayisi", "kesinti_sayisi", "toplam_sure_sn", "en_uzun_sn")},
+            {(i, g): tuple(d) for i, g, *d in OsosGunlukOzet.objects.filter(yil=self.YIL).values_list(
+                "il", "gun", "kesinti_sayisi", "modem_sayisi", "toplam_sure_sn")},
+        )
+
+    def test_vektorel_ozet_dongu_ile_ayni(self):
+        sonuc = osos_ozet_hesapla(self.YIL)
+        for tablo, beklenen in zip(self._tablolar(), self._dongu_ile()):
+            self.assertEqual(tablo, beklenen)
+        self.assertEqual((sonuc["kesinti"], sonuc["modem"]), (400, 40))
+
+    def test_tekrar_hesapta_yalniz_degisen_anahtarlar_yazilir(self):
+        osos_ozet_hesapla(self.YIL)
+        idler = set(OsosModemOzet.objects.filter(yil=self.YIL).values_list("pk", flat=True))
+        self.assertEqual(osos_ozet_hesapla(self.YIL)["yazilan"], 0)
+
+        # Tek modemin tek kesintisi uzadı: o modem, ili ve ilgili günler değişir
+        k = OsosKesinti.objects.filter(yil=self.YIL, modem_no="M004", bitis__isnull=False).first()
+        OsosKesinti.objects.filter(pk=k.pk).update(bitis=k.bitis + timedelta(minutes=7))
+        sonuc = osos_ozet_hesapla(self.YIL)
+        self.assertLess(sonuc["yazilan"], 12)
+        kalan = set(OsosModemOzet.objects.filter(yil=self.YIL).values_list("pk", flat=True))
+        self.assertEqual(len(idler - kalan), 1)  # yalnız M004 yeniden yazıldı
+        self.assertEqual(self._tablolar(), self._dongu_ile())
+
+
+class OzetYenileTesti(TestCase):
+    def test_her_yil_ayri_commit_edilir(self):
+        for yil in (2091, 2092):
+            dosya_olustur(f"ozet_{yil}.csv", yil=yil, satir_sayisi=yil - 2090)
+        eski = OzetSayaci.objects.create(sistem="oms", yil=2092, bolum="kayit", anahtar="eski", deger=1)
+        gercek = ozet.kaynak_ozetini_yenile
+
+        def yenile(sistem, kategori, yil):
+            if yil == 2092:
+                raise RuntimeError("kesildi")
+            gercek(sistem, kategori, yil)
+
+        with mock.patch.object(ozet, "kaynak_ozetini_yenile", yenile), self.assertRaises(RuntimeError):
+            hepsini_yenile(2091, 2092)
+        self.assertEqual(OzetSayaci.objects.get(sistem="oms", yil=2091, bolum="kayit", anahtar="kesinti", il="").deger,
+                         1)
+        # Hata veren yıl geri alındı: silinen eski sayaç yerinde
+        self.assertTrue(OzetSayaci.objects.filter(pk=eski.pk).exists())
+
+
+class EslestirmeTesti(TestCase):
+    def test_secilen_kesinti_pencerede_eslesmeyenin_adayi_yok(self):
+        rnd = np.random.default_rng(3)
+        n, m = 400, 600
+        k_unsur = rnd.choice(["F1", "F2", "F3", ""], n)
+        k_bas = rnd.integers(0, 200_000, n)
+        k_bit = k_bas + rnd.integers(60, 20_000, n)
+        k_no = np.array([str(i) for i in range(n)])
+        b_unsur = rnd.choice(["F1", "F2", "F3", "F4", ""], m)
+        b_zaman = rnd.integers(0, 220_000, m)
+        b_no = np.where(rnd.random(m) < 0.1, rnd.integers(0, 2 * n, m).astype(str), "")
+        once, sonra = 1800, 900
+
+        secilen, yontem = eslestir(k_unsur, k_bas, k_bit, k_no, b_unsur, b_zaman, b_no,
+                                   once_sn=once, sonra_sn=sonra)
+        for j in range(m):
+            if b_no[j] and b_no[j] in set(k_no):
+                self.assertEqual((yontem[j], k_no[secilen[j]]), (1, b_no[j]))
+                continue
+            uyan = {i for i in range(n) if b_unsur[j] and k_unsur[i] == b_unsur[j]
+                    and k_bas[i] <= b_zaman[j] + once and k_bit[i] + sonra >= b_zaman[j]}
+            if uyan:
+                self.assertEqual(yontem[j], 2)
+                self.assertIn(secilen[j], uyan)
+            else:
+                self.assertEqual((yontem[j], secilen[j]), (0, -1))
+
+
+class GridTesti(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        dosya = dosya_olustur("grid.csv")
+        bas = datetime(2091, 5, 1)
+        Kesinti.objects.bulk_create([
+            Kesinti(dosya=dosya, satir_no=i, sistem="oms", yil=2091, il="KARS",
+                    baslama=None if i % 5 == 0 else bas + timedelta(hours=i % 7),
+                    sure_dk=None if i % 4 == 0 else float(i % 6))
+            for i in range(1, 41)
+        ])
+
+    def test_keyset_sayfalama_null_kuyrugu(self):
+        tanim = GRIDLER["oms_kesinti"]
+        for siralama in ("id", "-id", "baslama", "-baslama", "sure_dk", "-sure_dk"):
+            alinan, imlec = [], None
+            while True:
+                params = QueryDict(mutable=True)
+                params.update({"siralama": siralama, "adet": "4", "kolonlar": "satir_no"})
+                if imlec:
+                    params["imlec"] = imlec
+                sayfa = grid_sayfasi(tanim, 2091, params, HEPSI)
+                alinan += [s[0] for s in sayfa["satirlar"]]
+                imlec = sayfa["sonraki"]
+                if not imlec:
+                    break
+
+            kolon, azalan = siralama.lstrip("-"), siralama.startswith("-")
+            satirlar = list(Kesinti.objects.filter(sistem="oms", yil=2091).values_list(kolon, "id", "satir_no"))
+            dolu = sorted((s for s in satirlar if s[0] is not None), key=lambda s: (s[0], s[1]), reverse=azalan)
+            bos = sorted((s for s in satirlar if s[0] is None), key=lambda s: s[1], reverse=azalan)
+            # NULL'lar her iki yönde de sonda
+            self.assertEqual(alinan, [s[2] for s in dolu + bos], siralama)
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class SayfaDefteriTesti(TestCase):
+    def setUp(self):
+        sayfalar.kayit_defteri.cache_clear()
+        self.addCleanup(sayfalar.kayit_defteri.cache_clear)
+
+    def test_defter_sablonu_olan_sayfalardan_bir_kez_kurulur(self):
+        tanim = dict(sayfalar.SAYFALAR["inavitas"], sekmeler=(("ozet", "Özet"), ("yok", "Şablonsuz")))
+        with mock.patch.dict(sayfalar.SAYFALAR, {"inavitas": tanim}), \
+                mock.patch.object(sayfalar, "get_template", wraps=sayfalar.get_template) as derle:
+            yil = sayfalar.yil_sayfalari("inavitas", 2022)
+            self.assertIs(sayfalar.yil_sayfalari("inavitas", 2022), yil)
+            self.assertEqual(derle.call_count, 4 + 2)  # inavitas: ozet, yok ve iki ek sayfa; oms: iki sekme
+        self.assertEqual([s["slug"] for s in yil.sekmeler], ["ozet"])
+        self.assertEqual(yil.sekmeler[0]["url"], reverse("duzeltme:ozet", args=["inavitas", 2022]))
+        self.assertEqual(set(yil.sablonlar), {"ozet", "tablo1_detay", "tablo1_yeni"})
+        self.assertIsNone(sayfalar.sayfa_sablonu("inavitas", 2022, "yok"))
+        # Hiç şablonu olmayan vendor/yıl deftere girmez
+        self.assertIsNone(sayfalar.yil_sayfalari("oms", 2022))
+
+    def test_bilinmeyen_sayfa_404(self):
+        self.client.force_login(get_user_model().objects.create_user("defter", "defter@ornek.invalid", "x"))
+        for vendor, yil, sayfa in (("inavitas", 2022, "yok"), ("inavitas", 2023, "oms_kesinti"),
+                                   ("oms", 2022, "ag_duzeltmeler")):
+            self.assertEqual(self.client.get(reverse("duzeltme:page", args=[vendor, yil, sayfa])).status_code, 404)
+        self.assertEqual(self.client.get(reverse("duzeltme:ozet", args=["yok", 2022])).status_code, 404)
+        self.assertEqual(
+            self.client.get(reverse("duzeltme:page_data", args=["inavitas", 2022, "ozet"])).status_code, 404)
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class EtagTesti(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        dosya = dosya_olustur("etag.csv", yil=2022)
+        Kesinti.objects.create(dosya=dosya, satir_no=1, sistem="oms", yil=2022, il="KARS",
+                               baslama=datetime(2022, 2, 1), sure_dk=10.0)
+        cls.kullanici = get_user_model().objects.create_user("etag", "etag@ornek.invalid", "x", il="KARS")
+        cls.url = reverse("duzeltme:page_data", args=["inavitas", 2022, "oms_kesinti"])
+
+    def test_ayni_etag_304_doner(self):
+        self.client.force_login(self.kullanici)
+        ilk = self.client.get(self.url)
+        self.assertEqual(ilk.status_code, 200)
+        self.assertTrue(ilk["ETag"])
+
+        tekrar = self.client.get(self.url, HTTP_IF_NONE_MATCH=ilk["ETag"])
+        self.assertEqual(tekrar.status_code, 304)
+
+        surumu_artir("oms", 2022)
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=ilk["ETag"]).status_code, 200)
+
+    def test_onbellek_yalniz_commit_sonrasi_eskir(self):
+        ns = onbellek.anahtar("inavitas", 2022, ["x"])
+        with self.captureOnCommitCallbacks(execute=True) as geri_cagirmalar:
+            with self.assertRaises(_Kesildi), transaction.atomic():
+                surumu_artir("oms", 2022)
+                raise _Kesildi
+        self.assertEqual(geri_cagirmalar, [])
+        self.assertEqual(onbellek.anahtar("inavitas", 2022, ["x"]), ns)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                surumu_artir("oms", 2022)
+                self.assertEqual(onbellek.anahtar("inavitas", 2022, ["x"]), ns)
+        self.assertNotEqual(onbellek.anahtar("inavitas", 2022, ["x"]), ns)
+
+
+class FarkTesti(_GeciciKlasor, TestCase):
+    def test_v01_v02_yalniz_fark_uygulanir(self):
+        v01 = self.csv_yaz("oms_kesinti_2091_2025-01-01_part-01_v01.csv",
+                           [kesinti_satiri(no) for no in range(1, 7)])
+        self.assertIsNone(dosya_yukle(v01)["fark"])
+        eski_idler = dict(Kesinti.objects.filter(sistem="oms", yil=2091).values_list("kesinti_no", "id"))
+
+        # 3 değişti, 4 silindi, 7 eklendi; 1, 2, 5, 6 aynı
+        v02 = self.csv_yaz("oms_kesinti_2091_2025-02-01_part-01_v02.csv",
+                           [kesinti_satiri(1), kesinti_satiri(2), kesinti_satiri(3, sure=95),
+                            kesinti_satiri(5), kesinti_satiri(6), kesinti_satiri(7)])
+        fark = dosya_yukle(v02)["fark"]
+        self.assertEqual(
+            {k: fark[k] for k in ("eklenen", "guncellenen", "silinen", "ayni", "tam_degisim")},
+            {"eklenen": 1, "guncellenen": 1, "silinen": 1, "ayni": 4, "tam_degisim": False},
+        )
+
+        satirlar = {k.kesinti_no: k for k in Kesinti.objects.filter(sistem="oms", yil=2091)}
+        self.assertEqual(sorted(satirlar, key=int), ["1", "2", "3", "5", "6", "7"])
+        yeni = YuklenenDosya.objects.get(dosya_adi=v02.name)
+        self.assertTrue(all(k.dosya_id == yeni.pk for k in satirlar.values()))
+        # Eşleşen satırların id'si korunur, güncellenen satıra yeni değer yazılır
+        for no in ("1", "2", "3", "5", "6"):
+            self.assertEqual(satirlar[no].id, eski_idler[no])
+        self.assertEqual(satirlar["3"].sure_dk, 95)
+        self.assertEqual(YuklenenDosya.objects.get(dosya_adi=v01.name).durum, YuklenenDosya.DURUM_ESKI)
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class GorunumTesti(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        dosya = dosya_olustur("gorunum.csv", yil=2022)
+        Kesinti.objects.bulk_create([
+            Kesinti(dosya=dosya, satir_no=i, sistem="oms", yil=2022, il=("KARS", "AĞRI", "ERZURUM")[i % 3],
+                    baslama=datetime(2022, 2, 1) + timedelta(hours=i), sure_dk=10.0)
+            for i in range(30)
+        ])
+        User = get_user_model()
+        cls.kars = User.objects.create_user("kars", "kars@ornek.invalid", "x", il="KARS")
+        cls.ilsiz = User.objects.create_user("ilsiz", "ilsiz@ornek.invalid", "x", il="")
+        cls.yonetici = User.objects.create_user("yonetici", "yonetici@ornek.invalid", "x", il="KARS")
+        cls.yonetici.groups.add(Group.objects.get_or_create(name="Admin")[0])
+        cls.url = reverse("duzeltme:page_data", args=["inavitas", 2022, "oms_kesinti"])
+
+    def _iller(self, kullanici) -> set:
+        self.client.force_login(kullanici)
+        yanit = self.client.get(self.url, {"kolonlar": "il", "adet": "100"})
+        self.assertEqual(yanit.status_code, 200)
+        return {s[0] for s in yanit.json()["satirlar"]}
+
+    def test_il_kullanicisi_yalniz_kendi_ilini_gorur(self):
+        self.assertEqual(self._iller(self.kars), {"KARS"})
+        yanit = self.client.get(reverse("duzeltme:page_export", args=["inavitas", 2022, "oms_kesinti", "csv"]),
+                                {"kolonlar": "il"})
+        govde = b"".join(yanit.streaming_content).decode("utf-8-sig").split()
+        self.assertEqual(set(govde[1:]), {"KARS"})
+
+    def test_ili_bos_kullanici_hicbir_satir_gormez(self):
+        self.assertEqual(self._iller(self.ilsiz), set())
+
+    def test_yonetici_grubu_butun_bolgeyi_gorur(self):
+        self.assertEqual(self._iller(self.yonetici), {"KARS", "AĞRI", "ERZURUM"})
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class DisaAktarmaTesti(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        dosya = dosya_olustur("aktarma.csv", yil=2022)
+        Kesinti.objects.bulk_create([
+            Kesinti(dosya=dosya, satir_no=i, sistem="oms", yil=2022, il=("KARS", "AĞRI")[i % 2],
+                    baslama=datetime(2022, 2, 1, 8, 30) + timedelta(hours=i), sure_dk=12.5 + i)
+            for i in range(6)
+        ])
+        cls.yonetici = get_user_model().objects.create_user("aktaran", "aktaran@ornek.invalid", "x", il="KARS")
+        cls.yonetici.groups.add(Group.objects.get_or_create(name="Admin")[0])
+
+    def setUp(self):
+        self.client.force_login(self.yonetici)
+
+    def _indir(self, bicim: str, **params):
+        return self.client.get(reverse("duzeltme:page_export", args=["inavitas", 2022, "oms_kesinti", bicim]), params)
+
+    def test_csv_bicimi_ve_filtre(self):
+        yanit = self._indir("csv", kolonlar="il,baslama,sure_dk", il="AĞRI")
+        self.assertEqual(yanit.status_code, 200)
+        self.assertIn('filename="inavitas_2022_oms_kesinti.csv"', yanit["Content-Disposition"])
+        govde = b"".join(yanit.streaming_content)
+        self.assertTrue(govde.startswith(b"\xef\xbb\xbf"))
+        satirlar = govde.decode("utf-8-sig").splitlines()
+        self.assertEqual(satirlar[0], "İl;Başlama;Süre (dk)")
+        self.assertEqual(satirlar[1:], ["AĞRI;01.02.2022 09:30;13,5", "AĞRI;01.02.2022 11:30;15,5",
+                                        "AĞRI;01.02.2022 13:30;17,5"])
+
+    def test_xlsx_openpyxl_ile_okunur(self):
+        yanit = self._indir("xlsx", kolonlar="satir_no,il,baslama,sure_dk")
+        self.assertEqual(yanit.status_code, 200)
+        kitap = load_workbook(io.BytesIO(b"".join(yanit.streaming_content)), read_only=True)
+        sayfa = kitap.active
+        self.assertEqual(sayfa.title, "Kesintiler")
+        satirlar = list(sayfa.iter_rows(values_only=True))
+        self.assertEqual(satirlar[0], ("Satır no", "İl", "Başlama", "Süre (dk)"))
+        self.assertEqual(satirlar[1:], [
+            (i, ("KARS", "AĞRI")[i % 2], datetime(2022, 2, 1, 8, 30) + timedelta(hours=i), 12.5 + i)
+            for i in range(6)
+        ])
+
+    def test_xlsx_ilk_parca_satirlar_bitmeden_gelir(self):
+        okunan = []
+
+        def satirlar():
+            for i in range(5000):
+                okunan.append(i)
+                yield (i, f"<metin {i} & ş>", None)
+
+        akis = xlsx_akisi(["no", "metin", "bos"], satirlar())
+        self.assertTrue(next(akis).startswith(b"PK"))
+        self.assertEqual(okunan, [])
+        parcalar = list(akis)
+        self.assertGreater(len([p for p in parcalar if p]), 2)
+        self.assertEqual(len(okunan), 5000)
+
+    def test_bilinmeyen_bicim_ve_kolon(self):
+        self.assertEqual(self._indir("pdf").status_code, 404)
+        yanit = self._indir("csv", kolonlar="yok")
+        self.assertEqual(yanit.status_code, 400)
+        self.assertIn("yok", yanit.json()["hata"])
+
+
+class EndeksTesti(TestCase):
+    SISTEM, YIL = "oms", 2091
+
+    @classmethod
+    def setUpTestData(cls):
+        dosya = dosya_olustur("endeks.csv", yil=cls.YIL)
+        bas = datetime(cls.YIL, 3, 1, 8, 0)
+        # Aynı il farklı yazımlarla: bütün yıl hesabı hepsini KARS hücresinde sayar
+        iller = ["KARS", "Kars", " kars ", "ERZURUM", "ağrı"]
+        Kesinti.objects.bulk_create([
+            Kesinti(dosya=dosya, satir_no=i, sistem=cls.SISTEM, yil=cls.YIL, il=iller[i % len(iller)],
+                    gerilim_seviyesi="OG" if i % 3 else "AG", baslama=bas + timedelta(hours=i),
+                    sure_dk=float(i % 40), etkilenen_abone=10 + i)
+            for i in range(200)
+        ])
+
+    def _hucreler(self, il: str) -> dict:
+        qs = KesintiEndeksi.objects.filter(sistem=self.SISTEM, tablo="kesinti", yil=self.YIL, il=il)
+        return {
+            e.gerilim_seviyesi: (e.kesinti_sayisi, e.kisa_kesinti_sayisi, e.abone_kesinti, e.abone_dakika,
+                                 e.toplam_sure_dk, e.en_uzun_dk)
+            for e in qs
+        }
+
+    def test_tek_il_butun_yil_ile_ayni(self):
+        endeksleri_hesapla(self.SISTEM, self.YIL, tablo="kesinti")
+        butun = {il: self._hucreler(il) for il in ("KARS", "AĞRI", "ERZURUM")}
+        self.assertEqual(sum(uzun + kisa for uzun, kisa, *_ in butun["KARS"].values()), 120)
+
+        endeksleri_hesapla(self.SISTEM, self.YIL, tablo="kesinti", iller=["kars", "AĞRI"])
+        for il, hucreler in butun.items():
+            self.assertEqual(self._hucreler(il), hucreler, il)
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class PerformansTesti(_GeciciKlasor, TestCase):
+    def test_yuzdelik_ve_ozet(self):
+        sureler = [i / 1000 for i in range(20, 0, -1)]  # 1..20 ms, karışık sırada
+        self.assertEqual(performans.yuzdelik(sorted(sureler), 0.95), 0.019)
+        self.assertEqual(performans.yuzdelik([0.1], 0.99), 0.1)
+        self.assertEqual(performans.yuzdelik([], 0.5), 0.0)
+        self.assertEqual(performans.ozetle(sureler, 2.0, birim=10),
+                         {"adet": 20, "islem_sn": 100.0, "p50_ms": 10.0, "p95_ms": 19.0, "p99_ms": 20.0})
+
+    def test_karsilastir(self):
+        temel = {"a": {"p50_ms": 10.0, "p95_ms": 20.0, "islem_sn": 100.0},
+                 "b": {"p50_ms": 1.0, "p95_ms": 1.0, "islem_sn": 900.0}}
+        simdi = {"a": {"p50_ms": 14.0, "p95_ms": 21.0, "islem_sn": 70.0},
+                 "b": {"p50_ms": 2.0, "p95_ms": 2.5, "islem_sn": 1000.0},  # %100 kötü ama 2 ms'den küçük fark
+                 "yeni": {"p50_ms": 99.0, "p95_ms": 99.0, "islem_sn": 1.0}}
+        self.assertEqual(performans.karsilastir(temel, simdi, tolerans=0.25, en_az_ms=2.0),
+                         ["a p50_ms: 10.0 -> 14.0 (%+40)", "a islem_sn: 100.0 -> 70.0 (%+30)"])
+
+    def test_komut_temeli_kaydeder_ve_gerilemede_hata_verir(self):
+        temel = self.klasor / "temel.json"
+        secenekler = {"senaryo": "veri:inavitas/2022/oms_kesinti", "yuklemesiz": True, "adet": 2,
+                      "temel": str(temel), "stdout": io.StringIO()}
+        call_command("performans", **secenekler)
+        kayitli = performans.temel_oku(temel)
+        self.assertEqual(set(kayitli["senaryolar"]),
+                         {"veri:inavitas/2022/oms_kesinti", "veri:inavitas/2022/oms_kesinti:soguk"})
+        self.assertFalse(get_user_model().objects.filter(username=performans._KULLANICI).exists())
+
+        yavas = {ad: dict(s, p50_ms=s["p50_ms"] * 3 + 10) for ad, s in kayitli["senaryolar"].items()}
+        with mock.patch.object(performans, "web_senaryolari", return_value=yavas), \
+                self.assertRaisesRegex(CommandError, "2 metrik %25 toleransı aştı"):
+            call_command("performans", **secenekler)
+        with mock.patch.object(performans, "web_senaryolari", return_value=kayitli["senaryolar"]):
+            call_command("performans", **secenekler)
+        self.assertIn("Gerileme yok", secenekler["stdout"].getvalue())
+
+
+class PerformansYuklemeTesti(TransactionTestCase):
+    # yil_bosalt yaprağı TRUNCATE eder; PostgreSQL bunu ertelenmiş FK tetikleri bekleyen transaction'da yapmaz
+    def test_yukleme_senaryosu_kendi_satirlarini_siler(self):
+        sonuc = performans.yukleme_senaryolari(1, 40, "yukle:oms_kesinti")
+        self.assertEqual(list(sonuc), ["yukle:oms_kesinti"])
+        self.assertEqual(sonuc["yukle:oms_kesinti"]["adet"], 1)
+        self.assertFalse(YuklenenDosya.objects.filter(yil=performans.PERFORMANS_YILI).exists())
+        self.assertFalse(Kesinti.objects.filter(yil=performans.PERFORMANS_YILI).exists())
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class BaglantiOlcumuTesti(TransactionTestCase):
+    # İstekler ayrı iş parçacıklarında, kendi bağlantılarıyla: veri commit edilmiş olmalı
+    def test_tek_mod_olcumu(self):
+        get_user_model().objects.create_user("olcen", "olcen@ornek.invalid", "x", il="KARS")
+        cikti = io.StringIO()
+        call_command("baglanti_olcumu", tek="havuzsuz", isci=2, adet=6, kullanici="olcen", stdout=cikti,
+                     url=reverse("duzeltme:page_data", args=["inavitas", 2022, "oms_kesinti"]))
+        sonuc = json.loads(cikti.getvalue())
+        self.assertEqual(sonuc["adet"], 6)
+        self.assertGreater(sonuc["istek_sn"], 0)
+        self.assertLessEqual(sonuc["p50_ms"], sonuc["p95_ms"])
+        if getattr(connection, "pool", None) is not None:
+            # Isınmadan sonra bağlantılar havuzdan gelir
+            self.assertLessEqual(sonuc["yeni_baglanti"], 2)
+
+    def test_olmayan_kullanici_hata(self):
+        with self.assertRaisesRegex(CommandError, "aktif kullanıcı yok"):
+            call_command("baglanti_olcumu", tek="havuzsuz", kullanici="yok", stdout=io.StringIO())
+
+    def test_iki_mod_karsilastirilir(self):
+        olcumler = {
+            "havuzsuz": {"adet": 10, "istek_sn": 50.0, "p50_ms": 12.0, "p95_ms": 30.0, "yeni_baglanti": 10},
+            "havuzlu": {"adet": 10, "istek_sn": 80.0, "p50_ms": 7.5, "p95_ms": 11.0, "yeni_baglanti": 0},
+        }
+        cikti = io.StringIO()
+        with mock.patch.object(baglanti_olcumu.Command, "_alt_surec", lambda self, mod, opts: olcumler[mod]):
+            call_command("baglanti_olcumu", stdout=cikti, stderr=io.StringIO())
+        if connection.vendor == "postgresql":
+            self.assertIn("Havuz p50'yi 4.5 ms, p95'i 19.0 ms kısalttı.", cikti.getvalue())
+        else:
+            # Havuz yalnız PostgreSQL'de: yalnız havuzsuz ölçülür
+            self.assertIn("havuzsuz", cikti.getvalue())
+            self.assertNotIn("havuzlu", cikti.getvalue())
+
+
+@skipUnless(connection.vendor == "postgresql", "Yıl/sistem bölümleri yalnız PostgreSQL'de")
+class YilBolumleriGocuTesti(TransactionTestCase):
+    ONCEKI = [("duzeltme", "0008_veri_surumu")]
+    SONRAKI = [("duzeltme", "0009_yil_bolumleri")]
+
+    def setUp(self):
+        son = MigrationExecutor(connection).loader.graph.leaf_nodes()
+        self.addCleanup(lambda: MigrationExecutor(connection).migrate(son))
+        MigrationExecutor(connection).migrate(self.ONCEKI)
+
+    def _satirlar(self) -> dict:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT "id", tableoid::regclass::text FROM "duzeltme_kesinti"')
+            return dict(cursor.fetchall())
+
+    def test_satirlar_yil_ve_sistem_yapraklarina_tasinir(self):
+        apps = MigrationExecutor(connection).loader.project_state(self.ONCEKI).apps
+        YuklenenDosya, Kesinti = apps.get_model("duzeltme", "YuklenenDosya"), apps.get_model("duzeltme", "Kesinti")
+        for sistem, yil in (("oms", 2091), ("inavitas", 2091), ("oms", 2092), ("oms-x", 2091)):
+            dosya = YuklenenDosya.objects.create(
+                dosya_adi=f"{sistem}_{yil}.csv", yol="/tmp/x.csv", sistem=sistem, kategori="kesinti", yil=yil,
+                cekim_tarihi=date(yil, 1, 1), versiyon=1, hedef_tablo="duzeltme_kesinti")
+            Kesinti.objects.bulk_create([
+                Kesinti(dosya=dosya, satir_no=i, sistem=sistem, yil=yil, il="KARS",
+                        baslama=datetime(yil, 3, 1) + timedelta(hours=i), sure_dk=10.0)
+                for i in range(3)
+            ])
+        onceki = self._satirlar()
+
+        MigrationExecutor(connection).migrate(self.SONRAKI)
+        sonraki = self._satirlar()
+        self.assertEqual(set(sonraki), set(onceki))
+        yapraklar = defaultdict(int)
+        for yaprak in sonraki.values():
+            yapraklar[yaprak] += 1
+        # Ad kuralına uymayan sistem yılın DEFAULT yaprağında kalır
+        self.assertEqual(dict(yapraklar), {"duzeltme_kesinti_2091_oms": 3, "duzeltme_kesinti_2091_inavitas": 3,
+                                           "duzeltme_kesinti_2092_oms": 3, "duzeltme_kesinti_2091_diger": 3})
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+                           "WHERE conrelid = 'duzeltme_kesinti'::regclass AND contype IN ('p', 'u')")
+            kisitlar = dict(cursor.fetchall())
+            cursor.execute("SELECT indexname FROM pg_indexes WHERE tablename = 'duzeltme_kesinti'")
+            indeksler = {r[0] for r in cursor.fetchall()}
+        # id kimliği kopyalanan en büyük id'den devam eder
+        apps = MigrationExecutor(connection).loader.project_state(self.SONRAKI).apps
+        yeni_id = apps.get_model("duzeltme", "Kesinti").objects.create(
+            dosya_id=dosya.pk, satir_no=99, sistem=dosya.sistem, yil=dosya.yil).pk
+        self.assertEqual(kisitlar["duzeltme_kesinti_pkey"], "PRIMARY KEY (id, yil, sistem)")
+        self.assertIn("UNIQUE (dosya_id, satir_no, sistem, yil)", kisitlar["kesinti_dosya_satir_tekil"])
+        self.assertTrue({"kesinti_no_idx", "kesinti_baslama_brin", "kesinti_bitis_brin"} <= indeksler)
+        self.assertGreater(yeni_id, max(onceki))
@@ -7,7 +7,17 @@ urlpatterns = [
     # Varsayılan sayfa: /tablo1duzeltme/<vendor>/<year>/
     path("<str:vendor>/<int:year>/", views.ozet, name="ozet"),
 
+    # Arka plan görevleri (özet sayfası yoklar / staff başlatır); sayfa rotasından önce
+    path("<str:vendor>/<int:year>/gorevler/", views.gorev_durumu, name="gorev_durumu"),
+    path("<str:vendor>/<int:year>/gorevler/baslat", views.gorev_baslat, name="gorev_baslat"),
+
     # Esnek sayfa rotası: /tablo1duzeltme/<vendor>/<year>/<page>/
     # page = "tablo1_detay", "tablo1_yeni", "ag_duzeltmeler", "ic_ice_duzeltmeler" ...
     path("<str:vendor>/<int:year>/<slug:page>/", views.page, name="page"),
+
+    # Grid verisi (JSON, keyset sayfalı): /tablo1duzeltme/<vendor>/<year>/<page>/data
+    path("<str:vendor>/<int:year>/<slug:page>/data", views.page_data, name="page_data"),
+
+    # İndirme (akışlı): /tablo1duzeltme/<vendor>/<year>/<page>/export.csv | export.xlsx
+    path("<str:vendor>/<int:year>/<slug:page>/export.<str:bicim>", views.page_export, name="page_export"),
 ]
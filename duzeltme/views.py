@@ -1,67 +1,201 @@
+import hashlib
+
 from django.contrib.auth.decorators import login_required
 from django.shortcuts import render
 from django.urls import reverse
-from django.http import Http404
-
-def _template_path(vendor: str, year: int, page: str) -> str:
-    # Örn: templates/duzeltme/inavitas/2022/ozet.html
-    return f"duzeltme/{vendor}/{year}/{page}.html"
-
-def _tabs(vendor: str, year: int):
-    # Üst sekmeler: vendor’a göre farklı menü
-    if vendor == "inavitas":
-        return [
-            {"slug": "ozet",           "label": "Özet",
-             "url": reverse("duzeltme:ozet", args=[vendor, year])},
-            {"slug": "inavitas_tablo1",   "label": "Inavitas-Tablo1",
-             "url": reverse("duzeltme:page", args=[vendor, year, "inavitas_tablo1"])},
-            {"slug": "inavitas_bildirim",    "label": "Inavitas-Bildirim",
-             "url": reverse("duzeltme:page", args=[vendor, year, "inavitas_bildirim"])},
-            {"slug": "inavitas_cakisanlar",    "label": "Inavitas-Cakisanlar",
-             "url": reverse("duzeltme:page", args=[vendor, year, "inavitas_cakisanlar"])},
-            {"slug": "omstablo1",   "label": "OMS Tablo1",
-             "url": reverse("duzeltme:page", args=[vendor, year, "oms_tablo1"])},
-            {"slug": "omskesinti",    "label": "OMS Kesinti",
-             "url": reverse("duzeltme:page", args=[vendor, year, "oms_kesinti"])},
-               {"slug": "omsbildirim",    "label": "OMS Bildirim",
-             "url": reverse("duzeltme:page", args=[vendor, year, "oms_bildirim"])},
-            {"slug": "crmbildirim",    "label": "CRM Bildirim",
-             "url": reverse("duzeltme:page", args=[vendor, year, "crm_bildirim"])},
-        ]
-    if vendor == "oms":
-        return [
-            {"slug": "ag_duzeltmeler",     "label": "AG Düzeltmeler",
-             "url": reverse("duzeltme:page", args=[vendor, year, "ag_duzeltmeler"])},
-            {"slug": "ic_ice_duzeltmeler", "label": "İç İçe Düzeltmeler",
-             "url": reverse("duzeltme:page", args=[vendor, year, "ic_ice_duzeltmeler"])},
-        ]
-    return []
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.views.decorators.cache import cache_control, never_cache
+from django.views.decorators.http import condition, require_GET, require_POST
+from django.db.models import Count
+
+from account.kapsam import HEPSI, istek_kapsami, kapsamla
+
+from . import onbellek
+from .disa_aktarma import AKTARIMLAR, BICIMLER, akis
+from .gorevler import GOREVLER, gorev_ekle, son_gorevler
+from .grid import GRIDLER, GridHatasi, grid_sayfasi, kolon_basliklari
+from .models import BildirimEslesme, CakisanKesinti, EslestirmeCalismasi, Gorev, OsosIlOzet, OsosModemOzet
+from .ozet import ozet_sayaclari
+from .sayfalar import sayfa_paketi, sayfa_sablonu, yil_sayfalari
+from .surum import yil_damgasi
+
+def _cakisanlar_verisi(vendor: str, year: int, kapsam: str) -> dict:
+    # Önceden hesaplanmış çiftler (bkz. cakisma_hesapla komutu); iki taraftan biri kapsamdaysa görünür
+    qs = CakisanKesinti.objects.filter(sistem=vendor, yil=year)
+    qs = kapsamla(qs, kapsam) | kapsamla(qs, kapsam, "il_b")
+    return {
+        "cakisma_ozet": {r["tip"]: r["adet"] for r in qs.values("tip").annotate(adet=Count("id"))},
+        "cakisanlar": qs.select_related("kesinti_a", "kesinti_b").order_by("-cakisma_dk")[:200],
+    }
+
+def _osos_verisi(vendor: str, year: int, kapsam: str) -> dict:
+    # Özet tabloları osos_ozet_hesapla ile doldurulur; ham tabloya dokunmuyoruz.
+    return {
+        "osos_iller": kapsamla(OsosIlOzet.objects.filter(yil=year), kapsam).order_by("il"),
+        "osos_modemler": kapsamla(OsosModemOzet.objects.filter(yil=year), kapsam).order_by("-toplam_sure_sn")[:50],
+    }
+
+def _bildirim_verisi(kaynak: str):
+    # Eşleşme tablosu bildirim_eslestir ile doldurulur.
+    def veri(vendor: str, year: int, kapsam: str) -> dict:
+        eslesmeler = kapsamla(BildirimEslesme.objects.filter(bildirim_sistemi=kaynak, yil=year), kapsam)
+        calisma = EslestirmeCalismasi.objects.filter(bildirim_sistemi=kaynak, yil=year).first()
+        if calisma is not None and kapsam != HEPSI:
+            # Çalışmanın sayıları bütün bölgenin; il kullanıcısına kendi ilininki
+            # (bildirim_sistemi, yil, il, kesinti) indeksinden sayılır.
+            sayi = eslesmeler.aggregate(bildirim_sayisi=Count("id"), eslesen=Count("kesinti"))
+            calisma = {**sayi, "eslesmeyen": sayi["bildirim_sayisi"] - sayi["eslesen"], "tarih": calisma.tarih}
+        return {
+            "eslestirme": calisma,
+            "eslesmeyenler": (
+                eslesmeler
+                .filter(kesinti__isnull=True)
+                .select_related("bildirim")
+                .order_by("bildirim__bildirim_zamani")[:200]
+            ),
+        }
+    return veri
+
+# Sayfaya özel veri: page slug -> fonksiyon(vendor, year, kapsam) -> ek context
+_SAYFA_VERISI = {
+    "inavitas_cakisanlar": _cakisanlar_verisi,
+    "osos_haberlesme": _osos_verisi,
+    "crm_bildirim": _bildirim_verisi("crm"),
+    "oms_bildirim": _bildirim_verisi("oms"),
+    "inavitas_bildirim": _bildirim_verisi("inavitas"),
+}
+
+def _damga(request, vendor: str, year: int, **kwargs):
+    # ETag ve Last-Modified aynı damgadan; istek başına tek sorgu
+    if not hasattr(request, "_veri_damgasi"):
+        request._veri_damgasi = yil_damgasi(year)
+    return request._veri_damgasi
+
+def _etag(request, vendor: str, year: int, **kwargs):
+    # Sayfada kullanıcı adı ve CSRF token'ı da var: oturuma özel ETag.
+    # İl kapsamı da girer: kullanıcının ili değişince eski sayfa 304 ile dönmesin.
+    oturum = hashlib.sha1(f"{request.session.session_key}:{istek_kapsami(request)}".encode()).hexdigest()[:8]
+    return f"{_damga(request, vendor, year).etag}-{oturum}"
+
+def _son_degisme(request, vendor: str, year: int, **kwargs):
+    return _damga(request, vendor, year).son_degisme
+
+def _kosullu(view):
+    # Veri sürümü değişmediyse görünüm hiç çalışmadan 304 döner (bkz. duzeltme/surum.py).
+    # no-cache: tarayıcı saklar ama her seferinde ETag ile sorar.
+    return cache_control(private=True, no_cache=True)(
+        condition(etag_func=_etag, last_modified_func=_son_degisme)(view))
+
+def _render(request, sablon, ctx):
+    # sablon: kayıt defterindeki derlenmiş şablon ya da (DEBUG'da) şablon adı
+    if isinstance(sablon, str):
+        return render(request, sablon, ctx)
+    return HttpResponse(sablon.render(ctx, request))
 
 @login_required
+@_kosullu
 def ozet(request, vendor: str, year: int):
-    tabs = _tabs(vendor, year)
-    if not tabs:
-        raise Http404("Bilinmeyen vendor")
+    bulunan = sayfa_sablonu(vendor, year, "ozet")
+    if bulunan is None:
+        raise Http404("Bilinmeyen vendor/yıl")
+    tabs, sablon = bulunan
     ctx = {
         "vendor": vendor, "year": year,
-        "top_tabs": tabs, "active_tab": "ozet",
+        "top_tabs": tabs, "active_tab": "ozet", "paket": sayfa_paketi("ozet"),
         # SEO blokları için (global base.html’deki block’ları dolduruyoruz)
         "page_title": f"Tablo1 Düzeltme – {vendor.upper()} {year}",
         "page_description": f"{vendor.upper()} {year} özet sayfası",
         "page_keywords": f"{vendor},{year},tablo1,duzeltme",
     }
-    return render(request, _template_path(vendor, year, "ozet"), ctx)
+    # Sayılar önceden hesaplanmış OzetSayaci'dan gelir (bkz. duzeltme/ozet.py)
+    kapsam = istek_kapsami(request)
+    ctx.update(ozet_sayaclari(year, kapsam))
+    ctx["il_kapsami"] = None if kapsam == HEPSI else kapsam
+    # Görev listesi sayfaya gömülmez (ETag'li sayfa bayatlamasın); JS gorev_durumu'nu yoklar
+    ctx["gorev_url"] = reverse("duzeltme:gorev_durumu", args=[vendor, year])
+    ctx["gorev_baslat_url"] = reverse("duzeltme:gorev_baslat", args=[vendor, year])
+    ctx["web_gorevleri"] = [(tur, t.etiket) for tur, t in GOREVLER.items() if t.web]
+    return _render(request, sablon, ctx)
 
 @login_required
+@_kosullu
 def page(request, vendor: str, year: int, page: str):
-    tabs = _tabs(vendor, year)
-    if not tabs:
-        raise Http404("Bilinmeyen vendor")
+    bulunan = sayfa_sablonu(vendor, year, page)
+    if bulunan is None:
+        raise Http404("Bilinmeyen sayfa")
+    tabs, sablon = bulunan
     ctx = {
         "vendor": vendor, "year": year,
-        "top_tabs": tabs, "active_tab": page,
+        "top_tabs": tabs, "active_tab": page, "paket": sayfa_paketi(page),
         "page_title": f"Tablo1 Düzeltme – {vendor.upper()} {year} – {page}",
         "page_description": f"{vendor.upper()} {year} {page} sayfası",
         "page_keywords": f"{vendor},{year},{page},tablo1,duzeltme",
     }
-    return render(request, _template_path(vendor, year, page), ctx)
+    if page in _SAYFA_VERISI:
+        ctx.update(_SAYFA_VERISI[page](vendor, year, istek_kapsami(request)))
+    if page in GRIDLER:
+        ctx["grid_kolonlari"] = kolon_basliklari(GRIDLER[page])
+        ctx["grid_filtreler"] = GRIDLER[page].filtreler
+        ctx["grid_url"] = reverse("duzeltme:page_data", args=[vendor, year, page])
+    return _render(request, sablon, ctx)
+
+@login_required
+@require_GET
+@_kosullu
+def page_data(request, vendor: str, year: int, page: str):
+    if yil_sayfalari(vendor, year) is None or page not in GRIDLER:
+        raise Http404("Bilinmeyen sayfa")
+    parametreler = sorted(request.GET.lists())
+    kapsam = istek_kapsami(request)
+    try:
+        veri = onbellek.getir(vendor, year, ("grid", page, kapsam, parametreler),
+                              lambda: grid_sayfasi(GRIDLER[page], year, request.GET, kapsam))
+    except GridHatasi as e:
+        return JsonResponse({"hata": str(e)}, status=400)
+    return JsonResponse(veri)
+
+@login_required
+@require_GET
+@_kosullu
+def page_export(request, vendor: str, year: int, page: str, bicim: str):
+    if yil_sayfalari(vendor, year) is None or page not in AKTARIMLAR or bicim not in BICIMLER:
+        raise Http404("Bilinmeyen sayfa")
+    try:
+        govde = akis(bicim, AKTARIMLAR[page], year, request.GET, istek_kapsami(request))
+    except GridHatasi as e:
+        return JsonResponse({"hata": str(e)}, status=400)
+    yanit = StreamingHttpResponse(govde, content_type=BICIMLER[bicim])
+    yanit["Content-Disposition"] = f'attachment; filename="{vendor}_{year}_{page}.{bicim}"'
+    return yanit
+
+# Görev başlatılırken özet sayfasının vendor'ına göre eklenen parametreler
+_WEB_GOREV_PARAMETRELERI = {
+    "cakisma": lambda vendor: {"sistem": vendor, "degisenler": True},
+    "endeks": lambda vendor: {"sistem": vendor, "tablo": "tablo1"},
+    "eslestirme": lambda vendor: {"kaynaklar": [], "zorla": False, "degisenler": True},
+}
+
+@login_required
+@require_GET
+@never_cache
+def gorev_durumu(request, vendor: str, year: int):
+    # Kısa yoklama: SSE bağlantısı gthread worker'ının bir thread'ini dakikalarca tutardı
+    if yil_sayfalari(vendor, year) is None:
+        raise Http404("Bilinmeyen vendor/yıl")
+    gorevler = son_gorevler(year)
+    aktif = any(g["durum"] in (Gorev.DURUM_BEKLIYOR, Gorev.DURUM_CALISIYOR) for g in gorevler)
+    return JsonResponse({"gorevler": gorevler, "aktif": aktif})
+
+@login_required
+@require_POST
+def gorev_baslat(request, vendor: str, year: int):
+    if yil_sayfalari(vendor, year) is None:
+        raise Http404("Bilinmeyen vendor/yıl")
+    if not request.user.is_staff:
+        return JsonResponse({"hata": "Görev başlatma yetkiniz yok."}, status=403)
+    tur = request.POST.get("tur", "")
+    if tur not in GOREVLER or not GOREVLER[tur].web:
+        return JsonResponse({"hata": "Bilinmeyen görev türü."}, status=400)
+    ek = _WEB_GOREV_PARAMETRELERI.get(tur, lambda vendor: {})(vendor)
+    gorev = gorev_ekle(tur, yil=year, kullanici=request.user, **ek)
+    return JsonResponse({"id": gorev.pk, "durum": gorev.durum}, status=202)
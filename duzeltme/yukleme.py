@@ -0,0 +1,422 @@
+"""
+Bu dosya: duzeltme/yukleme.py
+--------------------------------
+ham_veri dosyalarını (xlsx/csv) akış hâlinde okuyup staging tablolarına yazar.
+
+Mantık:
+- xlsx : openpyxl read_only + iter_rows(values_only=True) -> satırlar tek tek gelir.
+- csv  : csv.reader -> satırlar tek tek gelir (kodlama utf-8 / cp1254, ayraç ; , tab).
+- Satırlar PARCA_BOYUTU'luk parçalara bölünür; PostgreSQL'de her parça
+  psycopg 3 COPY ile, diğer veritabanlarında executemany ile yazılır.
+
+Bellekte aynı anda en fazla bir parça durur; 2.3 milyon satırlık OSOS
+dosyası da 100 satırlık dosya da aynı belleği kullanır.
+
+Her parça, dosyanın kontrol noktasıyla (sayfa, satır, csv bayt konumu) aynı
+transaction'da commit edilir; kesilen yükleme baştan değil, son parçadan devam eder.
+
+Aynı parçanın yeni sürümü (_v02) geldiğinde eski sürümün satırları topluca
+silinmez; satır özetleriyle fark çıkarılıp yalnızca o uygulanır (bkz. duzeltme.fark).
+"""
+
+import codecs
+import csv
+import hashlib
+from datetime import date, datetime
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .bolumleme import bolum_hazirla
+from .fark import (anahtar_indeksleri, farki_uygula, onceki_surum, satir_ozetleri, sonraki_surum_var_mi,
+                   tam_set_kaydet)
+from .kaynaklar import _slug, dosya_adi_coz, kaynak_bul
+from .models import YuklenenDosya
+from .ozet import kaynak_ozetini_yenile
+from .surum import surumu_artir
+
+PARCA_BOYUTU = 10_000
+DESTEKLENEN_UZANTILAR = (".xlsx", ".csv")
+
+_TARIH_BICIMLERI = (
+    "%d.%m.%Y %H:%M:%S",
+    "%d.%m.%Y %H:%M",
+    "%d.%m.%Y",
+    "%d/%m/%Y %H:%M:%S",
+    "%d/%m/%Y %H:%M",
+    "%d/%m/%Y",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d",
+)
+
+
+class YuklemeHatasi(Exception):
+    """Dosya yüklenemediğinde (isim kuralı, tanımsız kaynak, başlık) fırlatılır."""
+
+
+# ---- Hücre dönüştürücüleri ----
+def _metin(deger, uzunluk: int) -> str:
+    if deger is None:
+        return ""
+    if isinstance(deger, float) and deger.is_integer():
+        # Excel numara kolonlarını float verir: 12345.0 -> "12345"
+        deger = int(deger)
+    return str(deger).strip()[:uzunluk]
+
+
+def _tarih_saat(deger) -> Optional[datetime]:
+    if deger is None or deger == "":
+        return None
+    if isinstance(deger, datetime):
+        return deger
+    if isinstance(deger, date):
+        return datetime(deger.year, deger.month, deger.day)
+    if isinstance(deger, (int, float)):
+        from openpyxl.utils.datetime import from_excel
+        return from_excel(deger)
+    s = str(deger).strip()
+    if not s:
+        return None
+    for bicim in _TARIH_BICIMLERI:
+        try:
+            return datetime.strptime(s, bicim)
+        except ValueError:
+            pass
+    return datetime.fromisoformat(s)
+
+
+def _ondalik(deger) -> Optional[float]:
+    if deger is None or deger == "":
+        return None
+    if isinstance(deger, (int, float)):
+        return float(deger)
+    s = str(deger).strip()
+    if not s:
+        return None
+    if "," in s:
+        # Türkçe biçim: 1.234,5
+        s = s.replace(".", "").replace(",", ".")
+    return float(s)
+
+
+def _tamsayi(deger) -> Optional[int]:
+    sayi = _ondalik(deger)
+    return None if sayi is None else int(round(sayi))
+
+
+def _donusturucu(alan):
+    tip = alan.get_internal_type()
+    if tip == "DateTimeField":
+        return _tarih_saat
+    if tip == "FloatField":
+        return _ondalik
+    if tip in ("IntegerField", "PositiveIntegerField", "PositiveSmallIntegerField", "BigIntegerField"):
+        return _tamsayi
+    uzunluk = alan.max_length or 255
+    return lambda deger: _metin(deger, uzunluk)
+
+
+# ---- Okuyucular ----
+def _csv_kodlamasi(yol: Path) -> str:
+    """İlk 1 MB utf-8 olarak çözülebiliyorsa utf-8-sig, değilse cp1254 (Windows Türkçe)."""
+    with open(yol, "rb") as f:
+        parca = f.read(1 << 20)
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(parca, final=False)
+        return "utf-8-sig"
+    except UnicodeDecodeError:
+        return "cp1254"
+
+
+class _KonumluSatirlar:
+    """
+    İkili dosyadan satır satır okuyup çözen iterator.
+
+    csv.reader bir kaydı bitirmek için yalnızca gerektiği kadar satır çeker;
+    bu yüzden her kayıttan sonra `konum` tam olarak o kaydın bittiği bayttır.
+    Devam ederken dosya bu bayta seek edilir.
+    """
+
+    def __init__(self, f, kodlama: str):
+        self.f = f
+        self.kodlama = kodlama
+        self.konum = f.tell()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> str:
+        satir = self.f.readline()
+        if not satir:
+            raise StopIteration
+        self.konum += len(satir)
+        return satir.decode(self.kodlama)
+
+
+def _xlsx_sayfalari(yol: Path, devam: Optional[Tuple[str, int, int]]):
+    from openpyxl import load_workbook
+
+    devam_sayfa, devam_satir, _ = devam or ("", 0, 0)
+    wb = load_workbook(yol, read_only=True, data_only=True)
+    try:
+        for ws in wb.worksheets:
+            baslangic = 2
+            if devam_sayfa:
+                if ws.title != devam_sayfa:
+                    continue  # kontrol noktasından önceki sayfa: tamamı yüklü
+                devam_sayfa = ""
+                baslangic = max(devam_satir + 1, 2)
+            baslik = next(ws.iter_rows(max_row=1, values_only=True), None)
+            if baslik is None:
+                continue
+            # read_only modda min_row'dan önceki satırlar hücreye çevrilmeden geçilir
+            satirlar = ws.iter_rows(min_row=baslangic, values_only=True)
+            yield ws.title, baslik, (
+                (no, degerler, 0) for no, degerler in enumerate(satirlar, start=baslangic)
+            )
+    finally:
+        wb.close()
+
+
+def _csv_sayfalari(yol: Path, devam: Optional[Tuple[str, int, int]]):
+    kodlama = _csv_kodlamasi(yol)
+    with open(yol, "rb") as f:
+        ilk = f.readline().decode(kodlama)
+        ayrac = max((";", ",", "\t"), key=ilk.count)
+        f.seek(0)
+        okuyucu = _KonumluSatirlar(f, kodlama)
+        baslik = next(csv.reader(okuyucu, delimiter=ayrac), None)
+        if baslik is None:
+            return
+        no = 1
+        if devam and devam[2]:
+            f.seek(devam[2])
+            okuyucu.konum = devam[2]
+            no = devam[1]
+        kayitlar = csv.reader(okuyucu, delimiter=ayrac)
+        yield "", baslik, (
+            (satir_no, degerler, okuyucu.konum)
+            for satir_no, degerler in enumerate(kayitlar, start=no + 1)
+        )
+
+
+def ham_sayfalar(yol: Path, devam: Optional[Tuple[str, int, int]] = None):
+    """
+    (sayfa_adi, baslik, satirlar) üçlülerini sırayla verir.
+
+    satirlar -> (fiziksel_satir_no, degerler, bayt_konumu); bayt_konumu yalnızca
+    csv'de anlamlıdır. csv için tek "sayfa" vardır ve adı boştur.
+    devam = (sayfa, satir, bayt) verilirse okuma bu noktadan sonra başlar.
+    """
+    if yol.suffix.lower() == ".xlsx":
+        return _xlsx_sayfalari(yol, devam)
+    return _csv_sayfalari(yol, devam)
+
+
+def dosya_ozeti(yol: Path) -> str:
+    h = hashlib.sha256()
+    with open(yol, "rb") as f:
+        for blok in iter(lambda: f.read(1 << 20), b""):
+            h.update(blok)
+    return h.hexdigest()
+
+
+def _kolon_eslestir(baslik, kolonlar) -> List[Tuple[str, Optional[int]]]:
+    """Her model alanı için başlıktaki sütun sırasını (yoksa None) döner."""
+    sluglar = {}
+    for i, b in enumerate(baslik):
+        sluglar.setdefault(_slug(b), i)
+    eslesme = []
+    for alan, takma_adlar in kolonlar.items():
+        idx = next((sluglar[a] for a in takma_adlar if a in sluglar), None)
+        eslesme.append((alan, idx))
+    return eslesme
+
+
+def _parcalar(iterator, boyut: int) -> Iterator[list]:
+    while True:
+        parca = list(islice(iterator, boyut))
+        if not parca:
+            return
+        yield parca
+
+
+# ---- Yazıcı ----
+def parca_yaz(model, alanlar: List[str], satirlar: List[tuple]) -> None:
+    """Satırları toplu yazar: PostgreSQL'de COPY, diğerlerinde executemany."""
+    qn = connection.ops.quote_name
+    tablo = qn(model._meta.db_table)
+    kolon_sql = ", ".join(qn(model._meta.get_field(a).column) for a in alanlar)
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            with cursor.copy(f"COPY {tablo} ({kolon_sql}) FROM STDIN") as copy:
+                for satir in satirlar:
+                    copy.write_row(satir)
+        else:
+            yer = ", ".join(["%s"] * len(alanlar))
+            cursor.executemany(f"INSERT INTO {tablo} ({kolon_sql}) VALUES ({yer})", satirlar)
+
+
+def _dosya_satirlarini_sil(model, kayit: YuklenenDosya, satir_no_sonrasi: int = 0) -> None:
+    # ORM delete() milyonlarca satırı belleğe çeker; doğrudan SQL kullanıyoruz.
+    # sistem + yil koşulu PostgreSQL'de silmeyi dosyanın tek bölümüne indirir.
+    qn = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {qn(model._meta.db_table)} WHERE {qn('sistem')} = %s AND {qn('yil')} = %s "
+            f"AND {qn('dosya_id')} = %s AND {qn('satir_no')} > %s",
+            [kayit.sistem, kayit.yil, kayit.pk, satir_no_sonrasi],
+        )
+
+
+# ---- Ana akış ----
+def dosyalari_bul(yollar) -> List[Path]:
+    """Verilen dosya/klasörlerden isim kuralına uyan xlsx/csv dosyalarını toplar."""
+    bulunan = []
+    for yol in map(Path, yollar):
+        adaylar = sorted(yol.rglob("*")) if yol.is_dir() else [yol]
+        bulunan.extend(
+            p for p in adaylar
+            if p.is_file() and p.suffix.lower() in DESTEKLENEN_UZANTILAR
+        )
+    return bulunan
+
+
+def dosya_yukle(yol, *, parca_boyutu: int = PARCA_BOYUTU, yeniden: bool = False,
+                ilerleme: Optional[Callable[[int, int], None]] = None, ozet_yenile: bool = True) -> dict:
+    """
+    Tek bir ham dosyayı staging tablosuna yükler.
+
+    Dönüş: {"satir", "hatali_hucre", "eksik_kolonlar", "atlandi", "devam", "fark"}
+    - Her parça kendi transaction'ında, kontrol noktasıyla (sayfa, satır, bayt)
+      birlikte commit edilir. Yarıda kesilen yükleme tekrar çalıştırılınca,
+      dosya özeti (sha256) aynıysa son commit edilen parçadan devam eder.
+    - Dosya daha önce başarıyla yüklendiyse (ve yeniden=False) atlanır.
+    - İçeriği değişmiş dosyada ya da yeniden=True iken eski satırlar silinir.
+    - Aynı parçanın önceki sürümü (v01 -> v02) yüklüyse yalnızca fark uygulanır
+      ve değişiklik seti kaydedilir (bkz. duzeltme.fark); "fark" bu setin
+      sayılarıdır. Eski sürüm "eski" durumuna geçer.
+    - ilerleme(satir, bayt): her parça commit edildikten sonra çağrılır
+      (bayt: csv'de okunan konum, xlsx'te 0). Arka plan görevleri kullanır.
+    - ozet_yenile=False: kaynağın özet sayaçları yenilenmez. Çok dosyalı
+      yüklemede (paralel_yukle) sayaçlar her dosyadan sonra değil, sonda bir
+      kez yenilenir; il kırılımı bütün staging yaprağını taradığı için.
+    """
+    yol = Path(yol)
+    kimlik = dosya_adi_coz(yol.name)
+    if kimlik is None:
+        raise YuklemeHatasi(f"Dosya adı kurala uymuyor: {yol.name}")
+    tanim = kaynak_bul(kimlik)
+    if tanim is None:
+        raise YuklemeHatasi(f"Tanımsız kaynak: {kimlik.sistem}/{kimlik.kategori} ({yol.name})")
+    model = tanim.model
+
+    ozet = dosya_ozeti(yol)
+    kayit, _ = YuklenenDosya.objects.get_or_create(
+        dosya_adi=yol.name,
+        defaults=dict(
+            yol=str(yol), sistem=kimlik.sistem, kategori=kimlik.kategori, yil=kimlik.yil,
+            ay=kimlik.ay, cekim_tarihi=kimlik.cekim_tarihi, part=kimlik.part,
+            versiyon=kimlik.versiyon, hedef_tablo=model._meta.db_table, sha256=ozet,
+        ),
+    )
+    ayni_dosya = kayit.sha256 == ozet
+    atlanan = {"satir": kayit.satir_sayisi, "hatali_hucre": kayit.hatali_hucre,
+               "eksik_kolonlar": [], "atlandi": True, "devam": 0, "fark": None}
+    if kayit.durum == YuklenenDosya.DURUM_TAMAM and ayni_dosya and not yeniden:
+        return atlanan
+    if kayit.durum == YuklenenDosya.DURUM_ESKI and not yeniden:
+        return atlanan  # yerini yeni sürümü aldı
+    if sonraki_surum_var_mi(kayit):
+        raise YuklemeHatasi(f"Bu dosyanın daha yeni bir sürümü yüklü: {yol.name}")
+
+    if kayit.durum != YuklenenDosya.DURUM_TAMAM and ayni_dosya and not yeniden:
+        # Yarım kalmış yükleme: kontrol noktasından devam
+        satir_no, hatali = kayit.satir_sayisi, kayit.hatali_hucre
+        devam = (kayit.son_sayfa, kayit.son_sayfa_satiri, kayit.son_bayt) if satir_no else None
+    else:
+        satir_no = hatali = 0
+        devam = None
+    baslangic_satiri = satir_no
+
+    bolum_hazirla(model, kimlik.yil, kimlik.sistem)
+    with transaction.atomic():
+        # Kontrol noktasından sonraki satırlar (olmamalı ama) varsa temizle
+        _dosya_satirlarini_sil(model, kayit, satir_no)
+        YuklenenDosya.objects.filter(pk=kayit.pk).update(
+            yol=str(yol), sha256=ozet, durum=YuklenenDosya.DURUM_YUKLENIYOR,
+            satir_sayisi=satir_no, hatali_hucre=hatali,
+            **({} if devam else {"son_sayfa": "", "son_sayfa_satiri": 0, "son_bayt": 0}),
+        )
+    if kayit.satir_sayisi and not devam:
+        # Eski satırlar silindi: sayfalar artık önbellekteki hâli göstermesin
+        surumu_artir(kimlik.sistem, kimlik.yil)
+
+    alanlar = ["dosya", "satir_no", "sistem", "yil", "anahtar_ozeti", "satir_ozeti", *tanim.kolonlar]
+    donusturuculer = [_donusturucu(model._meta.get_field(a)) for a in tanim.kolonlar]
+    anahtar_idx = anahtar_indeksleri(model, tanim.kolonlar)
+    sabit = (kayit.pk,)
+    ek = (kimlik.sistem, kimlik.yil)
+
+    eksik = set(tanim.kolonlar)
+    try:
+        for sayfa, baslik, satirlar in ham_sayfalar(yol, devam):
+            eslesme = _kolon_eslestir(baslik, tanim.kolonlar)
+            if all(idx is None for _, idx in eslesme):
+                raise YuklemeHatasi(f"Başlıklar hiçbir kolonla eşleşmedi: {yol.name}")
+            eksik &= {alan for alan, idx in eslesme if idx is None}
+            indeksler = [idx for _, idx in eslesme]
+
+            for parca in _parcalar(satirlar, parca_boyutu):
+                yazilacak = []
+                for _fiziksel, ham, _bayt in parca:
+                    if not any(v not in (None, "") for v in ham):
+                        continue  # boş satır
+                    satir_no += 1
+                    degerler = []
+                    for idx, donustur in zip(indeksler, donusturuculer):
+                        hucre = ham[idx] if idx is not None and idx < len(ham) else None
+                        try:
+                            degerler.append(donustur(hucre))
+                        except (TypeError, ValueError, OverflowError):
+                            hatali += 1
+                            degerler.append(donustur(None))
+                    degerler = tuple(degerler)
+                    yazilacak.append(sabit + (satir_no,) + ek
+                                     + satir_ozetleri(tanim.kolonlar, anahtar_idx, degerler) + degerler)
+
+                son_fiziksel, _, son_bayt = parca[-1]
+                with transaction.atomic():
+                    if yazilacak:
+                        parca_yaz(model, alanlar, yazilacak)
+                    YuklenenDosya.objects.filter(pk=kayit.pk).update(
+                        son_sayfa=sayfa, son_sayfa_satiri=son_fiziksel, son_bayt=son_bayt,
+                        satir_sayisi=satir_no, hatali_hucre=hatali,
+                    )
+                if ilerleme is not None:
+                    ilerleme(satir_no, son_bayt)
+    except Exception as exc:
+        YuklenenDosya.objects.filter(pk=kayit.pk).update(
+            durum=YuklenenDosya.DURUM_HATA, hata_mesaji=str(exc))
+        raise
+
+    fark = None
+    with transaction.atomic():
+        onceki = onceki_surum(kayit)
+        if onceki is None:
+            tam_set_kaydet(model, kayit)
+        else:
+            seti = farki_uygula(model, onceki, kayit)
+            YuklenenDosya.objects.filter(pk=onceki.pk).update(durum=YuklenenDosya.DURUM_ESKI)
+            fark = {"onceki": onceki.dosya_adi, "eklenen": seti.eklenen, "guncellenen": seti.guncellenen,
+                    "silinen": seti.silinen, "ayni": seti.ayni, "tam_degisim": seti.tam_degisim}
+        YuklenenDosya.objects.filter(pk=kayit.pk).update(
+            durum=YuklenenDosya.DURUM_TAMAM, hata_mesaji="", bitis=timezone.now())
+    if ozet_yenile:
+        kaynak_ozetini_yenile(kimlik.sistem, kimlik.kategori, kimlik.yil)
+    return {"satir": satir_no, "hatali_hucre": hatali, "eksik_kolonlar": sorted(eksik),
+            "atlandi": False, "devam": baslangic_satiri, "fark": fark}
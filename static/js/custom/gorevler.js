@@ -0,0 +1,127 @@
+/*
+ * Bu dosya: static/js/custom/gorevler.js
+ * --------------------------------
+ * Özet sayfasındaki "Arka plan görevleri" kartı.
+ * gorev_durumu uç noktasını yoklar: çalışan/bekleyen görev varken 2 sn'de bir,
+ * yokken 15 sn'de bir; sekme gizliyken yoklamaz. Staff kullanıcı düğmelerle
+ * görev başlatabilir (gorev_baslat, POST).
+ */
+(function () {
+  "use strict";
+
+  var HIZLI_MS = 2000;
+  var YAVAS_MS = 15000;
+  var ROZET = { bekliyor: "badge-secondary", calisiyor: "badge-info", tamam: "badge-success", hata: "badge-danger" };
+
+  function sayi(deger) {
+    return deger === null || deger === undefined ? "" : Number(deger).toLocaleString("tr-TR");
+  }
+
+  function sure(sn) {
+    if (sn === null || sn === undefined) return "";
+    return sn < 60 ? sn + " sn" : Math.floor(sn / 60) + " dk " + (sn % 60) + " sn";
+  }
+
+  function hucre(tr, icerik) {
+    var td = document.createElement("td");
+    if (icerik instanceof Node) td.appendChild(icerik); else td.textContent = icerik;
+    tr.appendChild(td);
+    return td;
+  }
+
+  function satir(g) {
+    var tr = document.createElement("tr");
+    var ad = hucre(tr, g.etiket);
+    if (g.mesaj) {
+      var kucuk = document.createElement("div");
+      kucuk.className = "text-muted small";
+      kucuk.textContent = g.mesaj;
+      ad.appendChild(kucuk);
+    }
+
+    var rozet = document.createElement("span");
+    rozet.className = "badge " + (ROZET[g.durum] || "badge-secondary");
+    rozet.textContent = g.durum_etiketi;
+    if (g.hata) rozet.title = g.hata;
+    hucre(tr, rozet);
+
+    var cubuk = document.createElement("div");
+    cubuk.className = "progress";
+    var dolu = document.createElement("div");
+    dolu.className = "progress-bar" + (g.durum === "hata" ? " bg-danger" : "");
+    dolu.style.width = g.yuzde + "%";
+    dolu.setAttribute("role", "progressbar");
+    dolu.setAttribute("aria-valuenow", g.yuzde);
+    cubuk.appendChild(dolu);
+    var ilerleme = hucre(tr, cubuk);
+    if (g.hata) {
+      var hata = document.createElement("div");
+      hata.className = "text-danger small";
+      hata.textContent = g.hata;
+      ilerleme.appendChild(hata);
+    }
+
+    hucre(tr, sayi(g.islenen));
+    hucre(tr, g.satir_sn ? sayi(Math.round(g.satir_sn)) : "");
+    hucre(tr, sure(g.sure_sn));
+    return tr;
+  }
+
+  function kur(kart) {
+    var govde = kart.querySelector("tbody");
+    var hataAlani = kart.querySelector(".js-gorev-hata");
+    var zamanlayici = null;
+
+    function planla(ms) {
+      clearTimeout(zamanlayici);
+      zamanlayici = setTimeout(yokla, ms);
+    }
+
+    function yokla() {
+      if (document.hidden) return;  // görünür olunca visibilitychange yeniden başlatır
+      fetch(kart.dataset.url, { credentials: "same-origin", cache: "no-store" })
+        .then(function (r) { return r.json(); })
+        .then(function (veri) {
+          govde.innerHTML = "";
+          if (!veri.gorevler.length) {
+            var tr = document.createElement("tr");
+            hucre(tr, "Bu yıl için görev yok.").colSpan = 6;
+            govde.appendChild(tr);
+          }
+          veri.gorevler.forEach(function (g) { govde.appendChild(satir(g)); });
+          planla(veri.aktif ? HIZLI_MS : YAVAS_MS);
+        })
+        .catch(function () { planla(YAVAS_MS); });
+    }
+
+    kart.querySelectorAll(".js-gorev-baslat").forEach(function (dugme) {
+      dugme.addEventListener("click", function () {
+        var veri = new FormData();
+        veri.append("tur", dugme.dataset.tur);
+        dugme.disabled = true;
+        fetch(kart.dataset.baslatUrl, {
+          method: "POST",
+          credentials: "same-origin",
+          headers: { "X-CSRFToken": kart.querySelector("[name=csrfmiddlewaretoken]").value },
+          body: veri,
+        })
+          .then(function (r) { return r.json().then(function (j) { return { ok: r.ok, veri: j }; }); })
+          .then(function (sonuc) {
+            hataAlani.hidden = sonuc.ok;
+            if (!sonuc.ok) hataAlani.textContent = sonuc.veri.hata || "Görev başlatılamadı";
+            yokla();
+          })
+          .finally(function () { dugme.disabled = false; });
+      });
+    });
+
+    document.addEventListener("visibilitychange", function () {
+      if (!document.hidden) yokla();
+    });
+    yokla();
+  }
+
+  document.addEventListener("DOMContentLoaded", function () {
+    document.querySelectorAll(".js-gorevler").forEach(kur);
+  });
+})();
@@ -0,0 +1,77 @@
+/*
+ * Bu dosya: static/js/custom/grid.js
+ * --------------------------------
+ * duzeltme/partials/_grid.html iskeletini doldurur.
+ * Sunucu keyset sayfalı JSON döner: {kolonlar, satirlar, sonraki}.
+ * "Daha fazla" bir sonraki imleçle devam eder; sıralama/filtre değişince baştan başlar.
+ */
+(function () {
+  "use strict";
+
+  function tarihYaz(deger) {
+    if (typeof deger === "string" && /^\d{4}-\d{2}-\d{2}T/.test(deger)) {
+      return deger.slice(0, 16).replace("T", " ");
+    }
+    return deger === null ? "" : String(deger);
+  }
+
+  function kur(tablo) {
+    var kart = tablo.closest(".card-body");
+    var govde = tablo.querySelector("tbody");
+    var devamDugmesi = kart.querySelector(".js-grid-devam");
+    var hataAlani = kart.querySelector(".js-grid-hata");
+    var form = kart.querySelector(".js-grid-filtre");
+    var kolonlar = Array.prototype.map.call(
+      tablo.querySelectorAll("th[data-kolon]"), function (th) { return th.dataset.kolon; });
+    var siralama = "id";
+    var imlec = null;
+
+    function yukle(bastan) {
+      var params = new URLSearchParams(new FormData(form));
+      params.set("kolonlar", kolonlar.join(","));
+      params.set("siralama", siralama);
+      if (!bastan && imlec) params.set("imlec", imlec);
+      Array.from(params.keys()).forEach(function (k) { if (!params.get(k)) params.delete(k); });
+
+      fetch(tablo.dataset.url + "?" + params.toString(), { credentials: "same-origin" })
+        .then(function (r) { return r.json().then(function (veri) { return { ok: r.ok, veri: veri }; }); })
+        .then(function (sonuc) {
+          if (!sonuc.ok) {
+            hataAlani.textContent = sonuc.veri.hata || "Veri alınamadı";
+            hataAlani.hidden = false;
+            return;
+          }
+          hataAlani.hidden = true;
+          if (bastan) govde.innerHTML = "";
+          var parca = document.createDocumentFragment();
+          sonuc.veri.satirlar.forEach(function (satir) {
+            var tr = document.createElement("tr");
+            satir.forEach(function (deger) {
+              var td = document.createElement("td");
+              td.textContent = tarihYaz(deger);
+              tr.appendChild(td);
+            });
+            parca.appendChild(tr);
+          });
+          govde.appendChild(parca);
+          imlec = sonuc.veri.sonraki;
+          devamDugmesi.hidden = !imlec;
+        });
+    }
+
+    tablo.querySelectorAll("th[data-siralanir]").forEach(function (th) {
+      th.addEventListener("click", function () {
+        var kolon = th.dataset.kolon;
+        siralama = siralama === kolon ? "-" + kolon : kolon;
+        yukle(true);
+      });
+    });
+    form.addEventListener("submit", function (e) { e.preventDefault(); yukle(true); });
+    devamDugmesi.addEventListener("click", function () { yukle(false); });
+    yukle(true);
+  }
+
+  document.addEventListener("DOMContentLoaded", function () {
+    document.querySelectorAll("table.js-grid").forEach(kur);
+  });
+})();